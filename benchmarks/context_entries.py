@@ -0,0 +1,80 @@
+"""Measure memory and subsumption time of build-context entry groups.
+
+Builds a synthetic tree, selects the full context plus one group per package
+and compares ``set`` of path strings with ``_ContextEntries`` bitsets over the
+shared ``_ContextIndex``.
+
+Run with ``python benchmarks/context_entries.py [files]``.
+"""
+
+import posixpath
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from hyperbrowser.client.managers.sandboxes import image_build
+
+
+def _make_tree(root: Path, files: int) -> int:
+    packages = max(1, files // 1000)
+    for package in range(packages):
+        for directory in range(20):
+            path = root / f"pkg{package}" / f"dir{directory}"
+            path.mkdir(parents=True)
+            for index in range(50):
+                (path / f"file{index}.ts").write_bytes(b"")
+    return packages
+
+
+def _string_sets(root: Path, sources):
+    groups = []
+    for source in sources:
+        entries = set()
+        for path in (root / source).rglob("*"):
+            relative = path.relative_to(root).as_posix()
+            while relative not in ("", "."):
+                entries.add(relative)
+                relative = posixpath.dirname(relative)
+        groups.append(entries)
+    return groups
+
+
+def _bitsets(root: Path, sources):
+    index = image_build._ContextIndex(root, None)
+    return [
+        image_build._collect_context_entries(
+            root, [source], ignore_matcher=None, required=True, index=index
+        )
+        for source in sources
+    ]
+
+
+def _measure(label: str, build, root: Path, sources) -> None:
+    tracemalloc.start()
+    groups = build(root, sources)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    started = time.perf_counter()
+    kept = image_build._remove_subsumed_entry_groups(groups)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<14} {retained / 1e6:8.1f} MB retained, "
+        f"subsumption {elapsed * 1000:8.1f} ms ({len(kept)} kept)"
+    )
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as workspace:
+        root = Path(workspace)
+        packages = _make_tree(root, files)
+        sources = ["."] + [f"pkg{package}" for package in range(packages)]
+        print(f"{packages * 1000} files, {len(sources)} groups")
+        _measure("str sets", _string_sets, root, sources)
+        _measure("bitsets", _bitsets, root, sources)
+
+
+if __name__ == "__main__":
+    main()
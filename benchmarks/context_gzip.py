@@ -0,0 +1,63 @@
+"""Compare single-stream gzip with the parallel member writer used for bundles.
+
+Compresses semi-compressible data with ``gzip.GzipFile(compresslevel=1)`` and
+with ``_ParallelGzipWriter`` over thread pools of increasing size.
+
+Run with ``python benchmarks/context_gzip.py [megabytes]``.
+"""
+
+import gzip
+import io
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from hyperbrowser.client.managers.sandboxes import image_build
+
+
+def _payload(megabytes: int) -> bytes:
+    rng = random.Random(0)
+    words = [os.urandom(rng.randint(2, 12)).hex().encode() for _ in range(4096)]
+    chunk = b" ".join(rng.choice(words) for _ in range(200_000))[: 1 << 20]
+    return chunk * megabytes
+
+
+def _write(writer, data: bytes) -> None:
+    view = memoryview(data)
+    for start in range(0, len(data), 64 * 1024):
+        writer.write(view[start : start + 64 * 1024])
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    data = _payload(megabytes)
+    print(f"{megabytes} MB, {os.cpu_count()} CPUs")
+
+    output = io.BytesIO()
+    started = time.perf_counter()
+    with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=1, mtime=0) as gz:
+        _write(gz, data)
+    single = time.perf_counter() - started
+    print(f"GzipFile               {single:7.2f} s  {len(output.getvalue()):>12} B")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        output = io.BytesIO()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            with image_build._ParallelGzipWriter(
+                output, executor=executor, max_pending=2 * workers
+            ) as writer:
+                _write(writer, data)
+        elapsed = time.perf_counter() - started
+        print(
+            f"parallel, {workers:>2} worker(s) {elapsed:7.2f} s  "
+            f"{len(output.getvalue()):>12} B  {single / elapsed:5.1f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Time build-context selection over a synthetic tree.
+
+Selects the full context plus one sparse source group per package, the way
+``package_docker_build_context_manifest`` does, comparing a fresh
+``os.walk`` per source group with the shared ``os.scandir`` index.
+
+Run with ``python benchmarks/context_walk.py [files]``.
+"""
+
+import os
+import posixpath
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from hyperbrowser.client.managers.sandboxes import image_build
+from hyperbrowser.client.managers.sandboxes.dockerignore import DockerIgnoreMatcher
+
+DOCKERIGNORE = "**/node_modules\n**/__pycache__\n*.log\n"
+
+
+def _make_tree(root: Path, files: int) -> int:
+    packages = max(1, files // 200)
+    for package in range(packages):
+        for directory in ("src", "src/components", "node_modules/lib", "tests"):
+            path = root / f"pkg{package}" / directory
+            path.mkdir(parents=True, exist_ok=True)
+            for index in range(50):
+                (path / f"file{index}.ts").write_bytes(b"")
+    return packages
+
+
+def _walk_entries(root: Path, source: str, matcher: DockerIgnoreMatcher):
+    entries = set()
+    for directory, directories, files in os.walk(root / source):
+        for name in directories + files:
+            relative = (Path(directory) / name).relative_to(root).as_posix()
+            if matcher.matches(relative):
+                continue
+            while relative not in ("", "."):
+                entries.add(relative)
+                relative = posixpath.dirname(relative)
+    return entries
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    matcher = DockerIgnoreMatcher.from_text(DOCKERIGNORE)
+    with tempfile.TemporaryDirectory() as workspace:
+        root = Path(workspace)
+        packages = _make_tree(root, files)
+        sources = ["."] + [f"pkg{package}/src" for package in range(packages)]
+        print(f"{packages * 200} files, {len(sources)} source groups")
+
+        started = time.perf_counter()
+        for source in sources:
+            _walk_entries(root, source, matcher)
+        legacy = time.perf_counter() - started
+        print(f"os.walk per group      {legacy:8.2f} s")
+
+        for workers in (1, image_build._CONTEXT_WALK_WORKERS):
+            index = image_build._ContextIndex(root, matcher, workers=workers)
+            started = time.perf_counter()
+            for source in sources:
+                image_build._collect_context_entries(
+                    root, [source], ignore_matcher=matcher, required=True, index=index
+                )
+            elapsed = time.perf_counter() - started
+            print(f"shared index, {workers} worker(s) {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
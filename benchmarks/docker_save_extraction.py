@@ -0,0 +1,54 @@
+"""Time storing a streamed ``docker image save`` entry with and without overlap.
+
+A child process writes the entry to a pipe, the way ``docker image save``
+does. The entry is stored once with reading, writing and hashing in
+sequence, and once with reading overlapped with writing and hashing.
+
+Run with ``python benchmarks/docker_save_extraction.py [megabytes]``.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from hyperbrowser.client.managers.sandboxes import image_build
+
+_PRODUCER = """
+import os, sys
+block = os.urandom(1 << 20)
+for _ in range({megabytes}):
+    sys.stdout.buffer.write(block)
+"""
+
+
+def _store(megabytes: int, workspace: str, label: str) -> None:
+    process = subprocess.Popen(
+        [sys.executable, "-c", _PRODUCER.format(megabytes=megabytes)],
+        stdout=subprocess.PIPE,
+    )
+    destination = os.path.join(workspace, label.replace(" ", "-"))
+    started = time.perf_counter()
+    image_build._store_streamed_entry(
+        process.stdout, destination, megabytes << 20, "layer.tar"
+    )
+    elapsed = time.perf_counter() - started
+    process.wait()
+    os.remove(destination)
+    print(f"{label:<12} {elapsed:6.2f} s  {megabytes / elapsed:8.1f} MB/s")
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    print(f"{megabytes} MB entry, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as workspace:
+        pipelined = image_build._PIPELINED_ENTRY_BYTES
+        image_build._PIPELINED_ENTRY_BYTES = 1 << 62
+        _store(megabytes, workspace, "sequential")
+        image_build._PIPELINED_ENTRY_BYTES = pipelined
+        _store(megabytes, workspace, "overlapped")
+
+
+if __name__ == "__main__":
+    main()
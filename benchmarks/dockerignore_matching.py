@@ -0,0 +1,93 @@
+"""Time ``.dockerignore`` matching over a large synthetic monorepo tree.
+
+Paths are generated in walk order (directories before their contents), the
+way context traversal queries the matcher. The compiled matcher is compared
+with pattern-by-pattern matching of every parent prefix.
+
+Run with ``python benchmarks/dockerignore_matching.py [paths]``.
+"""
+
+import sys
+import time
+
+from hyperbrowser.client.managers.sandboxes.dockerignore import DockerIgnoreMatcher
+
+DOCKERIGNORE = """
+.git
+**/node_modules
+!**/node_modules/.bin/keep
+**/__pycache__
+**/*.pyc
+*.log
+**/dist/**
+build/
+coverage
+.env*
+!.env.example
+docs/**/*.png
+**/.DS_Store
+tmp/**
+**/target/debug
+"""
+
+
+def _tree(total: int):
+    paths = []
+    package = 0
+    while len(paths) < total:
+        root = f"packages/pkg{package}"
+        paths.append(root)
+        for directory in ("src", "src/components", "node_modules/lib", "dist"):
+            paths.append(f"{root}/{directory}")
+            for index in range(60):
+                paths.append(f"{root}/{directory}/file{index}.ts")
+        paths.extend(f"{root}/__pycache__/mod{index}.pyc" for index in range(10))
+        package += 1
+    return paths[:total]
+
+
+def _reference_matches(patterns, path: str) -> bool:
+    parts = path.split("/")
+    matched = False
+    for pattern in patterns:
+        if pattern.exclusion != matched:
+            continue
+        for length in range(len(parts), 0, -1):
+            if pattern.matches_path("/".join(parts[:length])):
+                matched = not pattern.exclusion
+                break
+    return matched
+
+
+def _measure(label: str, matches, paths) -> float:
+    started = time.perf_counter()
+    ignored = sum(1 for path in paths if matches(path))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed:8.2f} s  ({ignored} ignored)")
+    return elapsed
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    paths = _tree(total)
+    print(f"{len(paths)} paths, {len(DOCKERIGNORE.split())} patterns")
+
+    matcher = DockerIgnoreMatcher.from_text(DOCKERIGNORE)
+    reference = _measure(
+        "pattern by pattern",
+        lambda path: _reference_matches(matcher._patterns, path),
+        paths,
+    )
+    compiled = _measure(
+        "compiled", DockerIgnoreMatcher.from_text(DOCKERIGNORE).matches, paths
+    )
+    _measure(
+        "compiled, normalized",
+        DockerIgnoreMatcher.from_text(DOCKERIGNORE).matches_normalized,
+        paths,
+    )
+    print(f"speedup                {reference / compiled:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure cold import, client construction and first-call time.
+
+Every scenario runs in a fresh interpreter, so deferred model building is
+charged to the first request that uses a model.
+
+Run with ``python benchmarks/import_time.py [rounds]``.
+"""
+
+import subprocess
+import sys
+
+_SCENARIOS = {
+    "import hyperbrowser": "import hyperbrowser",
+    "import client": "from hyperbrowser import Hyperbrowser",
+    "construct client": (
+        "from hyperbrowser import Hyperbrowser; Hyperbrowser(api_key='benchmark')"
+    ),
+    "first manager": (
+        "from hyperbrowser import Hyperbrowser; "
+        "Hyperbrowser(api_key='benchmark').sessions"
+    ),
+    "import models": "from hyperbrowser.models import *",
+    "first fetch": (
+        "from hyperbrowser.models import FetchParams, FetchResponse; "
+        "FetchParams(url='https://example.com'); "
+        "FetchResponse.model_validate({'jobId': 'job', 'status': 'completed'})"
+    ),
+    "first sandbox": (
+        "from hyperbrowser.models import CreateSandboxParams, SandboxDetail; "
+        "CreateSandboxParams(image_name='node'); SandboxDetail.model_json_schema()"
+    ),
+}
+
+_TIMER = """
+import time
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started)
+"""
+
+
+def _measure(statement: str, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return min(timings)
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, statement in _SCENARIOS.items():
+        elapsed = _measure(statement, rounds)
+        print(f"{label:<18} {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare request serialization paths for a small, frequently sent payload.
+
+Run with ``python benchmarks/request_serialization.py [iterations]``.
+"""
+
+import sys
+import timeit
+
+from hyperbrowser.client._request import dump_request
+from hyperbrowser.models.computer_action import ClickActionParams
+
+
+def _measure(label: str, serialize, iterations: int) -> None:
+    elapsed = min(timeit.repeat(serialize, number=iterations, repeat=5)) / iterations
+    print(f"{label:<22} {elapsed * 1_000_000:8.2f} us")
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    mapping = {"x": 640, "y": 360, "num_clicks": 2, "return_screenshot": True}
+    params = ClickActionParams(**mapping)
+
+    _measure(
+        "validate + model_dump",
+        lambda: ClickActionParams.model_validate(mapping).model_dump(
+            by_alias=True, exclude_none=True
+        ),
+        iterations,
+    )
+    _measure(
+        "model_dump",
+        lambda: params.model_dump(by_alias=True, exclude_none=True),
+        iterations,
+    )
+    _measure(
+        "dump_request(mapping)",
+        lambda: dump_request(mapping, ClickActionParams),
+        iterations,
+    )
+    _measure(
+        "dump_request(model)",
+        lambda: dump_request(params, ClickActionParams),
+        iterations,
+    )
+    _measure(
+        "dump_request(trusted)",
+        lambda: dump_request(mapping, ClickActionParams, validate=False),
+        iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
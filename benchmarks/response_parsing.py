@@ -0,0 +1,73 @@
+"""Compare dict-then-model parsing with direct bytes-to-model validation.
+
+Run with ``python benchmarks/response_parsing.py [pages] [html_kib]``.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from hyperbrowser.json_codec import get_json_codec
+from hyperbrowser.models import CrawlJobResponse
+from hyperbrowser.transport.base import APIResponse
+
+
+def _build_payload(pages: int, html_kib: int) -> bytes:
+    codec = get_json_codec()
+    html = "<p>" + "x" * (html_kib * 1024) + "</p>"
+    return codec.dumps(
+        {
+            "jobId": "crawl_benchmark",
+            "status": "completed",
+            "data": [
+                {
+                    "url": f"https://example.com/{index}",
+                    "status": "completed",
+                    "html": html,
+                    "markdown": html,
+                    "links": [f"https://example.com/{index}/{n}" for n in range(50)],
+                    "metadata": {"title": f"Page {index}"},
+                }
+                for index in range(pages)
+            ],
+            "totalCrawledPages": pages,
+            "totalPageBatches": 1,
+            "currentPageBatch": 1,
+            "batchSize": pages,
+        }
+    )
+
+
+def _measure(label: str, parse, rounds: int = 20) -> None:
+    parse()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        parse()
+    elapsed = (time.perf_counter() - started) / rounds
+
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<14} {elapsed * 1000:8.2f} ms  peak {peak / 1024 / 1024:8.2f} MiB")
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    html_kib = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    codec = get_json_codec()
+    content = _build_payload(pages, html_kib)
+    print(f"{pages} pages, {len(content) / 1024 / 1024:.2f} MiB, codec={codec.name}")
+
+    _measure(
+        "dict + model",
+        lambda: CrawlJobResponse(**APIResponse.from_content(content, codec).data),
+    )
+    _measure(
+        "validate_json",
+        lambda: APIResponse.from_content(content, codec).to_model(CrawlJobResponse),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Measure per-request runtime connection resolution on a sandbox handle.
+
+Runs ``files.stat`` against a local stand-in for the sandbox runtime, then
+times connection resolution alone, comparing the cached connection with the
+previous path that deep-copied the session on every request.
+
+Run with ``python benchmarks/runtime_connection.py [requests]``.
+"""
+
+import json
+import sys
+import threading
+import time
+import timeit
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hyperbrowser.client.managers.sync_manager.sandbox import SandboxHandle
+from hyperbrowser.json_codec import STDLIB_JSON_CODEC
+from hyperbrowser.models import SandboxDetail
+from hyperbrowser.sandbox_common import RuntimeConnection
+
+_STAT_BODY = json.dumps(
+    {
+        "file": {
+            "path": "/tmp/data.txt",
+            "name": "data.txt",
+            "type": "file",
+            "size": 12,
+            "mode": 420,
+            "permissions": "-rw-r--r--",
+            "owner": "root",
+            "group": "root",
+        }
+    }
+).encode()
+
+
+class _RuntimeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_STAT_BODY)))
+        self.end_headers()
+        self.wfile.write(_STAT_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Service:
+    runtime_timeout = 30
+    runtime_proxy_override = None
+    json_codec = STDLIB_JSON_CODEC
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    def get_detail(self, sandbox_id: str) -> SandboxDetail:
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        return SandboxDetail(
+            id=sandbox_id,
+            teamId="team_1",
+            status="active",
+            startTime=0,
+            createdAt="2026-01-01T00:00:00Z",
+            updatedAt="2026-01-01T00:00:00Z",
+            region="us",
+            sessionUrl="http://localhost/session",
+            duration=0,
+            runtime={
+                "transport": "regional_proxy",
+                "host": self.base_url,
+                "baseUrl": f"{self.base_url}/sandbox/sbx_bench",
+            },
+            token="tok_bench",
+            tokenExpiresAt=expires_at.isoformat(),
+        )
+
+
+def _deep_copy_resolver(sandbox: SandboxHandle):
+    def resolve(force_refresh: bool = False) -> RuntimeConnection:
+        session = sandbox.create_runtime_session(force_refresh=force_refresh)
+        return RuntimeConnection(
+            sandbox_id=sandbox.id,
+            base_url=session.runtime.base_url,
+            token=session.token,
+        )
+
+    return resolve
+
+
+def _run_stats(sandbox: SandboxHandle, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        sandbox.files.stat("/tmp/data.txt")
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RuntimeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = _Service(f"http://127.0.0.1:{server.server_address[1]}")
+    sandbox = SandboxHandle(service, service.get_detail("sbx_bench"))
+
+    try:
+        elapsed = _run_stats(sandbox, requests)
+        print(
+            f"files.stat x {requests}: {elapsed:.2f} s "
+            f"({elapsed / requests * 1_000_000:.0f} us/request)"
+        )
+
+        legacy = _deep_copy_resolver(sandbox)
+        for label, resolve in (
+            ("deep-copy resolve", legacy),
+            ("cached resolve", sandbox._resolve_runtime_connection),
+        ):
+            per_call = min(timeit.repeat(resolve, number=requests, repeat=5)) / requests
+            print(f"{label:<20} {per_call * 1_000_000:8.2f} us")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,29 @@
-from .client.sync import Hyperbrowser
-from .client.async_client import AsyncHyperbrowser
-from .config import ClientConfig
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client.sync import Hyperbrowser
+    from .client.async_client import AsyncHyperbrowser
+    from .config import ClientConfig
+
+_LAZY_IMPORTS = {
+    "Hyperbrowser": ".client.sync",
+    "AsyncHyperbrowser": ".client.async_client",
+    "ClientConfig": ".config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = ["Hyperbrowser", "AsyncHyperbrowser", "ClientConfig"]
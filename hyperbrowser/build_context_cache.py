@@ -0,0 +1,259 @@
+"""Local cache for packaging remote Dockerfile build contexts.
+
+``build_image_from_dockerfile`` packs the build context into gzip-compressed
+tar bundles. With a ``BuildContextCache``, content digests of context files
+are kept per path, size, modification time and inode, and every bundle is
+kept under a fingerprint of its entry list. An unchanged bundle is reused
+without reading, tarring or compressing its files again, and its sha256 is
+known before the build is created. The cache is disabled unless a
+``BuildContextCache`` is passed as ``context_cache``.
+"""
+
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from .models.sandbox import SandboxBuildContextBundle
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS files (
+        root TEXT NOT NULL,
+        relative TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        inode INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        PRIMARY KEY (root, relative)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bundles (
+        fingerprint TEXT PRIMARY KEY,
+        sha256 TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        uncompressed_size_bytes INTEGER NOT NULL,
+        entry_count INTEGER NOT NULL,
+        used_at REAL NOT NULL
+    )
+    """,
+)
+
+FileDigest = Tuple[int, int, int, str]
+"""``(size, mtime_ns, inode, sha256)`` of a context file."""
+
+
+@dataclass(frozen=True)
+class BuildContextCacheStats:
+    """Counters describing how a ``BuildContextCache`` has been used."""
+
+    bundle_hits: int = 0
+    bundle_misses: int = 0
+    file_hits: int = 0
+    file_misses: int = 0
+
+
+class BuildContextCache:
+    """
+    Persistent cache of file digests and packaged build-context bundles.
+
+    ``path`` is a directory holding a SQLite index and the cached bundles.
+    ``max_bundle_bytes`` bounds the bundles kept on disk by dropping the
+    least recently used ones. Bundles are hard-linked into each build's
+    workspace where the filesystem allows it, and copied otherwise.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_bundle_bytes: int = 4 * 1024 * 1024 * 1024,
+    ):
+        if max_bundle_bytes < 0:
+            raise ValueError("max_bundle_bytes must not be negative")
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_bundle_bytes = max_bundle_bytes
+        self._bundle_directory = os.path.join(self.path, "bundles")
+        self._lock = threading.Lock()
+        self._counters = {name: 0 for name in BuildContextCacheStats.__annotations__}
+        self._connection = self._connect(self.path)
+        os.makedirs(self._bundle_directory, exist_ok=True)
+
+    @staticmethod
+    def _connect(path: str) -> Any:
+        import sqlite3
+
+        os.makedirs(path, exist_ok=True)
+        connection = sqlite3.connect(
+            os.path.join(path, "index.sqlite3"), check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+        return connection
+
+    @property
+    def stats(self) -> BuildContextCacheStats:
+        with self._lock:
+            return BuildContextCacheStats(**self._counters)
+
+    def file_digests(self, root: str) -> Dict[str, FileDigest]:
+        """Return the cached digests of files under the context ``root``."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT relative, size, mtime_ns, inode, sha256 FROM files "
+                "WHERE root = ?",
+                (root,),
+            ).fetchall()
+        return {row[0]: (row[1], row[2], row[3], row[4]) for row in rows}
+
+    def store_file_digests(
+        self,
+        root: str,
+        digests: Iterable[Tuple[str, FileDigest]],
+        *,
+        hits: int = 0,
+    ) -> None:
+        """Record newly computed digests; ``hits`` counts reused ones."""
+        rows = [(root, relative, *digest) for relative, digest in digests]
+        with self._lock:
+            self._counters["file_hits"] += hits
+            self._counters["file_misses"] += len(rows)
+            if not rows:
+                return
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO files "
+                "(root, relative, size, mtime_ns, inode, sha256) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def reuse_bundle(
+        self, fingerprint: str, destination: str
+    ) -> Optional[SandboxBuildContextBundle]:
+        """Place the bundle cached under ``fingerprint`` at ``destination``.
+
+        Returns its descriptor, or ``None`` when nothing usable is cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT sha256, size_bytes, uncompressed_size_bytes, entry_count "
+                "FROM bundles WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+            if row is not None:
+                source = self._bundle_path(row[0])
+                try:
+                    if os.path.getsize(source) != row[1]:
+                        raise FileNotFoundError(source)
+                    _link_or_copy(source, destination)
+                except OSError:
+                    self._connection.execute(
+                        "DELETE FROM bundles WHERE fingerprint = ?", (fingerprint,)
+                    )
+                    self._connection.commit()
+                    row = None
+            if row is None:
+                self._counters["bundle_misses"] += 1
+                return None
+            self._connection.execute(
+                "UPDATE bundles SET used_at = ? WHERE fingerprint = ?",
+                (time.time(), fingerprint),
+            )
+            self._connection.commit()
+            self._counters["bundle_hits"] += 1
+        return SandboxBuildContextBundle(
+            sha256=row[0],
+            size_bytes=row[1],
+            uncompressed_size_bytes=row[2],
+            entry_count=row[3],
+        )
+
+    def store_bundle(
+        self,
+        fingerprint: str,
+        path: str,
+        descriptor: SandboxBuildContextBundle,
+    ) -> None:
+        """Keep the bundle at ``path`` for later builds with ``fingerprint``."""
+        if descriptor.size_bytes > self.max_bundle_bytes:
+            return
+        target = self._bundle_path(descriptor.sha256)
+        with self._lock:
+            if not os.path.exists(target):
+                partial = f"{target}.{os.getpid()}.{threading.get_ident()}.partial"
+                try:
+                    _link_or_copy(path, partial)
+                    os.replace(partial, target)
+                except OSError:
+                    _remove_file(partial)
+                    return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO bundles (fingerprint, sha256, size_bytes, "
+                "uncompressed_size_bytes, entry_count, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    fingerprint,
+                    descriptor.sha256,
+                    descriptor.size_bytes,
+                    descriptor.uncompressed_size_bytes,
+                    descriptor.entry_count,
+                    time.time(),
+                ),
+            )
+            self._evict_bundles()
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Drop every cached digest and bundle. Counters are kept."""
+        with self._lock:
+            self._connection.execute("DELETE FROM files")
+            self._connection.execute("DELETE FROM bundles")
+            self._connection.commit()
+            shutil.rmtree(self._bundle_directory, ignore_errors=True)
+            os.makedirs(self._bundle_directory, exist_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _bundle_path(self, sha256: str) -> str:
+        return os.path.join(self._bundle_directory, f"{sha256}.tar.gz")
+
+    def _evict_bundles(self) -> None:
+        rows = self._connection.execute(
+            "SELECT fingerprint, sha256, size_bytes FROM bundles "
+            "ORDER BY used_at DESC"
+        ).fetchall()
+        kept_bytes = 0
+        kept = set()
+        for fingerprint, sha256, size_bytes in rows:
+            if sha256 in kept:
+                continue
+            if kept_bytes + size_bytes <= self.max_bundle_bytes:
+                kept_bytes += size_bytes
+                kept.add(sha256)
+                continue
+            self._connection.execute("DELETE FROM bundles WHERE sha256 = ?", (sha256,))
+            _remove_file(self._bundle_path(sha256))
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+__all__ = ["BuildContextCache", "BuildContextCacheStats"]
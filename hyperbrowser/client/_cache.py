@@ -0,0 +1,36 @@
+from typing import Any, Dict, Optional
+
+from hyperbrowser.json_codec import JsonCodec
+from hyperbrowser.transport.base import APIResponse
+
+
+def cache_key(client: Any, url: str, payload: Dict[str, Any]) -> Optional[str]:
+    """Cache key for a request, or ``None`` when the client has no cache."""
+    cache = getattr(client, "response_cache", None)
+    if cache is None:
+        return None
+    return cache.make_key(url, payload, scope=client.config.api_key)
+
+
+def requested_max_age(payload: Dict[str, Any]) -> Optional[float]:
+    """Freshness limit requested through ``cache.maxAgeSeconds``, if any.
+
+    The option already bounds how old a server-side cached page may be, so
+    the client cache applies the same limit.
+    """
+    options = payload.get("cache")
+    if isinstance(options, dict):
+        max_age = options.get("maxAgeSeconds")
+        if isinstance(max_age, (int, float)) and not isinstance(max_age, bool):
+            return float(max_age)
+    return None
+
+
+def response_content(response: APIResponse, json_codec: JsonCodec) -> bytes:
+    if response.content is not None:
+        return response.content
+    return json_codec.dumps(response.data)
+
+
+def cached_response(content: bytes, json_codec: JsonCodec) -> APIResponse:
+    return APIResponse.from_content(content, json_codec)
@@ -0,0 +1,84 @@
+from collections.abc import Mapping
+from typing import Any, Dict, List, Type
+
+from pydantic import BaseModel
+
+from hyperbrowser.client._request import dump_request
+from hyperbrowser.models import (
+    ClickActionParams,
+    ComputerAction,
+    DragActionParams,
+    GetClipboardTextActionParams,
+    HoldKeyActionParams,
+    ListWindowsActionParams,
+    MouseDownActionParams,
+    MouseUpActionParams,
+    MoveMouseActionParams,
+    PressKeysActionParams,
+    PutSelectionTextActionParams,
+    ScreenshotActionParams,
+    ScrollActionParams,
+    TypeTextActionParams,
+)
+
+ACTION_PARAM_MODELS = {
+    ComputerAction.CLICK.value: ClickActionParams,
+    ComputerAction.DRAG.value: DragActionParams,
+    ComputerAction.HOLD_KEY.value: HoldKeyActionParams,
+    ComputerAction.MOUSE_DOWN.value: MouseDownActionParams,
+    ComputerAction.MOUSE_UP.value: MouseUpActionParams,
+    ComputerAction.MOVE_MOUSE.value: MoveMouseActionParams,
+    ComputerAction.PRESS_KEYS.value: PressKeysActionParams,
+    ComputerAction.SCREENSHOT.value: ScreenshotActionParams,
+    ComputerAction.SCROLL.value: ScrollActionParams,
+    ComputerAction.TYPE_TEXT.value: TypeTextActionParams,
+    ComputerAction.GET_CLIPBOARD_TEXT.value: GetClipboardTextActionParams,
+    ComputerAction.PUT_SELECTION_TEXT.value: PutSelectionTextActionParams,
+    ComputerAction.LIST_WINDOWS.value: ListWindowsActionParams,
+}
+
+
+def action_param_model(params) -> Type[BaseModel]:
+    for model in ACTION_PARAM_MODELS.values():
+        if isinstance(params, model):
+            return model
+
+    if isinstance(params, Mapping):
+        action = params.get("action")
+        if isinstance(action, ComputerAction):
+            action = action.value
+        model = ACTION_PARAM_MODELS.get(action)
+        if model is not None:
+            return model
+
+    raise TypeError("params must be a computer action params instance or mapping")
+
+
+def sequence_payloads(
+    actions, return_screenshot: bool, validate: bool = True
+) -> List[Dict[str, Any]]:
+    """Serialize the actions of a ``sequence`` call.
+
+    Only the last action may return a screenshot, and only when
+    ``return_screenshot`` is set; asking for one after an action that cannot
+    return screenshots raises ``ValueError``.
+    """
+    if isinstance(actions, (str, bytes, Mapping)) or not actions:
+        raise ValueError("actions must be a non-empty sequence of computer actions")
+
+    models = [action_param_model(action) for action in actions]
+    payloads = [
+        dump_request(action, model, name="actions", validate=validate)
+        for action, model in zip(actions, models)
+    ]
+    for payload in payloads:
+        if "returnScreenshot" in payload:
+            payload["returnScreenshot"] = False
+    if return_screenshot:
+        if "return_screenshot" not in models[-1].model_fields:
+            raise ValueError(
+                "return_screenshot requires a last action that can return a "
+                f"screenshot; {models[-1].__name__} cannot"
+            )
+        payloads[-1]["returnScreenshot"] = True
+    return payloads
@@ -1,9 +1,28 @@
-from collections.abc import Mapping
+import json
+import threading
+import types
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
 from copy import deepcopy
-from typing import Any, Dict, Type, TypeVar
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import jsonref
-from pydantic import BaseModel
+from pydantic import BaseModel, PlainSerializer, WrapSerializer
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated, get_args, get_origin
 
 
 RequestModelT = TypeVar("RequestModelT", bound=BaseModel)
@@ -26,15 +45,222 @@ def coerce_request(
     )
 
 
+class _NotPlainValue(Exception):
+    pass
+
+
+_PLAIN_SCALARS = (str, int, float, bool, bytes, type(None))
+_PLAIN_CONTAINERS = (list, tuple, dict, set, frozenset)
+_UNION_TYPES = tuple(
+    union for union in (Union, getattr(types, "UnionType", None)) if union
+)
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """Whether values of ``annotation`` serialize to themselves in python mode."""
+    if annotation is Any or annotation in _PLAIN_SCALARS:
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        base, *metadata = get_args(annotation)
+        return not any(
+            isinstance(item, (PlainSerializer, WrapSerializer)) for item in metadata
+        ) and _is_plain_annotation(base)
+    if origin in _PLAIN_CONTAINERS or origin in _UNION_TYPES:
+        return all(
+            _is_plain_annotation(arg) for arg in get_args(annotation) if arg is not ...
+        )
+    return False
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    """Whether a plain annotation only admits immutable values."""
+    if annotation is Any:
+        return False
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _is_scalar_annotation(get_args(annotation)[0])
+    if origin in _UNION_TYPES:
+        return all(_is_scalar_annotation(arg) for arg in get_args(annotation))
+    return origin not in _PLAIN_CONTAINERS
+
+
+def _copy_plain(value: Any, enum_values: bool = False) -> Any:
+    if type(value) in _PLAIN_SCALARS:
+        return value
+    if isinstance(value, Enum):
+        return value.value if enum_values else value
+    if isinstance(value, _PLAIN_SCALARS):
+        return value
+    if isinstance(value, list):
+        return [_copy_plain(item, enum_values) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy_plain(item, enum_values) for key, item in value.items()}
+    if isinstance(value, (tuple, set, frozenset)):
+        return type(value)(_copy_plain(item, enum_values) for item in value)
+    raise _NotPlainValue
+
+
+class _WireField(NamedTuple):
+    name: str
+    input_keys: Tuple[str, ...]
+    wire_key: str
+    scalar: bool
+    required: bool
+    default: Any
+    field: FieldInfo
+
+
+class _WirePlan:
+    """Field-to-alias mapping used to serialize a flat request model."""
+
+    __slots__ = ("fields", "dump_fields", "enum_values")
+
+    def __init__(self, fields: Tuple[_WireField, ...], enum_values: bool):
+        self.fields = fields
+        self.dump_fields = tuple(
+            (field.name, field.wire_key, field.scalar) for field in fields
+        )
+        self.enum_values = enum_values
+
+    def dump(self, value: BaseModel, exclude_unset: bool) -> Dict[str, Any]:
+        values = value.__dict__
+        fields_set = value.model_fields_set if exclude_unset else None
+        payload = {}
+        for name, wire_key, scalar in self.dump_fields:
+            if fields_set is not None and name not in fields_set:
+                continue
+            item = values[name]
+            if item is not None:
+                payload[wire_key] = item if scalar else _copy_plain(item)
+        return payload
+
+    def dump_trusted(
+        self, value: Mapping, exclude_unset: bool
+    ) -> Optional[Dict[str, Any]]:
+        enum_values = self.enum_values
+        payload = {}
+        for field in self.fields:
+            for key in field.input_keys:
+                if key in value:
+                    item = value[key]
+                    break
+            else:
+                if field.required:
+                    return None
+                if exclude_unset:
+                    continue
+                if field.field.default_factory is None:
+                    item = field.default
+                else:
+                    item = field.field.get_default(call_default_factory=True)
+            if item is not None:
+                payload[field.wire_key] = _copy_plain(item, enum_values)
+        return payload
+
+
+@lru_cache(maxsize=None)
+def _wire_plan(model: Type[BaseModel]) -> Optional[_WirePlan]:
+    """Precompute how a flat request model maps onto its wire dictionary.
+
+    Returns ``None`` for models whose serialization cannot be reproduced by a
+    plain field-to-alias copy: nested models, custom serializers, computed or
+    extra fields and overridden ``model_dump`` implementations.
+    """
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.computed_fields
+        or model.model_config.get("extra") == "allow"
+        or model.model_dump is not BaseModel.model_dump
+    ):
+        return None
+
+    enum_values = bool(model.model_config.get("use_enum_values"))
+    fields = []
+    for name, field in model.model_fields.items():
+        if field.exclude:
+            continue
+        if not _is_plain_annotation(field.annotation) or any(
+            isinstance(item, (PlainSerializer, WrapSerializer))
+            for item in field.metadata
+        ):
+            return None
+        default = None
+        if field.default_factory is None and not field.is_required():
+            try:
+                default = _copy_plain(field.default, enum_values)
+            except _NotPlainValue:
+                return None
+        fields.append(
+            _WireField(
+                name=name,
+                input_keys=tuple(
+                    dict.fromkeys(
+                        key
+                        for key in (name, field.alias, field.validation_alias)
+                        if isinstance(key, str)
+                    )
+                ),
+                wire_key=field.serialization_alias or field.alias or name,
+                scalar=_is_scalar_annotation(field.annotation),
+                required=field.is_required(),
+                default=default,
+                field=field,
+            )
+        )
+    return _WirePlan(tuple(fields), enum_values)
+
+
+@lru_cache(maxsize=None)
+def _accepts_trusted_input(model: Type[BaseModel]) -> bool:
+    # Validators may rewrite values, so their models are always validated.
+    decorators = model.__pydantic_decorators__
+    return not (
+        decorators.field_validators
+        or decorators.model_validators
+        or decorators.validators
+        or decorators.root_validators
+    )
+
+
 def dump_request(
     value: Any,
     model: Type[RequestModelT],
     *,
     exclude_unset: bool = False,
     name: str = "params",
+    validate: bool = True,
 ) -> Dict[str, Any]:
-    """Validate and serialize a request using its existing wire contract."""
+    """Validate and serialize a request using its existing wire contract.
+
+    Flat request models are serialized with a cached field-to-alias plan
+    instead of ``model_dump``. ``validate=False`` marks a mapping input as
+    trusted: it is copied straight to the wire format without Pydantic
+    validation when the model allows it, and validated as usual otherwise.
+    """
+    if not validate and isinstance(value, Mapping):
+        plan = _wire_plan(model)
+        if plan is not None and _accepts_trusted_input(model):
+            try:
+                payload = plan.dump_trusted(value, exclude_unset)
+            except _NotPlainValue:
+                payload = None
+            if payload is not None:
+                return payload
+
     normalized = coerce_request(value, model, name=name)
+    plan = _wire_plan(type(normalized))
+    if plan is not None:
+        try:
+            return plan.dump(normalized, exclude_unset)
+        except _NotPlainValue:
+            pass
     return normalized.model_dump(
         by_alias=True,
         exclude_none=True,
@@ -42,8 +268,46 @@ def dump_request(
     )
 
 
-def normalize_pydantic_schema(value: Any) -> Any:
-    """Copy a schema input, resolving refs only for Pydantic schema providers."""
+_SCHEMA_CACHE_SIZE = 256
+_schema_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def _freeze_schema(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType(
+            {key: _freeze_schema(item) for key, item in value.items()}
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_schema(item) for item in value)
+    return value
+
+
+def _thaw_schema(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw_schema(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_schema(item) for item in value]
+    return value
+
+
+def _schema_cache_key(value: Any) -> Optional[Hashable]:
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return ("model", value)
+    if isinstance(value, BaseModel):
+        return ("model", type(value))
+    if hasattr(value, "model_json_schema"):
+        # Structural providers may build their schema dynamically.
+        return None
+    if isinstance(value, (Mapping, list)):
+        try:
+            return ("json", json.dumps(value, allow_nan=False))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _resolve_schema(value: Any) -> Any:
     if hasattr(value, "model_json_schema"):
         return jsonref.replace_refs(
             value.model_json_schema(),
@@ -53,6 +317,30 @@ def normalize_pydantic_schema(value: Any) -> Any:
     return deepcopy(value)
 
 
+def normalize_pydantic_schema(value: Any) -> Any:
+    """Copy a schema input, resolving refs only for Pydantic schema providers.
+
+    Resolved schemas are memoized per Pydantic model class, and per JSON
+    content for plain schemas, in a bounded LRU cache of frozen structures.
+    Every call returns a fresh mutable copy.
+    """
+    key = _schema_cache_key(value)
+    if key is None:
+        return _resolve_schema(value)
+
+    with _schema_cache_lock:
+        frozen = _schema_cache.get(key)
+        if frozen is not None:
+            _schema_cache.move_to_end(key)
+    if frozen is None:
+        frozen = _freeze_schema(_resolve_schema(value))
+        with _schema_cache_lock:
+            _schema_cache[key] = frozen
+            if len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+                _schema_cache.popitem(last=False)
+    return _thaw_schema(frozen)
+
+
 def dump_request_with_schema(
     value: Any,
     model: Type[RequestModelT],
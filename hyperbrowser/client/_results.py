@@ -0,0 +1,151 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from hyperbrowser.json_stream import JsonArrayStreamDecoder
+from hyperbrowser.models.consts import ResultMode
+from hyperbrowser.models.lazy import LazyJobResponse, LazyModel
+from hyperbrowser.transport.base import APIResponse, get_type_adapter
+
+JobResponseT = TypeVar("JobResponseT", bound=BaseModel)
+
+_RESULT_MODES = ("model", "dict", "lazy")
+
+
+def validate_result_mode(result_mode: ResultMode) -> ResultMode:
+    if result_mode not in _RESULT_MODES:
+        raise ValueError(
+            f"result_mode must be one of {', '.join(_RESULT_MODES)}, "
+            f"got {result_mode!r}"
+        )
+    return result_mode
+
+
+def batch_result_mode(result_mode: ResultMode) -> Literal["model", "lazy"]:
+    """Mode used for the page batches fetched by ``start_and_wait``.
+
+    ``"dict"`` jobs fetch lazy batches, which keep their wire payload, and
+    ``merge_job_batches`` turns them back into a dictionary at the end.
+    """
+    if validate_result_mode(result_mode) == "model":
+        return "model"
+    return "lazy"
+
+
+def parse_job_response(
+    response: APIResponse,
+    model: Type[JobResponseT],
+    page_model: Type[BaseModel],
+    result_mode: ResultMode,
+) -> Any:
+    """Parse a paginated job response according to ``result_mode``.
+
+    ``"model"`` validates everything, ``"dict"`` returns the decoded payload
+    and ``"lazy"`` returns a ``LazyJobResponse`` that validates the job fields
+    while wrapping each page in a ``LazyModel``.
+    """
+    if validate_result_mode(result_mode) == "model":
+        return response.to_model(model)
+
+    payload = response.data
+    if result_mode == "dict":
+        return payload
+    return LazyJobResponse(model, page_model, payload)
+
+
+def merge_job_batches(
+    last_batch: LazyJobResponse,
+    pages: Optional[List[LazyModel]],
+    result_mode: ResultMode,
+) -> Any:
+    """Combine the page batches fetched by ``start_and_wait``.
+
+    The result is the last batch's wire payload carrying every page, so
+    ``"dict"`` jobs match what ``get(result_mode="dict")`` returns.
+    """
+    payload = last_batch.to_dict()
+    if pages or payload.get("data") is not None:
+        payload = {**payload, "data": [page.to_dict() for page in pages or []]}
+    if result_mode == "dict":
+        return payload
+    return LazyJobResponse(last_batch.model_class, last_batch.page_model_class, payload)
+
+
+def parse_job_page(
+    page: Dict[str, Any],
+    page_model: Type[BaseModel],
+    result_mode: ResultMode,
+) -> Any:
+    if result_mode == "model":
+        return get_type_adapter(page_model).validate_python(page)
+    if result_mode == "dict":
+        return page
+    return LazyModel(page_model, page)
+
+
+def _next_page_batch(envelope: Dict[str, Any], page_batch: int) -> Optional[int]:
+    current = envelope.get("currentPageBatch") or page_batch
+    total = envelope.get("totalPageBatches") or 0
+    return current + 1 if current < total else None
+
+
+def iter_job_pages(
+    transport: Any,
+    url: str,
+    params: Dict[str, Any],
+    page_model: Type[BaseModel],
+    result_mode: ResultMode,
+) -> Iterator[Any]:
+    """Iterate over every page of a job, streaming one page batch at a time.
+
+    Each batch body is decoded incrementally, so only the page being yielded
+    is held in memory rather than the whole batch.
+    """
+    validate_result_mode(result_mode)
+
+    def pages() -> Iterator[Any]:
+        query = dict(params)
+        page_batch: Optional[int] = query.get("page") or 1
+        while page_batch is not None:
+            query["page"] = page_batch
+            decoder = JsonArrayStreamDecoder("data", transport.json_codec)
+            for chunk in transport.stream_get(url, params=query):
+                for page in decoder.feed(chunk):
+                    yield parse_job_page(page, page_model, result_mode)
+            page_batch = _next_page_batch(decoder.close(), page_batch)
+
+    return pages()
+
+
+def aiter_job_pages(
+    transport: Any,
+    url: str,
+    params: Dict[str, Any],
+    page_model: Type[BaseModel],
+    result_mode: ResultMode,
+) -> AsyncIterator[Any]:
+    """Async counterpart of ``iter_job_pages``."""
+    validate_result_mode(result_mode)
+
+    async def pages() -> AsyncIterator[Any]:
+        query = dict(params)
+        page_batch: Optional[int] = query.get("page") or 1
+        while page_batch is not None:
+            query["page"] = page_batch
+            decoder = JsonArrayStreamDecoder("data", transport.json_codec)
+            async for chunk in transport.stream_get(url, params=query):
+                for page in decoder.feed(chunk):
+                    yield parse_job_page(page, page_model, result_mode)
+            page_batch = _next_page_batch(decoder.close(), page_batch)
+
+    return pages()
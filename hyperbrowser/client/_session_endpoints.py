@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+COMPUTER_ACTION_ENDPOINT_TTL_SECONDS = 300.0
+COMPUTER_ACTION_ENDPOINT_MAX_ENTRIES = 1024
+
+
+class SessionEndpointCache:
+    """
+    Bounded, thread-safe cache of ``computer_action_endpoint`` per session id.
+
+    Lets computer actions addressed by session id skip the session lookup
+    that would otherwise precede every action. Entries expire after
+    ``ttl_seconds`` and the least recently used ones are dropped beyond
+    ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = COMPUTER_ACTION_ENDPOINT_TTL_SECONDS,
+        max_entries: int = COMPUTER_ACTION_ENDPOINT_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return entry[1]
+
+    def set(self, session_id: str, endpoint: str) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[session_id] = (time.monotonic() + self.ttl_seconds, endpoint)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,20 +1,23 @@
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
 from ..config import ClientConfig
 from ..transport.async_transport import AsyncTransport
 from .base import HyperbrowserBase
-from .managers.async_manager.web import WebManager
-from .managers.async_manager.agents import Agents
-from .managers.async_manager.crawl import CrawlManager
-from .managers.async_manager.extension import ExtensionManager
-from .managers.async_manager.extract import ExtractManager
-from .managers.async_manager.profile import ProfileManager
-from .managers.async_manager.sandbox import SandboxManager
-from .managers.async_manager.scrape import ScrapeManager
-from .managers.async_manager.session import SessionManager
-from .managers.async_manager.team import TeamManager
-from .managers.async_manager.computer_action import ComputerActionManager
-from .managers.async_manager.volume import VolumeManager
+
+if TYPE_CHECKING:
+    from .managers.async_manager.agents import Agents
+    from .managers.async_manager.computer_action import ComputerActionManager
+    from .managers.async_manager.crawl import CrawlManager
+    from .managers.async_manager.extension import ExtensionManager
+    from .managers.async_manager.extract import ExtractManager
+    from .managers.async_manager.profile import ProfileManager
+    from .managers.async_manager.sandbox import SandboxManager
+    from .managers.async_manager.scrape import ScrapeManager
+    from .managers.async_manager.session import SessionManager
+    from .managers.async_manager.team import TeamManager
+    from .managers.async_manager.volume import VolumeManager
+    from .managers.async_manager.web import WebManager
 
 
 class AsyncHyperbrowser(HyperbrowserBase):
@@ -37,18 +40,78 @@ class AsyncHyperbrowser(HyperbrowserBase):
         )
         self.timeout = timeout or 30
         self.transport.client.timeout = timeout
-        self.sessions = SessionManager(self)
-        self.web = WebManager(self)
-        self.scrape = ScrapeManager(self)
-        self.crawl = CrawlManager(self)
-        self.extract = ExtractManager(self)
-        self.profiles = ProfileManager(self)
-        self.extensions = ExtensionManager(self)
-        self.agents = Agents(self)
-        self.team = TeamManager(self)
-        self.computer_action = ComputerActionManager(self)
-        self.sandboxes = SandboxManager(self)
-        self.volumes = VolumeManager(self)
+
+    @cached_property
+    def sessions(self) -> "SessionManager":
+        from .managers.async_manager.session import SessionManager
+
+        return SessionManager(self)
+
+    @cached_property
+    def web(self) -> "WebManager":
+        from .managers.async_manager.web import WebManager
+
+        return WebManager(self)
+
+    @cached_property
+    def scrape(self) -> "ScrapeManager":
+        from .managers.async_manager.scrape import ScrapeManager
+
+        return ScrapeManager(self)
+
+    @cached_property
+    def crawl(self) -> "CrawlManager":
+        from .managers.async_manager.crawl import CrawlManager
+
+        return CrawlManager(self)
+
+    @cached_property
+    def extract(self) -> "ExtractManager":
+        from .managers.async_manager.extract import ExtractManager
+
+        return ExtractManager(self)
+
+    @cached_property
+    def profiles(self) -> "ProfileManager":
+        from .managers.async_manager.profile import ProfileManager
+
+        return ProfileManager(self)
+
+    @cached_property
+    def extensions(self) -> "ExtensionManager":
+        from .managers.async_manager.extension import ExtensionManager
+
+        return ExtensionManager(self)
+
+    @cached_property
+    def agents(self) -> "Agents":
+        from .managers.async_manager.agents import Agents
+
+        return Agents(self)
+
+    @cached_property
+    def team(self) -> "TeamManager":
+        from .managers.async_manager.team import TeamManager
+
+        return TeamManager(self)
+
+    @cached_property
+    def computer_action(self) -> "ComputerActionManager":
+        from .managers.async_manager.computer_action import ComputerActionManager
+
+        return ComputerActionManager(self)
+
+    @cached_property
+    def sandboxes(self) -> "SandboxManager":
+        from .managers.async_manager.sandbox import SandboxManager
+
+        return SandboxManager(self)
+
+    @cached_property
+    def volumes(self) -> "VolumeManager":
+        from .managers.async_manager.volume import VolumeManager
+
+        return VolumeManager(self)
 
     async def close(self) -> None:
         await self.transport.close()
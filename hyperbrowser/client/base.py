@@ -2,7 +2,9 @@ from typing import Optional
 
 from hyperbrowser.exceptions import HyperbrowserError
 from ..config import ClientConfig
+from ..json_codec import get_json_codec
 from ..transport.base import TransportStrategy
+from ._session_endpoints import SessionEndpointCache
 import os
 
 
@@ -38,7 +40,14 @@ class HyperbrowserBase:
             raise HyperbrowserError("API key must be provided")
 
         self.config = config
-        self.transport = transport(config.api_key)
+        self.json_codec = get_json_codec(config.json_codec)
+        self.response_cache = config.response_cache
+        self._session_endpoints = SessionEndpointCache()
+        self.transport = transport(
+            config.api_key,
+            json_codec=self.json_codec,
+            coalesce_gets=config.coalesce_gets,
+        )
 
     def _build_url(self, path: str) -> str:
         return f"{self.config.base_url}/api{path}"
@@ -37,25 +37,25 @@ class BrowserUseManager:
             self._client._build_url("/task/browser-use"),
             data=payload,
         )
-        return StartBrowserUseTaskResponse(**response.data)
+        return response.to_model(StartBrowserUseTaskResponse)
 
     async def get(self, job_id: str) -> BrowserUseTaskResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/browser-use/{job_id}")
         )
-        return BrowserUseTaskResponse(**response.data)
+        return response.to_model(BrowserUseTaskResponse)
 
     async def get_status(self, job_id: str) -> BrowserUseTaskStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/browser-use/{job_id}/status")
         )
-        return BrowserUseTaskStatusResponse(**response.data)
+        return response.to_model(BrowserUseTaskStatusResponse)
 
     async def stop(self, job_id: str) -> BasicResponse:
         response = await self._client.transport.put(
             self._client._build_url(f"/task/browser-use/{job_id}/stop")
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     async def start_and_wait(
         self,
@@ -32,25 +32,25 @@ class ClaudeComputerUseManager:
             self._client._build_url("/task/claude-computer-use"),
             data=dump_request(params, StartClaudeComputerUseTaskParams),
         )
-        return StartClaudeComputerUseTaskResponse(**response.data)
+        return response.to_model(StartClaudeComputerUseTaskResponse)
 
     async def get(self, job_id: str) -> ClaudeComputerUseTaskResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/claude-computer-use/{job_id}")
         )
-        return ClaudeComputerUseTaskResponse(**response.data)
+        return response.to_model(ClaudeComputerUseTaskResponse)
 
     async def get_status(self, job_id: str) -> ClaudeComputerUseTaskStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/claude-computer-use/{job_id}/status")
         )
-        return ClaudeComputerUseTaskStatusResponse(**response.data)
+        return response.to_model(ClaudeComputerUseTaskStatusResponse)
 
     async def stop(self, job_id: str) -> BasicResponse:
         response = await self._client.transport.put(
             self._client._build_url(f"/task/claude-computer-use/{job_id}/stop")
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     async def start_and_wait(
         self,
@@ -27,25 +27,25 @@ class CuaManager:
             self._client._build_url("/task/cua"),
             data=dump_request(params, StartCuaTaskParams),
         )
-        return StartCuaTaskResponse(**response.data)
+        return response.to_model(StartCuaTaskResponse)
 
     async def get(self, job_id: str) -> CuaTaskResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/cua/{job_id}")
         )
-        return CuaTaskResponse(**response.data)
+        return response.to_model(CuaTaskResponse)
 
     async def get_status(self, job_id: str) -> CuaTaskStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/cua/{job_id}/status")
         )
-        return CuaTaskStatusResponse(**response.data)
+        return response.to_model(CuaTaskStatusResponse)
 
     async def stop(self, job_id: str) -> BasicResponse:
         response = await self._client.transport.put(
             self._client._build_url(f"/task/cua/{job_id}/stop")
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     async def start_and_wait(
         self,
@@ -32,25 +32,25 @@ class GeminiComputerUseManager:
             self._client._build_url("/task/gemini-computer-use"),
             data=dump_request(params, StartGeminiComputerUseTaskParams),
         )
-        return StartGeminiComputerUseTaskResponse(**response.data)
+        return response.to_model(StartGeminiComputerUseTaskResponse)
 
     async def get(self, job_id: str) -> GeminiComputerUseTaskResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/gemini-computer-use/{job_id}")
         )
-        return GeminiComputerUseTaskResponse(**response.data)
+        return response.to_model(GeminiComputerUseTaskResponse)
 
     async def get_status(self, job_id: str) -> GeminiComputerUseTaskStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/gemini-computer-use/{job_id}/status")
         )
-        return GeminiComputerUseTaskStatusResponse(**response.data)
+        return response.to_model(GeminiComputerUseTaskStatusResponse)
 
     async def stop(self, job_id: str) -> BasicResponse:
         response = await self._client.transport.put(
             self._client._build_url(f"/task/gemini-computer-use/{job_id}/stop")
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     async def start_and_wait(
         self,
@@ -29,25 +29,25 @@ class HyperAgentManager:
             self._client._build_url("/task/hyper-agent"),
             data=dump_request(params, StartHyperAgentTaskParams),
         )
-        return StartHyperAgentTaskResponse(**response.data)
+        return response.to_model(StartHyperAgentTaskResponse)
 
     async def get(self, job_id: str) -> HyperAgentTaskResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/hyper-agent/{job_id}")
         )
-        return HyperAgentTaskResponse(**response.data)
+        return response.to_model(HyperAgentTaskResponse)
 
     async def get_status(self, job_id: str) -> HyperAgentTaskStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/task/hyper-agent/{job_id}/status")
         )
-        return HyperAgentTaskStatusResponse(**response.data)
+        return response.to_model(HyperAgentTaskStatusResponse)
 
     async def stop(self, job_id: str) -> BasicResponse:
         response = await self._client.transport.put(
             self._client._build_url(f"/task/hyper-agent/{job_id}/stop")
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     async def start_and_wait(
         self,
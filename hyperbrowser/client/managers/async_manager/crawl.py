@@ -1,13 +1,21 @@
 import asyncio
-from typing import Optional, Union
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Union, overload
 
 from hyperbrowser.client._request import dump_request
-from hyperbrowser.models.consts import POLLING_ATTEMPTS
+from hyperbrowser.client._results import (
+    aiter_job_pages,
+    batch_result_mode,
+    merge_job_batches,
+    parse_job_response,
+)
+from hyperbrowser.models.consts import POLLING_ATTEMPTS, ResultMode
+from hyperbrowser.models.lazy import LazyJobResponse, LazyModel
 from hyperbrowser.types import (
     GetCrawlJobParams as GetCrawlJobParamsDict,
     StartCrawlJobParams as StartCrawlJobParamsDict,
 )
 from ....models.crawl import (
+    CrawledPage,
     CrawlJobResponse,
     CrawlJobStatus,
     CrawlJobStatusResponse,
@@ -30,32 +38,112 @@ class CrawlManager:
             self._client._build_url("/crawl"),
             data=dump_request(params, StartCrawlJobParams),
         )
-        return StartCrawlJobResponse(**response.data)
+        return response.to_model(StartCrawlJobResponse)
 
     async def get_status(self, job_id: str) -> CrawlJobStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/crawl/{job_id}/status")
         )
-        return CrawlJobStatusResponse(**response.data)
+        return response.to_model(CrawlJobStatusResponse)
+
+    @overload
+    async def get(
+        self,
+        job_id: str,
+        params: Optional[Union[GetCrawlJobParamsDict, GetCrawlJobParams]] = None,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> CrawlJobResponse: ...
+
+    @overload
+    async def get(
+        self,
+        job_id: str,
+        params: Optional[Union[GetCrawlJobParamsDict, GetCrawlJobParams]] = None,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[CrawlJobResponse, CrawledPage]: ...
+
+    @overload
+    async def get(
+        self,
+        job_id: str,
+        params: Optional[Union[GetCrawlJobParamsDict, GetCrawlJobParams]] = None,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
 
     async def get(
         self,
         job_id: str,
         params: Optional[Union[GetCrawlJobParamsDict, GetCrawlJobParams]] = None,
-    ) -> CrawlJobResponse:
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        CrawlJobResponse, LazyJobResponse[CrawlJobResponse, CrawledPage], Dict[str, Any]
+    ]:
         if params is None:
             params = GetCrawlJobParams()
         response = await self._client.transport.get(
             self._client._build_url(f"/crawl/{job_id}"),
             params=dump_request(params, GetCrawlJobParams),
         )
-        return CrawlJobResponse(**response.data)
+        return parse_job_response(response, CrawlJobResponse, CrawledPage, result_mode)
+
+    def iter_pages(
+        self,
+        job_id: str,
+        params: Optional[Union[GetCrawlJobParamsDict, GetCrawlJobParams]] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> AsyncIterator[Union[CrawledPage, LazyModel[CrawledPage], Dict[str, Any]]]:
+        if params is None:
+            params = GetCrawlJobParams()
+        return aiter_job_pages(
+            self._client.transport,
+            self._client._build_url(f"/crawl/{job_id}"),
+            dump_request(params, GetCrawlJobParams),
+            CrawledPage,
+            result_mode,
+        )
+
+    @overload
+    async def start_and_wait(
+        self,
+        params: Union[StartCrawlJobParamsDict, StartCrawlJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> CrawlJobResponse: ...
+
+    @overload
+    async def start_and_wait(
+        self,
+        params: Union[StartCrawlJobParamsDict, StartCrawlJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[CrawlJobResponse, CrawledPage]: ...
+
+    @overload
+    async def start_and_wait(
+        self,
+        params: Union[StartCrawlJobParamsDict, StartCrawlJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
 
     async def start_and_wait(
         self,
         params: Union[StartCrawlJobParamsDict, StartCrawlJobParams],
         return_all_pages: bool = True,
-    ) -> CrawlJobResponse:
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        CrawlJobResponse, LazyJobResponse[CrawlJobResponse, CrawledPage], Dict[str, Any]
+    ]:
+        page_result_mode = batch_result_mode(result_mode)
         job_start_resp = await self.start(params)
         job_id = job_start_resp.job_id
         if not job_id:
@@ -81,7 +169,7 @@ class CrawlManager:
         if not return_all_pages:
             while True:
                 try:
-                    return await self.get(job_id)
+                    return await self.get(job_id, result_mode=result_mode)
                 except Exception as e:
                     failures += 1
                     if failures >= POLLING_ATTEMPTS:
@@ -111,6 +199,7 @@ class CrawlManager:
                     GetCrawlJobParams(
                         page=job_response.current_page_batch + 1, batch_size=100
                     ),
+                    result_mode=page_result_mode,
                 )
                 if tmp_job_response.data:
                     job_response.data.extend(tmp_job_response.data)
@@ -129,4 +218,6 @@ class CrawlManager:
                     )
             await asyncio.sleep(0.5)
 
-        return job_response
+        if result_mode == "model":
+            return job_response
+        return merge_job_batches(tmp_job_response, job_response.data, result_mode)
@@ -29,7 +29,7 @@ class ExtensionManager:
                 data=dump_request(normalized, CreateExtensionParams),
                 files={"file": file_obj},
             )
-        return ExtensionResponse(**response.data)
+        return response.to_model(ExtensionResponse)
 
     async def list(self) -> List[ExtensionResponse]:
         response = await self._client.transport.get(
@@ -29,7 +29,7 @@ class ProfileManager:
             self._client._build_url("/profile"),
             data=({} if params is None else dump_request(params, CreateProfileParams)),
         )
-        return CreateProfileResponse(**response.data)
+        return response.to_model(CreateProfileResponse)
 
     async def fork(
         self,
@@ -40,19 +40,19 @@ class ProfileManager:
             self._client._build_url(f"/profile/{id}/fork"),
             data=({} if params is None else dump_request(params, ForkProfileParams)),
         )
-        return CreateProfileResponse(**response.data)
+        return response.to_model(CreateProfileResponse)
 
     async def get(self, id: str) -> ProfileResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/profile/{id}"),
         )
-        return ProfileResponse(**response.data)
+        return response.to_model(ProfileResponse)
 
     async def delete(self, id: str) -> BasicResponse:
         response = await self._client.transport.delete(
             self._client._build_url(f"/profile/{id}"),
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     async def list(
         self,
@@ -64,4 +64,4 @@ class ProfileManager:
             self._client._build_url("/profiles"),
             params=dump_request(params, ProfileListParams),
         )
-        return ProfileListResponse(**response.data)
+        return response.to_model(ProfileListResponse)
@@ -1,10 +1,14 @@
 import asyncio
-import functools
 import time
-from typing import Dict, Optional, Union
+from copy import deepcopy
+from typing import Dict, Optional, Tuple, Union
 
 from ..._request import coerce_request, dump_request
+from ....build_context_cache import BuildContextCache
+from ....docker_layer_cache import DockerLayerCache
 from ....exceptions import HyperbrowserError
+from ....image_build_uploader import AsyncImageBuildUploader
+from ....json_codec import get_json_codec
 from ....models.sandbox import (
     CompleteSandboxImageBuildParams,
     CreateSandboxParams,
@@ -38,6 +42,7 @@ from ....models.sandbox import (
     StartSandboxFromSnapshotParams,
 )
 from ....models.session import BasicResponse
+from ....transport.single_flight import AsyncSingleFlight
 from ....types import (
     CompleteSandboxImageBuildParams as CompleteSandboxImageBuildParamsDict,
     CreateSandboxImageBuildParams as CreateSandboxImageBuildParamsDict,
@@ -55,6 +60,7 @@ from ....types import (
     StartSandboxFromSnapshotParams as StartSandboxFromSnapshotParamsDict,
 )
 from ....sandbox_common import (
+    RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS,
     RuntimeConnection,
     ensure_response_ok,
     normalize_network_error,
@@ -64,18 +70,15 @@ from ..sandboxes.shared import (
     _build_sandbox_exposed_url,
     _copy_model,
     _expires_within_buffer,
+    _refresh_deadline,
+    _seconds_until_background_refresh,
 )
 from ..sandboxes.image_build import (
     IMAGE_BUILD_SOURCE_PLATFORM,
-    build_docker_image_from_dockerfile,
     is_terminal_image_build_status,
     make_temp_docker_tag,
     merge_image_init,
     package_docker_build_context_manifest,
-    package_docker_image_manifest,
-    prepare_docker_image_manifest_source,
-    remove_docker_image,
-    upload_missing_image_build_artifacts,
 )
 from .sandboxes.sandbox_files import (
     DEFAULT_WATCH_TIMEOUT_MS,
@@ -83,6 +86,16 @@ from .sandboxes.sandbox_files import (
     SandboxFilesApi,
     SandboxWatchDirHandle,
 )
+from .sandboxes.sandbox_image_build import (
+    build_docker_image_from_dockerfile,
+    docker_image_manifest_source,
+    export_requested_docker_image_layers,
+    package_docker_image_manifest,
+    remove_docker_image,
+    require_async_uploader,
+    run_image_build_step,
+    upload_missing_image_build_artifacts,
+)
 from .sandboxes.sandbox_processes import (
     DEFAULT_PROCESS_KILL_WAIT_SECONDS,
     SandboxProcessHandle,
@@ -114,27 +127,26 @@ __all__ = [
 ]
 
 
-async def _run_blocking(func, *args, **kwargs):
-    loop = asyncio.get_running_loop()
-    call = functools.partial(func, *args, **kwargs)
-    return await loop.run_in_executor(None, call)
-
-
 class SandboxHandle:
     def __init__(self, service: "SandboxManager", detail: SandboxDetail):
         self._service = service
         self._detail = detail
         self._runtime_session = self._to_runtime_session(detail)
+        self._runtime_connection: Optional[Tuple[RuntimeConnection, float]] = None
+        self._runtime_refresh = AsyncSingleFlight()
+        self._background_refresh = None
         self._transport = RuntimeTransport(
             self._resolve_runtime_connection,
             service.runtime_timeout,
             service.runtime_proxy_override,
+            json_codec=service.json_codec,
         )
         self.processes = SandboxProcessesApi(self._transport)
         self.files = SandboxFilesApi(
             self._transport,
             self._resolve_runtime_socket_info,
             service.runtime_proxy_override,
+            validate_requests=getattr(service, "validate_requests", True),
         )
         self.terminal = SandboxTerminalApi(
             self._transport,
@@ -212,6 +224,7 @@ class SandboxHandle:
 
     async def stop(self) -> BasicResponse:
         response = await self._service.stop(self.id)
+        self.stop_background_refresh()
         self._clear_runtime_session("closed")
         return response
 
@@ -275,16 +288,22 @@ class SandboxHandle:
     async def create_runtime_session(
         self, force_refresh: bool = False
     ) -> SandboxRuntimeSession:
+        session = await self._ensure_runtime_session(force_refresh)
+        return _copy_model(session)
+
+    async def _ensure_runtime_session(
+        self, force_refresh: bool = False
+    ) -> SandboxRuntimeSession:
+        # Returns the handle's own session; callers must not mutate it.
         self._assert_runtime_available()
         if (
             not force_refresh
             and self._runtime_session is not None
             and not _expires_within_buffer(self._runtime_session.token_expires_at)
         ):
-            return _copy_model(self._runtime_session)
+            return self._runtime_session
 
-        detail = await self._service.get_detail(self.id)
-        self._hydrate(detail)
+        await self._refresh_runtime_session()
         if self._runtime_session is None:
             raise HyperbrowserError(
                 f"Sandbox {self.id} is not running",
@@ -293,7 +312,58 @@ class SandboxHandle:
                 retryable=False,
                 service="runtime",
             )
-        return _copy_model(self._runtime_session)
+        return self._runtime_session
+
+    def start_background_refresh(self) -> None:
+        """Renew the runtime token in a task before it nears expiry.
+
+        Must be called from a running event loop. Runtime calls then never
+        wait on a token refresh. The task stops with
+        ``stop_background_refresh()``, ``stop()`` or when the sandbox has no
+        expiring runtime session left.
+        """
+        if self._background_refresh is not None and not self._background_refresh.done():
+            return
+        self._background_refresh = asyncio.ensure_future(
+            self._background_refresh_loop()
+        )
+
+    def stop_background_refresh(self) -> None:
+        if self._background_refresh is None:
+            return
+        task = self._background_refresh
+        self._background_refresh = None
+        task.cancel()
+
+    async def _background_refresh_loop(self) -> None:
+        minimum = 0.0
+        while True:
+            session = self._runtime_session
+            delay = _seconds_until_background_refresh(
+                session.token_expires_at if session is not None else None,
+                minimum,
+            )
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+            try:
+                self._assert_runtime_available()
+                await self._refresh_runtime_session()
+                # Space out renewals of tokens that stay inside the lead time.
+                minimum = RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS
+            except HyperbrowserError as error:
+                if error.code == "sandbox_not_running":
+                    return
+                await asyncio.sleep(RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS)
+            except Exception:
+                await asyncio.sleep(RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS)
+
+    async def _refresh_runtime_session(self) -> None:
+        # Concurrent callers, including 401 retries, share one refresh.
+        await self._runtime_refresh.do(self.id, self._load_runtime_session)
+
+    async def _load_runtime_session(self) -> None:
+        self._hydrate(await self._service.get_detail(self.id))
 
     async def exec(
         self,
@@ -320,27 +390,36 @@ class SandboxHandle:
     def _hydrate(self, detail: SandboxDetail) -> None:
         self._detail = detail
         self._runtime_session = self._to_runtime_session(detail)
+        self._runtime_connection = None
 
     async def _resolve_runtime_connection(
         self, force_refresh: bool = False
     ) -> RuntimeConnection:
-        session = await self.create_runtime_session(force_refresh=force_refresh)
-        return RuntimeConnection(
+        # Hot path for every runtime request: reuse the immutable connection
+        # until the token enters the refresh buffer or the session changes.
+        cached = self._runtime_connection
+        if not force_refresh and cached is not None and time.time() < cached[1]:
+            return cached[0]
+
+        session = await self._ensure_runtime_session(force_refresh)
+        connection = RuntimeConnection(
             sandbox_id=self.id,
             base_url=session.runtime.base_url,
             token=session.token,
         )
+        if session is self._runtime_session:
+            self._runtime_connection = (
+                connection,
+                _refresh_deadline(session.token_expires_at),
+            )
+        return connection
 
     async def _resolve_runtime_socket_info(self) -> RuntimeConnection:
-        session = await self.create_runtime_session()
-        return RuntimeConnection(
-            sandbox_id=self.id,
-            base_url=session.runtime.base_url,
-            token=session.token,
-        )
+        return await self._resolve_runtime_connection()
 
     def _apply_runtime_session(self, session: SandboxRuntimeSession) -> None:
         self._runtime_session = _copy_model(session)
+        self._runtime_connection = None
         self._detail = self._detail.model_copy(
             update={
                 "status": session.status,
@@ -353,6 +432,7 @@ class SandboxHandle:
 
     def _clear_runtime_session(self, status: Optional[str] = None) -> None:
         self._runtime_session = None
+        self._runtime_connection = None
         self._detail = self._detail.model_copy(
             update={
                 "status": status or self._detail.status,
@@ -394,6 +474,8 @@ class SandboxManager:
             "runtime_proxy_override",
             None,
         )
+        self.json_codec = get_json_codec(getattr(client.config, "json_codec", None))
+        self.validate_requests = getattr(client.config, "validate_requests", True)
 
     async def create(
         self,
@@ -585,13 +667,14 @@ class SandboxManager:
         wait_timeout: Optional[float] = 35 * 60,
         temp_dir: Optional[str] = None,
         upload_timeout: Optional[float] = None,
+        layer_cache: Optional[DockerLayerCache] = None,
+        uploader: Optional[AsyncImageBuildUploader] = None,
     ) -> SandboxImageBuild:
-        source = await _run_blocking(
-            prepare_docker_image_manifest_source,
+        require_async_uploader(uploader)
+        async with docker_image_manifest_source(
             docker_image,
             platform=platform,
-        )
-        try:
+        ) as source:
             explicit_image_init = (
                 coerce_request(image_init, SandboxImageInit, name="image_init")
                 if image_init is not None
@@ -627,13 +710,13 @@ class SandboxManager:
                     )
                 return reused.build
 
-            packaged = await _run_blocking(
-                package_docker_image_manifest,
+            packaged = await package_docker_image_manifest(
                 docker_image,
                 source.image_digest,
                 source.config,
                 platform=platform,
                 temp_dir=temp_dir,
+                layer_cache=layer_cache,
             )
             build_id = None
             build_started = False
@@ -652,18 +735,29 @@ class SandboxManager:
                     )
                 )
                 build_id = create_result.build.id
-                await _run_blocking(
-                    upload_missing_image_build_artifacts,
+                await export_requested_docker_image_layers(
+                    packaged,
+                    create_result.uploads,
+                    docker_image,
+                    platform=platform,
+                )
+                await upload_missing_image_build_artifacts(
                     create_result.uploads,
                     packaged.layers,
                     label="Docker image layer",
                     timeout=upload_timeout,
+                    uploader=uploader,
                 )
                 build = await self._complete_image_build_resilient(
                     build_id,
                     artifact,
                 )
                 build_started = True
+                if layer_cache is not None:
+                    await run_image_build_step(
+                        layer_cache.mark_remote,
+                        [layer.sha256 for layer in packaged.manifest.layers],
+                    )
                 if wait:
                     return await self.wait_for_image_build(
                         build.id,
@@ -679,9 +773,7 @@ class SandboxManager:
                         pass
                 raise
             finally:
-                await _run_blocking(packaged.cleanup)
-        finally:
-            await _run_blocking(source.cleanup)
+                await run_image_build_step(packaged.cleanup)
 
     async def _complete_image_build_resilient(
         self,
@@ -721,13 +813,16 @@ class SandboxManager:
         wait_timeout: Optional[float],
         temp_dir: Optional[str],
         upload_timeout: Optional[float],
+        context_cache: Optional[BuildContextCache],
+        uploader: Optional[AsyncImageBuildUploader],
     ) -> SandboxImageBuild:
-        packaged = await _run_blocking(
+        packaged = await run_image_build_step(
             package_docker_build_context_manifest,
             context_path,
             dockerfile=dockerfile,
             force_full_context=remote_full_context,
             temp_dir=temp_dir,
+            context_cache=context_cache,
         )
         build_id = None
         build_started = False
@@ -752,12 +847,12 @@ class SandboxManager:
                 )
             )
             build_id = create_result.build.id
-            await _run_blocking(
-                upload_missing_image_build_artifacts,
+            await upload_missing_image_build_artifacts(
                 create_result.uploads,
                 packaged.bundles,
                 label="build context bundle",
                 timeout=upload_timeout,
+                uploader=uploader,
             )
             build = await self._complete_image_build_resilient(build_id, artifact)
             build_started = True
@@ -776,7 +871,7 @@ class SandboxManager:
                     pass
             raise
         finally:
-            await _run_blocking(packaged.cleanup)
+            await run_image_build_step(packaged.cleanup)
 
     async def build_image_from_dockerfile(
         self,
@@ -796,13 +891,22 @@ class SandboxManager:
         wait_timeout: Optional[float] = 35 * 60,
         temp_dir: Optional[str] = None,
         upload_timeout: Optional[float] = None,
+        context_cache: Optional[BuildContextCache] = None,
+        layer_cache: Optional[DockerLayerCache] = None,
+        uploader: Optional[AsyncImageBuildUploader] = None,
     ) -> SandboxImageBuild:
+        require_async_uploader(uploader)
         if remote:
             if docker_tag is not None or build_args:
                 raise ValueError(
                     "docker_tag and build_args require remote=False; remote "
                     "Dockerfile builds send the build context to Hyperbrowser"
                 )
+            if layer_cache is not None:
+                raise ValueError(
+                    "layer_cache requires remote=False; remote Dockerfile "
+                    "builds do not export a local image"
+                )
             return await self._build_image_from_remote_dockerfile(
                 context_path=context_path,
                 image_name=image_name,
@@ -816,12 +920,18 @@ class SandboxManager:
                 wait_timeout=wait_timeout,
                 temp_dir=temp_dir,
                 upload_timeout=upload_timeout,
+                context_cache=context_cache,
+                uploader=uploader,
+            )
+        if context_cache is not None:
+            raise ValueError(
+                "context_cache requires remote=True; local Dockerfile builds "
+                "do not package the build context"
             )
         tag = docker_tag or make_temp_docker_tag()
         remove_tag = docker_tag is None
         try:
-            await _run_blocking(
-                build_docker_image_from_dockerfile,
+            await build_docker_image_from_dockerfile(
                 context_path=context_path,
                 dockerfile=dockerfile,
                 tag=tag,
@@ -839,10 +949,12 @@ class SandboxManager:
                 wait_timeout=wait_timeout,
                 temp_dir=temp_dir,
                 upload_timeout=upload_timeout,
+                layer_cache=layer_cache,
+                uploader=uploader,
             )
         finally:
             if remove_tag:
-                await _run_blocking(remove_docker_image, tag)
+                await remove_docker_image(tag)
 
     async def get_runtime_session(self, sandbox_id: str) -> SandboxRuntimeSession:
         detail = await self.get_detail(sandbox_id)
@@ -941,13 +1053,36 @@ class SandboxManager:
         *,
         params: Optional[Dict[str, object]] = None,
         data: Optional[Dict[str, object]] = None,
+    ):
+        url = self._client._build_url(path)
+        query = {k: v for k, v in (params or {}).items() if v is not None}
+        # Control requests share the transport's single-flight group, so
+        # sandbox reads are coalesced and sandbox writes invalidate them.
+        single_flight = getattr(self._client.transport, "single_flight", None)
+        if single_flight is not None:
+            if method != "GET":
+                single_flight.invalidate()
+            elif single_flight.applies_to(url):
+                payload = await single_flight.do(
+                    (method, single_flight.key(url, query, False)),
+                    lambda: self._send_request(method, url, query, data),
+                )
+                return deepcopy(payload)
+        return await self._send_request(method, url, query, data)
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, object],
+        data: Optional[Dict[str, object]],
     ):
         try:
             response = await self._client.transport.client.request(
                 method,
-                self._client._build_url(path),
-                params={k: v for k, v in (params or {}).items() if v is not None},
-                json=data,
+                url,
+                params=params,
+                **self.json_codec.request_kwargs(data),
             )
         except BaseException as error:
             raise normalize_network_error(
@@ -957,4 +1092,8 @@ class SandboxManager:
             )
 
         ensure_response_ok(response, "control")
-        return parse_json_response(response, "control")
+        return parse_json_response(
+            response,
+            "control",
+            json_codec=self.json_codec,
+        )
@@ -3,7 +3,6 @@ import base64
 import functools
 import inspect
 import io
-import json
 import socket
 from datetime import datetime
 from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
@@ -181,9 +180,7 @@ class SandboxFileWatchHandle:
                 except ConnectionClosed:
                     break
 
-                if isinstance(message, bytes):
-                    message = message.decode("utf-8")
-                parsed = json.loads(message)
+                parsed = self._transport.json_codec.loads(message)
                 if parsed["type"] == "event":
                     event = SandboxFileWatchEventMessage(
                         type="event",
@@ -294,11 +291,13 @@ class SandboxFilesApi:
         get_connection_info,
         runtime_proxy_override: Optional[str] = None,
         default_run_as: Optional[str] = None,
+        validate_requests: bool = True,
     ):
         self._transport = transport
         self._get_connection_info = get_connection_info
         self._runtime_proxy_override = runtime_proxy_override
         self._default_run_as = default_run_as.strip() if default_run_as else None
+        self._validate_requests = validate_requests
 
     def with_run_as(self, run_as: Optional[str]):
         normalized = run_as.strip() if run_as else None
@@ -307,6 +306,7 @@ class SandboxFilesApi:
             self._get_connection_info,
             self._runtime_proxy_override,
             default_run_as=normalized,
+            validate_requests=self._validate_requests,
         )
 
     async def list(
@@ -432,7 +432,9 @@ class SandboxFilesApi:
 
         encoded_files = []
         for entry in path_or_files:
-            encoded_files.append(_encode_batch_write_entry(entry))
+            encoded_files.append(
+                _encode_batch_write_entry(entry, validate=self._validate_requests)
+            )
 
         payload = await self._transport.request_json(
             "/sandbox/files/write",
@@ -0,0 +1,507 @@
+"""Image build steps for the async sandbox manager.
+
+Docker commands run as asyncio subprocesses, ``docker image save`` is read
+from its pipe on the event loop, and artifacts are uploaded with an
+``AsyncImageBuildUploader``. File system work (creating workspaces, writing
+and hashing layer data, packaging build contexts) is CPU and disk bound; it
+runs on an executor reserved for image builds, so it neither blocks the loop
+nor occupies the loop's default executor.
+"""
+
+import asyncio
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional, Sequence
+
+from .....docker_layer_cache import DockerLayerCache
+from .....image_build_uploader import AsyncImageBuildUploader
+from .....models.sandbox import SandboxImageBuildUpload
+from ...sandboxes.image_build import (
+    IMAGE_BUILD_SOURCE_PLATFORM,
+    DockerImageBuildArtifact,
+    DockerImageManifestSource,
+    PackagedDockerImage,
+    _MAX_DOCKER_SAVE_ENTRIES,
+    _StoredDockerSaveEntry,
+    _admit_docker_save_entry,
+    _adopt_exported_docker_image_layers,
+    _describe_docker_save,
+    _docker_build_command,
+    _docker_image_layers_to_export,
+    _normalize_sha256_digest,
+    _packaged_docker_image,
+    _parse_docker_container_config,
+    _parse_docker_image_inspection,
+    _require_dict,
+    _requested_image_build_artifacts,
+    _skipped_docker_save_entry,
+)
+
+_IMAGE_BUILD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="hyperbrowser-image-build"
+)
+_DOCKER_SAVE_CHUNK_BYTES = 1024 * 1024
+
+
+async def run_image_build_step(func, *args, **kwargs):
+    """Run a blocking image build step on the image build executor."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(_IMAGE_BUILD_EXECUTOR, call)
+
+
+async def build_docker_image_from_dockerfile(
+    *,
+    context_path,
+    dockerfile="Dockerfile",
+    tag: str,
+    platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
+    build_args: Optional[Dict[str, str]] = None,
+) -> None:
+    await _run_command_output(
+        _docker_build_command(context_path, dockerfile, tag, platform, build_args)
+    )
+
+
+async def remove_docker_image(image: str) -> None:
+    try:
+        await _run_command_output(["docker", "image", "rm", image])
+    except RuntimeError:
+        pass
+
+
+@asynccontextmanager
+async def docker_image_manifest_source(
+    docker_image: str,
+    *,
+    platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
+) -> AsyncIterator[DockerImageManifestSource]:
+    """Inspect ``docker_image``, removing any helper container on exit."""
+    container_id = ""
+    try:
+        try:
+            inspection = _parse_docker_image_inspection(
+                await _run_command_output(
+                    [
+                        "docker",
+                        "image",
+                        "inspect",
+                        f"--platform={platform}",
+                        "--format",
+                        "{{json .}}",
+                        docker_image,
+                    ]
+                ),
+                docker_image,
+                platform,
+            )
+            image_digest = inspection.get("Id")
+            config = _require_dict(inspection.get("Config"), "Docker image config")
+        except RuntimeError:
+            container_id = (
+                await _run_command_output(
+                    ["docker", "create", f"--platform={platform}", docker_image]
+                )
+            ).strip()
+            if not container_id:
+                raise RuntimeError("docker create returned empty container ID")
+            config = _parse_docker_container_config(
+                await _run_command_output(
+                    [
+                        "docker",
+                        "container",
+                        "inspect",
+                        "--format",
+                        "{{json .Config}}",
+                        container_id,
+                    ]
+                )
+            )
+            try:
+                image_digest = await _run_command_output(
+                    [
+                        "docker",
+                        "image",
+                        "inspect",
+                        f"--platform={platform}",
+                        "--format",
+                        "{{.Id}}",
+                        docker_image,
+                    ]
+                )
+            except RuntimeError:
+                image_digest = await _run_command_output(
+                    [
+                        "docker",
+                        "container",
+                        "inspect",
+                        "--format",
+                        "{{.Image}}",
+                        container_id,
+                    ]
+                )
+        yield DockerImageManifestSource(
+            image_digest=_normalize_sha256_digest(image_digest),
+            config=config,
+            cleanup_callback=lambda: None,
+        )
+    finally:
+        if container_id:
+            try:
+                await _run_command_output(["docker", "rm", "-f", container_id])
+            except RuntimeError:
+                pass
+
+
+async def package_docker_image_manifest(
+    docker_image: str,
+    image_digest: str,
+    config: Dict[str, object],
+    *,
+    platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
+    temp_dir: Optional[str] = None,
+    layer_cache: Optional[DockerLayerCache] = None,
+) -> PackagedDockerImage:
+    image_digest = _normalize_sha256_digest(image_digest)
+    workspace = await run_image_build_step(
+        tempfile.mkdtemp, prefix="hb-docker-image-layers-", dir=temp_dir
+    )
+    try:
+        manifest = (
+            await run_image_build_step(layer_cache.manifest, image_digest, platform)
+            if layer_cache is not None
+            else None
+        )
+        layers: Dict[str, DockerImageBuildArtifact] = {}
+        if manifest is None:
+            remote_layers = (
+                await run_image_build_step(layer_cache.remote_layers)
+                if layer_cache is not None
+                else set()
+            )
+            entries = await _read_docker_save(
+                docker_image,
+                platform,
+                workspace,
+                skip=lambda digest_hex: digest_hex in remote_layers,
+            )
+            manifest, layers = await run_image_build_step(
+                _describe_docker_save,
+                entries,
+                image_digest,
+                platform,
+                layer_cache,
+            )
+        return await run_image_build_step(
+            _packaged_docker_image, workspace, manifest, layers, config
+        )
+    except BaseException:
+        await run_image_build_step(shutil.rmtree, workspace, ignore_errors=True)
+        raise
+
+
+async def export_requested_docker_image_layers(
+    packaged: PackagedDockerImage,
+    uploads: Sequence[SandboxImageBuildUpload],
+    docker_image: str,
+    *,
+    platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
+) -> None:
+    wanted = _docker_image_layers_to_export(packaged, uploads)
+    if not wanted:
+        return
+    workspace = await run_image_build_step(
+        tempfile.mkdtemp, prefix="exported-", dir=packaged.workspace
+    )
+    entries = await _read_docker_save(
+        docker_image,
+        platform,
+        workspace,
+        skip=lambda digest_hex: digest_hex not in wanted,
+    )
+    await run_image_build_step(
+        _adopt_exported_docker_image_layers,
+        packaged,
+        entries,
+        wanted,
+        docker_image,
+        platform,
+    )
+
+
+async def upload_missing_image_build_artifacts(
+    uploads: Sequence[SandboxImageBuildUpload],
+    artifacts: Dict[str, DockerImageBuildArtifact],
+    *,
+    label: str,
+    timeout: Optional[float] = None,
+    uploader: Optional[AsyncImageBuildUploader] = None,
+) -> None:
+    items = _requested_image_build_artifacts(uploads, artifacts, label=label)
+    if not items:
+        return
+    if uploader is None:
+        async with AsyncImageBuildUploader(timeout=timeout) as owned_uploader:
+            await owned_uploader.upload_many(items, label=label)
+        return
+    await uploader.upload_many(items, label=label, timeout=timeout)
+
+
+def require_async_uploader(uploader: Optional[AsyncImageBuildUploader]) -> None:
+    if uploader is not None and not isinstance(uploader, AsyncImageBuildUploader):
+        raise TypeError(
+            "uploader must be an AsyncImageBuildUploader for the async client, "
+            f"got {type(uploader).__name__}; use ImageBuildUploader with the "
+            "sync client"
+        )
+
+
+class _AsyncTarReader:
+    """Reads the members of an uncompressed tar stream in order.
+
+    PAX extended headers and GNU long names are applied to the member that
+    follows them; member data not read by the caller is skipped.
+    """
+
+    def __init__(self, stream: asyncio.StreamReader):
+        self._stream = stream
+        self._unread = 0
+        self._padding = 0
+
+    async def next(self) -> Optional[tarfile.TarInfo]:
+        await self._discard(self._unread + self._padding)
+        self._unread = self._padding = 0
+        pax_headers: Dict[str, str] = {}
+        long_name = None
+        while True:
+            block = await self._read_exactly(tarfile.BLOCKSIZE)
+            if not block or block == tarfile.NUL * tarfile.BLOCKSIZE:
+                return None
+            try:
+                member = tarfile.TarInfo.frombuf(
+                    block, tarfile.ENCODING, "surrogateescape"
+                )
+            except tarfile.HeaderError as exc:
+                raise RuntimeError("docker image save produced an invalid tar") from exc
+            if member.type in (
+                tarfile.XHDTYPE,
+                tarfile.XGLTYPE,
+                tarfile.SOLARIS_XHDTYPE,
+                tarfile.GNUTYPE_LONGNAME,
+                tarfile.GNUTYPE_LONGLINK,
+            ):
+                data = await self._read_exactly(_padded(member.size))
+                data = data[: member.size]
+                if member.type == tarfile.GNUTYPE_LONGNAME:
+                    long_name = data.split(tarfile.NUL, 1)[0].decode(
+                        tarfile.ENCODING, "surrogateescape"
+                    )
+                elif member.type in (tarfile.XHDTYPE, tarfile.SOLARIS_XHDTYPE):
+                    pax_headers.update(_parse_pax_records(data))
+                continue
+            if long_name is not None:
+                member.name = long_name
+            if "path" in pax_headers:
+                member.name = pax_headers["path"]
+            if "size" in pax_headers:
+                member.size = int(pax_headers["size"])
+            if member.isreg() or member.type not in tarfile.SUPPORTED_TYPES:
+                self._unread = member.size
+                self._padding = _padded(member.size) - member.size
+            return member
+
+    async def read(self, size: int) -> bytes:
+        """Read up to ``size`` bytes of the current member's data."""
+        size = min(size, self._unread)
+        if size <= 0:
+            return b""
+        data = await self._stream.read(size)
+        self._unread -= len(data)
+        return data
+
+    async def _read_exactly(self, size: int) -> bytes:
+        try:
+            return await self._stream.readexactly(size)
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial:
+                return b""
+            raise RuntimeError("docker image save produced a truncated tar") from exc
+
+    async def _discard(self, size: int) -> None:
+        while size > 0:
+            data = await self._stream.read(min(size, _DOCKER_SAVE_CHUNK_BYTES))
+            if not data:
+                raise RuntimeError("docker image save produced a truncated tar")
+            size -= len(data)
+
+
+def _padded(size: int) -> int:
+    return -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+
+def _parse_pax_records(data: bytes) -> Dict[str, str]:
+    records = {}
+    position = 0
+    while position < len(data):
+        length_end = data.find(b" ", position)
+        if length_end < 0:
+            break
+        try:
+            length = int(data[position:length_end])
+        except ValueError as exc:
+            raise RuntimeError("docker image save has an invalid PAX header") from exc
+        if length <= 0:
+            raise RuntimeError("docker image save has an invalid PAX header")
+        record = data[length_end + 1 : position + length - 1]
+        key, _, value = record.partition(b"=")
+        records[key.decode("utf-8", "surrogateescape")] = value.decode(
+            "utf-8", "surrogateescape"
+        )
+        position += length
+    return records
+
+
+async def _read_docker_save(
+    docker_image: str,
+    platform: str,
+    workspace: str,
+    *,
+    skip: Callable[[str], bool],
+) -> Dict[str, _StoredDockerSaveEntry]:
+    process = await asyncio.create_subprocess_exec(
+        "docker",
+        "image",
+        "save",
+        f"--platform={platform}",
+        docker_image,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stderr = asyncio.ensure_future(process.stderr.read())
+    try:
+        archive = _AsyncTarReader(process.stdout)
+        entries: Dict[str, _StoredDockerSaveEntry] = {}
+        total_bytes = 0
+        index = 0
+        while True:
+            member = await archive.next()
+            if member is None:
+                break
+            if index >= _MAX_DOCKER_SAVE_ENTRIES:
+                raise RuntimeError(
+                    "docker image save contains more than "
+                    f"{_MAX_DOCKER_SAVE_ENTRIES} entries"
+                )
+            destination = os.path.join(workspace, f"entry-{index:04d}")
+            index += 1
+            if not member.isfile():
+                continue
+            name, total_bytes = _admit_docker_save_entry(
+                entries, member.name, member.size, total_bytes
+            )
+            skipped = _skipped_docker_save_entry(name, member.size, skip)
+            if skipped is not None:
+                entries[name] = skipped
+                continue
+            entries[name] = await _store_streamed_entry(
+                archive, destination, member.size, name
+            )
+        return_code = await process.wait()
+        if return_code != 0:
+            message = (await stderr).decode("utf-8", errors="replace").strip()
+            if message:
+                raise RuntimeError(
+                    f"docker image save {docker_image} failed: {message}"
+                )
+            raise RuntimeError(
+                f"docker image save {docker_image} failed with code {return_code}"
+            )
+        return entries
+    except BaseException:
+        await _stop_process(process)
+        raise
+    finally:
+        stderr.cancel()
+
+
+async def _store_streamed_entry(
+    archive: _AsyncTarReader,
+    destination: str,
+    expected_size: int,
+    name: str,
+) -> _StoredDockerSaveEntry:
+    hasher = hashlib.sha256()
+    written = 0
+    loop = asyncio.get_running_loop()
+
+    def store(chunk: bytes) -> None:
+        output.write(chunk)
+        hasher.update(chunk)
+
+    output = await run_image_build_step(open, destination, "xb")
+    pending = None
+    try:
+        # Read the next chunk from docker while the previous one is written
+        # and hashed on the image build executor.
+        while written < expected_size:
+            chunk = await archive.read(
+                min(_DOCKER_SAVE_CHUNK_BYTES, expected_size - written)
+            )
+            if not chunk:
+                break
+            if pending is not None:
+                await pending
+            pending = loop.run_in_executor(_IMAGE_BUILD_EXECUTOR, store, chunk)
+            written += len(chunk)
+        if pending is not None:
+            await pending
+    finally:
+        if pending is not None and not pending.done():
+            await asyncio.wait([pending])
+        await run_image_build_step(output.close)
+    if written != expected_size:
+        raise RuntimeError(f'docker image save entry "{name}" has truncated content')
+    return _StoredDockerSaveEntry(
+        path=destination,
+        sha256_hex=hasher.hexdigest(),
+        size_bytes=written,
+    )
+
+
+async def _stop_process(process) -> None:
+    if process.returncode is None:
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass
+        try:
+            await asyncio.wait_for(process.wait(), 5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+async def _run_command_output(args: Sequence[str]) -> str:
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except BaseException:
+        await _stop_process(process)
+        raise
+    if process.returncode == 0:
+        return stdout.decode("utf-8", errors="replace")
+    message = stderr.decode("utf-8", errors="replace").strip()
+    if message:
+        raise RuntimeError(f"{' '.join(args)}: {message}")
+    raise RuntimeError(f"{' '.join(args)} failed with code {process.returncode}")
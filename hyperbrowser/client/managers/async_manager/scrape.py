@@ -1,8 +1,20 @@
 import asyncio
-from typing import Optional, Union
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Union, overload
 
+from hyperbrowser.client._cache import (
+    cache_key,
+    cached_response,
+    response_content,
+)
 from hyperbrowser.client._request import dump_request
-from hyperbrowser.models.consts import POLLING_ATTEMPTS
+from hyperbrowser.client._results import (
+    aiter_job_pages,
+    batch_result_mode,
+    merge_job_batches,
+    parse_job_response,
+)
+from hyperbrowser.models.consts import POLLING_ATTEMPTS, ResultMode
+from hyperbrowser.models.lazy import LazyJobResponse, LazyModel
 from hyperbrowser.types import (
     GetBatchScrapeJobParams as GetBatchScrapeJobParamsDict,
     StartBatchScrapeJobParams as StartBatchScrapeJobParamsDict,
@@ -12,6 +24,7 @@ from ....models.scrape import (
     BatchScrapeJobResponse,
     BatchScrapeJobStatusResponse,
     GetBatchScrapeJobParams,
+    ScrapedPage,
     ScrapeJobResponse,
     ScrapeJobStatus,
     ScrapeJobStatusResponse,
@@ -21,6 +34,7 @@ from ....models.scrape import (
     StartScrapeJobResponse,
 )
 from ....exceptions import HyperbrowserError
+from ....transport.base import APIResponse
 
 
 class BatchScrapeManager:
@@ -35,34 +49,128 @@ class BatchScrapeManager:
             self._client._build_url("/scrape/batch"),
             data=dump_request(params, StartBatchScrapeJobParams),
         )
-        return StartBatchScrapeJobResponse(**response.data)
+        return response.to_model(StartBatchScrapeJobResponse)
 
     async def get_status(self, job_id: str) -> BatchScrapeJobStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/scrape/batch/{job_id}/status")
         )
-        return BatchScrapeJobStatusResponse(**response.data)
+        return response.to_model(BatchScrapeJobStatusResponse)
 
+    @overload
     async def get(
         self,
         job_id: str,
         params: Optional[
             Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
         ] = None,
-    ) -> BatchScrapeJobResponse:
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> BatchScrapeJobResponse: ...
+
+    @overload
+    async def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[BatchScrapeJobResponse, ScrapedPage]: ...
+
+    @overload
+    async def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
+
+    async def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        BatchScrapeJobResponse,
+        LazyJobResponse[BatchScrapeJobResponse, ScrapedPage],
+        Dict[str, Any],
+    ]:
         if params is None:
             params = GetBatchScrapeJobParams()
         response = await self._client.transport.get(
             self._client._build_url(f"/scrape/batch/{job_id}"),
             params=dump_request(params, GetBatchScrapeJobParams),
         )
-        return BatchScrapeJobResponse(**response.data)
+        return parse_job_response(
+            response, BatchScrapeJobResponse, ScrapedPage, result_mode
+        )
 
+    def iter_pages(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> AsyncIterator[Union[ScrapedPage, LazyModel[ScrapedPage], Dict[str, Any]]]:
+        if params is None:
+            params = GetBatchScrapeJobParams()
+        return aiter_job_pages(
+            self._client.transport,
+            self._client._build_url(f"/scrape/batch/{job_id}"),
+            dump_request(params, GetBatchScrapeJobParams),
+            ScrapedPage,
+            result_mode,
+        )
+
+    @overload
+    async def start_and_wait(
+        self,
+        params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> BatchScrapeJobResponse: ...
+
+    @overload
+    async def start_and_wait(
+        self,
+        params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[BatchScrapeJobResponse, ScrapedPage]: ...
+
+    @overload
     async def start_and_wait(
         self,
         params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
         return_all_pages: bool = True,
-    ) -> BatchScrapeJobResponse:
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
+
+    async def start_and_wait(
+        self,
+        params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        BatchScrapeJobResponse,
+        LazyJobResponse[BatchScrapeJobResponse, ScrapedPage],
+        Dict[str, Any],
+    ]:
+        page_result_mode = batch_result_mode(result_mode)
         job_start_resp = await self.start(params)
         job_id = job_start_resp.job_id
         if not job_id:
@@ -88,7 +196,7 @@ class BatchScrapeManager:
         if not return_all_pages:
             while True:
                 try:
-                    return await self.get(job_id)
+                    return await self.get(job_id, result_mode=result_mode)
                 except Exception as e:
                     failures += 1
                     if failures >= POLLING_ATTEMPTS:
@@ -119,6 +227,7 @@ class BatchScrapeManager:
                     params=GetBatchScrapeJobParams(
                         page=job_response.current_page_batch + 1, batch_size=100
                     ),
+                    result_mode=page_result_mode,
                 )
                 if tmp_job_response.data:
                     job_response.data.extend(tmp_job_response.data)
@@ -137,7 +246,9 @@ class BatchScrapeManager:
                     )
             await asyncio.sleep(0.5)
 
-        return job_response
+        if result_mode == "model":
+            return job_response
+        return merge_job_batches(tmp_job_response, job_response.data, result_mode)
 
 
 class ScrapeManager:
@@ -149,29 +260,44 @@ class ScrapeManager:
         self,
         params: Union[StartScrapeJobParamsDict, StartScrapeJobParams],
     ) -> StartScrapeJobResponse:
+        return await self._start(dump_request(params, StartScrapeJobParams))
+
+    async def _start(self, payload: Dict[str, Any]) -> StartScrapeJobResponse:
         response = await self._client.transport.post(
             self._client._build_url("/scrape"),
-            data=dump_request(params, StartScrapeJobParams),
+            data=payload,
         )
-        return StartScrapeJobResponse(**response.data)
+        return response.to_model(StartScrapeJobResponse)
 
     async def get_status(self, job_id: str) -> ScrapeJobStatusResponse:
         response = await self._client.transport.get(
             self._client._build_url(f"/scrape/{job_id}/status")
         )
-        return ScrapeJobStatusResponse(**response.data)
+        return response.to_model(ScrapeJobStatusResponse)
 
     async def get(self, job_id: str) -> ScrapeJobResponse:
-        response = await self._client.transport.get(
+        response = await self._get_response(job_id)
+        return response.to_model(ScrapeJobResponse)
+
+    async def _get_response(self, job_id: str) -> APIResponse:
+        return await self._client.transport.get(
             self._client._build_url(f"/scrape/{job_id}")
         )
-        return ScrapeJobResponse(**response.data)
 
     async def start_and_wait(
         self,
         params: Union[StartScrapeJobParamsDict, StartScrapeJobParams],
     ) -> ScrapeJobResponse:
-        job_start_resp = await self.start(params)
+        payload = dump_request(params, StartScrapeJobParams)
+        key = cache_key(self._client, self._client._build_url("/scrape"), payload)
+        if key is not None:
+            content = await self._client.response_cache.aget(key)
+            if content is not None:
+                return cached_response(content, self._client.json_codec).to_model(
+                    ScrapeJobResponse
+                )
+
+        job_start_resp = await self._start(payload)
         job_id = job_start_resp.job_id
         if not job_id:
             raise HyperbrowserError("Failed to start scrape job")
@@ -182,7 +308,9 @@ class ScrapeManager:
                 job_status_resp = await self.get_status(job_id)
                 job_status = job_status_resp.status
                 if job_status == "completed" or job_status == "failed":
-                    return await self.get(job_id)
+                    response = await self._get_response(job_id)
+                    result = response.to_model(ScrapeJobResponse)
+                    break
                 failures = 0
             except Exception as e:
                 failures += 1
@@ -191,3 +319,9 @@ class ScrapeManager:
                         f"Failed to poll scrape job {job_id} after {POLLING_ATTEMPTS} attempts: {e}"
                     )
             await asyncio.sleep(2)
+
+        if key is not None and result.status == "completed":
+            await self._client.response_cache.aset(
+                key, response_content(response, self._client.json_codec)
+            )
+        return result
@@ -24,7 +24,7 @@ class VolumeManager:
             self._client._build_url("/volume"),
             data=dump_request(params, CreateVolumeParams),
         )
-        return Volume(**response.data)
+        return response.to_model(Volume)
 
     async def list(
         self,
@@ -37,17 +37,17 @@ class VolumeManager:
                 VolumeListParams,
             ),
         )
-        return VolumeListResponse(**response.data)
+        return response.to_model(VolumeListResponse)
 
     async def get(self, volume_id: str) -> Volume:
         response = await self._client.transport.get(
             self._client._build_url(f"/volume/{volume_id}")
         )
-        return Volume(**response.data)
+        return response.to_model(Volume)
 
     async def delete(self, volume_id: str) -> VolumeDeleteResult:
         """Delete a volume by id or name. Ambiguous names and active mounts return 409."""
         response = await self._client.transport.delete(
             self._client._build_url(f"/volume/{volume_id}")
         )
-        return VolumeDeleteResult(**response.data)
+        return response.to_model(VolumeDeleteResult)
@@ -10,10 +10,13 @@ import posixpath
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Pattern, Tuple
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
 
 
 _REGEX_META_WITHOUT_GLOB_MEANING = frozenset(".+()|{}$")
+# Empty, "." or ".." segments and leading or trailing slashes.
+_UNCLEAN_PATH = re.compile(r"(?:^|/)(?:\.\.?)?(?:/|\Z)")
+_SLASH_IN_CLASS = re.compile(r"\[[^\]]*/")
 
 
 def _clean_path(value: str) -> str:
@@ -202,8 +205,94 @@ def _consume_character_class_value(pattern: str, cursor: int) -> int:
     return cursor
 
 
+class _CompiledPatterns:
+    """Pattern set compiled for matching one path against every pattern.
+
+    ``direct_mask`` returns a bitmask with bit ``i`` set when pattern ``i``
+    matches the path itself. Literal patterns are answered with dictionary
+    lookups keyed by the exact value, prefix or suffix, and glob patterns are
+    screened by one combined regular expression before being tested one by
+    one.
+    """
+
+    def __init__(self, patterns: Sequence[_DockerIgnorePattern]):
+        self.exact: Dict[str, int] = {}
+        self.prefixes: Dict[str, int] = {}
+        self.suffixes: Dict[str, int] = {}
+        self.rooted_suffixes: Dict[str, int] = {}
+        self.always = 0
+        regexps = []
+        for index, pattern in enumerate(patterns):
+            bit = 1 << index
+            if pattern.match_type == "exact":
+                _add_bit(self.exact, pattern.value, bit)
+            elif pattern.match_type == "prefix":
+                prefix = pattern.value[:-2]
+                if prefix:
+                    _add_bit(self.prefixes, prefix, bit)
+                else:
+                    self.always |= bit
+            elif pattern.match_type == "suffix":
+                suffix = pattern.value[2:]
+                if not suffix:
+                    self.always |= bit
+                    continue
+                _add_bit(self.suffixes, suffix, bit)
+                if suffix.startswith("/"):
+                    _add_bit(self.rooted_suffixes, suffix[1:], bit)
+            elif pattern.regexp is not None:
+                regexps.append((bit, pattern.regexp))
+            else:
+                raise ValueError(f'invalid Docker ignore pattern: "{pattern.value}"')
+
+        self.prefix_lengths = sorted({len(prefix) for prefix in self.prefixes})
+        self.suffix_lengths = sorted({len(suffix) for suffix in self.suffixes})
+        self.regexps = tuple(regexps)
+        self.any_regexp: Optional[Pattern[str]] = None
+        if regexps:
+            self.any_regexp = re.compile(
+                "|".join(f"(?:{regexp.pattern})" for _, regexp in regexps)
+            )
+
+    def direct_mask(self, path: str) -> int:
+        mask = self.always | self.exact.get(path, 0)
+        size = len(path)
+        if self.prefix_lengths:
+            prefixes = self.prefixes
+            for length in self.prefix_lengths:
+                if length > size:
+                    break
+                mask |= prefixes.get(path[:length], 0)
+        if self.suffix_lengths:
+            suffixes = self.suffixes
+            for length in self.suffix_lengths:
+                if length > size:
+                    break
+                mask |= suffixes.get(path[-length:], 0)
+            mask |= self.rooted_suffixes.get(path, 0)
+        if self.any_regexp is not None and self.any_regexp.match(path) is not None:
+            for bit, regexp in self.regexps:
+                if regexp.match(path) is not None:
+                    mask |= bit
+        return mask
+
+
+def _add_bit(table: Dict[str, int], key: str, bit: int) -> None:
+    table[key] = table.get(key, 0) | bit
+
+
+def _needs_cleaning(path: str) -> bool:
+    return not path or _UNCLEAN_PATH.search(path) is not None
+
+
 class DockerIgnoreMatcher:
-    """Ordered Docker ignore matcher with parent-directory semantics."""
+    """Ordered Docker ignore matcher with parent-directory semantics.
+
+    A pattern applies to a path when it matches the path or any of its parent
+    directories. The set of patterns matching a directory or one of its
+    parents is memoized per directory, so sibling entries only pay for the
+    patterns matching their own name.
+    """
 
     def __init__(self, patterns: Iterable[str]):
         compiled = []
@@ -214,6 +303,18 @@ class DockerIgnoreMatcher:
             compiled.append(_DockerIgnorePattern.compile(cleaned))
         self._patterns = tuple(compiled)
         self.has_negations = any(pattern.exclusion for pattern in self._patterns)
+        self._compiled = _CompiledPatterns(self._patterns)
+        self._exclusion_mask = sum(
+            1 << index
+            for index, pattern in enumerate(self._patterns)
+            if pattern.exclusion
+        )
+        self._directory_masks: Dict[str, int] = {}
+        self._exclusion_segments = tuple(
+            (index, _pattern_segments(pattern))
+            for index, pattern in enumerate(self._patterns)
+            if pattern.exclusion
+        )
 
     @classmethod
     def from_file(cls, path: Path) -> "DockerIgnoreMatcher":
@@ -227,28 +328,90 @@ class DockerIgnoreMatcher:
     def matches(self, relative_path: str) -> bool:
         # Traversal supplies slash-delimited paths. On Unix, a backslash can
         # be part of a filename and must remain available for glob escaping.
-        path = _clean_path(relative_path)
+        path = relative_path
+        if _needs_cleaning(path):
+            path = _clean_path(path)
         if path == ".":
             return False
+        return self._decide(self._path_mask(path))
+
+    def matches_normalized(self, relative_path: str) -> bool:
+        """``matches`` for paths already in ``filepath.Clean`` form, such as
+        the slash-joined relative paths produced by context traversal."""
+        return self._decide(self._path_mask(relative_path))
+
+    def _path_mask(self, path: str) -> int:
+        separator = path.rfind("/")
+        if separator == -1:
+            return self._compiled.direct_mask(path)
+        parent = path[:separator]
+        parent_mask = self._directory_masks.get(parent)
+        if parent_mask is None:
+            parent_mask = self._path_mask(parent)
+            self._directory_masks[parent] = parent_mask
+        if parent_mask and not self._exclusion_mask:
+            # Without exclusions, an ignored parent decides every descendant.
+            return parent_mask
+        return parent_mask | self._compiled.direct_mask(path)
+
+    def _decide(self, mask: int) -> bool:
+        # Patterns apply in file order and each matching one overrides the
+        # previous decision, so the last matching pattern decides.
+        if not mask:
+            return False
+        return not self._exclusion_mask & (1 << (mask.bit_length() - 1))
 
-        parent = posixpath.dirname(path)
-        parent_parts = parent.split("/") if parent != "." else []
-        matched = False
-        for pattern in self._patterns:
-            # An exclusion can only re-include an ignored path, and a normal
-            # pattern only needs checking while the path is included.
-            if pattern.exclusion != matched:
-                continue
-
-            pattern_matches = pattern.matches_path(path)
-            if not pattern_matches:
-                for length in range(1, len(parent_parts) + 1):
-                    candidate = "/".join(parent_parts[:length])
-                    if pattern.matches_path(candidate):
-                        pattern_matches = True
-                        break
-
-            if pattern_matches:
-                matched = not pattern.exclusion
+    def can_prune(self, relative_directory: str) -> bool:
+        """Whether nothing beneath an ignored directory can be re-included.
 
-        return matched
+        True when no exclusion pattern that comes after the last pattern
+        ignoring the directory can match a path inside it, so traversal can
+        skip the directory without changing which entries are selected.
+        """
+        mask = self._path_mask(relative_directory)
+        if not self._decide(mask):
+            return False
+        last = mask.bit_length() - 1
+        directory_segments = relative_directory.split("/")
+        for index, segments in self._exclusion_segments:
+            if index > last and _may_match_beneath(segments, directory_segments):
+                return False
+        return True
+
+
+def _pattern_segments(
+    pattern: _DockerIgnorePattern,
+) -> Optional[Tuple[Tuple[str, Optional[Pattern[str]]], ...]]:
+    """Split a pattern into per-segment matchers for subtree analysis.
+
+    Returns ``None`` when the pattern can cross directory boundaries in a way
+    the analysis does not model, such as ``**``, escapes or character classes
+    containing a slash; such patterns are assumed to match anywhere.
+    """
+    value = pattern.value
+    if "**" in value or "\\" in value or _SLASH_IN_CLASS.search(value):
+        return None
+    segments = []
+    for segment in value.split("/"):
+        match_type, regexp = _compile_pattern(segment)
+        segments.append((segment, regexp if match_type == "regexp" else None))
+    return tuple(segments)
+
+
+def _may_match_beneath(
+    segments: Optional[Tuple[Tuple[str, Optional[Pattern[str]]], ...]],
+    directory_segments: List[str],
+) -> bool:
+    if segments is None:
+        return True
+    # Without ``**`` a pattern matches paths with exactly as many segments,
+    # and paths inside the directory have more segments than it does.
+    if len(segments) <= len(directory_segments):
+        return False
+    for (literal, regexp), name in zip(segments, directory_segments):
+        if regexp is None:
+            if literal != name:
+                return False
+        elif regexp.match(name) is None:
+            return False
+    return True
@@ -7,15 +7,22 @@ import os
 import posixpath
 import re
 import shutil
+import struct
 import subprocess
+import sys
 import tarfile
 import tempfile
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zlib
+from array import array
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from stat import S_IMODE, S_ISDIR, S_ISLNK, S_ISREG
 from typing import (
+    AbstractSet,
     Callable,
     Dict,
     FrozenSet,
@@ -27,11 +34,13 @@ from typing import (
     Tuple,
 )
 
-import httpx
-
 from .dockerfile_analysis import analyze_dockerfile_sources
 from .dockerignore import DockerIgnoreMatcher
 
+from ....build_context_cache import BuildContextCache, FileDigest
+from ....docker_layer_cache import DockerLayerCache
+from ....image_build_uploader import ImageBuildUploader
+
 from ....models.sandbox import (
     SandboxBuildContextBundle,
     SandboxBuildContextManifest,
@@ -74,6 +83,19 @@ _MAX_DOCKER_SAVE_ENTRIES = 4096
 _MAX_DOCKER_SAVE_ARCHIVE_BYTES = 5 * 1024 * 1024 * 1024
 _MAX_DOCKER_SAVE_METADATA_BYTES = 16 * 1024 * 1024
 _MAX_DOCKER_IMAGE_LAYERS = 512
+_CONTEXT_WALK_WORKERS = min(8, os.cpu_count() or 1)
+_ENTRY_DIRECTORY = 1
+_ENTRY_IGNORED = 2
+_ENTRY_PRUNABLE = 4
+_MARKER_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_CONTEXT_GZIP_BLOCK_BYTES = 1024 * 1024
+_CONTEXT_GZIP_WORKERS = min(32, os.cpu_count() or 1)
+_CONTEXT_BUNDLE_WORKERS = 4
+# Files modified this recently may still change within the same mtime tick,
+# so their digests are not cached.
+_RACY_MTIME_NS = 2_000_000_000
+_PIPELINED_ENTRY_BYTES = 8 * 1024 * 1024
+_DOCKER_SAVE_BLOB_PATTERN = re.compile(r"blobs/sha256/([0-9a-f]{64})")
 
 
 @dataclass
@@ -155,6 +177,100 @@ class _HashingCountingWriter:
         return self._fileobj.flush()
 
 
+class _ParallelGzipWriter:
+    """
+    Write-only file object producing gzip output as independent members of
+    ``block_size`` uncompressed bytes each, the layout pigz uses.
+
+    Blocks are compressed on ``executor`` and written in order, so the output
+    depends only on the data, level and block size, never on the number of
+    workers. Gzip readers decompress the members as one stream.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        *,
+        executor: Optional[Executor] = None,
+        compresslevel: int = 1,
+        block_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ):
+        self._fileobj = fileobj
+        self._executor = executor
+        self._compresslevel = compresslevel
+        self._block_size = block_size or _CONTEXT_GZIP_BLOCK_BYTES
+        self._max_pending = max_pending or 2 * _CONTEXT_GZIP_WORKERS
+        self._buffer = bytearray()
+        self._pending = deque()
+        self._offset = 0
+        self._members = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._offset += len(data)
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self._buffer or not self._members:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        self._drain(0)
+
+    def abort(self) -> None:
+        self.closed = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def __enter__(self) -> "_ParallelGzipWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _submit(self, block: bytes) -> None:
+        self._members += 1
+        if self._executor is None:
+            self._fileobj.write(_gzip_member(block, self._compresslevel))
+            return
+        self._pending.append(
+            self._executor.submit(_gzip_member, block, self._compresslevel)
+        )
+        self._drain(self._max_pending)
+
+    def _drain(self, limit: int) -> None:
+        while len(self._pending) > limit:
+            self._fileobj.write(self._pending.popleft().result())
+
+
+def _gzip_member(block: bytes, compresslevel: int) -> bytes:
+    # Header fields match gzip.GzipFile(filename="", mtime=0); zlib releases
+    # the GIL while compressing, so members compress in parallel.
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(block) + compressor.flush()
+    extra_flags = 2 if compresslevel == 9 else 4 if compresslevel == 1 else 0
+    header = struct.pack("<BBBBLBB", 0x1F, 0x8B, 8, 0, 0, extra_flags, 255)
+    trailer = struct.pack("<LL", zlib.crc32(block), len(block) & 0xFFFFFFFF)
+    return header + body + trailer
+
+
 def build_docker_image_from_dockerfile(
     *,
     context_path,
@@ -163,6 +279,18 @@ def build_docker_image_from_dockerfile(
     platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
     build_args: Optional[Dict[str, str]] = None,
 ) -> None:
+    _run_command(
+        _docker_build_command(context_path, dockerfile, tag, platform, build_args)
+    )
+
+
+def _docker_build_command(
+    context_path,
+    dockerfile,
+    tag: str,
+    platform: str,
+    build_args: Optional[Dict[str, str]],
+) -> List[str]:
     context = Path(context_path)
     if not context.exists():
         raise FileNotFoundError(f"Docker build context not found: {context}")
@@ -185,7 +313,7 @@ def build_docker_image_from_dockerfile(
     for key, value in (build_args or {}).items():
         args.extend(["--build-arg", f"{key}={value}"])
     args.append(str(context))
-    _run_command(args)
+    return args
 
 
 def package_docker_build_context_manifest(
@@ -194,6 +322,7 @@ def package_docker_build_context_manifest(
     dockerfile="Dockerfile",
     force_full_context: bool = False,
     temp_dir: Optional[str] = None,
+    context_cache: Optional[BuildContextCache] = None,
 ) -> PackagedDockerBuildContext:
     context_root = Path(context_path).expanduser().resolve(strict=True)
     if not context_root.is_dir():
@@ -235,6 +364,8 @@ def package_docker_build_context_manifest(
     control_sources = [dockerfile_relative, ignore_relative]
     resolved_relative = resolved_dockerfile.relative_to(context_root).as_posix()
     control_sources.append(resolved_relative)
+    # Every source group is answered from the same directory listings.
+    context_index = _ContextIndex(context_root, ignore_matcher)
 
     if context_mode == "full":
         entry_groups = [
@@ -243,23 +374,25 @@ def package_docker_build_context_manifest(
                 ["."],
                 ignore_matcher=ignore_matcher,
                 required=False,
+                index=context_index,
             )
             | _collect_context_entries(
                 context_root,
                 control_sources,
                 ignore_matcher=None,
                 required=False,
+                index=context_index,
             )
         ]
     else:
-        entry_groups = [
-            _collect_context_entries(
-                context_root,
-                control_sources,
-                ignore_matcher=None,
-                required=False,
-            )
-        ]
+        control_entries = _collect_context_entries(
+            context_root,
+            control_sources,
+            ignore_matcher=None,
+            required=False,
+            index=context_index,
+        )
+        entry_groups = [control_entries]
         for group in source_groups:
             entry_groups.append(
                 _collect_context_entries(
@@ -267,6 +400,7 @@ def package_docker_build_context_manifest(
                     group,
                     ignore_matcher=ignore_matcher,
                     required=True,
+                    index=context_index,
                 )
             )
         if sum(len(entries) for entries in entry_groups) > _MAX_CONTEXT_ENTRIES:
@@ -278,27 +412,43 @@ def package_docker_build_context_manifest(
                     ["."],
                     ignore_matcher=ignore_matcher,
                     required=False,
+                    index=context_index,
                 )
-                | _collect_context_entries(
-                    context_root,
-                    control_sources,
-                    ignore_matcher=None,
-                    required=False,
-                )
+                | control_entries
             ]
 
     entry_groups = _remove_subsumed_entry_groups(entry_groups)
     workspace = tempfile.mkdtemp(prefix="hb-docker-context-", dir=temp_dir)
     try:
+        # Tar building reads files while compression runs on the shared
+        # gzip pool, so independent bundles are packaged side by side.
+        bundle_workers = max(1, min(_CONTEXT_BUNDLE_WORKERS, len(entry_groups)))
+        file_digests = (
+            _CachedFileDigests(context_cache, str(context_root))
+            if context_cache is not None
+            else None
+        )
+        with ThreadPoolExecutor(max_workers=_CONTEXT_GZIP_WORKERS) as gzip_executor:
+            with ThreadPoolExecutor(max_workers=bundle_workers) as bundle_executor:
+                futures = [
+                    bundle_executor.submit(
+                        _package_or_reuse_context_bundle,
+                        context_root,
+                        sorted(entries),
+                        workspace,
+                        index,
+                        gzip_executor=gzip_executor,
+                        context_cache=context_cache,
+                        file_digests=file_digests,
+                    )
+                    for index, entries in enumerate(entry_groups)
+                ]
+                packaged_bundles = [future.result() for future in futures]
+        if file_digests is not None:
+            file_digests.save()
         bundles = {}
         descriptors = []
-        for index, entries in enumerate(entry_groups):
-            artifact, descriptor = _package_context_bundle(
-                context_root,
-                sorted(entries),
-                workspace,
-                index,
-            )
+        for artifact, descriptor in packaged_bundles:
             if descriptor.sha256 in bundles:
                 artifact.cleanup()
                 continue
@@ -390,9 +540,180 @@ def package_docker_image_manifest(
     *,
     platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
     temp_dir: Optional[str] = None,
+    layer_cache: Optional[DockerLayerCache] = None,
 ) -> PackagedDockerImage:
+    """Describe a local image by its config and layer digests.
+
+    With ``layer_cache``, an image exported before is described from its
+    stored manifest without running ``docker image save``, and layers the
+    server already holds are not written to the workspace. Layers missing
+    from ``layers`` are exported on demand by
+    ``export_requested_docker_image_layers``.
+    """
     image_digest = _normalize_sha256_digest(image_digest)
     workspace = tempfile.mkdtemp(prefix="hb-docker-image-layers-", dir=temp_dir)
+    try:
+        manifest = (
+            layer_cache.manifest(image_digest, platform)
+            if layer_cache is not None
+            else None
+        )
+        layers: Dict[str, DockerImageBuildArtifact] = {}
+        if manifest is None:
+            remote_layers = (
+                layer_cache.remote_layers() if layer_cache is not None else set()
+            )
+            entries = _read_docker_save(
+                docker_image,
+                platform,
+                workspace,
+                skip=lambda digest_hex: digest_hex in remote_layers,
+            )
+            manifest, layers = _describe_docker_save(
+                entries,
+                image_digest,
+                platform,
+                layer_cache,
+            )
+        return _packaged_docker_image(workspace, manifest, layers, config)
+    except Exception:
+        shutil.rmtree(workspace, ignore_errors=True)
+        raise
+
+
+def export_requested_docker_image_layers(
+    packaged: PackagedDockerImage,
+    uploads: Sequence[SandboxImageBuildUpload],
+    docker_image: str,
+    *,
+    platform: str = IMAGE_BUILD_SOURCE_PLATFORM,
+) -> None:
+    """Export the requested layers that ``packaged`` did not write out."""
+    wanted = _docker_image_layers_to_export(packaged, uploads)
+    if not wanted:
+        return
+    workspace = tempfile.mkdtemp(prefix="exported-", dir=packaged.workspace)
+    entries = _read_docker_save(
+        docker_image,
+        platform,
+        workspace,
+        skip=lambda digest_hex: digest_hex not in wanted,
+    )
+    _adopt_exported_docker_image_layers(
+        packaged, entries, wanted, docker_image, platform
+    )
+
+
+def _describe_docker_save(
+    entries: Dict[str, _StoredDockerSaveEntry],
+    image_digest: str,
+    platform: str,
+    layer_cache: Optional[DockerLayerCache],
+) -> Tuple[SandboxDockerImageManifest, Dict[str, DockerImageBuildArtifact]]:
+    manifest, layer_entries = _docker_save_image_manifest(entries, image_digest)
+    layers: Dict[str, DockerImageBuildArtifact] = {}
+    skipped = set()
+    for layer in layer_entries:
+        if not layer.path:
+            skipped.add(layer.sha256_hex)
+            continue
+        existing = layers.get(layer.sha256_hex)
+        if existing is not None and existing.size_bytes != layer.size_bytes:
+            raise RuntimeError(f"Docker layer {layer.sha256_hex} has conflicting sizes")
+        if existing is None:
+            layers[layer.sha256_hex] = DockerImageBuildArtifact(
+                path=layer.path,
+                sha256_hex=layer.sha256_hex,
+                size_bytes=layer.size_bytes,
+                input_format=DOCKER_IMAGE_MANIFEST_INPUT_FORMAT,
+                source_platform=platform,
+            )
+    if layer_cache is not None:
+        layer_cache.count_skipped_layers(len(skipped))
+        layer_cache.store_manifest(image_digest, platform, manifest)
+    return manifest, layers
+
+
+def _packaged_docker_image(
+    workspace: str,
+    manifest: SandboxDockerImageManifest,
+    layers: Dict[str, DockerImageBuildArtifact],
+    config: Dict[str, object],
+) -> PackagedDockerImage:
+    artifact = _write_manifest_artifact(
+        workspace,
+        "docker-image-manifest.json",
+        _canonical_model_json(manifest),
+        DOCKER_IMAGE_MANIFEST_INPUT_FORMAT,
+        image_config_user=str(config.get("User") or "").strip(),
+        image_init=_derive_auto_image_init(config),
+    )
+    return PackagedDockerImage(
+        artifact=artifact,
+        manifest=manifest,
+        layers=layers,
+        workspace=workspace,
+    )
+
+
+def _docker_image_layers_to_export(
+    packaged: PackagedDockerImage,
+    uploads: Sequence[SandboxImageBuildUpload],
+) -> Set[str]:
+    wanted = set()
+    for upload in uploads:
+        digest = (upload.sha256 or "").strip().lower()
+        if digest not in packaged.layers and _manifest_layer_size(
+            packaged.manifest, digest
+        ):
+            wanted.add(digest)
+    return wanted
+
+
+def _adopt_exported_docker_image_layers(
+    packaged: PackagedDockerImage,
+    entries: Dict[str, _StoredDockerSaveEntry],
+    wanted: Set[str],
+    docker_image: str,
+    platform: str,
+) -> None:
+    for entry in entries.values():
+        if not entry.path:
+            continue
+        if entry.sha256_hex not in wanted or entry.sha256_hex in packaged.layers:
+            os.remove(entry.path)
+            continue
+        if entry.size_bytes != _manifest_layer_size(
+            packaged.manifest, entry.sha256_hex
+        ):
+            raise RuntimeError(f"Docker layer {entry.sha256_hex} has conflicting sizes")
+        packaged.layers[entry.sha256_hex] = DockerImageBuildArtifact(
+            path=entry.path,
+            sha256_hex=entry.sha256_hex,
+            size_bytes=entry.size_bytes,
+            input_format=DOCKER_IMAGE_MANIFEST_INPUT_FORMAT,
+            source_platform=platform,
+        )
+    missing = sorted(wanted.difference(packaged.layers))
+    if missing:
+        raise RuntimeError(
+            f"docker image save {docker_image} no longer contains layer {missing[0]}"
+        )
+
+
+def _read_docker_save(
+    docker_image: str,
+    platform: str,
+    workspace: str,
+    *,
+    skip: Callable[[str], bool],
+) -> Dict[str, _StoredDockerSaveEntry]:
+    """Stream ``docker image save`` into ``workspace``, one file per entry.
+
+    Content-addressed ``blobs/sha256/<hex>`` entries for which ``skip(hex)``
+    is true are read past without being stored or hashed; they are recorded
+    with an empty ``path``.
+    """
     stderr_file = tempfile.TemporaryFile()
     process = None
     try:
@@ -414,16 +735,15 @@ def package_docker_image_manifest(
                     )
                 if not member.isfile():
                     continue
-                name = _normalize_docker_save_entry_name(member.name)
-                if name in entries:
-                    raise RuntimeError(
-                        f'docker image save contains duplicate entry "{name}"'
-                    )
-                total_bytes += member.size
-                if member.size < 0 or total_bytes > _MAX_DOCKER_SAVE_ARCHIVE_BYTES:
-                    raise RuntimeError(
-                        "docker image save archive exceeds the size limit"
-                    )
+                name, total_bytes = _admit_docker_save_entry(
+                    entries, member.name, member.size, total_bytes
+                )
+                skipped = _skipped_docker_save_entry(name, member.size, skip)
+                if skipped is not None:
+                    # The stream moves past the entry's content on the next
+                    # iteration.
+                    entries[name] = skipped
+                    continue
                 source = archive.extractfile(member)
                 if source is None:
                     raise RuntimeError(f'cannot read Docker save entry "{name}"')
@@ -445,72 +765,11 @@ def package_docker_image_manifest(
             raise RuntimeError(
                 f"docker image save {docker_image} failed with code {return_code}"
             )
-
-        config_entry, layer_entries = _resolve_docker_save_manifest(entries)
-        config_bytes = Path(config_entry.path).read_bytes()
-        _require_json_object(config_bytes, "Docker image config")
-        config_descriptor = SandboxDockerImageConfig(
-            sha256=config_entry.sha256_hex,
-            size_bytes=config_entry.size_bytes,
-            data_base64=base64.b64encode(config_bytes).decode("ascii"),
-        )
-        layer_descriptors = []
-        layers: Dict[str, DockerImageBuildArtifact] = {}
-        for layer in layer_entries:
-            layer_descriptor = SandboxDockerImageLayer(
-                sha256=layer.sha256_hex,
-                size_bytes=layer.size_bytes,
-            )
-            layer_descriptors.append(layer_descriptor)
-            existing = layers.get(layer.sha256_hex)
-            if existing is not None and existing.size_bytes != layer.size_bytes:
-                raise RuntimeError(
-                    f"Docker layer {layer.sha256_hex} has conflicting sizes"
-                )
-            if existing is None:
-                layers[layer.sha256_hex] = DockerImageBuildArtifact(
-                    path=layer.path,
-                    sha256_hex=layer.sha256_hex,
-                    size_bytes=layer.size_bytes,
-                    input_format=DOCKER_IMAGE_MANIFEST_INPUT_FORMAT,
-                    source_platform=platform,
-                )
-
-        image_descriptor = None
-        if image_digest != f"sha256:{config_descriptor.sha256}":
-            image_descriptor = _resolve_oci_image_descriptor(
-                entries,
-                image_digest,
-                config_descriptor,
-                layer_descriptors,
-            )
-        manifest = SandboxDockerImageManifest(
-            version=1,
-            image_digest=image_digest,
-            descriptor=image_descriptor,
-            config=config_descriptor,
-            layers=layer_descriptors,
-        )
-        manifest_bytes = _canonical_model_json(manifest)
-        artifact = _write_manifest_artifact(
-            workspace,
-            "docker-image-manifest.json",
-            manifest_bytes,
-            DOCKER_IMAGE_MANIFEST_INPUT_FORMAT,
-            image_config_user=str(config.get("User") or "").strip(),
-            image_init=_derive_auto_image_init(config),
-        )
-        return PackagedDockerImage(
-            artifact=artifact,
-            manifest=manifest,
-            layers=layers,
-            workspace=workspace,
-        )
+        return entries
     except Exception:
         if process is not None:
             _cleanup_docker_export_process(process)
             process = None
-        shutil.rmtree(workspace, ignore_errors=True)
         raise
     finally:
         if process is not None and process.poll() is not None:
@@ -518,6 +777,75 @@ def package_docker_image_manifest(
         stderr_file.close()
 
 
+def _admit_docker_save_entry(
+    entries: Dict[str, _StoredDockerSaveEntry],
+    raw_name: str,
+    size: int,
+    total_bytes: int,
+) -> Tuple[str, int]:
+    name = _normalize_docker_save_entry_name(raw_name)
+    if name in entries:
+        raise RuntimeError(f'docker image save contains duplicate entry "{name}"')
+    total_bytes += size
+    if size < 0 or total_bytes > _MAX_DOCKER_SAVE_ARCHIVE_BYTES:
+        raise RuntimeError("docker image save archive exceeds the size limit")
+    return name, total_bytes
+
+
+def _skipped_docker_save_entry(
+    name: str, size: int, skip: Callable[[str], bool]
+) -> Optional[_StoredDockerSaveEntry]:
+    blob = _DOCKER_SAVE_BLOB_PATTERN.fullmatch(name)
+    if blob is None or not skip(blob.group(1)):
+        return None
+    return _StoredDockerSaveEntry(path="", sha256_hex=blob.group(1), size_bytes=size)
+
+
+def _docker_save_image_manifest(
+    entries: Dict[str, _StoredDockerSaveEntry],
+    image_digest: str,
+) -> Tuple[SandboxDockerImageManifest, List[_StoredDockerSaveEntry]]:
+    config_entry, layer_entries = _resolve_docker_save_manifest(entries)
+    if not config_entry.path:
+        raise RuntimeError("docker image save config is missing or too large")
+    config_bytes = Path(config_entry.path).read_bytes()
+    _require_json_object(config_bytes, "Docker image config")
+    config_descriptor = SandboxDockerImageConfig(
+        sha256=config_entry.sha256_hex,
+        size_bytes=config_entry.size_bytes,
+        data_base64=base64.b64encode(config_bytes).decode("ascii"),
+    )
+    layer_descriptors = [
+        SandboxDockerImageLayer(sha256=layer.sha256_hex, size_bytes=layer.size_bytes)
+        for layer in layer_entries
+    ]
+    image_descriptor = None
+    if image_digest != f"sha256:{config_descriptor.sha256}":
+        image_descriptor = _resolve_oci_image_descriptor(
+            entries,
+            image_digest,
+            config_descriptor,
+            layer_descriptors,
+        )
+    manifest = SandboxDockerImageManifest(
+        version=1,
+        image_digest=image_digest,
+        descriptor=image_descriptor,
+        config=config_descriptor,
+        layers=layer_descriptors,
+    )
+    return manifest, layer_entries
+
+
+def _manifest_layer_size(
+    manifest: SandboxDockerImageManifest, digest_hex: str
+) -> Optional[int]:
+    for layer in manifest.layers:
+        if layer.sha256 == digest_hex:
+            return layer.size_bytes
+    return None
+
+
 def package_docker_image(
     docker_image: str,
     *,
@@ -563,35 +891,13 @@ def upload_image_build_artifact(
     artifact_path: str,
     *,
     timeout: Optional[float] = None,
+    uploader: Optional[ImageBuildUploader] = None,
 ) -> None:
-    artifact_size = os.path.getsize(artifact_path)
-    if upload.max_upload_bytes > 0 and artifact_size > upload.max_upload_bytes:
-        raise RuntimeError(
-            "image artifact exceeds the server upload limit "
-            f"({artifact_size} > {upload.max_upload_bytes})"
-        )
-    method = (upload.method or "PUT").strip().upper()
-    attempts = 3 if method == "PUT" else 1
-    last_error: Optional[Exception] = None
-    for attempt in range(1, attempts + 1):
-        try:
-            _upload_image_build_artifact_once(
-                upload,
-                artifact_path,
-                method=method,
-                timeout=timeout,
-            )
-            return
-        except httpx.HTTPError as exc:
-            last_error = exc
-        except _UploadStatusError as exc:
-            last_error = exc
-            if exc.status_code not in (408, 429) and exc.status_code < 500:
-                raise
-        if attempt < attempts:
-            time.sleep(attempt * 0.25)
-    if last_error is not None:
-        raise last_error
+    if uploader is None:
+        with ImageBuildUploader(timeout=timeout) as owned_uploader:
+            owned_uploader.upload(upload, artifact_path)
+        return
+    uploader.upload(upload, artifact_path, timeout=timeout)
 
 
 def upload_missing_image_build_artifacts(
@@ -600,7 +906,24 @@ def upload_missing_image_build_artifacts(
     *,
     label: str,
     timeout: Optional[float] = None,
+    uploader: Optional[ImageBuildUploader] = None,
 ) -> None:
+    items = _requested_image_build_artifacts(uploads, artifacts, label=label)
+    if not items:
+        return
+    if uploader is None:
+        with ImageBuildUploader(timeout=timeout) as owned_uploader:
+            owned_uploader.upload_many(items, label=label)
+        return
+    uploader.upload_many(items, label=label, timeout=timeout)
+
+
+def _requested_image_build_artifacts(
+    uploads: Sequence[SandboxImageBuildUpload],
+    artifacts: Dict[str, DockerImageBuildArtifact],
+    *,
+    label: str,
+) -> List[Tuple[SandboxImageBuildUpload, str]]:
     requested = []
     seen = set()
     for upload in uploads:
@@ -625,24 +948,9 @@ def upload_missing_image_build_artifacts(
                 f"({artifact.size_bytes} > {upload.max_upload_bytes})"
             )
         requested.append((upload, artifact))
-    if not requested:
-        return
-    with ThreadPoolExecutor(max_workers=min(4, len(requested))) as executor:
-        futures = {
-            executor.submit(
-                upload_image_build_artifact,
-                upload,
-                artifact.path,
-                timeout=timeout,
-            ): (upload.sha256 or "").strip().lower()
-            for upload, artifact in requested
-        }
-        for future in as_completed(futures):
-            digest = futures[future]
-            try:
-                future.result()
-            except Exception as exc:
-                raise RuntimeError(f"upload {label} {digest}: {exc}") from exc
+    # Largest first, so a big artifact does not start last and run alone.
+    requested.sort(key=lambda item: item[1].size_bytes, reverse=True)
+    return [(upload, artifact.path) for upload, artifact in requested]
 
 
 def merge_image_init(
@@ -689,36 +997,6 @@ def is_terminal_image_build_status(status: SandboxImageBuildStatus) -> bool:
     return status in TERMINAL_IMAGE_BUILD_STATUSES
 
 
-class _UploadStatusError(RuntimeError):
-    def __init__(self, status_code: int, body: str):
-        self.status_code = status_code
-        super().__init__(
-            f"image artifact upload failed: {status_code}: {body}".rstrip()
-        )
-
-
-def _upload_image_build_artifact_once(
-    upload: SandboxImageBuildUpload,
-    artifact_path: str,
-    *,
-    method: str,
-    timeout: Optional[float],
-) -> None:
-    headers = dict(upload.headers or {})
-    headers.setdefault("content-length", str(os.path.getsize(artifact_path)))
-    with open(artifact_path, "rb") as artifact:
-        response = httpx.request(
-            method,
-            upload.url,
-            content=artifact,
-            headers=headers,
-            timeout=timeout,
-        )
-    if response.is_success:
-        return
-    raise _UploadStatusError(response.status_code, response.text.strip())
-
-
 def _inspect_docker_image(docker_image: str, platform: str) -> Dict[str, object]:
     output = _run_command_output(
         [
@@ -730,9 +1008,15 @@ def _inspect_docker_image(docker_image: str, platform: str) -> Dict[str, object]
             "{{json .}}",
             docker_image,
         ]
-    ).strip()
+    )
+    return _parse_docker_image_inspection(output, docker_image, platform)
+
+
+def _parse_docker_image_inspection(
+    output: str, docker_image: str, platform: str
+) -> Dict[str, object]:
     try:
-        inspection = json.loads(output)
+        inspection = json.loads(output.strip())
     except json.JSONDecodeError as exc:
         raise RuntimeError("decode Docker image inspection") from exc
     if not isinstance(inspection, dict):
@@ -804,7 +1088,12 @@ def _inspect_docker_container_config(container_id: str) -> Dict[str, object]:
             "{{json .Config}}",
             container_id,
         ]
-    ).strip()
+    )
+    return _parse_docker_container_config(output)
+
+
+def _parse_docker_container_config(output: str) -> Dict[str, object]:
+    output = output.strip()
     if not output or output == "null":
         raise RuntimeError("docker inspect returned empty container config")
     try:
@@ -1013,8 +1302,12 @@ def _collect_context_entries(
     *,
     ignore_matcher: Optional[DockerIgnoreMatcher],
     required: bool,
+    index: Optional["_ContextIndex"] = None,
 ):
-    entries: Set[str] = set()
+    if index is None:
+        index = _ContextIndex(context_root, ignore_matcher)
+    apply_ignore = ignore_matcher is not None
+    marker = bytearray()
     for raw_source in sources:
         source = _normalize_context_source(raw_source)
         if source == ".":
@@ -1044,13 +1337,8 @@ def _collect_context_entries(
                     else context_root / followed_relative
                 )
                 if followed_path.exists() or followed_path.is_symlink():
-                    _collect_context_path(
-                        context_root,
-                        followed_path,
-                        entries,
-                        ignore_matcher,
-                    )
-    return entries
+                    index.collect(followed_relative, marker, apply_ignore)
+    return index.entries(marker)
 
 
 def _follow_context_source_symlinks(
@@ -1113,78 +1401,412 @@ def _follow_context_source_symlinks(
     return resolved
 
 
-def _collect_context_path(
-    context_root: Path,
-    path: Path,
-    entries,
-    ignore_matcher: Optional[DockerIgnoreMatcher],
-) -> None:
-    relative = path.relative_to(context_root).as_posix()
-    path_is_ignored = relative != "." and _is_ignored(relative, ignore_matcher)
-    can_prune_ignored_directories = not _ignore_matcher_has_negations(ignore_matcher)
-    if relative != "." and not path_is_ignored:
-        _add_context_entry_with_parents(entries, relative)
-    if path.is_symlink() or not path.is_dir():
-        return
-    if path_is_ignored and can_prune_ignored_directories:
-        return
-    for root, directories, files in os.walk(str(path), topdown=True, followlinks=False):
-        root_path = Path(root)
-        ordered_directories = sorted(directories)
-        directories[:] = ordered_directories
-        retained_directories = []
-        for name in ordered_directories:
-            child = root_path / name
-            child_relative = child.relative_to(context_root).as_posix()
-            if _is_ignored(child_relative, ignore_matcher):
-                if not can_prune_ignored_directories:
-                    retained_directories.append(name)
-                continue
-            _add_context_entry_with_parents(entries, child_relative)
-            retained_directories.append(name)
-        if can_prune_ignored_directories:
-            directories[:] = retained_directories
-        for name in sorted(files):
-            child = root_path / name
-            child_relative = child.relative_to(context_root).as_posix()
-            if _is_ignored(child_relative, ignore_matcher):
-                continue
-            _add_context_entry_with_parents(entries, child_relative)
+class _ContextIndex:
+    """
+    Directory listings of a build context, scanned once and shared by every
+    source group.
+
+    Entries are numbered as they are scanned. Each one keeps an interned name,
+    its parent's id and a few flag bits instead of a full path, and entry sets
+    are bitsets over those ids (see ``_ContextEntries``). Directories are
+    scanned breadth-first with ``os.scandir``, a level at a time across
+    ``workers`` threads, and only the subtrees a lookup needs are scanned.
+    """
 
+    def __init__(
+        self,
+        context_root: Path,
+        ignore_matcher: Optional[DockerIgnoreMatcher],
+        *,
+        workers: int = _CONTEXT_WALK_WORKERS,
+    ):
+        self.context_root = context_root
+        self.ignore_matcher = ignore_matcher
+        self.workers = workers
+        self._root = os.fspath(context_root)
+        # Entry 0 is the context root itself.
+        self._names: List[str] = [""]
+        self._parents = array("l", [-1])
+        self._flags = bytearray([_ENTRY_DIRECTORY])
+        self._children: Dict[int, Sequence[int]] = {}
+        self._name_tables: Dict[int, Dict[str, int]] = {}
+        self._directory_paths: Dict[int, str] = {0: "."}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def collect(self, relative: str, marker: bytearray, apply_ignore: bool) -> None:
+        """Mark ``relative`` and what lies beneath it in ``marker``.
+
+        ``marker`` holds one byte per entry id and is closed under parents:
+        marking an entry marks its ancestors, stopping at the first one that
+        is already marked.
+        """
+        entry = self._lookup(relative)
+        flags = self._flags[entry]
+        path_is_ignored = apply_ignore and bool(flags & _ENTRY_IGNORED)
+        if entry != 0 and not path_is_ignored:
+            self._mark(marker, entry)
+        path = self.context_root if relative == "." else self.context_root / relative
+        if path.is_symlink() or not path.is_dir():
+            return
+        if path_is_ignored and flags & _ENTRY_PRUNABLE:
+            return
+        self._scan_tree(entry, apply_ignore)
+
+        pending = [entry]
+        while pending:
+            for child in self._children[pending.pop()]:
+                flags = self._flags[child]
+                if apply_ignore and flags & _ENTRY_IGNORED:
+                    if flags & _ENTRY_PRUNABLE:
+                        continue
+                else:
+                    self._mark(marker, child)
+                if flags & _ENTRY_DIRECTORY:
+                    pending.append(child)
+
+    def entries(self, marker: bytearray) -> "_ContextEntries":
+        if not marker:
+            return _ContextEntries(self, 0)
+        # One ASCII digit per id, highest id first, parsed in a single pass.
+        digits = marker[::-1].translate(_MARKER_DIGITS)
+        return _ContextEntries(self, int(digits, 2))
+
+    def path(self, entry: int) -> str:
+        directory = self._directory_paths.get(entry)
+        if directory is not None:
+            return directory
+        parent = self._directory_path(self._parents[entry])
+        name = self._names[entry]
+        return name if parent == "." else f"{parent}/{name}"
+
+    def find(self, relative: str) -> Optional[int]:
+        """Id of an already scanned entry, without touching the filesystem."""
+        entry = 0
+        for name in [] if relative == "." else relative.split("/"):
+            if entry not in self._children:
+                return None
+            found = self._name_table(entry).get(name)
+            if found is None:
+                return None
+            entry = found
+        return entry
+
+    def _mark(self, marker: bytearray, entry: int) -> None:
+        if len(marker) < len(self._names):
+            marker.extend(bytes(len(self._names) - len(marker)))
+        while entry > 0 and not marker[entry]:
+            marker[entry] = 1
+            entry = self._parents[entry]
+
+    def _lookup(self, relative: str) -> int:
+        entry = 0
+        for name in [] if relative == "." else relative.split("/"):
+            if entry not in self._children:
+                self._store_listing(
+                    entry, self._scan_directory(self._directory_path(entry))
+                )
+            found = self._name_table(entry).get(name)
+            if found is None:
+                # The parent could not be listed; record the entry on its own.
+                found = self._add_entry(entry, name)
+            entry = found
+        return entry
+
+    def _add_entry(self, parent: int, name: str) -> int:
+        relative = self._join(self._directory_path(parent), name)
+        path = os.path.join(self._root, relative)
+        is_directory = os.path.isdir(path) and not os.path.islink(path)
+        entry = len(self._names)
+        self._append(parent, name, self._entry_flags(relative, is_directory))
+        self._children[parent] = [*self._children[parent], entry]
+        self._name_table(parent)[name] = entry
+        return entry
+
+    def _name_table(self, directory: int) -> Dict[str, int]:
+        table = self._name_tables.get(directory)
+        if table is None:
+            table = {self._names[child]: child for child in self._children[directory]}
+            self._name_tables[directory] = table
+        return table
+
+    def _directory_path(self, directory: int) -> str:
+        path = self._directory_paths.get(directory)
+        if path is None:
+            parent = self._directory_path(self._parents[directory])
+            path = self._join(parent, self._names[directory])
+            self._directory_paths[directory] = path
+        return path
+
+    @staticmethod
+    def _join(parent: str, name: str) -> str:
+        return name if parent == "." else f"{parent}/{name}"
+
+    def _scan_tree(self, directory: int, apply_ignore: bool) -> None:
+        if self.workers <= 1:
+            self._scan_levels([directory], apply_ignore, map)
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            self._scan_levels([directory], apply_ignore, executor.map)
 
-def _is_ignored(relative: str, matcher: Optional[DockerIgnoreMatcher]) -> bool:
-    if matcher is None:
-        return False
-    return matcher.matches(relative)
+    def _scan_levels(self, level: List[int], apply_ignore: bool, map_levels) -> None:
+        while level:
+            unscanned = [
+                directory for directory in level if directory not in self._children
+            ]
+            paths = [self._directory_path(directory) for directory in unscanned]
+            if len(paths) == 1:
+                listings = [self._scan_directory(paths[0])]
+            else:
+                listings = list(map_levels(self._scan_directory, paths))
+            for directory, listing in zip(unscanned, listings):
+                self._store_listing(directory, listing)
+            next_level = []
+            for directory in level:
+                for child in self._children[directory]:
+                    flags = self._flags[child]
+                    if flags & _ENTRY_DIRECTORY and not (
+                        apply_ignore and flags & _ENTRY_PRUNABLE
+                    ):
+                        next_level.append(child)
+            level = next_level
+
+    def _store_listing(self, directory: int, listing: List[Tuple[str, int]]) -> None:
+        start = len(self._names)
+        for name, flags in listing:
+            self._append(directory, name, flags)
+        self._children[directory] = range(start, len(self._names))
+
+    def _append(self, parent: int, name: str, flags: int) -> None:
+        self._names.append(sys.intern(name))
+        self._parents.append(parent)
+        self._flags.append(flags)
+
+    def _scan_directory(self, relative: str) -> List[Tuple[str, int]]:
+        path = self._root if relative == "." else os.path.join(self._root, relative)
+        prefix = "" if relative == "." else f"{relative}/"
+        listing = []
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        is_directory = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_directory = False
+                    flags = self._entry_flags(prefix + entry.name, is_directory)
+                    listing.append((entry.name, flags))
+        except OSError:
+            # os.walk skips unreadable directories; keep that behaviour.
+            pass
+        return listing
+
+    def _entry_flags(self, relative: str, is_directory: bool) -> int:
+        flags = _ENTRY_DIRECTORY if is_directory else 0
+        if _is_ignored(relative, self.ignore_matcher):
+            flags |= _ENTRY_IGNORED
+            if is_directory and _can_prune(relative, self.ignore_matcher):
+                flags |= _ENTRY_PRUNABLE
+        return flags
+
+
+class _ContextEntries(AbstractSet[str]):
+    """
+    Set of context-relative paths stored as a bitset over ``_ContextIndex``
+    entry ids.
+
+    A million-entry group takes 125 KB, and union and subset tests between
+    groups of the same index run a machine word at a time.
+    """
+
+    __slots__ = ("_index", "_mask", "_count")
+
+    def __init__(self, index: _ContextIndex, mask: int):
+        self._index = index
+        self._mask = mask
+        self._count = bin(mask).count("1")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        bits = format(self._mask, "b")[::-1]
+        position = bits.find("1")
+        while position != -1:
+            yield self._index.path(position)
+            position = bits.find("1", position + 1)
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        entry = self._index.find(value)
+        return entry is not None and bool(self._mask >> entry & 1)
+
+    def _same_index(self, other) -> bool:
+        return isinstance(other, _ContextEntries) and other._index is self._index
 
+    def __le__(self, other) -> bool:
+        if self._same_index(other):
+            return self._mask & other._mask == self._mask
+        return super().__le__(other)
 
-def _add_context_entry_with_parents(entries, relative: str) -> None:
-    current = relative
-    while current not in ("", "."):
-        entries.add(current)
-        current = posixpath.dirname(current)
+    def __eq__(self, other) -> bool:
+        if self._same_index(other):
+            return self._mask == other._mask
+        return super().__eq__(other)
 
+    def __or__(self, other):
+        if self._same_index(other):
+            return _ContextEntries(self._index, self._mask | other._mask)
+        return super().__or__(other)
 
-def _ignore_matcher_has_negations(
-    matcher: Optional[DockerIgnoreMatcher],
-) -> bool:
+    __hash__ = None  # type: ignore[assignment]
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+
+def _is_ignored(relative: str, matcher: Optional[DockerIgnoreMatcher]) -> bool:
     if matcher is None:
         return False
-    return matcher.has_negations
+    return matcher.matches_normalized(relative)
+
+
+def _can_prune(relative: str, matcher: Optional[DockerIgnoreMatcher]) -> bool:
+    return matcher is not None and matcher.can_prune(relative)
 
 
 def _remove_subsumed_entry_groups(groups):
-    result = []
-    for index, entries in enumerate(groups):
-        if any(
-            index != candidate_index
-            and entries <= candidate
-            and (entries != candidate or index > candidate_index)
-            for candidate_index, candidate in enumerate(groups)
+    # Only a group at least as large can contain another, so in decreasing
+    # size order each group is compared with the groups already kept.
+    order = sorted(range(len(groups)), key=lambda index: (-len(groups[index]), index))
+    kept: List[int] = []
+    for index in order:
+        entries = groups[index]
+        if any(entries <= groups[candidate] for candidate in kept):
+            continue
+        kept.append(index)
+    return [groups[index] for index in sorted(kept)]
+
+
+class _CachedFileDigests:
+    """Content digests of one context's files, backed by a ``BuildContextCache``."""
+
+    def __init__(self, cache: BuildContextCache, root: str):
+        self._cache = cache
+        self._root = root
+        self._known = cache.file_digests(root)
+        self._computed: Dict[str, FileDigest] = {}
+        self._reused: Set[str] = set()
+
+    def digest(self, relative: str, absolute: str, stat: os.stat_result) -> str:
+        cached = self._known.get(relative)
+        if cached is not None and cached[:3] == (
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
         ):
+            if relative not in self._computed:
+                self._reused.add(relative)
+            return cached[3]
+        hasher = hashlib.sha256()
+        with open(absolute, "rb") as source:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest = (stat.st_size, stat.st_mtime_ns, stat.st_ino, hasher.hexdigest())
+        self._known[relative] = digest
+        if time.time_ns() - stat.st_mtime_ns >= _RACY_MTIME_NS:
+            self._computed[relative] = digest
+        return digest[3]
+
+    def save(self) -> None:
+        self._cache.store_file_digests(
+            self._root, self._computed.items(), hits=len(self._reused)
+        )
+        self._computed = {}
+        self._reused = set()
+
+
+def _context_bundle_fingerprint(
+    context_root: Path,
+    entries: Sequence[str],
+    file_digests: _CachedFileDigests,
+) -> str:
+    """Hash everything a bundle's bytes depend on, without reading unchanged files.
+
+    Tar headers are normalized (owner, group and mtime are zeroed), so an entry
+    contributes its name, type, permission bits, size and either its content
+    digest or its link target.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(
+        f"context-bundle-v1\0{_CONTEXT_GZIP_BLOCK_BYTES}\0"
+        f"{zlib.ZLIB_VERSION}\n".encode()
+    )
+    hard_links: Dict[Tuple[int, int], str] = {}
+    for relative in entries:
+        _validate_archive_relative_path(relative)
+        absolute = os.path.join(context_root, relative)
+        stat = os.lstat(absolute)
+        if S_ISREG(stat.st_mode):
+            if stat.st_nlink > 1:
+                # tarfile stores repeated hard links as link entries, which
+                # bundles skip.
+                inode = (stat.st_ino, stat.st_dev)
+                if hard_links.setdefault(inode, relative) != relative:
+                    continue
+            detail = file_digests.digest(relative, absolute, stat)
+            kind = "f"
+        elif S_ISLNK(stat.st_mode):
+            detail = os.readlink(absolute)
+            kind = "l"
+        elif S_ISDIR(stat.st_mode):
+            detail = ""
+            kind = "d"
+        else:
             continue
-        result.append(entries)
-    return result
+        hasher.update(
+            f"{relative}\0{kind}\0{S_IMODE(stat.st_mode):o}\0"
+            f"{stat.st_size if kind == 'f' else 0}\0{detail}\n".encode(
+                "utf-8", "surrogateescape"
+            )
+        )
+    return hasher.hexdigest()
+
+
+def _package_or_reuse_context_bundle(
+    context_root: Path,
+    entries: Sequence[str],
+    workspace: str,
+    index: int,
+    *,
+    gzip_executor: Optional[Executor] = None,
+    context_cache: Optional[BuildContextCache] = None,
+    file_digests: Optional[_CachedFileDigests] = None,
+) -> Tuple[DockerImageBuildArtifact, SandboxBuildContextBundle]:
+    if context_cache is None or file_digests is None:
+        return _package_context_bundle(
+            context_root, entries, workspace, index, gzip_executor=gzip_executor
+        )
+    fingerprint = _context_bundle_fingerprint(context_root, entries, file_digests)
+    bundle_path = os.path.join(workspace, f"bundle-{index:04d}.tar.gz")
+    descriptor = context_cache.reuse_bundle(fingerprint, bundle_path)
+    if descriptor is not None:
+        artifact = DockerImageBuildArtifact(
+            path=bundle_path,
+            sha256_hex=descriptor.sha256,
+            size_bytes=descriptor.size_bytes,
+            input_format=CONTEXT_MANIFEST_INPUT_FORMAT,
+        )
+        return artifact, descriptor
+    artifact, descriptor = _package_context_bundle(
+        context_root, entries, workspace, index, gzip_executor=gzip_executor
+    )
+    # Files changed while they were packaged would make the fingerprint stale.
+    if _context_bundle_fingerprint(context_root, entries, file_digests) == fingerprint:
+        context_cache.store_bundle(fingerprint, artifact.path, descriptor)
+    return artifact, descriptor
 
 
 def _package_context_bundle(
@@ -1192,6 +1814,8 @@ def _package_context_bundle(
     entries: Sequence[str],
     workspace: str,
     index: int,
+    *,
+    gzip_executor: Optional[Executor] = None,
 ) -> Tuple[DockerImageBuildArtifact, SandboxBuildContextBundle]:
     bundle_path = os.path.join(workspace, f"bundle-{index:04d}.tar.gz")
     hasher = hashlib.sha256()
@@ -1199,12 +1823,8 @@ def _package_context_bundle(
     entry_count = 0
     with open(bundle_path, "wb") as destination:
         writer = _HashingCountingWriter(destination, hasher)
-        with gzip.GzipFile(
-            filename="",
-            fileobj=writer,
-            mode="wb",
-            compresslevel=1,
-            mtime=0,
+        with _ParallelGzipWriter(
+            writer, executor=gzip_executor, compresslevel=1
         ) as compressed:
             with tarfile.open(
                 fileobj=compressed,
@@ -1275,14 +1895,34 @@ def _store_streamed_entry(
 ) -> _StoredDockerSaveEntry:
     hasher = hashlib.sha256()
     written = 0
+
+    def store(chunk: bytes) -> None:
+        output.write(chunk)
+        hasher.update(chunk)
+
     with open(destination, "xb") as output:
-        while written < expected_size:
-            chunk = source.read(min(1024 * 1024, expected_size - written))
-            if not chunk:
-                break
-            output.write(chunk)
-            hasher.update(chunk)
-            written += len(chunk)
+        if expected_size < _PIPELINED_ENTRY_BYTES:
+            while written < expected_size:
+                chunk = source.read(min(1024 * 1024, expected_size - written))
+                if not chunk:
+                    break
+                store(chunk)
+                written += len(chunk)
+        else:
+            # Read the next chunk from docker while the previous one is
+            # written and hashed; both release the GIL.
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending = None
+                while written < expected_size:
+                    chunk = source.read(min(1024 * 1024, expected_size - written))
+                    if not chunk:
+                        break
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(store, chunk)
+                    written += len(chunk)
+                if pending is not None:
+                    pending.result()
     if written != expected_size:
         raise RuntimeError(f'docker image save entry "{name}" has truncated content')
     return _StoredDockerSaveEntry(
@@ -16,6 +16,7 @@ from ....models.sandbox import (
     SandboxTerminalStatus,
 )
 from ....sandbox_common import (
+    RUNTIME_SESSION_BACKGROUND_REFRESH_LEAD_MS,
     RUNTIME_SESSION_REFRESH_BUFFER_MS,
     normalize_network_error,
     parse_error_payload,
@@ -155,6 +156,36 @@ def _expires_within_buffer(expires_at: Optional[datetime]) -> bool:
     return expires_at <= threshold
 
 
+def _refresh_deadline(expires_at: Optional[datetime]) -> float:
+    """``time.time()`` value after which ``_expires_within_buffer`` is true."""
+    if expires_at is None:
+        return float("inf")
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp() - RUNTIME_SESSION_REFRESH_BUFFER_MS / 1000
+
+
+def _seconds_until_background_refresh(
+    expires_at: Optional[datetime],
+    minimum: float = 0.0,
+) -> Optional[float]:
+    """Delay before a background refresh should renew a runtime token.
+
+    Returns ``None`` for tokens without an expiry, which never need one.
+    The delay is at least ``minimum``, so a token that is short-lived or
+    came back with an unchanged expiry is not refreshed in a tight loop.
+    """
+    if expires_at is None:
+        return None
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    refresh_at = expires_at - timedelta(
+        milliseconds=RUNTIME_SESSION_REFRESH_BUFFER_MS
+        + RUNTIME_SESSION_BACKGROUND_REFRESH_LEAD_MS
+    )
+    return max(minimum, (refresh_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def _build_query_path(path: str, params: Optional[Dict[str, object]] = None) -> str:
     if not params:
         return path
@@ -290,30 +321,47 @@ def _encode_write_data(data: Union[str, bytes, bytearray]) -> Dict[str, str]:
 
 def _encode_batch_write_entry(
     entry: Union[SandboxFileWriteEntryDict, SandboxFileWriteEntry],
+    validate: bool = True,
 ) -> Dict[str, object]:
-    normalized = coerce_request(entry, SandboxFileWriteEntry, name="entry")
-    if isinstance(normalized.data, str):
-        encoding = normalized.encoding or "utf8"
+    if validate or not isinstance(entry, collections.abc.Mapping):
+        normalized = coerce_request(entry, SandboxFileWriteEntry, name="entry")
+        path, data = normalized.path, normalized.data
+        encoding, append, mode = (
+            normalized.encoding,
+            normalized.append,
+            normalized.mode,
+        )
+    else:
+        # Trusted input is read as-is instead of being validated.
+        path, data = entry["path"], entry["data"]
+        encoding, append, mode = (
+            entry.get("encoding"),
+            entry.get("append"),
+            entry.get("mode"),
+        )
+
+    if isinstance(data, str):
+        encoding = encoding or "utf8"
         if encoding not in {"utf8", "base64"}:
             raise ValueError("encoding should be one of: utf8, base64")
         payload: Dict[str, object] = {
-            "path": normalized.path,
-            "data": normalized.data,
+            "path": path,
+            "data": data,
             "encoding": encoding,
         }
     else:
-        if normalized.encoding not in {None, "base64"}:
+        if encoding not in {None, "base64"}:
             raise ValueError("encoding must be base64 when data is bytes")
         payload = {
-            "path": normalized.path,
-            "data": base64.b64encode(bytes(normalized.data)).decode("ascii"),
+            "path": path,
+            "data": base64.b64encode(bytes(data)).decode("ascii"),
             "encoding": "base64",
         }
 
-    if normalized.append is not None:
-        payload["append"] = normalized.append
-    if normalized.mode is not None:
-        payload["mode"] = normalized.mode
+    if append is not None:
+        payload["append"] = append
+    if mode is not None:
+        payload["mode"] = mode
     return payload
 
 
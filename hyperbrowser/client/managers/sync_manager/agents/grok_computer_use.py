@@ -32,25 +32,25 @@ class GrokComputerUseManager:
             self._client._build_url("/task/grok-computer-use"),
             data=dump_request(params, StartGrokComputerUseTaskParams),
         )
-        return StartGrokComputerUseTaskResponse(**response.data)
+        return response.to_model(StartGrokComputerUseTaskResponse)
 
     def get(self, job_id: str) -> GrokComputerUseTaskResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/task/grok-computer-use/{job_id}")
         )
-        return GrokComputerUseTaskResponse(**response.data)
+        return response.to_model(GrokComputerUseTaskResponse)
 
     def get_status(self, job_id: str) -> GrokComputerUseTaskStatusResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/task/grok-computer-use/{job_id}/status")
         )
-        return GrokComputerUseTaskStatusResponse(**response.data)
+        return response.to_model(GrokComputerUseTaskStatusResponse)
 
     def stop(self, job_id: str) -> BasicResponse:
         response = self._client.transport.put(
             self._client._build_url(f"/task/grok-computer-use/{job_id}/stop")
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     def start_and_wait(
         self,
@@ -1,10 +1,14 @@
-from collections.abc import Mapping
-from typing import Union, List, Optional
+import time
+from typing import Any, Dict, Union, List, Optional, Sequence
 
+from hyperbrowser.client._computer_action import (
+    action_param_model,
+    sequence_payloads,
+)
 from hyperbrowser.client._request import coerce_request, dump_request
+from hyperbrowser.exceptions import HyperbrowserError
 from hyperbrowser.models import (
     SessionDetail,
-    ComputerAction,
     ComputerActionParams,
     ComputerActionResponse,
     ClickActionParams,
@@ -29,65 +33,101 @@ from hyperbrowser.types import (
 )
 
 
-_ACTION_PARAM_MODELS = {
-    ComputerAction.CLICK.value: ClickActionParams,
-    ComputerAction.DRAG.value: DragActionParams,
-    ComputerAction.HOLD_KEY.value: HoldKeyActionParams,
-    ComputerAction.MOUSE_DOWN.value: MouseDownActionParams,
-    ComputerAction.MOUSE_UP.value: MouseUpActionParams,
-    ComputerAction.MOVE_MOUSE.value: MoveMouseActionParams,
-    ComputerAction.PRESS_KEYS.value: PressKeysActionParams,
-    ComputerAction.SCREENSHOT.value: ScreenshotActionParams,
-    ComputerAction.SCROLL.value: ScrollActionParams,
-    ComputerAction.TYPE_TEXT.value: TypeTextActionParams,
-    ComputerAction.GET_CLIPBOARD_TEXT.value: GetClipboardTextActionParams,
-    ComputerAction.PUT_SELECTION_TEXT.value: PutSelectionTextActionParams,
-    ComputerAction.LIST_WINDOWS.value: ListWindowsActionParams,
-}
-
-
-def _action_param_model(params):
-    for model in _ACTION_PARAM_MODELS.values():
-        if isinstance(params, model):
-            return model
-
-    if isinstance(params, Mapping):
-        action = params.get("action")
-        if isinstance(action, ComputerAction):
-            action = action.value
-        model = _ACTION_PARAM_MODELS.get(action)
-        if model is not None:
-            return model
-
-    raise TypeError("params must be a computer action params instance or mapping")
-
-
 class ComputerActionManager:
     def __init__(self, client):
         self._client = client
+        self._validate_requests = getattr(
+            getattr(client, "config", None), "validate_requests", True
+        )
+
+    def _computer_action_endpoint(
+        self, session: Union[SessionDetail, str]
+    ) -> Optional[str]:
+        if not isinstance(session, str):
+            return session.computer_action_endpoint
+
+        endpoints = self._client._session_endpoints
+        endpoint = endpoints.get(session)
+        if endpoint is None:
+            detail = self._client.sessions.get(session)
+            endpoint = detail.computer_action_endpoint
+            if endpoint:
+                endpoints.set(session, endpoint)
+        return endpoint
 
     def _execute_request(
         self,
         session: Union[SessionDetail, str],
         params: Union[ComputerActionParamsDict, ComputerActionParams],
     ) -> ComputerActionResponse:
-        if isinstance(session, str):
-            session = self._client.sessions.get(session)
-
-        if not session.computer_action_endpoint:
+        endpoint = self._computer_action_endpoint(session)
+        if not endpoint:
             raise ValueError("Computer action endpoint not available for this session")
 
         payload = dump_request(
             params,
-            _action_param_model(params),
+            action_param_model(params),
             name="params",
+            validate=self._validate_requests,
         )
+        return self._post_action(session, endpoint, payload)
+
+    def _execute_action(
+        self, session: Union[SessionDetail, str], model, **fields
+    ) -> ComputerActionResponse:
+        if self._validate_requests:
+            return self._execute_request(session, model(**fields))
+        # Trusted arguments skip building the model and go straight to the
+        # wire format.
+        action = model.model_fields["action"].default
+        return self._execute_request(session, {"action": action, **fields})
+
+    def _post_action(
+        self,
+        session: Union[SessionDetail, str],
+        endpoint: str,
+        payload: Dict[str, Any],
+    ) -> ComputerActionResponse:
+        try:
+            response = self._client.transport.post(endpoint, data=payload)
+        except HyperbrowserError as e:
+            if e.status_code == 404 and isinstance(session, str):
+                self._client._session_endpoints.invalidate(session)
+            raise
+        return response.to_model(ComputerActionResponse)
+
+    def sequence(
+        self,
+        session: Union[SessionDetail, str],
+        actions: Sequence[Union[ComputerActionParamsDict, ComputerActionParams]],
+        delay: float = 0,
+        return_screenshot: bool = False,
+    ) -> List[ComputerActionResponse]:
+        """
+        Run ``actions`` in order on one session and return their responses.
 
-        response = self._client.transport.post(
-            session.computer_action_endpoint,
-            data=payload,
+        Every action is validated before the first one is sent and the
+        session endpoint is resolved once. Intermediate actions never return
+        screenshots; with ``return_screenshot`` the last response carries
+        one, so the last action must be able to return a screenshot.
+        ``delay`` seconds are waited between consecutive actions. The
+        sequence stops at the first action that fails.
+        """
+        if delay < 0:
+            raise ValueError("delay must be greater than or equal to 0")
+        payloads = sequence_payloads(
+            actions, return_screenshot, self._validate_requests
         )
-        return ComputerActionResponse(**response.data)
+        endpoint = self._computer_action_endpoint(session)
+        if not endpoint:
+            raise ValueError("Computer action endpoint not available for this session")
+
+        responses = []
+        for index, payload in enumerate(payloads):
+            if index and delay:
+                time.sleep(delay)
+            responses.append(self._post_action(session, endpoint, payload))
+        return responses
 
     def click(
         self,
@@ -98,14 +138,15 @@ class ComputerActionManager:
         num_clicks: int = 1,
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = ClickActionParams(
+        return self._execute_action(
+            session,
+            ClickActionParams,
             x=x,
             y=y,
             button=button,
             num_clicks=num_clicks,
             return_screenshot=return_screenshot,
         )
-        return self._execute_request(session, params)
 
     def type_text(
         self,
@@ -113,15 +154,18 @@ class ComputerActionManager:
         text: str,
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = TypeTextActionParams(text=text, return_screenshot=return_screenshot)
-        return self._execute_request(session, params)
+        return self._execute_action(
+            session,
+            TypeTextActionParams,
+            text=text,
+            return_screenshot=return_screenshot,
+        )
 
     def screenshot(
         self,
         session: Union[SessionDetail, str],
     ) -> ComputerActionResponse:
-        params = ScreenshotActionParams()
-        return self._execute_request(session, params)
+        return self._execute_action(session, ScreenshotActionParams)
 
     def press_keys(
         self,
@@ -129,8 +173,12 @@ class ComputerActionManager:
         keys: List[str],
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = PressKeysActionParams(keys=keys, return_screenshot=return_screenshot)
-        return self._execute_request(session, params)
+        return self._execute_action(
+            session,
+            PressKeysActionParams,
+            keys=keys,
+            return_screenshot=return_screenshot,
+        )
 
     def hold_key(
         self,
@@ -139,10 +187,13 @@ class ComputerActionManager:
         duration: int,
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = HoldKeyActionParams(
-            key=key, duration=duration, return_screenshot=return_screenshot
+        return self._execute_action(
+            session,
+            HoldKeyActionParams,
+            key=key,
+            duration=duration,
+            return_screenshot=return_screenshot,
         )
-        return self._execute_request(session, params)
 
     def mouse_down(
         self,
@@ -150,10 +201,12 @@ class ComputerActionManager:
         button: ComputerActionMouseButton = "left",
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = MouseDownActionParams(
-            button=button, return_screenshot=return_screenshot
+        return self._execute_action(
+            session,
+            MouseDownActionParams,
+            button=button,
+            return_screenshot=return_screenshot,
         )
-        return self._execute_request(session, params)
 
     def mouse_up(
         self,
@@ -161,8 +214,12 @@ class ComputerActionManager:
         button: ComputerActionMouseButton = "left",
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = MouseUpActionParams(button=button, return_screenshot=return_screenshot)
-        return self._execute_request(session, params)
+        return self._execute_action(
+            session,
+            MouseUpActionParams,
+            button=button,
+            return_screenshot=return_screenshot,
+        )
 
     def drag(
         self,
@@ -170,14 +227,14 @@ class ComputerActionManager:
         path: List[Union[CoordinateDict, Coordinate]],
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = DragActionParams(
-            path=[
+        if self._validate_requests:
+            path = [
                 coerce_request(coordinate, Coordinate, name="coordinate")
                 for coordinate in path
-            ],
-            return_screenshot=return_screenshot,
+            ]
+        return self._execute_action(
+            session, DragActionParams, path=path, return_screenshot=return_screenshot
         )
-        return self._execute_request(session, params)
 
     def move_mouse(
         self,
@@ -186,8 +243,13 @@ class ComputerActionManager:
         y: int,
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = MoveMouseActionParams(x=x, y=y, return_screenshot=return_screenshot)
-        return self._execute_request(session, params)
+        return self._execute_action(
+            session,
+            MoveMouseActionParams,
+            x=x,
+            y=y,
+            return_screenshot=return_screenshot,
+        )
 
     def scroll(
         self,
@@ -198,22 +260,24 @@ class ComputerActionManager:
         scroll_y: int,
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = ScrollActionParams(
+        return self._execute_action(
+            session,
+            ScrollActionParams,
             x=x,
             y=y,
             scroll_x=scroll_x,
             scroll_y=scroll_y,
             return_screenshot=return_screenshot,
         )
-        return self._execute_request(session, params)
 
     def get_clipboard_text(
         self,
         session: Union[SessionDetail, str],
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = GetClipboardTextActionParams(return_screenshot=return_screenshot)
-        return self._execute_request(session, params)
+        return self._execute_action(
+            session, GetClipboardTextActionParams, return_screenshot=return_screenshot
+        )
 
     def put_selection_text(
         self,
@@ -221,15 +285,18 @@ class ComputerActionManager:
         text: str,
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = PutSelectionTextActionParams(
-            text=text, return_screenshot=return_screenshot
+        return self._execute_action(
+            session,
+            PutSelectionTextActionParams,
+            text=text,
+            return_screenshot=return_screenshot,
         )
-        return self._execute_request(session, params)
 
     def list_windows(
         self,
         session: Union[SessionDetail, str],
         return_screenshot: bool = False,
     ) -> ComputerActionResponse:
-        params = ListWindowsActionParams(return_screenshot=return_screenshot)
-        return self._execute_request(session, params)
+        return self._execute_action(
+            session, ListWindowsActionParams, return_screenshot=return_screenshot
+        )
@@ -29,7 +29,7 @@ class ExtensionManager:
                 data=dump_request(normalized, CreateExtensionParams),
                 files={"file": file_obj},
             )
-        return ExtensionResponse(**response.data)
+        return response.to_model(ExtensionResponse)
 
     def list(self) -> List[ExtensionResponse]:
         response = self._client.transport.get(
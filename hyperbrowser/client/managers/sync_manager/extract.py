@@ -36,19 +36,19 @@ class ExtractManager:
             self._client._build_url("/extract"),
             data=payload,
         )
-        return StartExtractJobResponse(**response.data)
+        return response.to_model(StartExtractJobResponse)
 
     def get_status(self, job_id: str) -> ExtractJobStatusResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/extract/{job_id}/status")
         )
-        return ExtractJobStatusResponse(**response.data)
+        return response.to_model(ExtractJobStatusResponse)
 
     def get(self, job_id: str) -> ExtractJobResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/extract/{job_id}")
         )
-        return ExtractJobResponse(**response.data)
+        return response.to_model(ExtractJobResponse)
 
     def start_and_wait(
         self,
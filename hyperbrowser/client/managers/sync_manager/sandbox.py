@@ -1,8 +1,14 @@
+import threading
 import time
-from typing import Dict, Optional, Union
+from copy import deepcopy
+from typing import Dict, Optional, Tuple, Union
 
 from ..._request import coerce_request, dump_request
+from ....build_context_cache import BuildContextCache
+from ....docker_layer_cache import DockerLayerCache
 from ....exceptions import HyperbrowserError
+from ....image_build_uploader import ImageBuildUploader
+from ....json_codec import get_json_codec
 from ....models.sandbox import (
     CompleteSandboxImageBuildParams,
     CreateSandboxParams,
@@ -36,6 +42,7 @@ from ....models.sandbox import (
     StartSandboxFromSnapshotParams,
 )
 from ....models.session import BasicResponse
+from ....transport.single_flight import SingleFlight
 from ....types import (
     CompleteSandboxImageBuildParams as CompleteSandboxImageBuildParamsDict,
     CreateSandboxImageBuildParams as CreateSandboxImageBuildParamsDict,
@@ -53,6 +60,7 @@ from ....types import (
     StartSandboxFromSnapshotParams as StartSandboxFromSnapshotParamsDict,
 )
 from ....sandbox_common import (
+    RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS,
     RuntimeConnection,
     ensure_response_ok,
     normalize_network_error,
@@ -62,10 +70,13 @@ from ..sandboxes.shared import (
     _build_sandbox_exposed_url,
     _copy_model,
     _expires_within_buffer,
+    _refresh_deadline,
+    _seconds_until_background_refresh,
 )
 from ..sandboxes.image_build import (
     IMAGE_BUILD_SOURCE_PLATFORM,
     build_docker_image_from_dockerfile,
+    export_requested_docker_image_layers,
     is_terminal_image_build_status,
     make_temp_docker_tag,
     merge_image_init,
@@ -117,16 +128,21 @@ class SandboxHandle:
         self._service = service
         self._detail = detail
         self._runtime_session = self._to_runtime_session(detail)
+        self._runtime_connection: Optional[Tuple[RuntimeConnection, float]] = None
+        self._runtime_refresh = SingleFlight()
+        self._background_refresh = None
         self._transport = RuntimeTransport(
             self._resolve_runtime_connection,
             service.runtime_timeout,
             service.runtime_proxy_override,
+            json_codec=service.json_codec,
         )
         self.processes = SandboxProcessesApi(self._transport)
         self.files = SandboxFilesApi(
             self._transport,
             self._resolve_runtime_socket_info,
             service.runtime_proxy_override,
+            validate_requests=getattr(service, "validate_requests", True),
         )
         self.terminal = SandboxTerminalApi(
             self._transport,
@@ -204,6 +220,7 @@ class SandboxHandle:
 
     def stop(self) -> BasicResponse:
         response = self._service.stop(self.id)
+        self.stop_background_refresh()
         self._clear_runtime_session("closed")
         return response
 
@@ -267,16 +284,22 @@ class SandboxHandle:
     def create_runtime_session(
         self, force_refresh: bool = False
     ) -> SandboxRuntimeSession:
+        session = self._ensure_runtime_session(force_refresh)
+        return _copy_model(session)
+
+    def _ensure_runtime_session(
+        self, force_refresh: bool = False
+    ) -> SandboxRuntimeSession:
+        # Returns the handle's own session; callers must not mutate it.
         self._assert_runtime_available()
         if (
             not force_refresh
             and self._runtime_session is not None
             and not _expires_within_buffer(self._runtime_session.token_expires_at)
         ):
-            return _copy_model(self._runtime_session)
+            return self._runtime_session
 
-        detail = self._service.get_detail(self.id)
-        self._hydrate(detail)
+        self._refresh_runtime_session()
         if self._runtime_session is None:
             raise HyperbrowserError(
                 f"Sandbox {self.id} is not running",
@@ -285,7 +308,67 @@ class SandboxHandle:
                 retryable=False,
                 service="runtime",
             )
-        return _copy_model(self._runtime_session)
+        return self._runtime_session
+
+    def start_background_refresh(self) -> None:
+        """Renew the runtime token in a daemon thread before it nears expiry.
+
+        Runtime calls then never wait on a token refresh. The thread stops
+        with ``stop_background_refresh()``, ``stop()`` or when the sandbox has
+        no expiring runtime session left.
+        """
+        if (
+            self._background_refresh is not None
+            and self._background_refresh[0].is_alive()
+        ):
+            return
+        stopped = threading.Event()
+        thread = threading.Thread(
+            target=self._background_refresh_loop,
+            args=(stopped,),
+            name=f"hyperbrowser-sandbox-refresh-{self.id}",
+            daemon=True,
+        )
+        self._background_refresh = (thread, stopped)
+        thread.start()
+
+    def stop_background_refresh(self) -> None:
+        if self._background_refresh is None:
+            return
+        thread, stopped = self._background_refresh
+        self._background_refresh = None
+        stopped.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _background_refresh_loop(self, stopped: threading.Event) -> None:
+        minimum = 0.0
+        while not stopped.is_set():
+            session = self._runtime_session
+            delay = _seconds_until_background_refresh(
+                session.token_expires_at if session is not None else None,
+                minimum,
+            )
+            if delay is None or stopped.wait(delay):
+                return
+            try:
+                self._assert_runtime_available()
+                self._refresh_runtime_session()
+                # Space out renewals of tokens that stay inside the lead time.
+                minimum = RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS
+            except HyperbrowserError as error:
+                if error.code == "sandbox_not_running":
+                    return
+                stopped.wait(RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS)
+            except Exception:
+                stopped.wait(RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS)
+
+    def _refresh_runtime_session(self) -> None:
+        # Concurrent callers, including 401 retries, share one refresh.
+        self._runtime_refresh.do(self.id, self._load_runtime_session)
+
+    def _load_runtime_session(self) -> None:
+        self._hydrate(self._service.get_detail(self.id))
 
     def exec(
         self,
@@ -312,27 +395,36 @@ class SandboxHandle:
     def _hydrate(self, detail: SandboxDetail) -> None:
         self._detail = detail
         self._runtime_session = self._to_runtime_session(detail)
+        self._runtime_connection = None
 
     def _resolve_runtime_connection(
         self, force_refresh: bool = False
     ) -> RuntimeConnection:
-        session = self.create_runtime_session(force_refresh=force_refresh)
-        return RuntimeConnection(
+        # Hot path for every runtime request: reuse the immutable connection
+        # until the token enters the refresh buffer or the session changes.
+        cached = self._runtime_connection
+        if not force_refresh and cached is not None and time.time() < cached[1]:
+            return cached[0]
+
+        session = self._ensure_runtime_session(force_refresh)
+        connection = RuntimeConnection(
             sandbox_id=self.id,
             base_url=session.runtime.base_url,
             token=session.token,
         )
+        if session is self._runtime_session:
+            self._runtime_connection = (
+                connection,
+                _refresh_deadline(session.token_expires_at),
+            )
+        return connection
 
     def _resolve_runtime_socket_info(self) -> RuntimeConnection:
-        session = self.create_runtime_session()
-        return RuntimeConnection(
-            sandbox_id=self.id,
-            base_url=session.runtime.base_url,
-            token=session.token,
-        )
+        return self._resolve_runtime_connection()
 
     def _apply_runtime_session(self, session: SandboxRuntimeSession) -> None:
         self._runtime_session = _copy_model(session)
+        self._runtime_connection = None
         self._detail = self._detail.model_copy(
             update={
                 "status": session.status,
@@ -345,6 +437,7 @@ class SandboxHandle:
 
     def _clear_runtime_session(self, status: Optional[str] = None) -> None:
         self._runtime_session = None
+        self._runtime_connection = None
         self._detail = self._detail.model_copy(
             update={
                 "status": status or self._detail.status,
@@ -386,6 +479,8 @@ class SandboxManager:
             "runtime_proxy_override",
             None,
         )
+        self.json_codec = get_json_codec(getattr(client.config, "json_codec", None))
+        self.validate_requests = getattr(client.config, "validate_requests", True)
 
     def create(
         self,
@@ -577,6 +672,8 @@ class SandboxManager:
         wait_timeout: Optional[float] = 35 * 60,
         temp_dir: Optional[str] = None,
         upload_timeout: Optional[float] = None,
+        layer_cache: Optional[DockerLayerCache] = None,
+        uploader: Optional[ImageBuildUploader] = None,
     ) -> SandboxImageBuild:
         source = prepare_docker_image_manifest_source(
             docker_image,
@@ -624,6 +721,7 @@ class SandboxManager:
                 source.config,
                 platform=platform,
                 temp_dir=temp_dir,
+                layer_cache=layer_cache,
             )
             build_id = None
             build_started = False
@@ -642,14 +740,25 @@ class SandboxManager:
                     )
                 )
                 build_id = create_result.build.id
+                export_requested_docker_image_layers(
+                    packaged,
+                    create_result.uploads,
+                    docker_image,
+                    platform=platform,
+                )
                 upload_missing_image_build_artifacts(
                     create_result.uploads,
                     packaged.layers,
                     label="Docker image layer",
                     timeout=upload_timeout,
+                    uploader=uploader,
                 )
                 build = self._complete_image_build_resilient(build_id, artifact)
                 build_started = True
+                if layer_cache is not None:
+                    layer_cache.mark_remote(
+                        layer.sha256 for layer in packaged.manifest.layers
+                    )
                 if wait:
                     return self.wait_for_image_build(
                         build.id,
@@ -707,12 +816,15 @@ class SandboxManager:
         wait_timeout: Optional[float],
         temp_dir: Optional[str],
         upload_timeout: Optional[float],
+        context_cache: Optional[BuildContextCache],
+        uploader: Optional[ImageBuildUploader],
     ) -> SandboxImageBuild:
         packaged = package_docker_build_context_manifest(
             context_path,
             dockerfile=dockerfile,
             force_full_context=remote_full_context,
             temp_dir=temp_dir,
+            context_cache=context_cache,
         )
         build_id = None
         build_started = False
@@ -742,6 +854,7 @@ class SandboxManager:
                 packaged.bundles,
                 label="build context bundle",
                 timeout=upload_timeout,
+                uploader=uploader,
             )
             build = self._complete_image_build_resilient(build_id, artifact)
             build_started = True
@@ -780,6 +893,9 @@ class SandboxManager:
         wait_timeout: Optional[float] = 35 * 60,
         temp_dir: Optional[str] = None,
         upload_timeout: Optional[float] = None,
+        context_cache: Optional[BuildContextCache] = None,
+        layer_cache: Optional[DockerLayerCache] = None,
+        uploader: Optional[ImageBuildUploader] = None,
     ) -> SandboxImageBuild:
         if remote:
             if docker_tag is not None or build_args:
@@ -787,6 +903,11 @@ class SandboxManager:
                     "docker_tag and build_args require remote=False; remote "
                     "Dockerfile builds send the build context to Hyperbrowser"
                 )
+            if layer_cache is not None:
+                raise ValueError(
+                    "layer_cache requires remote=False; remote Dockerfile "
+                    "builds do not export a local image"
+                )
             return self._build_image_from_remote_dockerfile(
                 context_path=context_path,
                 image_name=image_name,
@@ -800,6 +921,13 @@ class SandboxManager:
                 wait_timeout=wait_timeout,
                 temp_dir=temp_dir,
                 upload_timeout=upload_timeout,
+                context_cache=context_cache,
+                uploader=uploader,
+            )
+        if context_cache is not None:
+            raise ValueError(
+                "context_cache requires remote=True; local Dockerfile builds "
+                "do not package the build context"
             )
         tag = docker_tag or make_temp_docker_tag()
         remove_tag = docker_tag is None
@@ -822,6 +950,8 @@ class SandboxManager:
                 wait_timeout=wait_timeout,
                 temp_dir=temp_dir,
                 upload_timeout=upload_timeout,
+                layer_cache=layer_cache,
+                uploader=uploader,
             )
         finally:
             if remove_tag:
@@ -924,13 +1054,36 @@ class SandboxManager:
         *,
         params: Optional[Dict[str, object]] = None,
         data: Optional[Dict[str, object]] = None,
+    ):
+        url = self._client._build_url(path)
+        query = {k: v for k, v in (params or {}).items() if v is not None}
+        # Control requests share the transport's single-flight group, so
+        # sandbox reads are coalesced and sandbox writes invalidate them.
+        single_flight = getattr(self._client.transport, "single_flight", None)
+        if single_flight is not None:
+            if method != "GET":
+                single_flight.invalidate()
+            elif single_flight.applies_to(url):
+                payload = single_flight.do(
+                    (method, single_flight.key(url, query, False)),
+                    lambda: self._send_request(method, url, query, data),
+                )
+                return deepcopy(payload)
+        return self._send_request(method, url, query, data)
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, object],
+        data: Optional[Dict[str, object]],
     ):
         try:
             response = self._client.transport.client.request(
                 method,
-                self._client._build_url(path),
-                params={k: v for k, v in (params or {}).items() if v is not None},
-                json=data,
+                url,
+                params=params,
+                **self.json_codec.request_kwargs(data),
             )
         except BaseException as error:
             raise normalize_network_error(
@@ -940,4 +1093,8 @@ class SandboxManager:
             )
 
         ensure_response_ok(response, "control")
-        return parse_json_response(response, "control")
+        return parse_json_response(
+            response,
+            "control",
+            json_codec=self.json_codec,
+        )
@@ -1,6 +1,5 @@
 import base64
 import io
-import json
 import socket
 import threading
 from datetime import datetime
@@ -165,9 +164,7 @@ class SandboxFileWatchHandle:
                 except ConnectionClosed:
                     break
 
-                if isinstance(message, bytes):
-                    message = message.decode("utf-8")
-                parsed = json.loads(message)
+                parsed = self._transport.json_codec.loads(message)
                 if parsed["type"] == "event":
                     event = SandboxFileWatchEventMessage(
                         type="event",
@@ -270,11 +267,13 @@ class SandboxFilesApi:
         get_connection_info,
         runtime_proxy_override: Optional[str] = None,
         default_run_as: Optional[str] = None,
+        validate_requests: bool = True,
     ):
         self._transport = transport
         self._get_connection_info = get_connection_info
         self._runtime_proxy_override = runtime_proxy_override
         self._default_run_as = default_run_as.strip() if default_run_as else None
+        self._validate_requests = validate_requests
 
     def with_run_as(self, run_as: Optional[str]):
         normalized = run_as.strip() if run_as else None
@@ -283,6 +282,7 @@ class SandboxFilesApi:
             self._get_connection_info,
             self._runtime_proxy_override,
             default_run_as=normalized,
+            validate_requests=self._validate_requests,
         )
 
     def exists(self, path: str) -> bool:
@@ -400,7 +400,9 @@ class SandboxFilesApi:
 
         encoded_files = []
         for entry in path_or_files:
-            encoded_files.append(_encode_batch_write_entry(entry))
+            encoded_files.append(
+                _encode_batch_write_entry(entry, validate=self._validate_requests)
+            )
 
         payload = self._transport.request_json(
             "/sandbox/files/write",
@@ -1,5 +1,4 @@
 import base64
-import json
 import socket
 from typing import Dict, Optional, Union
 from urllib.parse import urlencode
@@ -15,6 +14,7 @@ from .....models.sandbox import (
     SandboxTerminalStatus,
     SandboxTerminalWaitParams,
 )
+from .....json_codec import JsonCodec, get_json_codec
 from .....sandbox_common import build_headers, to_websocket_transport_target
 from .....types import (
     SandboxTerminalCreateParams as SandboxTerminalCreateParamsDict,
@@ -31,8 +31,9 @@ DEFAULT_TERMINAL_KILL_WAIT_SECONDS = 5.0
 
 
 class SandboxTerminalConnection:
-    def __init__(self, websocket):
+    def __init__(self, websocket, json_codec: Optional[JsonCodec] = None):
         self._websocket = websocket
+        self._json_codec = json_codec or get_json_codec()
 
     def events(self):
         while True:
@@ -41,9 +42,7 @@ class SandboxTerminalConnection:
             except ConnectionClosed:
                 break
 
-            if isinstance(message, bytes):
-                message = message.decode("utf-8")
-            parsed = json.loads(message)
+            parsed = self._json_codec.loads(message)
             if parsed["type"] == "output":
                 normalized = _normalize_terminal_output_chunk(parsed)
                 yield SandboxTerminalOutputEvent(
@@ -65,11 +64,11 @@ class SandboxTerminalConnection:
         }
         if not isinstance(data, str):
             payload["encoding"] = "base64"
-        self._websocket.send(json.dumps(payload))
+        self._websocket.send(self._json_codec.dumps_text(payload))
 
     def resize(self, rows: int, cols: int) -> None:
         self._websocket.send(
-            json.dumps(
+            self._json_codec.dumps_text(
                 {
                     "type": "resize",
                     "rows": rows,
@@ -199,7 +198,9 @@ class SandboxTerminalHandle:
         except BaseException as error:
             raise _normalize_websocket_error(error)
 
-        return SandboxTerminalConnection(websocket)
+        return SandboxTerminalConnection(
+            websocket, getattr(self._transport, "json_codec", None)
+        )
 
 
 class SandboxTerminalApi:
@@ -3,6 +3,7 @@ from typing import Any, Dict, Iterator, Optional
 
 import httpx
 
+from .....json_codec import JSON_CONTENT_TYPE, JsonCodec, get_json_codec
 from .....sandbox_common import (
     RuntimeConnection,
     build_headers,
@@ -20,10 +21,12 @@ class RuntimeTransport:
         resolve_connection,
         timeout: float = 30.0,
         runtime_proxy_override: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
         self._resolve_connection = resolve_connection
         self._timeout = timeout
         self._runtime_proxy_override = runtime_proxy_override
+        self.json_codec = json_codec or get_json_codec()
 
     def request_json(
         self,
@@ -43,7 +46,7 @@ class RuntimeTransport:
             content=content,
             headers=headers,
         )
-        return parse_json_response(response, "runtime")
+        return parse_json_response(response, "runtime", json_codec=self.json_codec)
 
     def request_bytes(
         self,
@@ -96,7 +99,7 @@ class RuntimeTransport:
             data = raw_data
             if raw_data:
                 try:
-                    data = json.loads(raw_data)
+                    data = self.json_codec.loads(raw_data)
                 except json.JSONDecodeError:
                     data = raw_data
 
@@ -256,6 +259,10 @@ class RuntimeTransport:
             request_path,
             self._runtime_proxy_override,
         )
+        if json_body is not None:
+            content = self.json_codec.dumps(json_body)
+            if not any(key.lower() == "content-type" for key in headers or {}):
+                headers = {**(headers or {}), "Content-Type": JSON_CONTENT_TYPE}
         merged_headers = build_headers(connection.token, headers, target.host_header)
         client = httpx.Client(timeout=self._timeout)
 
@@ -264,7 +271,6 @@ class RuntimeTransport:
                 method,
                 target.url,
                 headers=merged_headers,
-                json=json_body,
                 content=content,
             )
         except BaseException as error:
@@ -1,8 +1,20 @@
 import time
-from typing import Optional, Union
+from typing import Any, Dict, Iterator, Literal, Optional, Union, overload
 
+from hyperbrowser.client._cache import (
+    cache_key,
+    cached_response,
+    response_content,
+)
 from hyperbrowser.client._request import dump_request
-from hyperbrowser.models.consts import POLLING_ATTEMPTS
+from hyperbrowser.client._results import (
+    batch_result_mode,
+    iter_job_pages,
+    merge_job_batches,
+    parse_job_response,
+)
+from hyperbrowser.models.consts import POLLING_ATTEMPTS, ResultMode
+from hyperbrowser.models.lazy import LazyJobResponse, LazyModel
 from hyperbrowser.types import (
     GetBatchScrapeJobParams as GetBatchScrapeJobParamsDict,
     StartBatchScrapeJobParams as StartBatchScrapeJobParamsDict,
@@ -12,6 +24,7 @@ from ....models.scrape import (
     BatchScrapeJobResponse,
     BatchScrapeJobStatusResponse,
     GetBatchScrapeJobParams,
+    ScrapedPage,
     ScrapeJobResponse,
     ScrapeJobStatus,
     ScrapeJobStatusResponse,
@@ -21,6 +34,7 @@ from ....models.scrape import (
     StartScrapeJobResponse,
 )
 from ....exceptions import HyperbrowserError
+from ....transport.base import APIResponse
 
 
 class BatchScrapeManager:
@@ -35,34 +49,128 @@ class BatchScrapeManager:
             self._client._build_url("/scrape/batch"),
             data=dump_request(params, StartBatchScrapeJobParams),
         )
-        return StartBatchScrapeJobResponse(**response.data)
+        return response.to_model(StartBatchScrapeJobResponse)
 
     def get_status(self, job_id: str) -> BatchScrapeJobStatusResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/scrape/batch/{job_id}/status")
         )
-        return BatchScrapeJobStatusResponse(**response.data)
+        return response.to_model(BatchScrapeJobStatusResponse)
 
+    @overload
     def get(
         self,
         job_id: str,
         params: Optional[
             Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
         ] = None,
-    ) -> BatchScrapeJobResponse:
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> BatchScrapeJobResponse: ...
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[BatchScrapeJobResponse, ScrapedPage]: ...
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
+
+    def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        BatchScrapeJobResponse,
+        LazyJobResponse[BatchScrapeJobResponse, ScrapedPage],
+        Dict[str, Any],
+    ]:
         if params is None:
             params = GetBatchScrapeJobParams()
         response = self._client.transport.get(
             self._client._build_url(f"/scrape/batch/{job_id}"),
             params=dump_request(params, GetBatchScrapeJobParams),
         )
-        return BatchScrapeJobResponse(**response.data)
+        return parse_job_response(
+            response, BatchScrapeJobResponse, ScrapedPage, result_mode
+        )
+
+    def iter_pages(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchScrapeJobParamsDict, GetBatchScrapeJobParams]
+        ] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Iterator[Union[ScrapedPage, LazyModel[ScrapedPage], Dict[str, Any]]]:
+        if params is None:
+            params = GetBatchScrapeJobParams()
+        return iter_job_pages(
+            self._client.transport,
+            self._client._build_url(f"/scrape/batch/{job_id}"),
+            dump_request(params, GetBatchScrapeJobParams),
+            ScrapedPage,
+            result_mode,
+        )
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> BatchScrapeJobResponse: ...
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[BatchScrapeJobResponse, ScrapedPage]: ...
 
+    @overload
     def start_and_wait(
         self,
         params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
         return_all_pages: bool = True,
-    ) -> BatchScrapeJobResponse:
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
+
+    def start_and_wait(
+        self,
+        params: Union[StartBatchScrapeJobParamsDict, StartBatchScrapeJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        BatchScrapeJobResponse,
+        LazyJobResponse[BatchScrapeJobResponse, ScrapedPage],
+        Dict[str, Any],
+    ]:
+        page_result_mode = batch_result_mode(result_mode)
         job_start_resp = self.start(params)
         job_id = job_start_resp.job_id
         if not job_id:
@@ -88,7 +196,7 @@ class BatchScrapeManager:
         if not return_all_pages:
             while True:
                 try:
-                    return self.get(job_id)
+                    return self.get(job_id, result_mode=result_mode)
                 except Exception as e:
                     failures += 1
                     if failures >= POLLING_ATTEMPTS:
@@ -119,6 +227,7 @@ class BatchScrapeManager:
                     params=GetBatchScrapeJobParams(
                         page=job_response.current_page_batch + 1, batch_size=100
                     ),
+                    result_mode=page_result_mode,
                 )
                 if tmp_job_response.data:
                     job_response.data.extend(tmp_job_response.data)
@@ -137,7 +246,9 @@ class BatchScrapeManager:
                     )
             time.sleep(0.5)
 
-        return job_response
+        if result_mode == "model":
+            return job_response
+        return merge_job_batches(tmp_job_response, job_response.data, result_mode)
 
 
 class ScrapeManager:
@@ -149,29 +260,42 @@ class ScrapeManager:
         self,
         params: Union[StartScrapeJobParamsDict, StartScrapeJobParams],
     ) -> StartScrapeJobResponse:
+        return self._start(dump_request(params, StartScrapeJobParams))
+
+    def _start(self, payload: Dict[str, Any]) -> StartScrapeJobResponse:
         response = self._client.transport.post(
             self._client._build_url("/scrape"),
-            data=dump_request(params, StartScrapeJobParams),
+            data=payload,
         )
-        return StartScrapeJobResponse(**response.data)
+        return response.to_model(StartScrapeJobResponse)
 
     def get_status(self, job_id: str) -> ScrapeJobStatusResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/scrape/{job_id}/status")
         )
-        return ScrapeJobStatusResponse(**response.data)
+        return response.to_model(ScrapeJobStatusResponse)
 
     def get(self, job_id: str) -> ScrapeJobResponse:
-        response = self._client.transport.get(
-            self._client._build_url(f"/scrape/{job_id}")
-        )
-        return ScrapeJobResponse(**response.data)
+        response = self._get_response(job_id)
+        return response.to_model(ScrapeJobResponse)
+
+    def _get_response(self, job_id: str) -> APIResponse:
+        return self._client.transport.get(self._client._build_url(f"/scrape/{job_id}"))
 
     def start_and_wait(
         self,
         params: Union[StartScrapeJobParamsDict, StartScrapeJobParams],
     ) -> ScrapeJobResponse:
-        job_start_resp = self.start(params)
+        payload = dump_request(params, StartScrapeJobParams)
+        key = cache_key(self._client, self._client._build_url("/scrape"), payload)
+        if key is not None:
+            content = self._client.response_cache.get(key)
+            if content is not None:
+                return cached_response(content, self._client.json_codec).to_model(
+                    ScrapeJobResponse
+                )
+
+        job_start_resp = self._start(payload)
         job_id = job_start_resp.job_id
         if not job_id:
             raise HyperbrowserError("Failed to start scrape job")
@@ -182,7 +306,9 @@ class ScrapeManager:
                 job_status_resp = self.get_status(job_id)
                 job_status = job_status_resp.status
                 if job_status == "completed" or job_status == "failed":
-                    return self.get(job_id)
+                    response = self._get_response(job_id)
+                    result = response.to_model(ScrapeJobResponse)
+                    break
                 failures = 0
             except Exception as e:
                 failures += 1
@@ -191,3 +317,9 @@ class ScrapeManager:
                         f"Failed to poll scrape job {job_id} after {POLLING_ATTEMPTS} attempts: {e}"
                     )
             time.sleep(2)
+
+        if key is not None and result.status == "completed":
+            self._client.response_cache.set(
+                key, response_content(response, self._client.json_codec)
+            )
+        return result
@@ -59,7 +59,7 @@ class SessionEventLogsManager:
             self._client._build_url(f"/session/{session_id}/event-logs"),
             params=dump_request(params, SessionEventLogListParams),
         )
-        return SessionEventLogListResponse(**response.data)
+        return response.to_model(SessionEventLogListResponse)
 
 
 class SessionManager:
@@ -77,7 +77,7 @@ class SessionManager:
             self._client._build_url("/session"),
             data=({} if params is None else dump_request(params, CreateSessionParams)),
         )
-        return SessionDetail(**response.data)
+        return response.to_model(SessionDetail)
 
     def get(
         self,
@@ -90,20 +90,21 @@ class SessionManager:
             self._client._build_url(f"/session/{id}"),
             params=dump_request(params, SessionGetParams),
         )
-        return SessionDetail(**response.data)
+        return response.to_model(SessionDetail)
 
     def stop(self, id: str) -> BasicResponse:
         response = self._client.transport.put(
             self._client._build_url(f"/session/{id}/stop")
         )
-        return BasicResponse(**response.data)
+        self._client._session_endpoints.invalidate(id)
+        return response.to_model(BasicResponse)
 
     def create_snapshot(self, id: str) -> CreateSessionSnapshotResponse:
         response = self._client.transport.post(
             self._client._build_url(f"/session/{id}/snapshot"),
             data={},
         )
-        return CreateSessionSnapshotResponse(**response.data)
+        return response.to_model(CreateSessionSnapshotResponse)
 
     def evaluate_captcha(
         self,
@@ -120,7 +121,7 @@ class SessionManager:
                 self._client.timeout, CAPTCHA_EVALUATION_REQUEST_TIMEOUT_SECONDS
             ),
         )
-        return CaptchaEvaluationResponse(**response.data)
+        return response.to_model(CaptchaEvaluationResponse)
 
     def list(
         self,
@@ -132,31 +133,31 @@ class SessionManager:
             self._client._build_url("/sessions"),
             params=dump_request(params, SessionListParams),
         )
-        return SessionListResponse(**response.data)
+        return response.to_model(SessionListResponse)
 
     def get_recording(self, id: str) -> List[SessionRecording]:
         response = self._client.transport.get(
             self._client._build_url(f"/session/{id}/recording"), None, True
         )
-        return [SessionRecording(**recording) for recording in response.data]
+        return response.to_model(List[SessionRecording])
 
     def get_recording_url(self, id: str) -> GetSessionRecordingUrlResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/session/{id}/recording-url")
         )
-        return GetSessionRecordingUrlResponse(**response.data)
+        return response.to_model(GetSessionRecordingUrlResponse)
 
     def get_video_recording_url(self, id: str) -> GetSessionVideoRecordingUrlResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/session/{id}/video-recording-url")
         )
-        return GetSessionVideoRecordingUrlResponse(**response.data)
+        return response.to_model(GetSessionVideoRecordingUrlResponse)
 
     def get_downloads_url(self, id: str) -> GetSessionDownloadsUrlResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/session/{id}/downloads-url")
         )
-        return GetSessionDownloadsUrlResponse(**response.data)
+        return response.to_model(GetSessionDownloadsUrlResponse)
 
     def upload_file(self, id: str, file_input: Union[str, IO]) -> UploadFileResponse:
         response = None
@@ -174,14 +175,14 @@ class SessionManager:
                 files=files,
             )
 
-        return UploadFileResponse(**response.data)
+        return response.to_model(UploadFileResponse)
 
     def extend_session(self, id: str, duration_minutes: int) -> BasicResponse:
         response = self._client.transport.put(
             self._client._build_url(f"/session/{id}/extend-session"),
             data={"durationMinutes": duration_minutes},
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     @overload
     def update_profile_params(
@@ -251,7 +252,7 @@ class SessionManager:
                 "params": dump_request(params_obj, UpdateSessionProfileParams),
             },
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     def update_proxy_params(
         self,
@@ -265,7 +266,7 @@ class SessionManager:
                 "params": dump_request(params, UpdateSessionProxyParams),
             },
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     def update_screen_size(
         self,
@@ -279,7 +280,7 @@ class SessionManager:
                 "params": dump_request(params, UpdateSessionScreenParams),
             },
         )
-        return BasicResponse(**response.data)
+        return response.to_model(BasicResponse)
 
     def start_captcha_solving(
         self,
@@ -304,7 +305,7 @@ class SessionManager:
                 },
             },
         )
-        return UpdateSessionSolveCaptchasResponse(**response.data)
+        return response.to_model(UpdateSessionSolveCaptchasResponse)
 
     def stop_captcha_solving(self, id: str) -> UpdateSessionSolveCaptchasResponse:
         response = self._client.transport.put(
@@ -316,7 +317,7 @@ class SessionManager:
                 },
             },
         )
-        return UpdateSessionSolveCaptchasResponse(**response.data)
+        return response.to_model(UpdateSessionSolveCaptchasResponse)
 
     def _warn_update_profile_params_boolean_deprecated(self) -> None:
         if SessionManager._has_warned_update_profile_params_boolean_deprecated:
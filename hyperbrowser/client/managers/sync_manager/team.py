@@ -9,4 +9,4 @@ class TeamManager:
         response = self._client.transport.get(
             self._client._build_url("/team/credit-info")
         )
-        return TeamCreditInfo(**response.data)
+        return response.to_model(TeamCreditInfo)
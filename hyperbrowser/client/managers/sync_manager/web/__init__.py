@@ -1,5 +1,11 @@
 from typing import Union
 
+from hyperbrowser.client._cache import (
+    cache_key,
+    cached_response,
+    requested_max_age,
+    response_content,
+)
 from hyperbrowser.client._request import dump_request, dump_request_with_fetch_schemas
 from hyperbrowser.types import (
     FetchParams as FetchParamsDict,
@@ -26,11 +32,23 @@ class WebManager:
         self,
         params: Union[FetchParamsDict, FetchParams],
     ) -> FetchResponse:
-        response = self._client.transport.post(
-            self._client._build_url("/web/fetch"),
-            data=dump_request_with_fetch_schemas(params, FetchParams),
-        )
-        return FetchResponse(**response.data)
+        url = self._client._build_url("/web/fetch")
+        payload = dump_request_with_fetch_schemas(params, FetchParams)
+        key = cache_key(self._client, url, payload)
+        if key is not None:
+            content = self._client.response_cache.get(key, requested_max_age(payload))
+            if content is not None:
+                return cached_response(content, self._client.json_codec).to_model(
+                    FetchResponse
+                )
+
+        response = self._client.transport.post(url, data=payload)
+        result = response.to_model(FetchResponse)
+        if key is not None and result.status == "completed":
+            self._client.response_cache.set(
+                key, response_content(response, self._client.json_codec)
+            )
+        return result
 
     def search(
         self,
@@ -40,4 +58,4 @@ class WebManager:
             self._client._build_url("/web/search"),
             data=dump_request(params, WebSearchParams),
         )
-        return WebSearchResponse(**response.data)
+        return response.to_model(WebSearchResponse)
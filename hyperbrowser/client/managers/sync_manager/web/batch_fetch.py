@@ -1,10 +1,16 @@
 import time
-from typing import Optional, Union
+from typing import Any, Dict, Iterator, Literal, Optional, Union, overload
 
 from hyperbrowser.client._request import (
     dump_request,
     dump_request_with_fetch_schemas,
 )
+from hyperbrowser.client._results import (
+    batch_result_mode,
+    iter_job_pages,
+    merge_job_batches,
+    parse_job_response,
+)
 from hyperbrowser.exceptions import HyperbrowserError
 from hyperbrowser.models import (
     StartBatchFetchJobParams,
@@ -13,7 +19,11 @@ from hyperbrowser.models import (
     GetBatchFetchJobParams,
     BatchFetchJobResponse,
     BatchFetchJobStatus,
+    LazyJobResponse,
+    LazyModel,
+    PageData,
     POLLING_ATTEMPTS,
+    ResultMode,
 )
 from hyperbrowser.types import (
     GetBatchFetchJobParams as GetBatchFetchJobParamsDict,
@@ -33,13 +43,46 @@ class BatchFetchManager:
             self._client._build_url("/web/batch-fetch"),
             data=dump_request_with_fetch_schemas(params, StartBatchFetchJobParams),
         )
-        return StartBatchFetchJobResponse(**response.data)
+        return response.to_model(StartBatchFetchJobResponse)
 
     def get_status(self, job_id: str) -> BatchFetchJobStatusResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/web/batch-fetch/{job_id}/status")
         )
-        return BatchFetchJobStatusResponse(**response.data)
+        return response.to_model(BatchFetchJobStatusResponse)
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchFetchJobParamsDict, GetBatchFetchJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> BatchFetchJobResponse: ...
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchFetchJobParamsDict, GetBatchFetchJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[BatchFetchJobResponse, PageData]: ...
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchFetchJobParamsDict, GetBatchFetchJobParams]
+        ] = None,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
 
     def get(
         self,
@@ -47,20 +90,81 @@ class BatchFetchManager:
         params: Optional[
             Union[GetBatchFetchJobParamsDict, GetBatchFetchJobParams]
         ] = None,
-    ) -> BatchFetchJobResponse:
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        BatchFetchJobResponse,
+        LazyJobResponse[BatchFetchJobResponse, PageData],
+        Dict[str, Any],
+    ]:
         if params is None:
             params = GetBatchFetchJobParams()
         response = self._client.transport.get(
             self._client._build_url(f"/web/batch-fetch/{job_id}"),
             params=dump_request(params, GetBatchFetchJobParams),
         )
-        return BatchFetchJobResponse(**response.data)
+        return parse_job_response(
+            response, BatchFetchJobResponse, PageData, result_mode
+        )
+
+    def iter_pages(
+        self,
+        job_id: str,
+        params: Optional[
+            Union[GetBatchFetchJobParamsDict, GetBatchFetchJobParams]
+        ] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Iterator[Union[PageData, LazyModel[PageData], Dict[str, Any]]]:
+        if params is None:
+            params = GetBatchFetchJobParams()
+        return iter_job_pages(
+            self._client.transport,
+            self._client._build_url(f"/web/batch-fetch/{job_id}"),
+            dump_request(params, GetBatchFetchJobParams),
+            PageData,
+            result_mode,
+        )
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartBatchFetchJobParamsDict, StartBatchFetchJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> BatchFetchJobResponse: ...
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartBatchFetchJobParamsDict, StartBatchFetchJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[BatchFetchJobResponse, PageData]: ...
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartBatchFetchJobParamsDict, StartBatchFetchJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
 
     def start_and_wait(
         self,
         params: Union[StartBatchFetchJobParamsDict, StartBatchFetchJobParams],
         return_all_pages: bool = True,
-    ) -> BatchFetchJobResponse:
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        BatchFetchJobResponse,
+        LazyJobResponse[BatchFetchJobResponse, PageData],
+        Dict[str, Any],
+    ]:
+        page_result_mode = batch_result_mode(result_mode)
         job_start_resp = self.start(params)
         job_id = job_start_resp.job_id
         if not job_id:
@@ -86,7 +190,7 @@ class BatchFetchManager:
         if not return_all_pages:
             while True:
                 try:
-                    return self.get(job_id)
+                    return self.get(job_id, result_mode=result_mode)
                 except Exception as e:
                     failures += 1
                     if failures >= POLLING_ATTEMPTS:
@@ -117,6 +221,7 @@ class BatchFetchManager:
                     params=GetBatchFetchJobParams(
                         page=job_response.current_page_batch + 1, batch_size=100
                     ),
+                    result_mode=page_result_mode,
                 )
                 if tmp_job_response.data:
                     job_response.data.extend(tmp_job_response.data)
@@ -135,4 +240,6 @@ class BatchFetchManager:
                     )
             time.sleep(0.5)
 
-        return job_response
+        if result_mode == "model":
+            return job_response
+        return merge_job_batches(tmp_job_response, job_response.data, result_mode)
@@ -1,10 +1,16 @@
 import time
-from typing import Optional, Union
+from typing import Any, Dict, Iterator, Literal, Optional, Union, overload
 
 from hyperbrowser.client._request import (
     dump_request,
     dump_request_with_fetch_schemas,
 )
+from hyperbrowser.client._results import (
+    batch_result_mode,
+    iter_job_pages,
+    merge_job_batches,
+    parse_job_response,
+)
 from hyperbrowser.exceptions import HyperbrowserError
 from hyperbrowser.models import (
     StartWebCrawlJobParams,
@@ -13,7 +19,11 @@ from hyperbrowser.models import (
     GetWebCrawlJobParams,
     WebCrawlJobResponse,
     WebCrawlJobStatus,
+    LazyJobResponse,
+    LazyModel,
+    PageData,
     POLLING_ATTEMPTS,
+    ResultMode,
 )
 from hyperbrowser.types import (
     GetWebCrawlJobParams as GetWebCrawlJobParamsDict,
@@ -33,32 +43,116 @@ class WebCrawlManager:
             self._client._build_url("/web/crawl"),
             data=dump_request_with_fetch_schemas(params, StartWebCrawlJobParams),
         )
-        return StartWebCrawlJobResponse(**response.data)
+        return response.to_model(StartWebCrawlJobResponse)
 
     def get_status(self, job_id: str) -> WebCrawlJobStatusResponse:
         response = self._client.transport.get(
             self._client._build_url(f"/web/crawl/{job_id}/status")
         )
-        return WebCrawlJobStatusResponse(**response.data)
+        return response.to_model(WebCrawlJobStatusResponse)
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[Union[GetWebCrawlJobParamsDict, GetWebCrawlJobParams]] = None,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> WebCrawlJobResponse: ...
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[Union[GetWebCrawlJobParamsDict, GetWebCrawlJobParams]] = None,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[WebCrawlJobResponse, PageData]: ...
+
+    @overload
+    def get(
+        self,
+        job_id: str,
+        params: Optional[Union[GetWebCrawlJobParamsDict, GetWebCrawlJobParams]] = None,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
 
     def get(
         self,
         job_id: str,
         params: Optional[Union[GetWebCrawlJobParamsDict, GetWebCrawlJobParams]] = None,
-    ) -> WebCrawlJobResponse:
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        WebCrawlJobResponse,
+        LazyJobResponse[WebCrawlJobResponse, PageData],
+        Dict[str, Any],
+    ]:
         if params is None:
             params = GetWebCrawlJobParams()
         response = self._client.transport.get(
             self._client._build_url(f"/web/crawl/{job_id}"),
             params=dump_request(params, GetWebCrawlJobParams),
         )
-        return WebCrawlJobResponse(**response.data)
+        return parse_job_response(response, WebCrawlJobResponse, PageData, result_mode)
+
+    def iter_pages(
+        self,
+        job_id: str,
+        params: Optional[Union[GetWebCrawlJobParamsDict, GetWebCrawlJobParams]] = None,
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Iterator[Union[PageData, LazyModel[PageData], Dict[str, Any]]]:
+        if params is None:
+            params = GetWebCrawlJobParams()
+        return iter_job_pages(
+            self._client.transport,
+            self._client._build_url(f"/web/crawl/{job_id}"),
+            dump_request(params, GetWebCrawlJobParams),
+            PageData,
+            result_mode,
+        )
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartWebCrawlJobParamsDict, StartWebCrawlJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["model"] = "model",
+    ) -> WebCrawlJobResponse: ...
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartWebCrawlJobParamsDict, StartWebCrawlJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["lazy"],
+    ) -> LazyJobResponse[WebCrawlJobResponse, PageData]: ...
+
+    @overload
+    def start_and_wait(
+        self,
+        params: Union[StartWebCrawlJobParamsDict, StartWebCrawlJobParams],
+        return_all_pages: bool = True,
+        *,
+        result_mode: Literal["dict"],
+    ) -> Dict[str, Any]: ...
 
     def start_and_wait(
         self,
         params: Union[StartWebCrawlJobParamsDict, StartWebCrawlJobParams],
         return_all_pages: bool = True,
-    ) -> WebCrawlJobResponse:
+        *,
+        result_mode: ResultMode = "model",
+    ) -> Union[
+        WebCrawlJobResponse,
+        LazyJobResponse[WebCrawlJobResponse, PageData],
+        Dict[str, Any],
+    ]:
+        page_result_mode = batch_result_mode(result_mode)
         job_start_resp = self.start(params)
         job_id = job_start_resp.job_id
         if not job_id:
@@ -84,7 +178,7 @@ class WebCrawlManager:
         if not return_all_pages:
             while True:
                 try:
-                    return self.get(job_id)
+                    return self.get(job_id, result_mode=result_mode)
                 except Exception as e:
                     failures += 1
                     if failures >= POLLING_ATTEMPTS:
@@ -115,6 +209,7 @@ class WebCrawlManager:
                     params=GetWebCrawlJobParams(
                         page=job_response.current_page_batch + 1, batch_size=100
                     ),
+                    result_mode=page_result_mode,
                 )
                 if tmp_job_response.data:
                     job_response.data.extend(tmp_job_response.data)
@@ -133,4 +228,6 @@ class WebCrawlManager:
                     )
             time.sleep(0.5)
 
-        return job_response
+        if result_mode == "model":
+            return job_response
+        return merge_job_batches(tmp_job_response, job_response.data, result_mode)
@@ -1,20 +1,23 @@
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
 from ..config import ClientConfig
 from ..transport.sync import SyncTransport
 from .base import HyperbrowserBase
-from .managers.sync_manager.web import WebManager
-from .managers.sync_manager.agents import Agents
-from .managers.sync_manager.crawl import CrawlManager
-from .managers.sync_manager.extension import ExtensionManager
-from .managers.sync_manager.extract import ExtractManager
-from .managers.sync_manager.profile import ProfileManager
-from .managers.sync_manager.sandbox import SandboxManager
-from .managers.sync_manager.scrape import ScrapeManager
-from .managers.sync_manager.session import SessionManager
-from .managers.sync_manager.team import TeamManager
-from .managers.sync_manager.computer_action import ComputerActionManager
-from .managers.sync_manager.volume import VolumeManager
+
+if TYPE_CHECKING:
+    from .managers.sync_manager.agents import Agents
+    from .managers.sync_manager.computer_action import ComputerActionManager
+    from .managers.sync_manager.crawl import CrawlManager
+    from .managers.sync_manager.extension import ExtensionManager
+    from .managers.sync_manager.extract import ExtractManager
+    from .managers.sync_manager.profile import ProfileManager
+    from .managers.sync_manager.sandbox import SandboxManager
+    from .managers.sync_manager.scrape import ScrapeManager
+    from .managers.sync_manager.session import SessionManager
+    from .managers.sync_manager.team import TeamManager
+    from .managers.sync_manager.volume import VolumeManager
+    from .managers.sync_manager.web import WebManager
 
 
 class Hyperbrowser(HyperbrowserBase):
@@ -37,18 +40,78 @@ class Hyperbrowser(HyperbrowserBase):
         )
         self.timeout = timeout or 30
         self.transport.client.timeout = timeout
-        self.sessions = SessionManager(self)
-        self.web = WebManager(self)
-        self.scrape = ScrapeManager(self)
-        self.crawl = CrawlManager(self)
-        self.extract = ExtractManager(self)
-        self.profiles = ProfileManager(self)
-        self.extensions = ExtensionManager(self)
-        self.agents = Agents(self)
-        self.team = TeamManager(self)
-        self.computer_action = ComputerActionManager(self)
-        self.sandboxes = SandboxManager(self)
-        self.volumes = VolumeManager(self)
+
+    @cached_property
+    def sessions(self) -> "SessionManager":
+        from .managers.sync_manager.session import SessionManager
+
+        return SessionManager(self)
+
+    @cached_property
+    def web(self) -> "WebManager":
+        from .managers.sync_manager.web import WebManager
+
+        return WebManager(self)
+
+    @cached_property
+    def scrape(self) -> "ScrapeManager":
+        from .managers.sync_manager.scrape import ScrapeManager
+
+        return ScrapeManager(self)
+
+    @cached_property
+    def crawl(self) -> "CrawlManager":
+        from .managers.sync_manager.crawl import CrawlManager
+
+        return CrawlManager(self)
+
+    @cached_property
+    def extract(self) -> "ExtractManager":
+        from .managers.sync_manager.extract import ExtractManager
+
+        return ExtractManager(self)
+
+    @cached_property
+    def profiles(self) -> "ProfileManager":
+        from .managers.sync_manager.profile import ProfileManager
+
+        return ProfileManager(self)
+
+    @cached_property
+    def extensions(self) -> "ExtensionManager":
+        from .managers.sync_manager.extension import ExtensionManager
+
+        return ExtensionManager(self)
+
+    @cached_property
+    def agents(self) -> "Agents":
+        from .managers.sync_manager.agents import Agents
+
+        return Agents(self)
+
+    @cached_property
+    def team(self) -> "TeamManager":
+        from .managers.sync_manager.team import TeamManager
+
+        return TeamManager(self)
+
+    @cached_property
+    def computer_action(self) -> "ComputerActionManager":
+        from .managers.sync_manager.computer_action import ComputerActionManager
+
+        return ComputerActionManager(self)
+
+    @cached_property
+    def sandboxes(self) -> "SandboxManager":
+        from .managers.sync_manager.sandbox import SandboxManager
+
+        return SandboxManager(self)
+
+    @cached_property
+    def volumes(self) -> "VolumeManager":
+        from .managers.sync_manager.volume import VolumeManager
+
+        return VolumeManager(self)
 
     def close(self) -> None:
         self.transport.close()
@@ -2,6 +2,10 @@ from dataclasses import dataclass
 from typing import Optional
 import os
 
+from .json_codec import JsonCodecName
+from .response_cache import ResponseCache
+from .transport.single_flight import CoalesceGets
+
 
 @dataclass
 class ClientConfig:
@@ -10,6 +14,10 @@ class ClientConfig:
     api_key: str
     base_url: str = "https://api.hyperbrowser.ai"
     runtime_proxy_override: Optional[str] = None
+    json_codec: JsonCodecName = "auto"
+    response_cache: Optional[ResponseCache] = None
+    coalesce_gets: CoalesceGets = False
+    validate_requests: bool = True
 
     @classmethod
     def from_env(cls) -> "ClientConfig":
@@ -20,4 +28,5 @@ class ClientConfig:
         base_url = os.environ.get(
             "HYPERBROWSER_BASE_URL", "https://api.hyperbrowser.ai"
         )
-        return cls(api_key=api_key, base_url=base_url)
+        json_codec = os.environ.get("HYPERBROWSER_JSON_CODEC", "auto")
+        return cls(api_key=api_key, base_url=base_url, json_codec=json_codec)
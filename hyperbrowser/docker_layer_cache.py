@@ -0,0 +1,169 @@
+"""Local cache that lets image builds skip exporting layers the server holds.
+
+``build_image_from_docker_image`` describes a local image by a manifest of
+its config and layer digests, which normally requires a full
+``docker image save``. With a ``DockerLayerCache``, the manifest of every
+exported image is kept by image ID and platform, and layer digests are
+remembered once the server has them. A known image is then described
+without exporting it, and a new image's layers that the server already holds
+are hashed from their ``docker image save`` names instead of being written
+to disk. Layers the server asks for anyway are exported on demand. The cache
+is disabled unless a ``DockerLayerCache`` is passed as ``layer_cache``.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Set, Union
+
+from .models.sandbox import SandboxDockerImageManifest
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS manifests (
+        image_digest TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        manifest TEXT NOT NULL,
+        used_at REAL NOT NULL,
+        PRIMARY KEY (image_digest, platform)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS remote_layers (
+        sha256 TEXT PRIMARY KEY,
+        seen_at REAL NOT NULL
+    )
+    """,
+)
+
+
+@dataclass(frozen=True)
+class DockerLayerCacheStats:
+    """Counters describing how a ``DockerLayerCache`` has been used."""
+
+    manifest_hits: int = 0
+    manifest_misses: int = 0
+    skipped_layers: int = 0
+
+
+class DockerLayerCache:
+    """
+    Persistent record of exported image manifests and server-side layers.
+
+    ``path`` is a SQLite file shared across processes. ``max_manifests``
+    bounds the stored manifests by dropping the least recently used ones.
+    Layers are assumed to stay on the server once uploaded; if one has been
+    removed, the build requests it and it is exported again.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_manifests: int = 1_000,
+    ):
+        if max_manifests < 0:
+            raise ValueError("max_manifests must not be negative")
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_manifests = max_manifests
+        self._lock = threading.Lock()
+        self._counters = {name: 0 for name in DockerLayerCacheStats.__annotations__}
+        self._connection = self._connect(self.path)
+
+    @staticmethod
+    def _connect(path: str) -> Any:
+        import sqlite3
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+        return connection
+
+    @property
+    def stats(self) -> DockerLayerCacheStats:
+        with self._lock:
+            return DockerLayerCacheStats(**self._counters)
+
+    def manifest(
+        self, image_digest: str, platform: str
+    ) -> Optional[SandboxDockerImageManifest]:
+        """Return the stored manifest of an already exported image."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT manifest FROM manifests "
+                "WHERE image_digest = ? AND platform = ?",
+                (image_digest, platform),
+            ).fetchone()
+            if row is None:
+                self._counters["manifest_misses"] += 1
+                return None
+            self._connection.execute(
+                "UPDATE manifests SET used_at = ? "
+                "WHERE image_digest = ? AND platform = ?",
+                (time.time(), image_digest, platform),
+            )
+            self._connection.commit()
+            self._counters["manifest_hits"] += 1
+        return SandboxDockerImageManifest.model_validate_json(row[0])
+
+    def store_manifest(
+        self,
+        image_digest: str,
+        platform: str,
+        manifest: SandboxDockerImageManifest,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO manifests "
+                "(image_digest, platform, manifest, used_at) VALUES (?, ?, ?, ?)",
+                (image_digest, platform, manifest.model_dump_json(), time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM manifests WHERE rowid IN ("
+                "SELECT rowid FROM manifests ORDER BY used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_manifests,),
+            )
+            self._connection.commit()
+
+    def remote_layers(self) -> Set[str]:
+        """Digests of layers the server is known to hold."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT sha256 FROM remote_layers"
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_remote(self, digests: Iterable[str]) -> None:
+        now = time.time()
+        rows = [(digest, now) for digest in digests]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO remote_layers (sha256, seen_at) "
+                "VALUES (?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def count_skipped_layers(self, count: int) -> None:
+        with self._lock:
+            self._counters["skipped_layers"] += count
+
+    def clear(self) -> None:
+        """Drop every stored manifest and layer. Counters are kept."""
+        with self._lock:
+            self._connection.execute("DELETE FROM manifests")
+            self._connection.execute("DELETE FROM remote_layers")
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+__all__ = ["DockerLayerCache", "DockerLayerCacheStats"]
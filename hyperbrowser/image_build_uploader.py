@@ -0,0 +1,389 @@
+"""Pooled uploader for image build artifacts.
+
+Image builds upload Docker layers and build-context bundles to presigned
+URLs. An ``ImageBuildUploader`` sends them over one ``httpx.Client``, so
+connections are reused across artifacts and retries, with a configurable
+number of parallel uploads, an optional bandwidth limit shared by all of
+them and progress callbacks. ``AsyncImageBuildUploader`` does the same on
+the event loop with an ``httpx.AsyncClient``. Image builds create one per
+build unless an ``uploader`` is passed.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Callable, Iterator, Optional, Sequence, Tuple
+
+import httpx
+
+from .models.sandbox import SandboxImageBuildUpload
+
+_UPLOAD_CHUNK_BYTES = 256 * 1024
+_ARTIFACT_READ_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="hyperbrowser-image-upload"
+)
+
+ProgressCallback = Callable[[SandboxImageBuildUpload, int, int], None]
+"""Called with the upload, the bytes sent so far and the artifact size."""
+
+
+class _UploadStatusError(RuntimeError):
+    def __init__(self, status_code: int, body: str):
+        self.status_code = status_code
+        super().__init__(
+            f"image artifact upload failed: {status_code}: {body}".rstrip()
+        )
+
+
+class _UploadRateLimiter:
+    """Paces chunks from every upload to ``bytes_per_second`` in total."""
+
+    def __init__(self, bytes_per_second: float):
+        self._bytes_per_second = bytes_per_second
+        self._lock = threading.Lock()
+        self._available_at = time.monotonic()
+
+    def reserve(self, size: int) -> float:
+        """Book ``size`` bytes and return how long to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._available_at)
+            self._available_at = start + size / self._bytes_per_second
+        return start - now
+
+
+class ImageBuildUploader:
+    """
+    Uploads image build artifacts over a shared connection pool.
+
+    ``max_concurrency`` bounds both the parallel uploads and the pooled
+    connections. ``max_bytes_per_second`` limits the combined upload rate.
+    ``progress`` is called from the uploading threads after every chunk;
+    a retried upload reports again from zero. ``timeout`` applies to every
+    request, and ``None`` disables it. PUT uploads are attempted up to
+    ``attempts`` times on network errors, 408, 429 and 5xx responses.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 4,
+        max_bytes_per_second: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None,
+        timeout: Optional[float] = None,
+        attempts: int = 3,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+            raise ValueError("max_bytes_per_second must be positive")
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.attempts = attempts
+        self._progress = progress
+        self._rate_limiter = (
+            _UploadRateLimiter(max_bytes_per_second)
+            if max_bytes_per_second is not None
+            else None
+        )
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+        )
+
+    def upload(
+        self,
+        upload: SandboxImageBuildUpload,
+        artifact_path: str,
+        *,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Upload one artifact; ``timeout`` overrides the uploader's."""
+        artifact_size = os.path.getsize(artifact_path)
+        if upload.max_upload_bytes > 0 and artifact_size > upload.max_upload_bytes:
+            raise RuntimeError(
+                "image artifact exceeds the server upload limit "
+                f"({artifact_size} > {upload.max_upload_bytes})"
+            )
+        method = (upload.method or "PUT").strip().upper()
+        attempts = self.attempts if method == "PUT" else 1
+        last_error: Optional[Exception] = None
+        for attempt in range(1, attempts + 1):
+            try:
+                self._send(
+                    upload,
+                    artifact_path,
+                    artifact_size,
+                    method=method,
+                    timeout=timeout,
+                )
+                return
+            except httpx.HTTPError as exc:
+                last_error = exc
+            except _UploadStatusError as exc:
+                last_error = exc
+                if exc.status_code not in (408, 429) and exc.status_code < 500:
+                    raise
+            if attempt < attempts:
+                time.sleep(attempt * 0.25)
+        if last_error is not None:
+            raise last_error
+
+    def upload_many(
+        self,
+        items: Sequence[Tuple[SandboxImageBuildUpload, str]],
+        *,
+        label: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Upload ``(upload, artifact_path)`` pairs in parallel, in order."""
+        if not items:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(items))
+        ) as executor:
+            futures = {}
+            for upload, artifact_path in items:
+                future = executor.submit(
+                    self.upload, upload, artifact_path, timeout=timeout
+                )
+                futures[future] = (upload.sha256 or "").strip().lower()
+            for future in as_completed(futures):
+                digest = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    raise RuntimeError(f"upload {label} {digest}: {exc}") from exc
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> "ImageBuildUploader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _send(
+        self,
+        upload: SandboxImageBuildUpload,
+        artifact_path: str,
+        artifact_size: int,
+        *,
+        method: str,
+        timeout: Optional[float],
+    ) -> None:
+        headers = dict(upload.headers or {})
+        headers.setdefault("content-length", str(artifact_size))
+        with open(artifact_path, "rb") as artifact:
+            response = self._client.request(
+                method,
+                upload.url,
+                content=self._chunks(upload, artifact, artifact_size),
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        if response.is_success:
+            return
+        raise _UploadStatusError(response.status_code, response.text.strip())
+
+    def _chunks(
+        self, upload: SandboxImageBuildUpload, artifact, artifact_size: int
+    ) -> Iterator[bytes]:
+        sent = 0
+        while True:
+            chunk = artifact.read(_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                return
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve(len(chunk))
+                if delay > 0:
+                    time.sleep(delay)
+            yield chunk
+            sent += len(chunk)
+            if self._progress is not None:
+                self._progress(upload, sent, artifact_size)
+
+
+class AsyncImageBuildUploader:
+    """
+    Asyncio counterpart of ``ImageBuildUploader``.
+
+    Uploads run as tasks on the event loop over one ``httpx.AsyncClient``,
+    at most ``max_concurrency`` at a time, and take the same settings.
+    Artifacts are opened and read on a dedicated executor, so file I/O never
+    blocks the loop. ``progress`` is called on the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 4,
+        max_bytes_per_second: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None,
+        timeout: Optional[float] = None,
+        attempts: int = 3,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+            raise ValueError("max_bytes_per_second must be positive")
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.attempts = attempts
+        self._progress = progress
+        self._rate_limiter = (
+            _UploadRateLimiter(max_bytes_per_second)
+            if max_bytes_per_second is not None
+            else None
+        )
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+        )
+
+    async def upload(
+        self,
+        upload: SandboxImageBuildUpload,
+        artifact_path: str,
+        *,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Upload one artifact; ``timeout`` overrides the uploader's."""
+        artifact_size = await _read_artifact(os.path.getsize, artifact_path)
+        if upload.max_upload_bytes > 0 and artifact_size > upload.max_upload_bytes:
+            raise RuntimeError(
+                "image artifact exceeds the server upload limit "
+                f"({artifact_size} > {upload.max_upload_bytes})"
+            )
+        method = (upload.method or "PUT").strip().upper()
+        attempts = self.attempts if method == "PUT" else 1
+        last_error: Optional[Exception] = None
+        for attempt in range(1, attempts + 1):
+            try:
+                await self._send(
+                    upload,
+                    artifact_path,
+                    artifact_size,
+                    method=method,
+                    timeout=timeout,
+                )
+                return
+            except httpx.HTTPError as exc:
+                last_error = exc
+            except _UploadStatusError as exc:
+                last_error = exc
+                if exc.status_code not in (408, 429) and exc.status_code < 500:
+                    raise
+            if attempt < attempts:
+                await asyncio.sleep(attempt * 0.25)
+        if last_error is not None:
+            raise last_error
+
+    async def upload_many(
+        self,
+        items: Sequence[Tuple[SandboxImageBuildUpload, str]],
+        *,
+        label: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Upload ``(upload, artifact_path)`` pairs concurrently, in order.
+
+        The first failure cancels the uploads still running.
+        """
+        if not items:
+            return
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def upload_one(upload: SandboxImageBuildUpload, artifact_path: str):
+            async with semaphore:
+                try:
+                    await self.upload(upload, artifact_path, timeout=timeout)
+                except Exception as exc:
+                    digest = (upload.sha256 or "").strip().lower()
+                    raise RuntimeError(f"upload {label} {digest}: {exc}") from exc
+
+        tasks = [asyncio.ensure_future(upload_one(*item)) for item in items]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncImageBuildUploader":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _send(
+        self,
+        upload: SandboxImageBuildUpload,
+        artifact_path: str,
+        artifact_size: int,
+        *,
+        method: str,
+        timeout: Optional[float],
+    ) -> None:
+        headers = dict(upload.headers or {})
+        headers.setdefault("content-length", str(artifact_size))
+        artifact = await _read_artifact(open, artifact_path, "rb")
+        try:
+            response = await self._client.request(
+                method,
+                upload.url,
+                content=self._chunks(upload, artifact, artifact_size),
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        finally:
+            artifact.close()
+        if response.is_success:
+            return
+        raise _UploadStatusError(response.status_code, response.text.strip())
+
+    async def _chunks(
+        self, upload: SandboxImageBuildUpload, artifact, artifact_size: int
+    ) -> AsyncIterator[bytes]:
+        sent = 0
+        while True:
+            chunk = await _read_artifact(artifact.read, _UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                return
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve(len(chunk))
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield chunk
+            sent += len(chunk)
+            if self._progress is not None:
+                self._progress(upload, sent, artifact_size)
+
+
+async def _read_artifact(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _ARTIFACT_READ_EXECUTOR, functools.partial(func, *args)
+    )
+
+
+__all__ = ["AsyncImageBuildUploader", "ImageBuildUploader", "ProgressCallback"]
@@ -0,0 +1,168 @@
+"""JSON encoding shared by the control-plane and runtime transports.
+
+The standard library codec is always available. ``orjson`` and ``msgspec`` are
+optional accelerators: when one is installed and selected through
+``ClientConfig.json_codec`` (``"auto"`` picks the first that imports), request
+bodies, API responses, runtime SSE events and WebSocket frames all go through
+it. Decode failures are always raised as ``json.JSONDecodeError`` so callers
+can keep a single error contract regardless of the selected backend.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Literal, Optional, Union
+
+from .exceptions import HyperbrowserError
+
+JsonCodecName = Literal["auto", "json", "orjson", "msgspec"]
+JSON_CONTENT_TYPE = "application/json"
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+    ).encode("utf-8")
+
+
+def _stdlib_loads(data: JsonInput) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+class JsonCodec:
+    """A named pair of JSON encode/decode functions."""
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[JsonInput], Any],
+    ):
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize ``value`` to compact UTF-8 JSON bytes."""
+        return self._dumps(value)
+
+    def dumps_text(self, value: Any) -> str:
+        """Serialize ``value`` for text transports such as WebSocket frames."""
+        return self._dumps(value).decode("utf-8")
+
+    def loads(self, data: JsonInput) -> Any:
+        """Parse JSON from bytes or text."""
+        return self._loads(data)
+
+    def request_kwargs(self, data: Optional[Any]) -> Dict[str, Any]:
+        """Build httpx keyword arguments for a JSON request body."""
+        if data is None:
+            return {}
+        return {
+            "content": self._dumps(data),
+            "headers": {"Content-Type": JSON_CONTENT_TYPE},
+        }
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+STDLIB_JSON_CODEC = JsonCodec("json", _stdlib_dumps, _stdlib_loads)
+
+
+def _load_orjson_codec() -> Optional[JsonCodec]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, option=options)
+        except TypeError:
+            # orjson rejects a few values the stdlib accepts, such as integers
+            # wider than 64 bits; keep the wire contract identical for them.
+            return _stdlib_dumps(value)
+
+    def loads(data: JsonInput) -> Any:
+        return orjson.loads(data)
+
+    return JsonCodec("orjson", dumps, loads)
+
+
+def _load_msgspec_codec() -> Optional[JsonCodec]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(value: Any) -> bytes:
+        try:
+            return encoder.encode(value)
+        except TypeError:
+            return _stdlib_dumps(value)
+
+    def loads(data: JsonInput) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise json.JSONDecodeError(str(exc), "", 0) from exc
+
+    return JsonCodec("msgspec", dumps, loads)
+
+
+_OPTIONAL_CODEC_LOADERS = {
+    "orjson": _load_orjson_codec,
+    "msgspec": _load_msgspec_codec,
+}
+
+
+@lru_cache(maxsize=None)
+def get_json_codec(name: Optional[str] = "auto") -> JsonCodec:
+    """Resolve a codec name to a codec instance.
+
+    ``"auto"`` (or ``None``) selects orjson, then msgspec, then the standard
+    library. Naming an optional backend explicitly requires it to be installed.
+    """
+    normalized = (name or "auto").strip().lower()
+    if normalized == "json":
+        return STDLIB_JSON_CODEC
+    if normalized == "auto":
+        for loader in _OPTIONAL_CODEC_LOADERS.values():
+            codec = loader()
+            if codec is not None:
+                return codec
+        return STDLIB_JSON_CODEC
+
+    loader = _OPTIONAL_CODEC_LOADERS.get(normalized)
+    if loader is None:
+        raise HyperbrowserError(
+            f'Unknown JSON codec "{name}"; expected one of: auto, json, '
+            "orjson, msgspec"
+        )
+    codec = loader()
+    if codec is None:
+        raise HyperbrowserError(
+            f'JSON codec "{normalized}" requires the {normalized} package'
+        )
+    return codec
+
+
+__all__ = [
+    "JSON_CONTENT_TYPE",
+    "JsonCodec",
+    "JsonCodecName",
+    "STDLIB_JSON_CODEC",
+    "get_json_codec",
+]
@@ -0,0 +1,158 @@
+"""Incremental decoding of a JSON object that carries one large array.
+
+Batch result endpoints return an envelope such as
+``{"jobId": ..., "data": [page, page, ...], "currentPageBatch": 1, ...}``
+where ``data`` dominates the payload. ``JsonArrayStreamDecoder`` scans the
+body as it arrives, hands back each array entry as soon as its closing
+delimiter is seen and drops the consumed bytes, so memory stays bounded by the
+largest entry rather than the whole response. String contents are skipped with
+compiled regular expressions; only structural characters are visited in
+Python.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from .json_codec import JsonCodec, get_json_codec
+
+_STRUCTURAL = re.compile(rb'[\[\]{},"]')
+# Consumes string content up to (not including) the closing quote or a
+# trailing, not yet escaped, backslash.
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*')
+_KEY_SEPARATOR = re.compile(rb"\s*:\s*")
+
+_PREFIX = 0
+_ARRAY = 1
+_SUFFIX = 2
+
+
+class JsonArrayStreamDecoder:
+    """
+    Push-style decoder yielding the entries of ``object[key]`` incrementally.
+
+    Call ``feed()`` with each chunk of the response body; it returns the
+    entries completed by that chunk. ``close()`` checks the document is
+    complete and returns the remaining top-level fields with ``key`` set to an
+    empty list.
+    """
+
+    def __init__(self, key: str = "data", json_codec: Optional[JsonCodec] = None):
+        self._key = key
+        self._json_codec = json_codec or get_json_codec()
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._phase = _PREFIX
+        self._string_start: Optional[int] = None
+        self._last_string: Optional[slice] = None
+        self._prefix = b""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        if self._phase == _SUFFIX:
+            self._buffer += chunk
+            return []
+        self._buffer += chunk
+        return self._scan()
+
+    def close(self) -> Dict[str, Any]:
+        if self._phase == _PREFIX:
+            envelope = self._json_codec.loads(bytes(self._buffer))
+        elif self._phase == _ARRAY:
+            raise json.JSONDecodeError(
+                f'Unterminated "{self._key}" array', "", len(self._buffer)
+            )
+        else:
+            envelope = self._json_codec.loads(self._prefix + b"[]" + self._buffer)
+        if not isinstance(envelope, dict):
+            raise json.JSONDecodeError("Expected a JSON object", "", 0)
+        self._buffer = bytearray()
+        return envelope
+
+    def _scan(self) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+        while True:
+            if self._string_start is not None:
+                if not self._consume_string():
+                    break
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                break
+
+            index = match.start()
+            char = buffer[index]
+            self._pos = index + 1
+            if char == 0x22:  # "
+                self._string_start = index
+            elif char in (0x7B, 0x5B):  # { [
+                if (
+                    char == 0x5B
+                    and self._phase == _PREFIX
+                    and self._depth == 1
+                    and self._is_target_key(index)
+                ):
+                    self._enter_array(index)
+                    buffer = self._buffer
+                    continue
+                self._depth += 1
+            elif char in (0x7D, 0x5D):  # } ]
+                if self._phase == _ARRAY and self._depth == 0:
+                    if char == 0x7D:
+                        raise json.JSONDecodeError(
+                            f'Unterminated "{self._key}" array', "", index
+                        )
+                    self._append_item(items, index)
+                    self._phase = _SUFFIX
+                    del buffer[: self._pos]
+                    self._pos = 0
+                    break
+                self._depth -= 1
+            elif self._phase == _ARRAY and self._depth == 0:  # ,
+                self._append_item(items, index)
+                del buffer[: self._pos]
+                self._pos = 0
+        return items
+
+    def _consume_string(self) -> bool:
+        buffer = self._buffer
+        end = _STRING_BODY.match(buffer, self._pos).end()
+        if end >= len(buffer) or buffer[end] != 0x22:
+            # Resume from the unfinished escape (or the end) on the next chunk.
+            self._pos = end
+            return False
+        if self._phase == _PREFIX and self._depth == 1:
+            self._last_string = slice(self._string_start, end + 1)
+        self._string_start = None
+        self._pos = end + 1
+        return True
+
+    def _is_target_key(self, index: int) -> bool:
+        last = self._last_string
+        if last is None:
+            return False
+        separator = _KEY_SEPARATOR.fullmatch(self._buffer, last.stop, index)
+        if separator is None:
+            return False
+        return json.loads(bytes(self._buffer[last])) == self._key
+
+    def _enter_array(self, index: int) -> None:
+        self._prefix = bytes(self._buffer[:index])
+        del self._buffer[: index + 1]
+        self._pos = 0
+        self._depth = 0
+        self._phase = _ARRAY
+        self._last_string = None
+
+    def _append_item(self, items: List[Any], index: int) -> None:
+        item = bytes(self._buffer[:index]).strip()
+        if item:
+            items.append(self._json_codec.loads(item))
+        elif self._buffer[index] == 0x2C:  # ,
+            raise json.JSONDecodeError(f'Empty entry in "{self._key}" array', "", index)
+
+
+__all__ = ["JsonArrayStreamDecoder"]
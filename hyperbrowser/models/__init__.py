@@ -1,412 +1,862 @@
-from .web.batch_fetch import (
-    StartBatchFetchJobParams,
-    StartBatchFetchJobResponse,
-    BatchFetchJobStatusResponse,
-    GetBatchFetchJobParams,
-    BatchFetchJobResponse,
-)
-from .web.crawl import (
-    WebCrawlOptions,
-    StartWebCrawlJobParams,
-    GetWebCrawlJobParams,
-    StartWebCrawlJobResponse,
-    WebCrawlJobStatusResponse,
-    WebCrawlJobResponse,
-)
-from .web.fetch import (
-    FetchParams,
-    FetchResponse,
-    FetchResponseData,
-)
-from .web.common import (
-    PageData,
-    FetchOutputOptions,
-    FetchNavigationOptions,
-    FetchBrowserOptions,
-    FetchCacheOptions,
-    FetchBrowserLocationOptions,
-    FetchStorageStateOptions,
-    FetchOutputJsonOptions,
-    FetchOutputScreenshotOptions,
-    FetchOutputJson,
-    FetchOutputMarkdown,
-    FetchOutputHtml,
-    FetchOutputLinks,
-    FetchOutputScreenshot,
-    FetchOutputBranding,
-    FetchOutputFormat,
-)
-from .web.branding import (
-    BrandingProfile,
-    BrandingColors,
-    BrandingFont,
-    BrandingFontRole,
-    BrandingTypography,
-    BrandingFontFamilies,
-    BrandingFontStacks,
-    BrandingFontSizes,
-    BrandingSpacing,
-    BrandingComponents,
-    BrandingButtonStyle,
-    BrandingInputStyle,
-    BrandingBorderRadiusCorners,
-    BrandingImages,
-    BrandingPersonality,
-    BrandingPersonalityTone,
-    BrandingPersonalityEnergy,
-    BrandingDesignSystem,
-    BrandingDesignFramework,
-    BrandingConfidence,
-    BrandingColorScheme,
-)
-from .web.search import (
-    WebSearchFilters,
-    WebSearchFiletype,
-    WebSearchParams,
-    WebSearchLocation,
-    WebSearchResponse,
-    WebSearchResponseData,
-    WebSearchResultItem,
-)
-from .agents.browser_use import (
-    BrowserUseTaskData,
-    BrowserUseTaskResponse,
-    BrowserUseTaskStatusResponse,
-    StartBrowserUseTaskParams,
-    StartBrowserUseTaskResponse,
-    BrowserUseApiKeys,
-    BrowserUseAgentBrain,
-    BrowserUseAgentOutput,
-    BrowserUseActionResult,
-    BrowserUseStepMetadata,
-    BrowserUseTabInfo,
-    BrowserUseCoordinates,
-    BrowserUseCoordinateSet,
-    BrowserUseViewportInfo,
-    BrowserUseDOMHistoryElement,
-    BrowserUseBrowserStateHistory,
-    BrowserUseAgentHistory,
-    BrowserUseAgentOutputV0710,
-    BrowserUseActionResultV0710,
-    BrowserUseBrowserStateHistoryV0710,
-    BrowserUseStepMetadataV0710,
-    BrowserUseAgentHistoryV0710,
-    BrowserUseAgentHistoryLatest,
-    BrowserUseTaskMetadata,
-    BrowserUseStep,
-    cast_steps_for_version,
-    BrowserUseTaskStatus,
-)
-from .agents.claude_computer_use import (
-    ClaudeComputerUseTaskStatus,
-    ClaudeComputerUseStepResponse,
-    ClaudeComputerUseTaskData,
-    ClaudeComputerUseTaskResponse,
-    ClaudeComputerUseTaskStatusResponse,
-    StartClaudeComputerUseTaskParams,
-    StartClaudeComputerUseTaskResponse,
-    ClaudeComputerUseApiKeys,
-)
-from .agents.gemini_computer_use import (
-    GeminiComputerUseTaskStatus,
-    GeminiComputerUseStepResponse,
-    GeminiComputerUseTaskData,
-    GeminiComputerUseTaskResponse,
-    GeminiComputerUseTaskStatusResponse,
-    StartGeminiComputerUseTaskParams,
-    StartGeminiComputerUseTaskResponse,
-    GeminiComputerUseApiKeys,
-)
-from .agents.grok_computer_use import (
-    GrokComputerUseTaskStatus,
-    GrokComputerUseStepResponse,
-    GrokComputerUseTaskData,
-    GrokComputerUseTaskResponse,
-    GrokComputerUseTaskStatusResponse,
-    StartGrokComputerUseTaskParams,
-    StartGrokComputerUseTaskResponse,
-    GrokComputerUseApiKeys,
-)
-from .agents.cua import (
-    CuaTaskData,
-    CuaTaskResponse,
-    CuaTaskStatusResponse,
-    StartCuaTaskParams,
-    StartCuaTaskResponse,
-    CuaApiKeys,
-    CuaBaseUrls,
-    CuaTaskStatus,
-)
-from .agents.hyper_agent import (
-    HyperAgentActionOutput,
-    HyperAgentOutput,
-    HyperAgentStep,
-    HyperAgentTaskData,
-    HyperAgentTaskResponse,
-    HyperAgentTaskStatus,
-    HyperAgentTaskStatusResponse,
-    StartHyperAgentTaskParams,
-    StartHyperAgentTaskResponse,
-    HyperAgentApiKeys,
-    HyperAgentOutputV110,
-    HyperAgentStepV110,
-)
-from .consts import (
-    ISO639_1,
-    POLLING_ATTEMPTS,
-    HyperAgentLlm,
-    BrowserUseLlm,
-    ClaudeComputerUseLlm,
-    CuaLlm,
-    GrokComputerUseLlm,
-    GrokReasoningEffort,
-    Country,
-    DownloadsStatus,
-    FetchScreenshotFormat,
-    FetchStealthMode,
-    FetchSanitizeMode,
-    FetchWaitUntil,
-    BatchFetchJobStatus,
-    WebCrawlJobStatus,
-    FetchStatus,
-    OperatingSystem,
-    Platform,
-    PageStatus,
-    WebSearchStatus,
-    RecordingStatus,
-    ScrapeFormat,
-    ScrapePageStatus,
-    ScrapeScreenshotFormat,
-    ScrapeWaitUntil,
-    SessionEventLogType,
-    State,
-    SessionRegion,
-    BrowserUseVersion,
-    HyperAgentVersion,
-)
-from .crawl import (
-    CrawledPage,
-    CrawlJobResponse,
-    CrawlJobStatus,
-    CrawlJobStatusResponse,
-    CrawlPageStatus,
-    GetCrawlJobParams,
-    StartCrawlJobParams,
-    StartCrawlJobResponse,
-)
-from .extension import CreateExtensionParams, ExtensionResponse
-from .extract import (
-    ExtractJobResponse,
-    ExtractJobStatus,
-    ExtractJobStatusResponse,
-    StartExtractJobParams,
-    StartExtractJobResponse,
-    ExtractJobMetadata,
-)
-from .profile import (
-    CreateProfileParams,
-    CreateProfileResponse,
-    ForkProfileParams,
-    ProfileListParams,
-    ProfileListResponse,
-    ProfileResponse,
-)
-from .volume import (
-    CreateVolumeParams,
-    Volume,
-    VolumeDeleteResult,
-    VolumeListParams,
-    VolumeListResponse,
-)
-from .scrape import (
-    BatchScrapeJobResponse,
-    BatchScrapeJobStatusResponse,
-    GetBatchScrapeJobParams,
-    ScrapedPage,
-    ScrapeJobData,
-    ScrapeJobResponse,
-    ScrapeJobStatus,
-    ScrapeJobStatusResponse,
-    ScrapeOptions,
-    ScreenshotOptions,
-    StartBatchScrapeJobParams,
-    StartBatchScrapeJobResponse,
-    StartScrapeJobParams,
-    StartScrapeJobResponse,
-    StorageStateOptions,
-)
-from .computer_action import (
-    ClickActionParams,
-    ComputerAction,
-    ComputerActionParams,
-    ComputerActionResponse,
-    Coordinate,
-    DragActionParams,
-    HoldKeyActionParams,
-    MouseDownActionParams,
-    MouseUpActionParams,
-    MoveMouseActionParams,
-    PressKeysActionParams,
-    ScreenshotActionParams,
-    ScrollActionParams,
-    TypeTextActionParams,
-    ComputerActionMouseButton,
-    GetClipboardTextActionParams,
-    PutSelectionTextActionParams,
-    ListWindowsActionParams,
-    ComputerActionWindow,
-    ComputerActionResponseDataClipboardText,
-    ComputerActionResponseDataListWindows,
-    ComputerActionResponseData,
-)
-from .session import (
-    BasicResponse,
-    BrowserMemorySize,
-    CreateSessionParams,
-    CreateSessionProfile,
-    CreateSessionSnapshotResponse,
-    GetSessionDownloadsUrlResponse,
-    GetSessionRecordingUrlResponse,
-    GetSessionVideoRecordingUrlResponse,
-    ScreenConfig,
-    Session,
-    SessionDetail,
-    SessionGetParams,
-    SessionListParams,
-    SessionListResponse,
-    SessionRecording,
-    SessionStatus,
-    SessionEventLog,
-    SessionEventLogListParams,
-    SessionEventLogListResponse,
-    SessionCreditBreakdown,
-    SessionProfile,
-    SessionLaunchState,
-    StartSessionFromSnapshotParams,
-    UploadFileResponse,
-    ImageCaptchaParam,
-    CaptchaSolverType,
-    CaptchaEvaluationPageResult,
-    CaptchaEvaluationParams,
-    CaptchaEvaluationResponse,
-    CaptchaEvaluationTarget,
-    CaptchaEvaluationType,
-    UpdateSessionProfileParams,
-    UpdateSessionProxyLocationParams,
-    UpdateSessionProxyParams,
-    UpdateSessionScreenParams,
-    UpdateSessionSolveCaptchasParams,
-    UpdateSessionSolveCaptchasResponse,
-)
-from .sandbox import (
-    SandboxStatus,
-    SandboxRegion,
-    SandboxRuntimeTarget,
-    Sandbox,
-    SandboxDetail,
-    SandboxRuntimeSession,
-    SandboxVolumeMountType,
-    SandboxVolumeMount,
-    SandboxNetworkPolicy,
-    SandboxNetworkUpdateResult,
-    CreateSandboxParams,
-    StartSandboxFromSnapshotParams,
-    SandboxListParams,
-    SandboxListResponse,
-    SandboxImageListParams,
-    SandboxImageListResponse,
-    SandboxImageSummary,
-    SandboxSnapshotStatus,
-    SandboxSnapshotDeleteResult,
-    SandboxImageDeleteResult,
-    SandboxSnapshotListResponse,
-    SandboxSnapshotSummary,
-    SandboxSnapshotListParams,
-    SandboxMemorySnapshotParams,
-    SandboxMemorySnapshotResult,
-    SandboxImageBuildInputFormat,
-    SandboxImageBuildSourcePlatform,
-    SandboxImageBuildStatus,
-    SandboxImageInit,
-    SandboxBuildContextBundle,
-    SandboxBuildContextManifest,
-    SandboxDockerImageConfig,
-    SandboxDockerImageLayer,
-    SandboxDockerImageManifest,
-    CreateSandboxImageBuildParams,
-    ReuseSandboxDockerImageParams,
-    CompleteSandboxImageBuildParams,
-    SandboxImageBuildUpload,
-    SandboxImageBuild,
-    SandboxImageBuildCreateResult,
-    SandboxDockerImageReuseResult,
-    SandboxImageBuildListParams,
-    SandboxImageBuildListResponse,
-    SandboxExposeParams,
-    SandboxExposeResult,
-    SandboxUnexposeResult,
-    SandboxProcessStatus,
-    SandboxExecParams,
-    SandboxProcessSummary,
-    SandboxProcessResult,
-    SandboxProcessListParams,
-    SandboxProcessListResponse,
-    SandboxProcessWaitParams,
-    SandboxProcessStdinParams,
-    SandboxProcessOutputEvent,
-    SandboxProcessExitEvent,
-    SandboxProcessStreamEvent,
-    SandboxFileType,
-    SandboxFileReadFormat,
-    SandboxFileInfo,
-    SandboxFileWriteInfo,
-    SandboxFileEntry,
-    SandboxFileListOptions,
-    SandboxFileListParams,
-    SandboxFileListResponse,
-    SandboxFileReadOptions,
-    SandboxFileReadParams,
-    SandboxFileReadResult,
-    SandboxFileWriteEntry,
-    SandboxFileTextWriteOptions,
-    SandboxFileBytesWriteOptions,
-    SandboxFileWriteTextParams,
-    SandboxFileWriteBytesParams,
-    SandboxFileWriteResult,
-    SandboxFileUploadParams,
-    SandboxFileRemoveOptions,
-    SandboxFileDeleteParams,
-    SandboxFileMakeDirOptions,
-    SandboxFileMkdirParams,
-    SandboxFileMoveParams,
-    SandboxFileCopyParams,
-    SandboxFileChmodParams,
-    SandboxFileChownParams,
-    SandboxFileMutationResult,
-    SandboxFileTransferResult,
-    SandboxFileMoveCopyResult,
-    SandboxFileWatchParams,
-    SandboxFileWatchEvent,
-    SandboxFileWatchStatus,
-    SandboxFileWatchRoute,
-    SandboxFileWatchEventsParams,
-    SandboxFileWatchEventMessage,
-    SandboxFileWatchDoneEvent,
-    SandboxFileWatchStreamEvent,
-    SandboxFileSystemEventType,
-    SandboxFileSystemEvent,
-    SandboxPresignFileParams,
-    SandboxPresignedUrl,
-    SandboxTerminalCreateParams,
-    SandboxTerminalOutputChunk,
-    SandboxTerminalStatus,
-    SandboxTerminalWaitParams,
-    SandboxTerminalKillParams,
-    SandboxTerminalOutputEvent,
-    SandboxTerminalExitEvent,
-    SandboxTerminalEvent,
-)
-from .team import TeamCreditInfo
+"""Pydantic models for Hyperbrowser API requests and responses.
+
+Models are re-exported from their submodules lazily: a name is imported from
+its submodule on first access, so using one product area does not pay for
+building the models of every other one.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .web.batch_fetch import (
+        StartBatchFetchJobParams,
+        StartBatchFetchJobResponse,
+        BatchFetchJobStatusResponse,
+        GetBatchFetchJobParams,
+        BatchFetchJobResponse,
+    )
+    from .web.crawl import (
+        WebCrawlOptions,
+        StartWebCrawlJobParams,
+        GetWebCrawlJobParams,
+        StartWebCrawlJobResponse,
+        WebCrawlJobStatusResponse,
+        WebCrawlJobResponse,
+    )
+    from .web.fetch import (
+        FetchParams,
+        FetchResponse,
+        FetchResponseData,
+    )
+    from .web.common import (
+        PageData,
+        FetchOutputOptions,
+        FetchNavigationOptions,
+        FetchBrowserOptions,
+        FetchCacheOptions,
+        FetchBrowserLocationOptions,
+        FetchStorageStateOptions,
+        FetchOutputJsonOptions,
+        FetchOutputScreenshotOptions,
+        FetchOutputJson,
+        FetchOutputMarkdown,
+        FetchOutputHtml,
+        FetchOutputLinks,
+        FetchOutputScreenshot,
+        FetchOutputBranding,
+        FetchOutputFormat,
+    )
+    from .web.branding import (
+        BrandingProfile,
+        BrandingColors,
+        BrandingFont,
+        BrandingFontRole,
+        BrandingTypography,
+        BrandingFontFamilies,
+        BrandingFontStacks,
+        BrandingFontSizes,
+        BrandingSpacing,
+        BrandingComponents,
+        BrandingButtonStyle,
+        BrandingInputStyle,
+        BrandingBorderRadiusCorners,
+        BrandingImages,
+        BrandingPersonality,
+        BrandingPersonalityTone,
+        BrandingPersonalityEnergy,
+        BrandingDesignSystem,
+        BrandingDesignFramework,
+        BrandingConfidence,
+        BrandingColorScheme,
+    )
+    from .web.search import (
+        WebSearchFilters,
+        WebSearchFiletype,
+        WebSearchParams,
+        WebSearchLocation,
+        WebSearchResponse,
+        WebSearchResponseData,
+        WebSearchResultItem,
+    )
+    from .agents.browser_use import (
+        BrowserUseTaskData,
+        BrowserUseTaskResponse,
+        BrowserUseTaskStatusResponse,
+        StartBrowserUseTaskParams,
+        StartBrowserUseTaskResponse,
+        BrowserUseApiKeys,
+        BrowserUseAgentBrain,
+        BrowserUseAgentOutput,
+        BrowserUseActionResult,
+        BrowserUseStepMetadata,
+        BrowserUseTabInfo,
+        BrowserUseCoordinates,
+        BrowserUseCoordinateSet,
+        BrowserUseViewportInfo,
+        BrowserUseDOMHistoryElement,
+        BrowserUseBrowserStateHistory,
+        BrowserUseAgentHistory,
+        BrowserUseAgentOutputV0710,
+        BrowserUseActionResultV0710,
+        BrowserUseBrowserStateHistoryV0710,
+        BrowserUseStepMetadataV0710,
+        BrowserUseAgentHistoryV0710,
+        BrowserUseAgentHistoryLatest,
+        BrowserUseTaskMetadata,
+        BrowserUseStep,
+        cast_steps_for_version,
+        BrowserUseTaskStatus,
+    )
+    from .agents.claude_computer_use import (
+        ClaudeComputerUseTaskStatus,
+        ClaudeComputerUseStepResponse,
+        ClaudeComputerUseTaskData,
+        ClaudeComputerUseTaskResponse,
+        ClaudeComputerUseTaskStatusResponse,
+        StartClaudeComputerUseTaskParams,
+        StartClaudeComputerUseTaskResponse,
+        ClaudeComputerUseApiKeys,
+    )
+    from .agents.gemini_computer_use import (
+        GeminiComputerUseTaskStatus,
+        GeminiComputerUseStepResponse,
+        GeminiComputerUseTaskData,
+        GeminiComputerUseTaskResponse,
+        GeminiComputerUseTaskStatusResponse,
+        StartGeminiComputerUseTaskParams,
+        StartGeminiComputerUseTaskResponse,
+        GeminiComputerUseApiKeys,
+    )
+    from .agents.grok_computer_use import (
+        GrokComputerUseTaskStatus,
+        GrokComputerUseStepResponse,
+        GrokComputerUseTaskData,
+        GrokComputerUseTaskResponse,
+        GrokComputerUseTaskStatusResponse,
+        StartGrokComputerUseTaskParams,
+        StartGrokComputerUseTaskResponse,
+        GrokComputerUseApiKeys,
+    )
+    from .agents.cua import (
+        CuaTaskData,
+        CuaTaskResponse,
+        CuaTaskStatusResponse,
+        StartCuaTaskParams,
+        StartCuaTaskResponse,
+        CuaApiKeys,
+        CuaBaseUrls,
+        CuaTaskStatus,
+    )
+    from .agents.hyper_agent import (
+        HyperAgentActionOutput,
+        HyperAgentOutput,
+        HyperAgentStep,
+        HyperAgentTaskData,
+        HyperAgentTaskResponse,
+        HyperAgentTaskStatus,
+        HyperAgentTaskStatusResponse,
+        StartHyperAgentTaskParams,
+        StartHyperAgentTaskResponse,
+        HyperAgentApiKeys,
+        HyperAgentOutputV110,
+        HyperAgentStepV110,
+    )
+    from .consts import (
+        ISO639_1,
+        POLLING_ATTEMPTS,
+        HyperAgentLlm,
+        BrowserUseLlm,
+        ClaudeComputerUseLlm,
+        CuaLlm,
+        GrokComputerUseLlm,
+        GrokReasoningEffort,
+        Country,
+        DownloadsStatus,
+        FetchScreenshotFormat,
+        FetchStealthMode,
+        FetchSanitizeMode,
+        FetchWaitUntil,
+        BatchFetchJobStatus,
+        WebCrawlJobStatus,
+        FetchStatus,
+        OperatingSystem,
+        Platform,
+        PageStatus,
+        WebSearchStatus,
+        RecordingStatus,
+        ScrapeFormat,
+        ScrapePageStatus,
+        ScrapeScreenshotFormat,
+        ScrapeWaitUntil,
+        SessionEventLogType,
+        State,
+        SessionRegion,
+        BrowserUseVersion,
+        HyperAgentVersion,
+        ResultMode,
+    )
+    from .crawl import (
+        CrawledPage,
+        CrawlJobResponse,
+        CrawlJobStatus,
+        CrawlJobStatusResponse,
+        CrawlPageStatus,
+        GetCrawlJobParams,
+        StartCrawlJobParams,
+        StartCrawlJobResponse,
+    )
+    from .extension import CreateExtensionParams, ExtensionResponse
+    from .extract import (
+        ExtractJobResponse,
+        ExtractJobStatus,
+        ExtractJobStatusResponse,
+        StartExtractJobParams,
+        StartExtractJobResponse,
+        ExtractJobMetadata,
+    )
+    from .profile import (
+        CreateProfileParams,
+        CreateProfileResponse,
+        ForkProfileParams,
+        ProfileListParams,
+        ProfileListResponse,
+        ProfileResponse,
+    )
+    from .volume import (
+        CreateVolumeParams,
+        Volume,
+        VolumeDeleteResult,
+        VolumeListParams,
+        VolumeListResponse,
+    )
+    from .scrape import (
+        BatchScrapeJobResponse,
+        BatchScrapeJobStatusResponse,
+        GetBatchScrapeJobParams,
+        ScrapedPage,
+        ScrapeJobData,
+        ScrapeJobResponse,
+        ScrapeJobStatus,
+        ScrapeJobStatusResponse,
+        ScrapeOptions,
+        ScreenshotOptions,
+        StartBatchScrapeJobParams,
+        StartBatchScrapeJobResponse,
+        StartScrapeJobParams,
+        StartScrapeJobResponse,
+        StorageStateOptions,
+    )
+    from .computer_action import (
+        ClickActionParams,
+        ComputerAction,
+        ComputerActionParams,
+        ComputerActionResponse,
+        Coordinate,
+        DragActionParams,
+        HoldKeyActionParams,
+        MouseDownActionParams,
+        MouseUpActionParams,
+        MoveMouseActionParams,
+        PressKeysActionParams,
+        ScreenshotActionParams,
+        ScrollActionParams,
+        TypeTextActionParams,
+        ComputerActionMouseButton,
+        GetClipboardTextActionParams,
+        PutSelectionTextActionParams,
+        ListWindowsActionParams,
+        ComputerActionWindow,
+        ComputerActionResponseDataClipboardText,
+        ComputerActionResponseDataListWindows,
+        ComputerActionResponseData,
+    )
+    from .session import (
+        BasicResponse,
+        BrowserMemorySize,
+        CreateSessionParams,
+        CreateSessionProfile,
+        CreateSessionSnapshotResponse,
+        GetSessionDownloadsUrlResponse,
+        GetSessionRecordingUrlResponse,
+        GetSessionVideoRecordingUrlResponse,
+        ScreenConfig,
+        Session,
+        SessionDetail,
+        SessionGetParams,
+        SessionListParams,
+        SessionListResponse,
+        SessionRecording,
+        SessionStatus,
+        SessionEventLog,
+        SessionEventLogListParams,
+        SessionEventLogListResponse,
+        SessionCreditBreakdown,
+        SessionProfile,
+        SessionLaunchState,
+        StartSessionFromSnapshotParams,
+        UploadFileResponse,
+        ImageCaptchaParam,
+        CaptchaSolverType,
+        CaptchaEvaluationPageResult,
+        CaptchaEvaluationParams,
+        CaptchaEvaluationResponse,
+        CaptchaEvaluationTarget,
+        CaptchaEvaluationType,
+        UpdateSessionProfileParams,
+        UpdateSessionProxyLocationParams,
+        UpdateSessionProxyParams,
+        UpdateSessionScreenParams,
+        UpdateSessionSolveCaptchasParams,
+        UpdateSessionSolveCaptchasResponse,
+    )
+    from .sandbox import (
+        SandboxStatus,
+        SandboxRegion,
+        SandboxRuntimeTarget,
+        Sandbox,
+        SandboxDetail,
+        SandboxRuntimeSession,
+        SandboxVolumeMountType,
+        SandboxVolumeMount,
+        SandboxNetworkPolicy,
+        SandboxNetworkUpdateResult,
+        CreateSandboxParams,
+        StartSandboxFromSnapshotParams,
+        SandboxListParams,
+        SandboxListResponse,
+        SandboxImageListParams,
+        SandboxImageListResponse,
+        SandboxImageSummary,
+        SandboxSnapshotStatus,
+        SandboxSnapshotDeleteResult,
+        SandboxImageDeleteResult,
+        SandboxSnapshotListResponse,
+        SandboxSnapshotSummary,
+        SandboxSnapshotListParams,
+        SandboxMemorySnapshotParams,
+        SandboxMemorySnapshotResult,
+        SandboxImageBuildInputFormat,
+        SandboxImageBuildSourcePlatform,
+        SandboxImageBuildStatus,
+        SandboxImageInit,
+        SandboxBuildContextBundle,
+        SandboxBuildContextManifest,
+        SandboxDockerImageConfig,
+        SandboxDockerImageLayer,
+        SandboxDockerImageManifest,
+        CreateSandboxImageBuildParams,
+        ReuseSandboxDockerImageParams,
+        CompleteSandboxImageBuildParams,
+        SandboxImageBuildUpload,
+        SandboxImageBuild,
+        SandboxImageBuildCreateResult,
+        SandboxDockerImageReuseResult,
+        SandboxImageBuildListParams,
+        SandboxImageBuildListResponse,
+        SandboxExposeParams,
+        SandboxExposeResult,
+        SandboxUnexposeResult,
+        SandboxProcessStatus,
+        SandboxExecParams,
+        SandboxProcessSummary,
+        SandboxProcessResult,
+        SandboxProcessListParams,
+        SandboxProcessListResponse,
+        SandboxProcessWaitParams,
+        SandboxProcessStdinParams,
+        SandboxProcessOutputEvent,
+        SandboxProcessExitEvent,
+        SandboxProcessStreamEvent,
+        SandboxFileType,
+        SandboxFileReadFormat,
+        SandboxFileInfo,
+        SandboxFileWriteInfo,
+        SandboxFileEntry,
+        SandboxFileListOptions,
+        SandboxFileListParams,
+        SandboxFileListResponse,
+        SandboxFileReadOptions,
+        SandboxFileReadParams,
+        SandboxFileReadResult,
+        SandboxFileWriteEntry,
+        SandboxFileTextWriteOptions,
+        SandboxFileBytesWriteOptions,
+        SandboxFileWriteTextParams,
+        SandboxFileWriteBytesParams,
+        SandboxFileWriteResult,
+        SandboxFileUploadParams,
+        SandboxFileRemoveOptions,
+        SandboxFileDeleteParams,
+        SandboxFileMakeDirOptions,
+        SandboxFileMkdirParams,
+        SandboxFileMoveParams,
+        SandboxFileCopyParams,
+        SandboxFileChmodParams,
+        SandboxFileChownParams,
+        SandboxFileMutationResult,
+        SandboxFileTransferResult,
+        SandboxFileMoveCopyResult,
+        SandboxFileWatchParams,
+        SandboxFileWatchEvent,
+        SandboxFileWatchStatus,
+        SandboxFileWatchRoute,
+        SandboxFileWatchEventsParams,
+        SandboxFileWatchEventMessage,
+        SandboxFileWatchDoneEvent,
+        SandboxFileWatchStreamEvent,
+        SandboxFileSystemEventType,
+        SandboxFileSystemEvent,
+        SandboxPresignFileParams,
+        SandboxPresignedUrl,
+        SandboxTerminalCreateParams,
+        SandboxTerminalOutputChunk,
+        SandboxTerminalStatus,
+        SandboxTerminalWaitParams,
+        SandboxTerminalKillParams,
+        SandboxTerminalOutputEvent,
+        SandboxTerminalExitEvent,
+        SandboxTerminalEvent,
+    )
+    from .team import TeamCreditInfo
+    from .lazy import LazyJobResponse, LazyModel
+    from .screenshot import Screenshot
+
+_SUBMODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    ".web.batch_fetch": (
+        "StartBatchFetchJobParams",
+        "StartBatchFetchJobResponse",
+        "BatchFetchJobStatusResponse",
+        "GetBatchFetchJobParams",
+        "BatchFetchJobResponse",
+    ),
+    ".web.crawl": (
+        "WebCrawlOptions",
+        "StartWebCrawlJobParams",
+        "GetWebCrawlJobParams",
+        "StartWebCrawlJobResponse",
+        "WebCrawlJobStatusResponse",
+        "WebCrawlJobResponse",
+    ),
+    ".web.fetch": (
+        "FetchParams",
+        "FetchResponse",
+        "FetchResponseData",
+    ),
+    ".web.common": (
+        "PageData",
+        "FetchOutputOptions",
+        "FetchNavigationOptions",
+        "FetchBrowserOptions",
+        "FetchCacheOptions",
+        "FetchBrowserLocationOptions",
+        "FetchStorageStateOptions",
+        "FetchOutputJsonOptions",
+        "FetchOutputScreenshotOptions",
+        "FetchOutputJson",
+        "FetchOutputMarkdown",
+        "FetchOutputHtml",
+        "FetchOutputLinks",
+        "FetchOutputScreenshot",
+        "FetchOutputBranding",
+        "FetchOutputFormat",
+    ),
+    ".web.branding": (
+        "BrandingProfile",
+        "BrandingColors",
+        "BrandingFont",
+        "BrandingFontRole",
+        "BrandingTypography",
+        "BrandingFontFamilies",
+        "BrandingFontStacks",
+        "BrandingFontSizes",
+        "BrandingSpacing",
+        "BrandingComponents",
+        "BrandingButtonStyle",
+        "BrandingInputStyle",
+        "BrandingBorderRadiusCorners",
+        "BrandingImages",
+        "BrandingPersonality",
+        "BrandingPersonalityTone",
+        "BrandingPersonalityEnergy",
+        "BrandingDesignSystem",
+        "BrandingDesignFramework",
+        "BrandingConfidence",
+        "BrandingColorScheme",
+    ),
+    ".web.search": (
+        "WebSearchFilters",
+        "WebSearchFiletype",
+        "WebSearchParams",
+        "WebSearchLocation",
+        "WebSearchResponse",
+        "WebSearchResponseData",
+        "WebSearchResultItem",
+    ),
+    ".agents.browser_use": (
+        "BrowserUseTaskData",
+        "BrowserUseTaskResponse",
+        "BrowserUseTaskStatusResponse",
+        "StartBrowserUseTaskParams",
+        "StartBrowserUseTaskResponse",
+        "BrowserUseApiKeys",
+        "BrowserUseAgentBrain",
+        "BrowserUseAgentOutput",
+        "BrowserUseActionResult",
+        "BrowserUseStepMetadata",
+        "BrowserUseTabInfo",
+        "BrowserUseCoordinates",
+        "BrowserUseCoordinateSet",
+        "BrowserUseViewportInfo",
+        "BrowserUseDOMHistoryElement",
+        "BrowserUseBrowserStateHistory",
+        "BrowserUseAgentHistory",
+        "BrowserUseAgentOutputV0710",
+        "BrowserUseActionResultV0710",
+        "BrowserUseBrowserStateHistoryV0710",
+        "BrowserUseStepMetadataV0710",
+        "BrowserUseAgentHistoryV0710",
+        "BrowserUseAgentHistoryLatest",
+        "BrowserUseTaskMetadata",
+        "BrowserUseStep",
+        "cast_steps_for_version",
+        "BrowserUseTaskStatus",
+    ),
+    ".agents.claude_computer_use": (
+        "ClaudeComputerUseTaskStatus",
+        "ClaudeComputerUseStepResponse",
+        "ClaudeComputerUseTaskData",
+        "ClaudeComputerUseTaskResponse",
+        "ClaudeComputerUseTaskStatusResponse",
+        "StartClaudeComputerUseTaskParams",
+        "StartClaudeComputerUseTaskResponse",
+        "ClaudeComputerUseApiKeys",
+    ),
+    ".agents.gemini_computer_use": (
+        "GeminiComputerUseTaskStatus",
+        "GeminiComputerUseStepResponse",
+        "GeminiComputerUseTaskData",
+        "GeminiComputerUseTaskResponse",
+        "GeminiComputerUseTaskStatusResponse",
+        "StartGeminiComputerUseTaskParams",
+        "StartGeminiComputerUseTaskResponse",
+        "GeminiComputerUseApiKeys",
+    ),
+    ".agents.grok_computer_use": (
+        "GrokComputerUseTaskStatus",
+        "GrokComputerUseStepResponse",
+        "GrokComputerUseTaskData",
+        "GrokComputerUseTaskResponse",
+        "GrokComputerUseTaskStatusResponse",
+        "StartGrokComputerUseTaskParams",
+        "StartGrokComputerUseTaskResponse",
+        "GrokComputerUseApiKeys",
+    ),
+    ".agents.cua": (
+        "CuaTaskData",
+        "CuaTaskResponse",
+        "CuaTaskStatusResponse",
+        "StartCuaTaskParams",
+        "StartCuaTaskResponse",
+        "CuaApiKeys",
+        "CuaBaseUrls",
+        "CuaTaskStatus",
+    ),
+    ".agents.hyper_agent": (
+        "HyperAgentActionOutput",
+        "HyperAgentOutput",
+        "HyperAgentStep",
+        "HyperAgentTaskData",
+        "HyperAgentTaskResponse",
+        "HyperAgentTaskStatus",
+        "HyperAgentTaskStatusResponse",
+        "StartHyperAgentTaskParams",
+        "StartHyperAgentTaskResponse",
+        "HyperAgentApiKeys",
+        "HyperAgentOutputV110",
+        "HyperAgentStepV110",
+    ),
+    ".consts": (
+        "ISO639_1",
+        "POLLING_ATTEMPTS",
+        "HyperAgentLlm",
+        "BrowserUseLlm",
+        "ClaudeComputerUseLlm",
+        "CuaLlm",
+        "GrokComputerUseLlm",
+        "GrokReasoningEffort",
+        "Country",
+        "DownloadsStatus",
+        "FetchScreenshotFormat",
+        "FetchStealthMode",
+        "FetchSanitizeMode",
+        "FetchWaitUntil",
+        "BatchFetchJobStatus",
+        "WebCrawlJobStatus",
+        "FetchStatus",
+        "OperatingSystem",
+        "Platform",
+        "PageStatus",
+        "WebSearchStatus",
+        "RecordingStatus",
+        "ScrapeFormat",
+        "ScrapePageStatus",
+        "ScrapeScreenshotFormat",
+        "ScrapeWaitUntil",
+        "SessionEventLogType",
+        "State",
+        "SessionRegion",
+        "BrowserUseVersion",
+        "HyperAgentVersion",
+        "ResultMode",
+    ),
+    ".crawl": (
+        "CrawledPage",
+        "CrawlJobResponse",
+        "CrawlJobStatus",
+        "CrawlJobStatusResponse",
+        "CrawlPageStatus",
+        "GetCrawlJobParams",
+        "StartCrawlJobParams",
+        "StartCrawlJobResponse",
+    ),
+    ".extension": (
+        "CreateExtensionParams",
+        "ExtensionResponse",
+    ),
+    ".extract": (
+        "ExtractJobResponse",
+        "ExtractJobStatus",
+        "ExtractJobStatusResponse",
+        "StartExtractJobParams",
+        "StartExtractJobResponse",
+        "ExtractJobMetadata",
+    ),
+    ".profile": (
+        "CreateProfileParams",
+        "CreateProfileResponse",
+        "ForkProfileParams",
+        "ProfileListParams",
+        "ProfileListResponse",
+        "ProfileResponse",
+    ),
+    ".volume": (
+        "CreateVolumeParams",
+        "Volume",
+        "VolumeDeleteResult",
+        "VolumeListParams",
+        "VolumeListResponse",
+    ),
+    ".scrape": (
+        "BatchScrapeJobResponse",
+        "BatchScrapeJobStatusResponse",
+        "GetBatchScrapeJobParams",
+        "ScrapedPage",
+        "ScrapeJobData",
+        "ScrapeJobResponse",
+        "ScrapeJobStatus",
+        "ScrapeJobStatusResponse",
+        "ScrapeOptions",
+        "ScreenshotOptions",
+        "StartBatchScrapeJobParams",
+        "StartBatchScrapeJobResponse",
+        "StartScrapeJobParams",
+        "StartScrapeJobResponse",
+        "StorageStateOptions",
+    ),
+    ".computer_action": (
+        "ClickActionParams",
+        "ComputerAction",
+        "ComputerActionParams",
+        "ComputerActionResponse",
+        "Coordinate",
+        "DragActionParams",
+        "HoldKeyActionParams",
+        "MouseDownActionParams",
+        "MouseUpActionParams",
+        "MoveMouseActionParams",
+        "PressKeysActionParams",
+        "ScreenshotActionParams",
+        "ScrollActionParams",
+        "TypeTextActionParams",
+        "ComputerActionMouseButton",
+        "GetClipboardTextActionParams",
+        "PutSelectionTextActionParams",
+        "ListWindowsActionParams",
+        "ComputerActionWindow",
+        "ComputerActionResponseDataClipboardText",
+        "ComputerActionResponseDataListWindows",
+        "ComputerActionResponseData",
+    ),
+    ".session": (
+        "BasicResponse",
+        "BrowserMemorySize",
+        "CreateSessionParams",
+        "CreateSessionProfile",
+        "CreateSessionSnapshotResponse",
+        "GetSessionDownloadsUrlResponse",
+        "GetSessionRecordingUrlResponse",
+        "GetSessionVideoRecordingUrlResponse",
+        "ScreenConfig",
+        "Session",
+        "SessionDetail",
+        "SessionGetParams",
+        "SessionListParams",
+        "SessionListResponse",
+        "SessionRecording",
+        "SessionStatus",
+        "SessionEventLog",
+        "SessionEventLogListParams",
+        "SessionEventLogListResponse",
+        "SessionCreditBreakdown",
+        "SessionProfile",
+        "SessionLaunchState",
+        "StartSessionFromSnapshotParams",
+        "UploadFileResponse",
+        "ImageCaptchaParam",
+        "CaptchaSolverType",
+        "CaptchaEvaluationPageResult",
+        "CaptchaEvaluationParams",
+        "CaptchaEvaluationResponse",
+        "CaptchaEvaluationTarget",
+        "CaptchaEvaluationType",
+        "UpdateSessionProfileParams",
+        "UpdateSessionProxyLocationParams",
+        "UpdateSessionProxyParams",
+        "UpdateSessionScreenParams",
+        "UpdateSessionSolveCaptchasParams",
+        "UpdateSessionSolveCaptchasResponse",
+    ),
+    ".sandbox": (
+        "SandboxStatus",
+        "SandboxRegion",
+        "SandboxRuntimeTarget",
+        "Sandbox",
+        "SandboxDetail",
+        "SandboxRuntimeSession",
+        "SandboxVolumeMountType",
+        "SandboxVolumeMount",
+        "SandboxNetworkPolicy",
+        "SandboxNetworkUpdateResult",
+        "CreateSandboxParams",
+        "StartSandboxFromSnapshotParams",
+        "SandboxListParams",
+        "SandboxListResponse",
+        "SandboxImageListParams",
+        "SandboxImageListResponse",
+        "SandboxImageSummary",
+        "SandboxSnapshotStatus",
+        "SandboxSnapshotDeleteResult",
+        "SandboxImageDeleteResult",
+        "SandboxSnapshotListResponse",
+        "SandboxSnapshotSummary",
+        "SandboxSnapshotListParams",
+        "SandboxMemorySnapshotParams",
+        "SandboxMemorySnapshotResult",
+        "SandboxImageBuildInputFormat",
+        "SandboxImageBuildSourcePlatform",
+        "SandboxImageBuildStatus",
+        "SandboxImageInit",
+        "SandboxBuildContextBundle",
+        "SandboxBuildContextManifest",
+        "SandboxDockerImageConfig",
+        "SandboxDockerImageLayer",
+        "SandboxDockerImageManifest",
+        "CreateSandboxImageBuildParams",
+        "ReuseSandboxDockerImageParams",
+        "CompleteSandboxImageBuildParams",
+        "SandboxImageBuildUpload",
+        "SandboxImageBuild",
+        "SandboxImageBuildCreateResult",
+        "SandboxDockerImageReuseResult",
+        "SandboxImageBuildListParams",
+        "SandboxImageBuildListResponse",
+        "SandboxExposeParams",
+        "SandboxExposeResult",
+        "SandboxUnexposeResult",
+        "SandboxProcessStatus",
+        "SandboxExecParams",
+        "SandboxProcessSummary",
+        "SandboxProcessResult",
+        "SandboxProcessListParams",
+        "SandboxProcessListResponse",
+        "SandboxProcessWaitParams",
+        "SandboxProcessStdinParams",
+        "SandboxProcessOutputEvent",
+        "SandboxProcessExitEvent",
+        "SandboxProcessStreamEvent",
+        "SandboxFileType",
+        "SandboxFileReadFormat",
+        "SandboxFileInfo",
+        "SandboxFileWriteInfo",
+        "SandboxFileEntry",
+        "SandboxFileListOptions",
+        "SandboxFileListParams",
+        "SandboxFileListResponse",
+        "SandboxFileReadOptions",
+        "SandboxFileReadParams",
+        "SandboxFileReadResult",
+        "SandboxFileWriteEntry",
+        "SandboxFileTextWriteOptions",
+        "SandboxFileBytesWriteOptions",
+        "SandboxFileWriteTextParams",
+        "SandboxFileWriteBytesParams",
+        "SandboxFileWriteResult",
+        "SandboxFileUploadParams",
+        "SandboxFileRemoveOptions",
+        "SandboxFileDeleteParams",
+        "SandboxFileMakeDirOptions",
+        "SandboxFileMkdirParams",
+        "SandboxFileMoveParams",
+        "SandboxFileCopyParams",
+        "SandboxFileChmodParams",
+        "SandboxFileChownParams",
+        "SandboxFileMutationResult",
+        "SandboxFileTransferResult",
+        "SandboxFileMoveCopyResult",
+        "SandboxFileWatchParams",
+        "SandboxFileWatchEvent",
+        "SandboxFileWatchStatus",
+        "SandboxFileWatchRoute",
+        "SandboxFileWatchEventsParams",
+        "SandboxFileWatchEventMessage",
+        "SandboxFileWatchDoneEvent",
+        "SandboxFileWatchStreamEvent",
+        "SandboxFileSystemEventType",
+        "SandboxFileSystemEvent",
+        "SandboxPresignFileParams",
+        "SandboxPresignedUrl",
+        "SandboxTerminalCreateParams",
+        "SandboxTerminalOutputChunk",
+        "SandboxTerminalStatus",
+        "SandboxTerminalWaitParams",
+        "SandboxTerminalKillParams",
+        "SandboxTerminalOutputEvent",
+        "SandboxTerminalExitEvent",
+        "SandboxTerminalEvent",
+    ),
+    ".team": ("TeamCreditInfo",),
+    ".lazy": ("LazyJobResponse", "LazyModel"),
+    ".screenshot": ("Screenshot",),
+}
+
+_LAZY_IMPORTS: Dict[str, str] = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # consts
@@ -439,6 +889,7 @@ __all__ = [
     "SessionRegion",
     "BrowserUseVersion",
     "HyperAgentVersion",
+    "ResultMode",
     # agents
     "HyperAgentTaskStatus",
     "HyperAgentActionOutput",
@@ -716,6 +1167,11 @@ __all__ = [
     "SandboxTerminalEvent",
     # team
     "TeamCreditInfo",
+    # lazy
+    "LazyJobResponse",
+    "LazyModel",
+    # screenshot
+    "Screenshot",
     # computer action
     "ClickActionParams",
     "ComputerAction",
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Literal, Optional, Type, Union
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..consts import BrowserUseLlm, BrowserUseVersion
+from ..screenshot import ScreenshotMixin
 from ..session import CreateSessionParams
 
 BrowserUseTaskStatus = Literal["pending", "running", "completed", "failed", "stopped"]
@@ -17,6 +18,7 @@ class BrowserUseApiKeys(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     openai: Optional[str] = Field(default=None, serialization_alias="openai")
@@ -31,6 +33,7 @@ class StartBrowserUseTaskParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     task: str
@@ -96,6 +99,7 @@ class StartBrowserUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -109,23 +113,30 @@ class BrowserUseTaskStatusResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     status: BrowserUseTaskStatus
 
 
 class BrowserUseAgentBrain(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     evaluation_previous_goal: str
     memory: str
     next_goal: str
 
 
 class BrowserUseAgentOutput(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     current_state: BrowserUseAgentBrain
     action: List[Dict]
 
 
 class BrowserUseActionResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     is_done: Optional[bool] = False
     success: Optional[bool] = None
     extracted_content: Optional[str] = None
@@ -134,6 +145,8 @@ class BrowserUseActionResult(BaseModel):
 
 
 class BrowserUseStepMetadata(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     step_start_time: float
     step_end_time: float
     input_tokens: int
@@ -141,17 +154,23 @@ class BrowserUseStepMetadata(BaseModel):
 
 
 class BrowserUseTabInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     page_id: int
     url: str
     title: str
 
 
 class BrowserUseCoordinates(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     x: int
     y: int
 
 
 class BrowserUseCoordinateSet(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     top_left: BrowserUseCoordinates
     top_right: BrowserUseCoordinates
     bottom_left: BrowserUseCoordinates
@@ -162,6 +181,8 @@ class BrowserUseCoordinateSet(BaseModel):
 
 
 class BrowserUseViewportInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     scroll_x: int
     scroll_y: int
     width: int
@@ -169,6 +190,8 @@ class BrowserUseViewportInfo(BaseModel):
 
 
 class BrowserUseDOMHistoryElement(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     tag_name: str
     xpath: str
     highlight_index: Optional[int]
@@ -181,7 +204,9 @@ class BrowserUseDOMHistoryElement(BaseModel):
     viewport_info: Optional[BrowserUseViewportInfo] = None
 
 
-class BrowserUseBrowserStateHistory(BaseModel):
+class BrowserUseBrowserStateHistory(ScreenshotMixin, BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     url: str
     title: str
     tabs: List[BrowserUseTabInfo]
@@ -192,7 +217,7 @@ class BrowserUseBrowserStateHistory(BaseModel):
 
 
 class BrowserUseAgentHistory(BaseModel):
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
     model_output: Union[BrowserUseAgentOutput, None]
     result: List[BrowserUseActionResult]
@@ -204,6 +229,8 @@ class BrowserUseAgentHistory(BaseModel):
 
 
 class BrowserUseAgentOutputV0710(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     thinking: Optional[str] = None
     evaluation_previous_goal: Optional[str] = None
     memory: Optional[str] = None
@@ -212,6 +239,8 @@ class BrowserUseAgentOutputV0710(BaseModel):
 
 
 class BrowserUseActionResultV0710(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     is_done: Optional[bool] = False
     success: Optional[bool] = None
     error: Optional[str] = None
@@ -224,6 +253,8 @@ class BrowserUseActionResultV0710(BaseModel):
 
 
 class BrowserUseBrowserStateHistoryV0710(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     url: str
     title: str
     tabs: List[Dict]
@@ -231,13 +262,15 @@ class BrowserUseBrowserStateHistoryV0710(BaseModel):
 
 
 class BrowserUseStepMetadataV0710(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     step_start_time: float
     step_end_time: float
     step_number: int
 
 
 class BrowserUseAgentHistoryV0710(BaseModel):
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
     model_output: Union[BrowserUseAgentOutputV0710, None]
     result: List[BrowserUseActionResultV0710]
@@ -257,6 +290,7 @@ BrowserUseStep = Union[
 class BrowserUseTaskData(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     steps: List[BrowserUseStep]
@@ -266,6 +300,7 @@ class BrowserUseTaskData(BaseModel):
 class BrowserUseTaskMetadata(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     input_tokens: Optional[int] = Field(default=None, alias="inputTokens")
@@ -282,6 +317,7 @@ class BrowserUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
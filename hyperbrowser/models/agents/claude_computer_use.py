@@ -19,6 +19,7 @@ class ClaudeComputerUseApiKeys(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     anthropic: Optional[str] = Field(default=None, serialization_alias="anthropic")
@@ -31,6 +32,7 @@ class StartClaudeComputerUseTaskParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     task: str
@@ -62,6 +64,7 @@ class StartClaudeComputerUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -75,6 +78,7 @@ class ClaudeComputerUseTaskStatusResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     status: ClaudeComputerUseTaskStatus
@@ -87,6 +91,7 @@ class ClaudeComputerUseStepResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     role: str
@@ -100,6 +105,7 @@ class ClaudeComputerUseStepResponse(BaseModel):
 class ClaudeComputerUseTaskData(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     steps: List[ClaudeComputerUseStepResponse]
@@ -109,6 +115,7 @@ class ClaudeComputerUseTaskData(BaseModel):
 class ClaudeComputerUseTaskMetadata(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     input_tokens: Optional[int] = Field(default=None, alias="inputTokens")
@@ -125,6 +132,7 @@ class ClaudeComputerUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -17,6 +17,7 @@ class CuaApiKeys(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     openai: Optional[str] = Field(default=None, serialization_alias="openai")
@@ -29,6 +30,7 @@ class CuaBaseUrls(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     openai: Optional[str] = Field(default=None, serialization_alias="openai")
@@ -41,6 +43,7 @@ class StartCuaTaskParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     task: str
@@ -73,6 +76,7 @@ class StartCuaTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -86,6 +90,7 @@ class CuaTaskStatusResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     status: CuaTaskStatus
@@ -98,6 +103,7 @@ class CuaStepResponseError(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     code: str
@@ -111,6 +117,7 @@ class CuaStepIncompleteDetails(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     reason: Optional[str] = Field(default=None)
@@ -123,6 +130,7 @@ class CuaStepReasoning(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     effort: Optional[str] = Field(default=None)
@@ -134,6 +142,8 @@ class CuaStepResponse(BaseModel):
     Response from a single CUA step.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     created_at: int
     output_text: str
     error: Optional[CuaStepResponseError] = None
@@ -147,6 +157,7 @@ class CuaStepResponse(BaseModel):
 class CuaTaskData(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     steps: List[CuaStepResponse]
@@ -156,6 +167,7 @@ class CuaTaskData(BaseModel):
 class CuaTaskMetadata(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     input_tokens: Optional[int] = Field(default=None, alias="inputTokens")
@@ -172,6 +184,7 @@ class CuaTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -19,6 +19,7 @@ class GeminiComputerUseApiKeys(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     google: Optional[str] = Field(default=None, serialization_alias="google")
@@ -31,6 +32,7 @@ class StartGeminiComputerUseTaskParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     task: str
@@ -62,6 +64,7 @@ class StartGeminiComputerUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -75,6 +78,7 @@ class GeminiComputerUseTaskStatusResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     status: GeminiComputerUseTaskStatus
@@ -88,6 +92,7 @@ class GeminiComputerUseStepResponse(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
     candidates: Optional[List[Any]] = Field(
@@ -101,6 +106,7 @@ class GeminiComputerUseStepResponse(BaseModel):
 class GeminiComputerUseTaskData(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     steps: List[GeminiComputerUseStepResponse]
@@ -110,6 +116,7 @@ class GeminiComputerUseTaskData(BaseModel):
 class GeminiComputerUseTaskMetadata(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     input_tokens: Optional[int] = Field(default=None, alias="inputTokens")
@@ -126,6 +133,7 @@ class GeminiComputerUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
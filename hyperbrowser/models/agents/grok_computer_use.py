@@ -20,6 +20,7 @@ class GrokComputerUseApiKeys(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     xai: Optional[str] = Field(default=None, serialization_alias="xai")
@@ -32,6 +33,7 @@ class StartGrokComputerUseTaskParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     task: str
@@ -66,6 +68,7 @@ class StartGrokComputerUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -79,6 +82,7 @@ class GrokComputerUseTaskStatusResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     status: GrokComputerUseTaskStatus
@@ -91,6 +95,7 @@ class GrokComputerUseStepResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     created_at: Optional[int] = Field(default=None, serialization_alias="created_at")
@@ -115,6 +120,7 @@ class GrokComputerUseStepResponse(BaseModel):
 class GrokComputerUseTaskData(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     steps: List[GrokComputerUseStepResponse]
@@ -124,6 +130,7 @@ class GrokComputerUseTaskData(BaseModel):
 class GrokComputerUseTaskMetadata(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     input_tokens: Optional[int] = Field(default=None, alias="inputTokens")
@@ -140,6 +147,7 @@ class GrokComputerUseTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
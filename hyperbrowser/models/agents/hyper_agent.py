@@ -17,6 +17,7 @@ class HyperAgentApiKeys(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     openai: Optional[str] = Field(default=None, serialization_alias="openai")
@@ -31,6 +32,7 @@ class StartHyperAgentTaskParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     version: Optional[HyperAgentVersion] = Field(
@@ -64,6 +66,7 @@ class StartHyperAgentTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
@@ -77,6 +80,7 @@ class HyperAgentTaskStatusResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     status: HyperAgentTaskStatus
@@ -89,6 +93,7 @@ class HyperAgentActionOutput(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     success: bool
@@ -103,6 +108,7 @@ class HyperAgentOutput(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     thoughts: Optional[str] = Field(default=None)
@@ -118,6 +124,7 @@ class HyperAgentStep(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     idx: int
@@ -132,6 +139,7 @@ class HyperAgentOutputV110(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     thoughts: Optional[str] = Field(default=None)
@@ -146,6 +154,7 @@ class HyperAgentStepV110(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     idx: int
@@ -156,6 +165,7 @@ class HyperAgentStepV110(BaseModel):
 class HyperAgentTaskData(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     steps: List[Union[HyperAgentStep, HyperAgentStepV110]]
@@ -165,6 +175,7 @@ class HyperAgentTaskData(BaseModel):
 class HyperAgentTaskMetadata(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     num_task_steps_completed: Optional[int] = Field(
@@ -179,6 +190,7 @@ class HyperAgentTaskResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     job_id: str = Field(alias="jobId")
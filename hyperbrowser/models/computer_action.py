@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import List, Literal, Optional, Union
 from pydantic import BaseModel, ConfigDict, Field
+from hyperbrowser.models.screenshot import ScreenshotMixin
 
 
 class ComputerAction(str, Enum):
@@ -29,6 +30,8 @@ ComputerActionMouseButton = Literal[
 class Coordinate(BaseModel):
     """Coordinate model for drag actions."""
 
+    model_config = ConfigDict(defer_build=True)
+
     x: int
     y: int
 
@@ -36,7 +39,7 @@ class Coordinate(BaseModel):
 class ClickActionParams(BaseModel):
     """Parameters for click action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.CLICK] = ComputerAction.CLICK
     x: Optional[int] = Field(default=None)
@@ -51,7 +54,7 @@ class ClickActionParams(BaseModel):
 class DragActionParams(BaseModel):
     """Parameters for drag action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.DRAG] = ComputerAction.DRAG
     path: List[Coordinate]
@@ -63,7 +66,7 @@ class DragActionParams(BaseModel):
 class PressKeysActionParams(BaseModel):
     """Parameters for press keys action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.PRESS_KEYS] = ComputerAction.PRESS_KEYS
     keys: List[str]
@@ -75,7 +78,7 @@ class PressKeysActionParams(BaseModel):
 class HoldKeyActionParams(BaseModel):
     """Parameters for hold key action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.HOLD_KEY] = ComputerAction.HOLD_KEY
     key: str
@@ -88,7 +91,7 @@ class HoldKeyActionParams(BaseModel):
 class MouseDownActionParams(BaseModel):
     """Parameters for mouse down action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.MOUSE_DOWN] = ComputerAction.MOUSE_DOWN
     button: ComputerActionMouseButton = Field(default="left")
@@ -100,7 +103,7 @@ class MouseDownActionParams(BaseModel):
 class MouseUpActionParams(BaseModel):
     """Parameters for mouse up action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.MOUSE_UP] = ComputerAction.MOUSE_UP
     button: ComputerActionMouseButton = Field(default="left")
@@ -112,7 +115,7 @@ class MouseUpActionParams(BaseModel):
 class MoveMouseActionParams(BaseModel):
     """Parameters for move mouse action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.MOVE_MOUSE] = ComputerAction.MOVE_MOUSE
     x: int = Field(ge=0)
@@ -125,7 +128,7 @@ class MoveMouseActionParams(BaseModel):
 class ScreenshotActionParams(BaseModel):
     """Parameters for screenshot action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.SCREENSHOT] = ComputerAction.SCREENSHOT
 
@@ -133,7 +136,7 @@ class ScreenshotActionParams(BaseModel):
 class ScrollActionParams(BaseModel):
     """Parameters for scroll action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.SCROLL] = ComputerAction.SCROLL
     x: int
@@ -148,7 +151,7 @@ class ScrollActionParams(BaseModel):
 class TypeTextActionParams(BaseModel):
     """Parameters for type text action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.TYPE_TEXT] = ComputerAction.TYPE_TEXT
     text: str
@@ -160,7 +163,7 @@ class TypeTextActionParams(BaseModel):
 class GetClipboardTextActionParams(BaseModel):
     """Parameters for get clipboard text action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.GET_CLIPBOARD_TEXT] = (
         ComputerAction.GET_CLIPBOARD_TEXT
@@ -173,7 +176,7 @@ class GetClipboardTextActionParams(BaseModel):
 class PutSelectionTextActionParams(BaseModel):
     """Parameters for put selection text action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.PUT_SELECTION_TEXT] = (
         ComputerAction.PUT_SELECTION_TEXT
@@ -187,7 +190,7 @@ class PutSelectionTextActionParams(BaseModel):
 class ListWindowsActionParams(BaseModel):
     """Parameters for list windows action."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     action: Literal[ComputerAction.LIST_WINDOWS] = ComputerAction.LIST_WINDOWS
     return_screenshot: bool = Field(
@@ -215,13 +218,13 @@ ComputerActionParams = Union[
 class ComputerActionResponseDataClipboardText(BaseModel):
     """Data for get clipboard text action."""
 
-    model_config = ConfigDict(populate_by_alias=True)
+    model_config = ConfigDict(populate_by_alias=True, defer_build=True)
 
     clipboard_text: Optional[str] = Field(default=None, alias="clipboardText")
 
 
 class ComputerActionWindow(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True)
+    model_config = ConfigDict(populate_by_alias=True, defer_build=True)
 
     id: str
     name: str
@@ -231,7 +234,7 @@ class ComputerActionWindow(BaseModel):
 class ComputerActionResponseDataListWindows(BaseModel):
     """Data for list windows action."""
 
-    model_config = ConfigDict(populate_by_alias=True)
+    model_config = ConfigDict(populate_by_alias=True, defer_build=True)
 
     active_window_id: str = Field(default="", alias="activeWindowId")
     windows: List[ComputerActionWindow] = Field(default_factory=list)
@@ -243,11 +246,12 @@ ComputerActionResponseData = Union[
 ]
 
 
-class ComputerActionResponse(BaseModel):
+class ComputerActionResponse(ScreenshotMixin, BaseModel):
     """Response from computer action API."""
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     success: bool
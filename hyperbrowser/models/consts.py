@@ -26,6 +26,8 @@ SessionEventLogType = Literal[
 
 POLLING_ATTEMPTS = 5
 
+ResultMode = Literal["model", "dict", "lazy"]
+
 BrowserUseVersion = Literal["0.1.40", "0.7.10", "latest"]
 HyperAgentVersion = Literal["0.8.0", "1.1.0"]
 
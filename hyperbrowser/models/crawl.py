@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from hyperbrowser.models.scrape import ScrapeOptions
+from hyperbrowser.models.screenshot import ScreenshotMixin
 from hyperbrowser.models.session import CreateSessionParams
 
 CrawlJobStatus = Literal["pending", "running", "completed", "failed"]
@@ -61,7 +62,7 @@ class CrawlJobStatusResponse(BaseModel):
     status: CrawlJobStatus
 
 
-class CrawledPage(BaseModel):
+class CrawledPage(ScreenshotMixin, BaseModel):
     """
     Data from a crawled page.
     """
@@ -10,6 +10,7 @@ class CreateExtensionParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     name: Optional[str] = Field(default=None, serialization_alias="name")
@@ -19,6 +20,7 @@ class CreateExtensionParams(BaseModel):
 class ExtensionResponse(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     id: str = Field(serialization_alias="id")
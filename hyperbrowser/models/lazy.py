@@ -0,0 +1,214 @@
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import Annotated
+
+from .screenshot import Screenshot, ScreenshotMixin
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+JobResponseT = TypeVar("JobResponseT", bound=BaseModel)
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    field = model.model_fields[name]
+    if not field.metadata:
+        return TypeAdapter(field.annotation)
+    return TypeAdapter(Annotated[(field.annotation, *field.metadata)])
+
+
+@lru_cache(maxsize=None)
+def _supports_field_validation(model: Type[BaseModel]) -> bool:
+    # Validators and discriminated unions can depend on the surrounding model,
+    # so models that declare any are always validated as a whole.
+    decorators = model.__pydantic_decorators__
+    if any(field.discriminator for field in model.model_fields.values()):
+        return False
+    return not (
+        decorators.field_validators
+        or decorators.model_validators
+        or decorators.validators
+        or decorators.root_validators
+    )
+
+
+class LazyModel(Generic[ModelT]):
+    """
+    Read-only view of a raw API object that validates fields on first access.
+
+    Attribute access mirrors ``model``; ``to_model()`` builds the full Pydantic
+    model and ``to_dict()`` returns the untouched wire payload.
+    """
+
+    __slots__ = ("_model", "_raw", "_values", "_instance")
+
+    def __init__(self, model: Type[ModelT], raw: Dict[str, Any]):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_values", {})
+        object.__setattr__(self, "_instance", None)
+
+    def __getattr__(self, name: str) -> Any:
+        field = self._model.model_fields.get(name)
+        if field is None:
+            raise AttributeError(
+                f"{self._model.__name__!r} object has no attribute {name!r}"
+            )
+        value = self._values.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if self._instance is not None or not _supports_field_validation(self._model):
+            value = getattr(self.to_model(), name)
+        else:
+            raw_value = _MISSING
+            if isinstance(field.alias, str):
+                raw_value = self._raw.get(field.alias, _MISSING)
+            if raw_value is _MISSING:
+                raw_value = self._raw.get(name, _MISSING)
+            if raw_value is not _MISSING:
+                value = _field_adapter(self._model, name).validate_python(raw_value)
+            elif field.is_required():
+                # Raises the same ValidationError as eager parsing would.
+                value = getattr(self.to_model(), name)
+            else:
+                value = field.get_default(call_default_factory=True)
+        self._values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self._model.model_fields))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            return self._model is other._model and self._raw == other._raw
+        if isinstance(other, BaseModel):
+            return self.to_model() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}]({self._raw!r})"
+
+    @property
+    def model_class(self) -> Type[ModelT]:
+        return self._model
+
+    def to_model(self) -> ModelT:
+        """Validate the whole payload and return the Pydantic model."""
+        if self._instance is None:
+            object.__setattr__(self, "_instance", self._model.model_validate(self._raw))
+        return self._instance
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the raw payload exactly as received from the API."""
+        return self._raw
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.to_model().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        return self.to_model().model_dump_json(**kwargs)
+
+    def screenshot_data(self, release: bool = False) -> Optional[Screenshot]:
+        """Wrap ``screenshot`` in a lazily decoded ``Screenshot``.
+
+        Only the ``screenshot`` field is validated. With ``release``, it is
+        cleared from the view and from the raw payload, so the returned object
+        holds the only reference to the base64 text.
+        """
+        if not issubclass(self._model, ScreenshotMixin):
+            raise AttributeError(
+                f"{self._model.__name__!r} object has no attribute 'screenshot_data'"
+            )
+        encoded = self.screenshot
+        if encoded is None:
+            return None
+        if release:
+            self._values["screenshot"] = None
+            if "screenshot" in self._raw:
+                self._raw["screenshot"] = None
+            if self._instance is not None:
+                self._instance.screenshot = None
+        return Screenshot(encoded)
+
+
+class LazyJobResponse(Generic[JobResponseT, ModelT]):
+    """
+    Paginated job response whose pages are ``LazyModel`` views.
+
+    The job fields are validated up front and read like attributes of
+    ``model``; ``data`` holds one ``LazyModel`` per page. ``to_model()``
+    validates everything and ``to_dict()`` returns the wire payload.
+    """
+
+    __slots__ = ("_model", "_page_model", "_raw", "_envelope", "data")
+
+    data: Optional[List[LazyModel[ModelT]]]
+
+    def __init__(
+        self,
+        model: Type[JobResponseT],
+        page_model: Type[ModelT],
+        raw: Dict[str, Any],
+    ):
+        pages = raw.get("data")
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_page_model", page_model)
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(
+            self,
+            "_envelope",
+            model.model_validate({**raw, "data": [] if pages is not None else None}),
+        )
+        object.__setattr__(
+            self,
+            "data",
+            None if pages is None else [LazyModel(page_model, page) for page in pages],
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._envelope, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self._model.model_fields))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyJobResponse):
+            return self._model is other._model and self._raw == other._raw
+        if isinstance(other, BaseModel):
+            return self.to_model() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyJobResponse[{self._model.__name__}]({self._raw!r})"
+
+    @property
+    def model_class(self) -> Type[JobResponseT]:
+        return self._model
+
+    @property
+    def page_model_class(self) -> Type[ModelT]:
+        return self._page_model
+
+    def to_model(self) -> JobResponseT:
+        """Validate the whole payload, pages included, and return the model."""
+        return self._model.model_validate(self._raw)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the raw payload exactly as received from the API."""
+        return self._raw
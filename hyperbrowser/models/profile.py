@@ -11,6 +11,7 @@ class CreateProfileParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     name: Optional[str] = Field(default=None, serialization_alias="name")
@@ -23,6 +24,7 @@ class ForkProfileParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     name: Optional[str] = Field(default=None, serialization_alias="name")
@@ -35,6 +37,7 @@ class CreateProfileResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     id: str
@@ -44,6 +47,7 @@ class CreateProfileResponse(BaseModel):
 class ProfileResponse(BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     id: str
@@ -60,6 +64,7 @@ class ProfileListParams(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     page: int = Field(default=1, ge=1)
@@ -74,6 +79,7 @@ class ProfileListResponse(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     profiles: List[ProfileResponse]
@@ -76,7 +76,7 @@ def _parse_optional_datetime_from_millis(value):
 
 
 class SandboxBaseModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class SandboxRuntimeTarget(SandboxBaseModel):
@@ -9,6 +9,7 @@ from hyperbrowser.models.consts import (
     ScrapeScreenshotFormat,
     ScrapeWaitUntil,
 )
+from hyperbrowser.models.screenshot import ScreenshotMixin
 from hyperbrowser.models.session import CreateSessionParams
 
 ScrapeJobStatus = Literal["pending", "running", "completed", "failed"]
@@ -114,7 +115,7 @@ class ScrapeJobStatusResponse(BaseModel):
     status: ScrapeJobStatus
 
 
-class ScrapeJobData(BaseModel):
+class ScrapeJobData(ScreenshotMixin, BaseModel):
     """
     Data from a scraped site.
     """
@@ -167,7 +168,7 @@ class BatchScrapeJobStatusResponse(BaseModel):
     status: ScrapeJobStatus
 
 
-class ScrapedPage(BaseModel):
+class ScrapedPage(ScreenshotMixin, BaseModel):
     """
     A scraped page.
     """
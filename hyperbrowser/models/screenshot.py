@@ -0,0 +1,148 @@
+import binascii
+import os
+from typing import IO, Optional, Union
+
+_DATA_URL_MARKER = ";base64,"
+# Multiple of 4, so every chunk decodes independently of its neighbours.
+_DECODE_CHUNK_CHARS = 1 << 16
+
+
+class Screenshot:
+    """
+    Base64 screenshot from an API response, decoded only when needed.
+
+    ``write_to()`` and ``decode_into()`` decode in fixed-size chunks straight
+    into a file or caller-owned buffer, so the full decoded image is never
+    held next to the base64 text. ``view()`` decodes once into an internal
+    buffer that later calls reuse. ``release()`` drops the base64 text once
+    only the decoded bytes are needed.
+    """
+
+    __slots__ = ("_encoded", "_start", "_buffer")
+
+    def __init__(self, encoded: str):
+        self._encoded: Optional[str] = encoded
+        self._start = 0
+        self._buffer: Optional[bytearray] = None
+        if encoded.startswith("data:"):
+            marker = encoded.find(_DATA_URL_MARKER, 0, 256)
+            if marker != -1:
+                self._start = marker + len(_DATA_URL_MARKER)
+
+    @property
+    def nbytes(self) -> int:
+        """Decoded size in bytes, computed without decoding."""
+        if self._buffer is not None:
+            return len(self._buffer)
+        encoded = self._require_encoded()
+        length = len(encoded) - self._start
+        padding = 0
+        if length and encoded.endswith("=="):
+            padding = 2
+        elif length and encoded.endswith("="):
+            padding = 1
+        return length * 3 // 4 - padding
+
+    @property
+    def released(self) -> bool:
+        return self._encoded is None
+
+    def decode_into(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Decode into a writable buffer and return the number of bytes written."""
+        target = memoryview(buffer).cast("B")
+        if self._buffer is not None:
+            size = len(self._buffer)
+            self._check_capacity(target, size)
+            target[:size] = self._buffer
+            return size
+
+        offset = 0
+        for chunk in self._chunks():
+            end = offset + len(chunk)
+            self._check_capacity(target, end)
+            target[offset:end] = chunk
+            offset = end
+        return offset
+
+    def write_to(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Write the decoded image to a path or binary file object."""
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as handle:
+                return self.write_to(handle)
+
+        if self._buffer is not None:
+            file.write(self._buffer)
+            return len(self._buffer)
+        written = 0
+        for chunk in self._chunks():
+            file.write(chunk)
+            written += len(chunk)
+        return written
+
+    def view(self, release: bool = False) -> memoryview:
+        """Read-only view of the decoded bytes, decoded on the first call.
+
+        With ``release``, the base64 text is dropped afterwards.
+        """
+        if self._buffer is None:
+            buffer = bytearray(self.nbytes)
+            size = self.decode_into(buffer)
+            del buffer[size:]
+            self._buffer = buffer
+        if release:
+            self._encoded = None
+        return memoryview(self._buffer).toreadonly()
+
+    def to_bytes(self) -> bytes:
+        if self._buffer is not None:
+            return bytes(self._buffer)
+        return binascii.a2b_base64(self._require_encoded()[self._start :])
+
+    def release(self) -> None:
+        """Drop the base64 text. Decoded bytes, if any, stay available."""
+        self._encoded = None
+
+    def _chunks(self):
+        encoded = self._require_encoded()
+        if "\n" in encoded or "\r" in encoded:
+            # Line breaks shift chunk boundaries; decode in one piece.
+            yield binascii.a2b_base64(encoded[self._start :])
+            return
+        for start in range(self._start, len(encoded), _DECODE_CHUNK_CHARS):
+            yield binascii.a2b_base64(encoded[start : start + _DECODE_CHUNK_CHARS])
+
+    def _require_encoded(self) -> str:
+        if self._encoded is None:
+            raise ValueError("Screenshot was released before it was decoded")
+        return self._encoded
+
+    @staticmethod
+    def _check_capacity(target: memoryview, size: int) -> None:
+        if size > len(target):
+            raise ValueError(
+                f"Buffer of {len(target)} bytes is too small for the screenshot"
+            )
+
+    def __repr__(self) -> str:
+        state = "decoded" if self._buffer is not None else "encoded"
+        return f"Screenshot({self.nbytes} bytes, {state})"
+
+
+class ScreenshotMixin:
+    """Adds ``screenshot_data()`` to response models with a ``screenshot`` field."""
+
+    def screenshot_data(self, release: bool = False) -> Optional[Screenshot]:
+        """Wrap ``screenshot`` in a lazily decoded ``Screenshot``.
+
+        With ``release``, the model's ``screenshot`` is cleared so the returned
+        object holds the only reference to the base64 text.
+        """
+        encoded = getattr(self, "screenshot")
+        if encoded is None:
+            return None
+        if release:
+            setattr(self, "screenshot", None)
+        return Screenshot(encoded)
+
+
+__all__ = ["Screenshot", "ScreenshotMixin"]
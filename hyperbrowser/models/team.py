@@ -8,6 +8,7 @@ class TeamCreditInfo(BaseModel):
 
     model_config = ConfigDict(
         populate_by_alias=True,
+        defer_build=True,
     )
 
     usage: int = Field(alias="usage")
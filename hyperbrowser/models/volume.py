@@ -6,7 +6,7 @@ from ._parsers import _parse_optional_int
 
 
 class VolumeBaseModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class CreateVolumeParams(VolumeBaseModel):
@@ -38,7 +38,7 @@ BrandingDesignFramework = Union[
 
 
 class BrandingColors(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     primary: Optional[str] = None
     secondary: Optional[str] = None
@@ -57,14 +57,14 @@ class BrandingColors(BaseModel):
 
 
 class BrandingFont(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     family: Optional[str] = None
     role: Optional[BrandingFontRole] = None
 
 
 class BrandingBorderRadiusCorners(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     top_left: Optional[str] = Field(
         default=None, alias="topLeft", serialization_alias="topLeft"
@@ -81,7 +81,7 @@ class BrandingBorderRadiusCorners(BaseModel):
 
 
 class BrandingButtonStyle(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     background: Optional[str] = None
     text_color: Optional[str] = Field(
@@ -102,7 +102,7 @@ class BrandingButtonStyle(BaseModel):
 
 
 class BrandingInputStyle(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     background: Optional[str] = None
     text_color: Optional[str] = Field(
@@ -128,7 +128,7 @@ class BrandingInputStyle(BaseModel):
 
 
 class BrandingComponents(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     button_primary: Optional[BrandingButtonStyle] = Field(
         default=None, alias="buttonPrimary", serialization_alias="buttonPrimary"
@@ -142,7 +142,7 @@ class BrandingComponents(BaseModel):
 
 
 class BrandingFontFamilies(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     primary: Optional[str] = None
     heading: Optional[str] = None
@@ -150,7 +150,7 @@ class BrandingFontFamilies(BaseModel):
 
 
 class BrandingFontStacks(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     primary: Optional[List[Optional[str]]] = None
     heading: Optional[List[Optional[str]]] = None
@@ -159,7 +159,7 @@ class BrandingFontStacks(BaseModel):
 
 
 class BrandingFontSizes(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     h1: Optional[str] = None
     h2: Optional[str] = None
@@ -169,7 +169,7 @@ class BrandingFontSizes(BaseModel):
 
 
 class BrandingTypography(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     font_families: Optional[BrandingFontFamilies] = Field(
         default=None, alias="fontFamilies", serialization_alias="fontFamilies"
@@ -189,7 +189,7 @@ class BrandingTypography(BaseModel):
 
 
 class BrandingSpacing(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     base_unit: Optional[float] = Field(
         default=None, alias="baseUnit", serialization_alias="baseUnit"
@@ -205,7 +205,7 @@ class BrandingSpacing(BaseModel):
 
 
 class BrandingImages(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     logo: Optional[str] = None
     logo_href: Optional[str] = Field(
@@ -221,7 +221,7 @@ class BrandingImages(BaseModel):
 
 
 class BrandingPersonality(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     tone: Optional[BrandingPersonalityTone] = None
     energy: Optional[BrandingPersonalityEnergy] = None
@@ -233,7 +233,7 @@ class BrandingPersonality(BaseModel):
 
 
 class BrandingDesignSystem(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     framework: Optional[BrandingDesignFramework] = None
     component_library: Optional[str] = Field(
@@ -244,7 +244,7 @@ class BrandingDesignSystem(BaseModel):
 
 
 class BrandingConfidence(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     buttons: Optional[float] = None
     colors: Optional[float] = None
@@ -252,7 +252,7 @@ class BrandingConfidence(BaseModel):
 
 
 class BrandingProfile(BaseModel):
-    model_config = ConfigDict(populate_by_alias=True, extra="allow")
+    model_config = ConfigDict(populate_by_alias=True, extra="allow", defer_build=True)
 
     color_scheme: Optional[BrandingColorScheme] = Field(
         default=None, alias="colorScheme", serialization_alias="colorScheme"
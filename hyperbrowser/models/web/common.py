@@ -9,6 +9,7 @@ from hyperbrowser.models.consts import (
     State,
     FetchSanitizeMode,
 )
+from hyperbrowser.models.screenshot import ScreenshotMixin
 from hyperbrowser.models.session import ScreenConfig
 from hyperbrowser.models.web.branding import BrandingProfile
 
@@ -60,7 +61,7 @@ class FetchBrowserLocationOptions(BaseModel):
     city: Optional[str] = Field(default=None, serialization_alias="city")
 
 
-class PageData(BaseModel):
+class PageData(ScreenshotMixin, BaseModel):
     """
     Output data for a fetched page.
     """
@@ -9,6 +9,7 @@ from .common import (
 )
 from .branding import BrandingProfile
 from hyperbrowser.models.consts import FetchStatus, FetchStealthMode
+from hyperbrowser.models.screenshot import ScreenshotMixin
 
 
 class FetchParams(BaseModel):
@@ -34,7 +35,7 @@ class FetchParams(BaseModel):
     )
 
 
-class FetchResponseData(BaseModel):
+class FetchResponseData(ScreenshotMixin, BaseModel):
     model_config = ConfigDict(
         populate_by_alias=True,
     )
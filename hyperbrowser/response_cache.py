@@ -0,0 +1,229 @@
+"""Client-side cache for repeated ``web.fetch`` and scrape results.
+
+Completed responses are stored as the raw JSON bytes returned by the API,
+keyed on a hash of the endpoint, the normalized wire payload and the API key.
+Entries live in an in-memory LRU and, when ``path`` is given, in a SQLite
+database so they survive restarts and can be shared between processes of the
+same user. The cache is disabled unless a ``ResponseCache`` is passed through
+``ClientConfig(response_cache=...)``.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    content BLOB NOT NULL
+)
+"""
+_CREATED_AT_INDEX = (
+    "CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)"
+)
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Counters describing how a ``ResponseCache`` has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    Two-level cache of completed API responses.
+
+    ``max_age_seconds`` is the default freshness limit; callers can pass a
+    stricter or looser ``max_age`` per lookup. ``max_entries`` and
+    ``max_memory_bytes`` bound the in-memory LRU, ``max_disk_entries`` bounds
+    the SQLite store by dropping the oldest rows.
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = 300.0,
+        max_entries: int = 256,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_disk_entries: Optional[int] = 10_000,
+    ):
+        if max_age_seconds < 0:
+            raise ValueError("max_age_seconds must be greater than or equal to 0")
+        if max_entries < 0 or max_memory_bytes < 0:
+            raise ValueError("max_entries and max_memory_bytes must not be negative")
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_entries = max_disk_entries
+        self.path = os.path.expanduser(os.fspath(path)) if path is not None else None
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._counters = {name: 0 for name in ResponseCacheStats.__annotations__}
+        self._connection: Any = None
+        if self.path is not None:
+            self._connection = self._connect(self.path)
+
+    @staticmethod
+    def _connect(path: str) -> Any:
+        import sqlite3
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(_SCHEMA)
+        connection.execute(_CREATED_AT_INDEX)
+        connection.commit()
+        return connection
+
+    @staticmethod
+    def make_key(url: str, payload: Any, scope: str = "") -> str:
+        """Hash an endpoint and its wire payload into a cache key.
+
+        ``payload`` is serialized with sorted keys, so mappings that differ
+        only in key order share an entry. ``scope`` separates callers that
+        must not see each other's results, such as different API keys.
+        """
+        normalized = json.dumps(
+            payload,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = hashlib.sha256()
+        for part in (scope, url, normalized):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(**self._counters)
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+        """Return cached content for ``key`` if it is at most ``max_age`` old."""
+        max_age = self.max_age_seconds if max_age is None else max_age
+        oldest = time.time() - max_age
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and max_age > 0 and entry[0] >= oldest:
+                self._memory.move_to_end(key)
+                self._count("hits", "memory_hits")
+                return entry[1]
+
+            if self._connection is not None and max_age > 0:
+                row = self._connection.execute(
+                    "SELECT created_at, content FROM responses "
+                    "WHERE key = ? AND created_at >= ?",
+                    (key, oldest),
+                ).fetchone()
+                if row is not None:
+                    created_at, content = row[0], bytes(row[1])
+                    self._remember(key, created_at, content)
+                    self._count("hits", "disk_hits")
+                    return content
+
+            self._count("misses")
+            return None
+
+    def set(self, key: str, content: bytes) -> None:
+        """Store ``content`` under ``key`` in memory and, if enabled, on disk."""
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, content)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, created_at, content) "
+                    "VALUES (?, ?, ?)",
+                    (key, created_at, content),
+                )
+                if self.max_disk_entries is not None:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        "SELECT key FROM responses ORDER BY created_at DESC "
+                        "LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+                self._connection.commit()
+            self._count("stores")
+
+    async def aget(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+        """Async ``get``; disk lookups run in the default executor."""
+        if self._connection is None:
+            return self.get(key, max_age)
+        return await _run_blocking(self.get, key, max_age)
+
+    async def aset(self, key: str, content: bytes) -> None:
+        """Async ``set``; disk writes run in the default executor."""
+        if self._connection is None:
+            self.set(key, content)
+            return
+        await _run_blocking(self.set, key, content)
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk. Counters are kept."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM responses")
+                self._connection.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any. Memory entries stay usable."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, created_at: float, content: bytes) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[1])
+        if len(content) > self.max_memory_bytes or self.max_entries == 0:
+            return
+        self._memory[key] = (created_at, content)
+        self._memory_bytes += len(content)
+        while (
+            len(self._memory) > self.max_entries
+            or self._memory_bytes > self.max_memory_bytes
+        ):
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._count("evictions")
+
+    def _count(self, *names: str) -> None:
+        for name in names:
+            self._counters[name] += 1
+
+
+async def _run_blocking(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+__all__ = ["ResponseCache", "ResponseCacheStats"]
@@ -6,9 +6,14 @@ from urllib.parse import urljoin, urlsplit, urlunsplit
 import httpx
 
 from .exceptions import HyperbrowserError, HyperbrowserService
+from .json_codec import JsonCodec, get_json_codec
 
 RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
 RUNTIME_SESSION_REFRESH_BUFFER_MS = 60_000
+# Background refresh runs this long before the refresh buffer is reached, so
+# runtime calls keep finding a token that is not about to expire.
+RUNTIME_SESSION_BACKGROUND_REFRESH_LEAD_MS = 30_000
+RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS = 5.0
 
 
 @dataclass(frozen=True)
@@ -92,12 +97,13 @@ def parse_json_response(
     response: httpx.Response,
     service: HyperbrowserService,
     default_message: str = "Failed to parse JSON response",
+    json_codec: Optional[JsonCodec] = None,
 ) -> Any:
     if not response.content:
         return {}
 
     try:
-        return response.json()
+        return (json_codec or get_json_codec()).loads(response.content)
     except json.JSONDecodeError as error:
         raise HyperbrowserError(
             default_message,
@@ -1,16 +1,25 @@
 import asyncio
 import httpx
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import JsonCodec, get_json_codec
 from .base import TransportStrategy, APIResponse
+from .single_flight import AsyncSingleFlight, CoalesceGets
 
 
 class AsyncTransport(TransportStrategy):
     """Asynchronous transport implementation using httpx"""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        json_codec: Optional[JsonCodec] = None,
+        coalesce_gets: CoalesceGets = False,
+    ):
         self.client = httpx.AsyncClient(headers={"x-api-key": api_key})
+        self.json_codec = json_codec or get_json_codec()
+        self.single_flight = AsyncSingleFlight(coalesce_gets)
         self._closed = False
 
     async def close(self) -> None:
@@ -41,7 +50,9 @@ class AsyncTransport(TransportStrategy):
             try:
                 if not response.content:
                     return APIResponse.from_status(response.status_code)
-                return APIResponse(response.json())
+                return APIResponse.from_content(
+                    response.content, self.json_codec, response.status_code
+                )
             except httpx.DecodingError as e:
                 if response.status_code >= 400:
                     raise HyperbrowserError(
@@ -53,7 +64,7 @@ class AsyncTransport(TransportStrategy):
                 return APIResponse.from_status(response.status_code)
         except httpx.HTTPStatusError as e:
             try:
-                error_data = response.json()
+                error_data = self.json_codec.loads(response.content)
                 message = error_data.get("message") or error_data.get("error") or str(e)
             except Exception:
                 message = str(e)
@@ -73,6 +84,7 @@ class AsyncTransport(TransportStrategy):
         files: Optional[dict] = None,
         timeout: Optional[float] = None,
     ) -> APIResponse:
+        self.single_flight.invalidate()
         try:
             kwargs = {}
             if timeout is not None:
@@ -80,7 +92,9 @@ class AsyncTransport(TransportStrategy):
             if files:
                 response = await self.client.post(url, data=data, files=files, **kwargs)
             else:
-                response = await self.client.post(url, json=data, **kwargs)
+                response = await self.client.post(
+                    url, **self.json_codec.request_kwargs(data), **kwargs
+                )
             return await self._handle_response(response)
         except HyperbrowserError:
             raise
@@ -92,6 +106,17 @@ class AsyncTransport(TransportStrategy):
     ) -> APIResponse:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
+        if self.single_flight.applies_to(url):
+            shared = await self.single_flight.do(
+                self.single_flight.key(url, params, follow_redirects),
+                lambda: self._get(url, params, follow_redirects),
+            )
+            return shared.copy()
+        return await self._get(url, params, follow_redirects)
+
+    async def _get(
+        self, url: str, params: Optional[dict], follow_redirects: bool
+    ) -> APIResponse:
         try:
             response = await self.client.get(
                 url, params=params, follow_redirects=follow_redirects
@@ -102,9 +127,30 @@ class AsyncTransport(TransportStrategy):
         except Exception as e:
             raise HyperbrowserError("Get request failed", original_error=e)
 
+    async def stream_get(
+        self, url: str, params: Optional[dict] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield the body of a GET request in chunks as it is received."""
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        try:
+            async with self.client.stream("GET", url, params=params) as response:
+                if response.is_error:
+                    await response.aread()
+                    await self._handle_response(response)
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+        except HyperbrowserError:
+            raise
+        except httpx.HTTPError as e:
+            raise HyperbrowserError("Get request failed", original_error=e)
+
     async def put(self, url: str, data: Optional[dict] = None) -> APIResponse:
+        self.single_flight.invalidate()
         try:
-            response = await self.client.put(url, json=data)
+            response = await self.client.put(
+                url, **self.json_codec.request_kwargs(data)
+            )
             return await self._handle_response(response)
         except HyperbrowserError:
             raise
@@ -112,6 +158,7 @@ class AsyncTransport(TransportStrategy):
             raise HyperbrowserError("Put request failed", original_error=e)
 
     async def delete(self, url: str) -> APIResponse:
+        self.single_flight.invalidate()
         try:
             response = await self.client.delete(url)
             return await self._handle_response(response)
@@ -1,19 +1,94 @@
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import lru_cache
 from typing import Optional, TypeVar, Generic, Type, Union
 
+from pydantic import TypeAdapter, ValidationError
+
 from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import JsonCodec
 
 T = TypeVar("T")
 
 
+_UNSET = object()
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model: Type[T]) -> TypeAdapter[T]:
+    """Return a process-wide cached ``TypeAdapter`` for ``model``."""
+    return TypeAdapter(model)
+
+
 class APIResponse(Generic[T]):
     """
     Wrapper for API responses to standardize sync/async handling.
+
+    Responses built from raw bytes decode them lazily: ``to_model`` validates the
+    bytes directly with pydantic-core, so the intermediate ``dict`` tree is only
+    built when ``data`` is read.
     """
 
     def __init__(self, data: Optional[Union[dict, T]] = None, status_code: int = 200):
-        self.data = data
+        self._data = data
+        self.content: Optional[bytes] = None
         self.status_code = status_code
+        self._json_codec: Optional[JsonCodec] = None
+
+    @classmethod
+    def from_content(
+        cls,
+        content: bytes,
+        json_codec: JsonCodec,
+        status_code: int = 200,
+    ) -> "APIResponse":
+        """Create an APIResponse that defers JSON decoding of ``content``."""
+        response = cls(status_code=status_code)
+        response._data = _UNSET
+        response.content = content
+        response._json_codec = json_codec
+        return response
+
+    @property
+    def data(self) -> Optional[Union[dict, T]]:
+        if self._data is _UNSET:
+            try:
+                self._data = self._json_codec.loads(self.content)
+            except Exception as e:
+                raise HyperbrowserError(
+                    "Failed to parse response data", original_error=e
+                )
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[Union[dict, T]]) -> None:
+        self._data = value
+
+    def copy(self) -> "APIResponse[T]":
+        """Return a response whose ``data`` is independent of this one's."""
+        if self._data is _UNSET:
+            return type(self).from_content(
+                self.content, self._json_codec, self.status_code
+            )
+        return type(self)(deepcopy(self._data), self.status_code)
+
+    def to_model(self, model: Type[T]) -> T:
+        """Validate the response body as ``model``.
+
+        Undecoded bytes go straight to ``TypeAdapter.validate_json``; otherwise
+        the already-decoded ``data`` is validated.
+        """
+        adapter = get_type_adapter(model)
+        if self._data is not _UNSET:
+            return adapter.validate_python(self._data)
+        try:
+            return adapter.validate_json(self.content)
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise HyperbrowserError(
+                    "Failed to parse response data", original_error=e
+                )
+            raise
 
     @classmethod
     def from_json(cls, json_data: dict, model: Type[T]) -> "APIResponse[T]":
@@ -37,7 +112,7 @@ class TransportStrategy(ABC):
     """Abstract base class for different transport implementations"""
 
     @abstractmethod
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, json_codec: Optional[JsonCodec] = None):
         pass
 
     @abstractmethod
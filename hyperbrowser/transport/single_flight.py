@@ -0,0 +1,167 @@
+"""Coalescing of concurrent identical GET requests.
+
+When several threads or coroutines poll the same resource at once, only the
+first caller issues the request; the others wait for it and each receive a
+copy of its ``APIResponse`` (or exception). Nothing is cached: once the
+request finishes the next call starts a new one, and a GET issued after a
+write never joins a request that started before it.
+"""
+
+import asyncio
+import copy
+import itertools
+import re
+import threading
+from fnmatch import translate
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Pattern,
+    Sequence,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+
+CoalesceGets = Union[bool, Sequence[str]]
+"""``True`` for every GET, ``False`` for none, or glob patterns for URL paths."""
+
+
+def _compile_endpoints(endpoints: CoalesceGets) -> Optional[Pattern[str]]:
+    if endpoints is True:
+        return re.compile(".*")
+    if endpoints is False:
+        return None
+    if isinstance(endpoints, str):
+        endpoints = [endpoints]
+    if not endpoints:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in endpoints))
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """Copy ``error`` so each waiter raises its own exception instance."""
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
+
+
+class _SingleFlightBase:
+    def __init__(self, endpoints: CoalesceGets = True):
+        self._endpoints = _compile_endpoints(endpoints)
+        self._generations = itertools.count(1)
+        self._generation = 0
+        self.shared = 0
+
+    def applies_to(self, url: str) -> bool:
+        """Whether GET requests to ``url`` are coalesced."""
+        if self._endpoints is None:
+            return False
+        return self._endpoints.match(urlsplit(url).path) is not None
+
+    def invalidate(self) -> None:
+        """Keep later requests from joining the ones already in flight.
+
+        Transports call this before every write, so reads issued after it
+        observe the write.
+        """
+        self._generation = next(self._generations)
+
+    def key(
+        self, url: str, params: Optional[Dict[str, Any]], follow_redirects: bool
+    ) -> Hashable:
+        return (
+            self._generation,
+            url,
+            repr(sorted(params.items())) if params else "",
+            follow_redirects,
+        )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(_SingleFlightBase):
+    """Thread-safe single-flight group for the synchronous transport."""
+
+    def __init__(self, endpoints: CoalesceGets = True):
+        super().__init__(endpoints)
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                error = call.error
+                raise _copy_error(error) from error.__cause__
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight(_SingleFlightBase):
+    """Single-flight group for the asynchronous transport.
+
+    The shared request runs as its own task, so cancelling one waiter does not
+    cancel the request for the others.
+    """
+
+    def __init__(self, endpoints: CoalesceGets = True):
+        super().__init__(endpoints)
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+        try:
+            return await asyncio.shield(task)
+        except Exception as error:
+            if not task.done() or task.cancelled() or task.exception() is not error:
+                raise
+            raise _copy_error(error) from error.__cause__
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        self._tasks.pop(key, None)
+        if not task.cancelled():
+            # Retrieve the exception so it is not reported as unhandled when
+            # every waiter was cancelled before the request finished.
+            task.exception()
+
+
+__all__ = ["AsyncSingleFlight", "CoalesceGets", "SingleFlight"]
@@ -1,15 +1,24 @@
 import httpx
-from typing import Optional
+from typing import Iterator, Optional
 
 from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import JsonCodec, get_json_codec
 from .base import TransportStrategy, APIResponse
+from .single_flight import SingleFlight, CoalesceGets
 
 
 class SyncTransport(TransportStrategy):
     """Synchronous transport implementation using httpx"""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        json_codec: Optional[JsonCodec] = None,
+        coalesce_gets: CoalesceGets = False,
+    ):
         self.client = httpx.Client(headers={"x-api-key": api_key})
+        self.json_codec = json_codec or get_json_codec()
+        self.single_flight = SingleFlight(coalesce_gets)
 
     def _handle_response(self, response: httpx.Response) -> APIResponse:
         try:
@@ -17,7 +26,9 @@ class SyncTransport(TransportStrategy):
             try:
                 if not response.content:
                     return APIResponse.from_status(response.status_code)
-                return APIResponse(response.json())
+                return APIResponse.from_content(
+                    response.content, self.json_codec, response.status_code
+                )
             except httpx.DecodingError as e:
                 if response.status_code >= 400:
                     raise HyperbrowserError(
@@ -29,7 +40,7 @@ class SyncTransport(TransportStrategy):
                 return APIResponse.from_status(response.status_code)
         except httpx.HTTPStatusError as e:
             try:
-                error_data = response.json()
+                error_data = self.json_codec.loads(response.content)
                 message = error_data.get("message") or error_data.get("error") or str(e)
             except Exception:
                 message = str(e)
@@ -52,6 +63,7 @@ class SyncTransport(TransportStrategy):
         files: Optional[dict] = None,
         timeout: Optional[float] = None,
     ) -> APIResponse:
+        self.single_flight.invalidate()
         try:
             kwargs = {}
             if timeout is not None:
@@ -59,7 +71,9 @@ class SyncTransport(TransportStrategy):
             if files:
                 response = self.client.post(url, data=data, files=files, **kwargs)
             else:
-                response = self.client.post(url, json=data, **kwargs)
+                response = self.client.post(
+                    url, **self.json_codec.request_kwargs(data), **kwargs
+                )
             return self._handle_response(response)
         except HyperbrowserError:
             raise
@@ -71,6 +85,17 @@ class SyncTransport(TransportStrategy):
     ) -> APIResponse:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
+        if self.single_flight.applies_to(url):
+            shared = self.single_flight.do(
+                self.single_flight.key(url, params, follow_redirects),
+                lambda: self._get(url, params, follow_redirects),
+            )
+            return shared.copy()
+        return self._get(url, params, follow_redirects)
+
+    def _get(
+        self, url: str, params: Optional[dict], follow_redirects: bool
+    ) -> APIResponse:
         try:
             response = self.client.get(
                 url, params=params, follow_redirects=follow_redirects
@@ -81,9 +106,25 @@ class SyncTransport(TransportStrategy):
         except Exception as e:
             raise HyperbrowserError("Get request failed", original_error=e)
 
+    def stream_get(self, url: str, params: Optional[dict] = None) -> Iterator[bytes]:
+        """Yield the body of a GET request in chunks as it is received."""
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        try:
+            with self.client.stream("GET", url, params=params) as response:
+                if response.is_error:
+                    response.read()
+                    self._handle_response(response)
+                yield from response.iter_bytes()
+        except HyperbrowserError:
+            raise
+        except httpx.HTTPError as e:
+            raise HyperbrowserError("Get request failed", original_error=e)
+
     def put(self, url: str, data: Optional[dict] = None) -> APIResponse:
+        self.single_flight.invalidate()
         try:
-            response = self.client.put(url, json=data)
+            response = self.client.put(url, **self.json_codec.request_kwargs(data))
             return self._handle_response(response)
         except HyperbrowserError:
             raise
@@ -91,6 +132,7 @@ class SyncTransport(TransportStrategy):
             raise HyperbrowserError("Put request failed", original_error=e)
 
     def delete(self, url: str) -> APIResponse:
+        self.single_flight.invalidate()
         try:
             response = self.client.delete(url)
             return self._handle_response(response)
@@ -0,0 +1,140 @@
+import json
+from typing import List
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import STDLIB_JSON_CODEC, JsonCodec
+from hyperbrowser.models import CrawlJobResponse, SessionRecording
+from hyperbrowser.transport.async_transport import AsyncTransport
+from hyperbrowser.transport.base import APIResponse, get_type_adapter
+from hyperbrowser.transport.sync import SyncTransport
+
+CRAWL_JOB_PAYLOAD = {
+    "jobId": "crawl_123",
+    "status": "completed",
+    "data": [
+        {
+            "url": f"https://example.com/{index}",
+            "status": "completed",
+            "html": "<html><body>" + "x" * 64 + "</body></html>",
+            "markdown": "# page",
+            "links": ["https://example.com/"],
+            "metadata": {"title": f"Page {index}"},
+        }
+        for index in range(3)
+    ],
+    "totalCrawledPages": 3,
+    "totalPageBatches": 1,
+    "currentPageBatch": 1,
+    "batchSize": 100,
+}
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        super().__init__("counting", STDLIB_JSON_CODEC.dumps, self._count_loads)
+        self.loads_calls = 0
+
+    def _count_loads(self, data):
+        self.loads_calls += 1
+        return STDLIB_JSON_CODEC.loads(data)
+
+
+def test_to_model_validates_raw_bytes_without_decoding_a_dict():
+    codec = CountingCodec()
+    response = APIResponse.from_content(
+        json.dumps(CRAWL_JOB_PAYLOAD).encode("utf-8"), codec
+    )
+
+    job = response.to_model(CrawlJobResponse)
+
+    assert codec.loads_calls == 0
+    assert job == CrawlJobResponse(**CRAWL_JOB_PAYLOAD)
+
+
+def test_data_is_decoded_lazily_and_once():
+    codec = CountingCodec()
+    response = APIResponse.from_content(b'{"success": true}', codec, 201)
+
+    assert response.status_code == 201
+    assert codec.loads_calls == 0
+    assert response.data == {"success": True}
+    assert response.data == {"success": True}
+    assert codec.loads_calls == 1
+
+
+def test_to_model_reuses_decoded_data():
+    response = APIResponse(dict(CRAWL_JOB_PAYLOAD))
+
+    assert response.to_model(CrawlJobResponse) == CrawlJobResponse(**CRAWL_JOB_PAYLOAD)
+
+
+def test_to_model_supports_non_model_types():
+    payload = [
+        {
+            "type": 2,
+            "data": {"href": "https://example.com"},
+            "timestamp": 1,
+        }
+    ]
+    response = APIResponse.from_content(
+        json.dumps(payload).encode("utf-8"), STDLIB_JSON_CODEC
+    )
+
+    assert response.to_model(List[SessionRecording]) == [
+        SessionRecording(**recording) for recording in payload
+    ]
+    assert get_type_adapter(List[SessionRecording]) is get_type_adapter(
+        List[SessionRecording]
+    )
+
+
+def test_invalid_json_raises_hyperbrowser_error():
+    response = APIResponse.from_content(b"{not json", STDLIB_JSON_CODEC)
+
+    with pytest.raises(HyperbrowserError, match="Failed to parse response data"):
+        response.to_model(CrawlJobResponse)
+    with pytest.raises(HyperbrowserError, match="Failed to parse response data"):
+        response.data
+
+
+def test_schema_mismatches_still_raise_validation_errors():
+    response = APIResponse.from_content(b'{"jobId": "crawl_123"}', STDLIB_JSON_CODEC)
+
+    with pytest.raises(ValidationError):
+        response.to_model(CrawlJobResponse)
+
+
+def _crawl_job_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=CRAWL_JOB_PAYLOAD)
+
+
+def test_sync_transport_returns_undecoded_responses():
+    transport = SyncTransport("test-key", json_codec=STDLIB_JSON_CODEC)
+    transport.client = httpx.Client(transport=httpx.MockTransport(_crawl_job_handler))
+    try:
+        response = transport.get("https://api.example.com/crawl/crawl_123")
+    finally:
+        transport.close()
+
+    assert response.content is not None
+    assert response.to_model(CrawlJobResponse).job_id == "crawl_123"
+
+
+@pytest.mark.anyio
+async def test_async_transport_returns_undecoded_responses():
+    transport = AsyncTransport("test-key", json_codec=STDLIB_JSON_CODEC)
+    await transport.client.aclose()
+    transport.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_crawl_job_handler)
+    )
+    try:
+        response = await transport.get("https://api.example.com/crawl/crawl_123")
+    finally:
+        await transport.close()
+
+    assert response.content is not None
+    assert response.to_model(CrawlJobResponse).job_id == "crawl_123"
@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import io
+import json
+import os
+import stat
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from hyperbrowser.client.managers.async_manager.sandbox import (
+    SandboxManager as AsyncSandboxManager,
+)
+from hyperbrowser.client.managers.async_manager.sandboxes import sandbox_image_build
+from hyperbrowser.client.managers.sandboxes import image_build
+from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.image_build_uploader import (
+    AsyncImageBuildUploader,
+    ImageBuildUploader,
+)
+from hyperbrowser.models import (
+    SandboxImageBuild,
+    SandboxImageBuildCreateResult,
+    SandboxImageBuildUpload,
+)
+
+CONFIG = b'{"architecture":"amd64","config":{}}'
+LAYERS = [b"base-layer" * 100_000, b"app-layer"]
+CONFIG_SHA = hashlib.sha256(CONFIG).hexdigest()
+LAYER_SHAS = [hashlib.sha256(layer).hexdigest() for layer in LAYERS]
+
+FAKE_DOCKER = """#!/bin/sh
+case "$1 $2" in
+  "image save") exec cat "$FAKE_DOCKER_SAVE" ;;
+  "image inspect") exec cat "$FAKE_DOCKER_INSPECT" ;;
+  "image rm") echo "$3" >> "$FAKE_DOCKER_LOG" ;;
+  *) echo "unexpected docker $*" >&2; exit 1 ;;
+esac
+"""
+
+
+def _tar(members, tar_format=tarfile.PAX_FORMAT):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tar_format) as archive:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                archive.addfile(info)
+                continue
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _docker_save_archive():
+    manifest = json.dumps(
+        [
+            {
+                "Config": f"blobs/sha256/{CONFIG_SHA}",
+                "Layers": [f"blobs/sha256/{sha}" for sha in LAYER_SHAS],
+            }
+        ]
+    ).encode()
+    return _tar(
+        [
+            ("blobs", None),
+            ("blobs/sha256", None),
+            (f"blobs/sha256/{CONFIG_SHA}", CONFIG),
+            *[(f"blobs/sha256/{sha}", data) for sha, data in zip(LAYER_SHAS, LAYERS)],
+            ("manifest.json", manifest),
+        ]
+    )
+
+
+@pytest.fixture
+def fake_docker(monkeypatch, tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(FAKE_DOCKER)
+    docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+    save = tmp_path / "save.tar"
+    save.write_bytes(_docker_save_archive())
+    inspect = tmp_path / "inspect.json"
+    inspect.write_text(
+        json.dumps(
+            {
+                "Id": f"sha256:{CONFIG_SHA}",
+                "Os": "linux",
+                "Architecture": "amd64",
+                "Config": {"User": "node"},
+            }
+        )
+    )
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_SAVE", str(save))
+    monkeypatch.setenv("FAKE_DOCKER_INSPECT", str(inspect))
+    monkeypatch.setenv("FAKE_DOCKER_LOG", str(tmp_path / "docker.log"))
+    return tmp_path
+
+
+class _NoDefaultExecutor(ThreadPoolExecutor):
+    def submit(self, *args, **kwargs):
+        raise AssertionError("image build used the default executor")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("tar_format", [tarfile.PAX_FORMAT, tarfile.GNU_FORMAT])
+async def test_async_tar_reader_matches_tarfile(tar_format):
+    archive = _tar(
+        [
+            ("dir", None),
+            ("dir/" + "long-name-" * 20, b"x" * 1500),
+            ("empty", b""),
+            ("dir/small", b"small"),
+        ],
+        tar_format,
+    )
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r|") as expected:
+        expected_members = [
+            (
+                member.name,
+                member.type,
+                expected.extractfile(member).read() if member.isfile() else None,
+            )
+            for member in expected
+        ]
+
+    for read_data in (True, False):
+        stream = asyncio.StreamReader()
+        stream.feed_data(archive)
+        stream.feed_eof()
+        reader = sandbox_image_build._AsyncTarReader(stream)
+        members = []
+        while True:
+            member = await reader.next()
+            if member is None:
+                break
+            data = None
+            if member.isfile():
+                # Unread data is skipped before the next member.
+                data = await reader.read(member.size) if read_data else b""
+            members.append((member.name, member.type, data))
+
+        assert members == [
+            (name, member_type, data if read_data or data is None else b"")
+            for name, member_type, data in expected_members
+        ]
+
+
+@pytest.mark.anyio
+async def test_async_docker_image_manifest_matches_sync_packaging(fake_docker):
+    sync_packaged = image_build.package_docker_image_manifest(
+        "local/app:latest", f"sha256:{CONFIG_SHA}", {"User": "node"}
+    )
+    async_packaged = await sandbox_image_build.package_docker_image_manifest(
+        "local/app:latest", f"sha256:{CONFIG_SHA}", {"User": "node"}
+    )
+    try:
+        assert async_packaged.manifest == sync_packaged.manifest
+        assert async_packaged.artifact.sha256_hex == sync_packaged.artifact.sha256_hex
+        for sha, data in zip(LAYER_SHAS, LAYERS):
+            with open(async_packaged.layers[sha].path, "rb") as layer:
+                assert layer.read() == data
+    finally:
+        sync_packaged.cleanup()
+        async_packaged.cleanup()
+
+
+@pytest.mark.anyio
+async def test_async_docker_save_failure_reports_stderr(fake_docker, monkeypatch):
+    monkeypatch.setenv("FAKE_DOCKER_SAVE", str(fake_docker / "missing.tar"))
+
+    with pytest.raises(RuntimeError, match="docker image save local/app failed: "):
+        await sandbox_image_build.package_docker_image_manifest(
+            "local/app",
+            f"sha256:{CONFIG_SHA}",
+            {},
+            temp_dir=str(fake_docker),
+        )
+    assert sorted(os.listdir(fake_docker)) == [
+        "bin",
+        "inspect.json",
+        "save.tar",
+    ]
+
+
+@pytest.mark.anyio
+async def test_async_docker_image_build_runs_off_the_default_executor(
+    fake_docker, monkeypatch
+):
+    asyncio.get_running_loop().set_default_executor(_NoDefaultExecutor())
+    manager = AsyncSandboxManager(
+        SimpleNamespace(timeout=30, config=SimpleNamespace(runtime_proxy_override=None))
+    )
+    build = SandboxImageBuild(id="build-123", imageName="custom", status="dispatching")
+    created = []
+
+    async def reuse_docker_image(params):
+        raise HyperbrowserError("not found", status_code=404)
+
+    async def create_image_build(params):
+        created.append(params)
+        return SandboxImageBuildCreateResult(
+            build=build,
+            uploads=[
+                SandboxImageBuildUpload(
+                    sha256=sha,
+                    url=f"https://upload.example.com/{sha}",
+                    method="PUT",
+                    headers={},
+                    objectKey=sha,
+                    expiresInSeconds=900,
+                    maxUploadBytes=0,
+                )
+                for sha in LAYER_SHAS
+            ],
+        )
+
+    async def complete_image_build(build_id, artifact):
+        return build
+
+    monkeypatch.setattr(manager, "reuse_docker_image", reuse_docker_image)
+    monkeypatch.setattr(manager, "create_image_build", create_image_build)
+    monkeypatch.setattr(
+        manager, "_complete_image_build_resilient", complete_image_build
+    )
+    uploaded = {}
+
+    async def handler(request):
+        uploaded[request.url.path.lstrip("/")] = await request.aread()
+        return httpx.Response(200)
+
+    async with AsyncImageBuildUploader(
+        max_concurrency=2, transport=httpx.MockTransport(handler)
+    ) as uploader:
+        result = await manager.build_image_from_docker_image(
+            docker_image="local/app:latest",
+            image_name="custom",
+            wait=False,
+            uploader=uploader,
+        )
+
+    assert result.status == "dispatching"
+    assert created[0].image_config_user == "node"
+    assert uploaded == dict(zip(LAYER_SHAS, LAYERS))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("build_image_from_docker_image", {"docker_image": "local/app:latest"}),
+        ("build_image_from_dockerfile", {"context_path": "."}),
+        ("build_image_from_dockerfile", {"context_path": ".", "remote": True}),
+    ],
+)
+async def test_async_image_builds_reject_a_sync_uploader(method, kwargs):
+    manager = AsyncSandboxManager(
+        SimpleNamespace(timeout=30, config=SimpleNamespace(runtime_proxy_override=None))
+    )
+
+    with ImageBuildUploader() as uploader:
+        with pytest.raises(TypeError, match="AsyncImageBuildUploader"):
+            await getattr(manager, method)(
+                image_name="custom", uploader=uploader, **kwargs
+            )
@@ -0,0 +1,133 @@
+import os
+import tarfile
+from types import SimpleNamespace
+
+import pytest
+
+from hyperbrowser.build_context_cache import BuildContextCache, BuildContextCacheStats
+from hyperbrowser.client.managers.sandboxes import image_build
+from hyperbrowser.client.managers.sync_manager.sandbox import SandboxManager
+
+
+def _context(tmp_path):
+    context = tmp_path / "context"
+    (context / "src").mkdir(parents=True)
+    (context / "Dockerfile").write_text("FROM scratch\nCOPY src /app/src\n")
+    (context / "src" / "main.py").write_text("print('hello')\n")
+    (context / "src" / "util.py").write_text("VALUE = 1\n")
+    _age(context)
+    return context
+
+
+def _age(context):
+    # Digests of files modified in the last couple of seconds are not cached.
+    for path in [context, *context.rglob("*")]:
+        os.utime(path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+
+def _package(context, cache):
+    packaged = image_build.package_docker_build_context_manifest(
+        context, context_cache=cache
+    )
+    try:
+        names = set()
+        for artifact in packaged.bundles.values():
+            with tarfile.open(artifact.path, "r:gz") as archive:
+                names.update(archive.getnames())
+        return [bundle.sha256 for bundle in packaged.manifest.bundles], names
+    finally:
+        packaged.cleanup()
+
+
+def test_unchanged_bundles_are_reused_without_packaging(monkeypatch, tmp_path):
+    context = _context(tmp_path)
+    cache = BuildContextCache(tmp_path / "cache")
+    first, names = _package(context, cache)
+    assert "src/main.py" in names
+
+    def fail(*args, **kwargs):
+        raise AssertionError("bundle was packaged again")
+
+    monkeypatch.setattr(image_build, "_package_context_bundle", fail)
+    second, reused_names = _package(context, cache)
+
+    assert second == first
+    assert reused_names == names
+    assert cache.stats == BuildContextCacheStats(
+        bundle_hits=len(first),
+        bundle_misses=len(first),
+        file_hits=3,
+        file_misses=3,
+    )
+
+
+def test_changed_content_repackages_and_touched_files_are_rehashed(tmp_path):
+    context = _context(tmp_path)
+    cache = BuildContextCache(tmp_path / "cache")
+    first, _ = _package(context, cache)
+
+    os.utime(context / "src" / "util.py", ns=(1_700_000_000_000_000_000,) * 2)
+    touched, _ = _package(context, cache)
+    assert touched == first
+    assert cache.stats.bundle_hits == len(first)
+    assert cache.stats.file_misses == 4
+
+    (context / "src" / "util.py").write_text("VALUE = 2\n")
+    _age(context)
+    changed, _ = _package(context, cache)
+    assert changed != first
+    assert cache.stats.bundle_hits == len(first) + 1
+
+
+def test_missing_cached_bundle_falls_back_to_packaging(tmp_path):
+    context = _context(tmp_path)
+    cache = BuildContextCache(tmp_path / "cache")
+    first, _ = _package(context, cache)
+    for name in os.listdir(tmp_path / "cache" / "bundles"):
+        os.remove(tmp_path / "cache" / "bundles" / name)
+
+    assert _package(context, cache)[0] == first
+    assert cache.stats.bundle_hits == 0
+    assert len(os.listdir(tmp_path / "cache" / "bundles")) == len(first)
+
+
+def test_bundles_beyond_the_size_limit_are_evicted(tmp_path):
+    context = _context(tmp_path)
+    cache = BuildContextCache(tmp_path / "cache", max_bundle_bytes=0)
+
+    _package(context, cache)
+    _package(context, cache)
+
+    assert cache.stats.bundle_hits == 0
+    assert os.listdir(tmp_path / "cache" / "bundles") == []
+
+
+def test_cache_persists_across_instances_and_clear(tmp_path):
+    context = _context(tmp_path)
+    first, _ = _package(context, BuildContextCache(tmp_path / "cache"))
+
+    reopened = BuildContextCache(tmp_path / "cache")
+    assert _package(context, reopened)[0] == first
+    assert reopened.stats.bundle_hits == len(first)
+
+    reopened.clear()
+    _package(context, reopened)
+    assert reopened.stats.bundle_hits == len(first)
+    reopened.close()
+
+
+def test_context_cache_requires_remote_builds(tmp_path):
+    manager = SandboxManager(
+        SimpleNamespace(
+            timeout=30,
+            config=SimpleNamespace(runtime_proxy_override=None),
+        )
+    )
+
+    with pytest.raises(ValueError, match="context_cache requires remote=True"):
+        manager.build_image_from_dockerfile(
+            context_path=".",
+            image_name="custom",
+            remote=False,
+            context_cache=BuildContextCache(tmp_path / "cache"),
+        )
@@ -0,0 +1,108 @@
+import json
+
+import httpx
+import pytest
+
+import hyperbrowser.client._session_endpoints as session_endpoints_module
+from hyperbrowser import AsyncHyperbrowser, Hyperbrowser
+from hyperbrowser.client._session_endpoints import SessionEndpointCache
+from hyperbrowser.exceptions import HyperbrowserError
+
+ENDPOINT = "https://computer.example.com/session/sess_1/action"
+
+
+def _handler(requests, action_status=200):
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/api/session/sess_1":
+            return httpx.Response(
+                200,
+                json={
+                    "id": "sess_1",
+                    "teamId": "team_1",
+                    "status": "active",
+                    "createdAt": "2026-01-01T00:00:00Z",
+                    "updatedAt": "2026-01-01T00:00:00Z",
+                    "sessionUrl": "https://app.example.com/sess_1",
+                    "proxyDataConsumed": "0",
+                    "liveUrl": "https://live.example.com/sess_1",
+                    "token": "tok",
+                    "computerActionEndpoint": ENDPOINT,
+                },
+            )
+        if request.url.path == "/api/session/sess_1/stop":
+            return httpx.Response(200, json={"success": True})
+        if action_status != 200:
+            return httpx.Response(action_status, json={"message": "not found"})
+        assert json.loads(request.content)["action"] == "click"
+        return httpx.Response(200, json={"success": True})
+
+    return handler
+
+
+def test_endpoint_cache_expires_and_evicts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(session_endpoints_module.time, "monotonic", lambda: now[0])
+    cache = SessionEndpointCache(ttl_seconds=10, max_entries=2)
+    cache.set("a", "endpoint-a")
+    cache.set("b", "endpoint-b")
+    cache.get("a")
+    cache.set("c", "endpoint-c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "endpoint-a"
+    now[0] += 10
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert len(cache) == 0
+
+
+def test_session_id_is_looked_up_once_for_many_actions():
+    requests = []
+    client = Hyperbrowser(api_key="test-key")
+    client.transport.client = httpx.Client(
+        transport=httpx.MockTransport(_handler(requests))
+    )
+
+    for _ in range(5):
+        assert client.computer_action.click("sess_1", x=1, y=1).success
+
+    assert requests.count(("GET", "/api/session/sess_1")) == 1
+    assert len(requests) == 6
+
+    client.sessions.stop("sess_1")
+    client.computer_action.click("sess_1", x=1, y=1)
+    assert requests.count(("GET", "/api/session/sess_1")) == 2
+
+
+def test_not_found_action_invalidates_the_cached_endpoint():
+    requests = []
+    client = Hyperbrowser(api_key="test-key")
+    client.transport.client = httpx.Client(
+        transport=httpx.MockTransport(_handler(requests, action_status=404))
+    )
+
+    for _ in range(2):
+        with pytest.raises(HyperbrowserError) as exc_info:
+            client.computer_action.click("sess_1", x=1, y=1)
+        assert exc_info.value.status_code == 404
+
+    assert requests.count(("GET", "/api/session/sess_1")) == 2
+    assert client._session_endpoints.get("sess_1") is None
+
+
+@pytest.mark.anyio
+async def test_async_session_id_is_looked_up_once_for_many_actions():
+    requests = []
+    client = AsyncHyperbrowser(api_key="test-key")
+    client.transport.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler(requests))
+    )
+
+    for _ in range(5):
+        await client.computer_action.click("sess_1", x=1, y=1)
+    await client.sessions.stop("sess_1")
+
+    assert requests.count(("GET", "/api/session/sess_1")) == 1
+    assert client._session_endpoints.get("sess_1") is None
+    await client.close()
@@ -0,0 +1,171 @@
+import json
+
+import httpx
+import pytest
+
+import hyperbrowser.client.managers.sync_manager.computer_action as sync_module
+from hyperbrowser import AsyncHyperbrowser, Hyperbrowser
+from hyperbrowser.config import ClientConfig
+from hyperbrowser.models import ClickActionParams, SessionDetail
+
+SESSION = SessionDetail(
+    id="sess_1",
+    teamId="team_1",
+    status="active",
+    createdAt="2026-01-01T00:00:00Z",
+    updatedAt="2026-01-01T00:00:00Z",
+    sessionUrl="https://app.example.com/sess_1",
+    proxyDataConsumed="0",
+    liveUrl="https://live.example.com/sess_1",
+    token="tok",
+    computerActionEndpoint="https://computer.example.com/action",
+)
+
+ACTIONS = [
+    {"action": "move_mouse", "x": 10, "y": 20, "return_screenshot": True},
+    ClickActionParams(x=10, y=20),
+    {"action": "type_text", "text": "hello"},
+    {"action": "press_keys", "keys": ["Enter"]},
+]
+
+
+def _handler(payloads):
+    def handler(request):
+        payload = json.loads(request.content)
+        payloads.append(payload)
+        screenshot = "aGk=" if payload.get("returnScreenshot") else None
+        return httpx.Response(200, json={"success": True, "screenshot": screenshot})
+
+    return handler
+
+
+def test_sequence_sends_actions_in_order_with_a_final_screenshot(monkeypatch):
+    payloads = []
+    sleeps = []
+    monkeypatch.setattr(sync_module.time, "sleep", sleeps.append)
+    client = Hyperbrowser(api_key="test-key")
+    client.transport.client = httpx.Client(
+        transport=httpx.MockTransport(_handler(payloads))
+    )
+
+    responses = client.computer_action.sequence(
+        SESSION, ACTIONS, delay=0.05, return_screenshot=True
+    )
+
+    assert [payload["action"] for payload in payloads] == [
+        "move_mouse",
+        "click",
+        "type_text",
+        "press_keys",
+    ]
+    assert [payload["returnScreenshot"] for payload in payloads] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert [response.screenshot for response in responses] == [None, None, None, "aGk="]
+    assert sleeps == [0.05, 0.05, 0.05]
+
+
+def test_sequence_validates_every_action_before_sending():
+    payloads = []
+    client = Hyperbrowser(api_key="test-key")
+    client.transport.client = httpx.Client(
+        transport=httpx.MockTransport(_handler(payloads))
+    )
+
+    with pytest.raises(ValueError):
+        client.computer_action.sequence(
+            SESSION, [ACTIONS[0], {"action": "move_mouse", "x": -1, "y": 0}]
+        )
+    with pytest.raises(TypeError):
+        client.computer_action.sequence(SESSION, [{"action": "unknown"}])
+    with pytest.raises(ValueError):
+        client.computer_action.sequence(SESSION, [])
+    with pytest.raises(ValueError):
+        client.computer_action.sequence(SESSION, ACTIONS, delay=-1)
+
+    assert payloads == []
+
+
+@pytest.mark.anyio
+async def test_async_sequence_returns_one_response_per_action():
+    payloads = []
+    client = AsyncHyperbrowser(api_key="test-key")
+    client.transport.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler(payloads))
+    )
+
+    responses = await client.computer_action.sequence(SESSION, ACTIONS)
+
+    assert len(responses) == 4
+    assert not any(payload["returnScreenshot"] for payload in payloads)
+    await client.close()
+
+
+def test_trusted_requests_are_sent_without_validation():
+    payloads = []
+    client = Hyperbrowser(
+        config=ClientConfig(api_key="test-key", validate_requests=False)
+    )
+    client.transport.client = httpx.Client(
+        transport=httpx.MockTransport(_handler(payloads))
+    )
+
+    # -1 fails validation, so reaching the wire shows it was skipped.
+    client.computer_action.sequence(
+        SESSION, [{"action": "move_mouse", "x": -1, "y": 0}]
+    )
+    client.computer_action.move_mouse(SESSION, -1, 0)
+
+    assert [(payload["x"], payload["y"]) for payload in payloads] == [
+        (-1, 0),
+        (-1, 0),
+    ]
+
+
+@pytest.mark.parametrize("validate_requests", [True, False])
+def test_sequence_rejects_a_final_screenshot_the_last_action_cannot_return(
+    validate_requests,
+):
+    payloads = []
+    client = Hyperbrowser(
+        config=ClientConfig(api_key="test-key", validate_requests=validate_requests)
+    )
+    client.transport.client = httpx.Client(
+        transport=httpx.MockTransport(_handler(payloads))
+    )
+
+    with pytest.raises(ValueError, match="ScreenshotActionParams"):
+        client.computer_action.sequence(
+            SESSION, [ACTIONS[0], {"action": "screenshot"}], return_screenshot=True
+        )
+
+    assert payloads == []
+
+
+@pytest.mark.anyio
+async def test_async_trusted_sequence_adds_the_final_screenshot_flag():
+    payloads = []
+    client = AsyncHyperbrowser(
+        config=ClientConfig(api_key="test-key", validate_requests=False)
+    )
+    client.transport.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler(payloads))
+    )
+
+    # Trusted mappings without returnScreenshot still get the flag.
+    responses = await client.computer_action.sequence(
+        SESSION,
+        [{"action": "screenshot"}, {"action": "type_text", "text": "hello"}],
+        return_screenshot=True,
+    )
+
+    assert payloads[-1]["returnScreenshot"] is True
+    assert responses[-1].screenshot == "aGk="
+    with pytest.raises(ValueError, match="ScreenshotActionParams"):
+        await client.computer_action.sequence(
+            SESSION, [{"action": "screenshot"}], return_screenshot=True
+        )
+    await client.close()
@@ -0,0 +1,216 @@
+import hashlib
+import io
+import json
+import tarfile
+from types import SimpleNamespace
+
+import pytest
+
+import hyperbrowser.client.managers.sync_manager.sandbox as sync_sandbox_module
+from hyperbrowser.client.managers.sandboxes import image_build
+from hyperbrowser.client.managers.sync_manager.sandbox import SandboxManager
+from hyperbrowser.docker_layer_cache import DockerLayerCache, DockerLayerCacheStats
+from hyperbrowser.models import (
+    SandboxImageBuild,
+    SandboxImageBuildCreateResult,
+    SandboxImageBuildUpload,
+)
+
+CONFIG = b'{"architecture":"amd64","config":{}}'
+BASE_LAYER = b"base-layer-tar"
+APP_LAYER = b"app-layer-tar"
+CONFIG_SHA = hashlib.sha256(CONFIG).hexdigest()
+BASE_SHA = hashlib.sha256(BASE_LAYER).hexdigest()
+APP_SHA = hashlib.sha256(APP_LAYER).hexdigest()
+
+
+def _docker_save_archive():
+    manifest = json.dumps(
+        [
+            {
+                "Config": f"blobs/sha256/{CONFIG_SHA}",
+                "Layers": [f"blobs/sha256/{BASE_SHA}", f"blobs/sha256/{APP_SHA}"],
+            }
+        ]
+    ).encode()
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for name, data in (
+            (f"blobs/sha256/{CONFIG_SHA}", CONFIG),
+            (f"blobs/sha256/{BASE_SHA}", BASE_LAYER),
+            (f"blobs/sha256/{APP_SHA}", APP_LAYER),
+            ("manifest.json", manifest),
+        ):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class FakeProcess:
+    def __init__(self, data):
+        self.stdout = io.BytesIO(data)
+        self.return_code = None
+
+    def poll(self):
+        return self.return_code
+
+    def wait(self, timeout=None):
+        self.return_code = 0
+        return 0
+
+    def terminate(self):
+        self.return_code = -15
+
+    def kill(self):
+        self.return_code = -9
+
+
+@pytest.fixture
+def docker_saves(monkeypatch):
+    saves = []
+    archive = _docker_save_archive()
+
+    def fake_popen(args, **kwargs):
+        saves.append(args)
+        return FakeProcess(archive)
+
+    monkeypatch.setattr(image_build.subprocess, "Popen", fake_popen)
+    return saves
+
+
+def _package(cache, tmp_path):
+    return image_build.package_docker_image_manifest(
+        "local/app:latest",
+        f"sha256:{CONFIG_SHA}",
+        {"User": "node"},
+        temp_dir=str(tmp_path),
+        layer_cache=cache,
+    )
+
+
+def _upload(sha256):
+    return SandboxImageBuildUpload(
+        sha256=sha256,
+        url="https://upload.example.com/" + sha256,
+        method="PUT",
+        headers={},
+        objectKey=sha256,
+        expiresInSeconds=600,
+        maxUploadBytes=0,
+    )
+
+
+def test_exported_image_manifest_is_reused_without_docker_save(docker_saves, tmp_path):
+    cache = DockerLayerCache(tmp_path / "layers.sqlite3")
+    first = _package(cache, tmp_path)
+    first.cleanup()
+
+    second = _package(cache, tmp_path)
+    try:
+        assert len(docker_saves) == 1
+        assert second.manifest == first.manifest
+        assert second.artifact.sha256_hex == first.artifact.sha256_hex
+        assert second.layers == {}
+        assert cache.stats == DockerLayerCacheStats(manifest_hits=1, manifest_misses=1)
+    finally:
+        second.cleanup()
+
+
+def test_remote_layers_are_skipped_and_exported_when_requested(docker_saves, tmp_path):
+    cache = DockerLayerCache(tmp_path / "layers.sqlite3")
+    cache.mark_remote([BASE_SHA])
+
+    packaged = _package(cache, tmp_path)
+    try:
+        assert [layer.sha256 for layer in packaged.manifest.layers] == [
+            BASE_SHA,
+            APP_SHA,
+        ]
+        assert list(packaged.layers) == [APP_SHA]
+        assert cache.stats.skipped_layers == 1
+
+        image_build.export_requested_docker_image_layers(
+            packaged,
+            [_upload(BASE_SHA), _upload(APP_SHA)],
+            "local/app:latest",
+        )
+
+        assert len(docker_saves) == 2
+        assert sorted(packaged.layers) == sorted([BASE_SHA, APP_SHA])
+        with open(packaged.layers[BASE_SHA].path, "rb") as layer:
+            assert layer.read() == BASE_LAYER
+    finally:
+        packaged.cleanup()
+
+
+def test_sync_docker_image_build_records_remote_layers(
+    monkeypatch, docker_saves, tmp_path
+):
+    source = image_build.DockerImageManifestSource(
+        image_digest=f"sha256:{CONFIG_SHA}",
+        config={"User": "node"},
+        cleanup_callback=lambda: None,
+    )
+    monkeypatch.setattr(
+        sync_sandbox_module,
+        "prepare_docker_image_manifest_source",
+        lambda *args, **kwargs: source,
+    )
+    manager = SandboxManager(
+        SimpleNamespace(timeout=30, config=SimpleNamespace(runtime_proxy_override=None))
+    )
+    build = SandboxImageBuild(id="build-123", imageName="custom", status="dispatching")
+    monkeypatch.setattr(
+        manager,
+        "reuse_docker_image",
+        lambda params: SimpleNamespace(hit=False, build=None),
+    )
+    monkeypatch.setattr(
+        manager,
+        "create_image_build",
+        lambda params: SandboxImageBuildCreateResult(
+            build=build, uploads=[_upload(APP_SHA)]
+        ),
+    )
+    monkeypatch.setattr(
+        manager, "_complete_image_build_resilient", lambda build_id, artifact: build
+    )
+    uploaded = []
+    monkeypatch.setattr(
+        sync_sandbox_module,
+        "upload_missing_image_build_artifacts",
+        lambda uploads, artifacts, **kwargs: uploaded.extend(
+            artifacts[upload.sha256].path for upload in uploads
+        ),
+    )
+    cache = DockerLayerCache(tmp_path / "layers.sqlite3")
+
+    for _ in range(2):
+        manager.build_image_from_docker_image(
+            docker_image="local/app:latest",
+            image_name="custom",
+            wait=False,
+            temp_dir=str(tmp_path),
+            layer_cache=cache,
+        )
+
+    assert cache.remote_layers() == {BASE_SHA, APP_SHA}
+    assert cache.stats.manifest_hits == 1
+    # The second build found the manifest cached and exported only the
+    # requested layer.
+    assert len(docker_saves) == 2
+    assert len(uploaded) == 2
+
+
+def test_layer_cache_requires_local_dockerfile_builds(tmp_path):
+    manager = SandboxManager(
+        SimpleNamespace(timeout=30, config=SimpleNamespace(runtime_proxy_override=None))
+    )
+
+    with pytest.raises(ValueError, match="layer_cache requires remote=False"):
+        manager.build_image_from_dockerfile(
+            context_path=".",
+            image_name="custom",
+            layer_cache=DockerLayerCache(tmp_path / "layers.sqlite3"),
+        )
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from hyperbrowser.client.managers.sandboxes.dockerignore import (
@@ -145,3 +147,60 @@ def test_invalid_patterns_are_rejected_at_load_time(pattern):
 
 def test_context_root_cannot_be_ignored():
     assert DockerIgnoreMatcher.from_text("**\n").matches(".") is False
+
+
+def _reference_matches(patterns, path):
+    parts = path.split("/")
+    matched = False
+    for pattern in patterns:
+        if pattern.exclusion != matched:
+            continue
+        if any(
+            pattern.matches_path("/".join(parts[:length]))
+            for length in range(1, len(parts) + 1)
+        ):
+            matched = not pattern.exclusion
+    return matched
+
+
+def test_compiled_matcher_agrees_with_pattern_by_pattern_matching():
+    rng = random.Random(1234)
+    names = ["a", "b", "src", "node_modules", "x.log", "keep.js", "ab", "tmp"]
+    globs = ["*", "**", "?", "*.log", "a*", "[a-b]", "**/tmp"]
+    paths = [
+        "/".join(rng.choice(names) for _ in range(rng.randint(1, 5)))
+        for _ in range(300)
+    ]
+    for _ in range(200):
+        lines = []
+        for _ in range(rng.randint(1, 6)):
+            parts = [rng.choice(names + globs) for _ in range(rng.randint(1, 3))]
+            negation = "!" if rng.random() < 0.3 else ""
+            lines.append(negation + "/".join(parts))
+        matcher = DockerIgnoreMatcher.from_text("\n".join(lines))
+
+        for path in paths:
+            expected = _reference_matches(matcher._patterns, path)
+            assert matcher.matches(path) is expected, (lines, path)
+            assert matcher.matches_normalized(path) is expected, (lines, path)
+
+
+@pytest.mark.parametrize(
+    "patterns,directory,expected",
+    [
+        ("vendor\n!src/keep.py", "vendor", True),
+        ("node_modules\n!node_modules/keep.js", "node_modules", False),
+        ("node_modules\n!*/keep.js", "node_modules", False),
+        ("node_modules\n!other/*/keep.js", "node_modules", True),
+        ("node_modules\n!**/keep.js", "node_modules", False),
+        ("!node_modules/keep.js\nnode_modules", "node_modules", True),
+        ("build\n!build", "build", False),
+        ("a/b\n!a/b/c/d", "a/b", False),
+        ("a/b\n!a/c/d", "a/b", True),
+        ("src", "lib", False),
+    ],
+)
+def test_can_prune_only_when_no_exclusion_reaches_beneath(
+    patterns, directory, expected
+):
+    assert DockerIgnoreMatcher.from_text(patterns).can_prune(directory) is expected
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from hyperbrowser import image_build_uploader
+from hyperbrowser.image_build_uploader import (
+    AsyncImageBuildUploader,
+    ImageBuildUploader,
+)
+from hyperbrowser.models import SandboxImageBuildUpload
+
+
+def _upload(name):
+    return SandboxImageBuildUpload(
+        sha256=name,
+        url=f"https://upload.example.com/{name}",
+        method="PUT",
+        headers={},
+        objectKey=name,
+        expiresInSeconds=900,
+        maxUploadBytes=0,
+    )
+
+
+def _artifacts(tmp_path, sizes):
+    items = []
+    for index, size in enumerate(sizes):
+        path = tmp_path / f"artifact-{index}"
+        path.write_bytes(bytes([index]) * size)
+        items.append((_upload(f"artifact-{index}"), str(path)))
+    return items
+
+
+def test_upload_many_bounds_concurrency_and_reports_progress(tmp_path):
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    received = {}
+
+    def handler(request):
+        with lock:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        received[request.url.path.lstrip("/")] = request.read()
+        with lock:
+            in_flight.remove(request)
+        return httpx.Response(200)
+
+    progress = {}
+    items = _artifacts(tmp_path, [10, 300_000, 0, 5, 600_000, 1])
+    with ImageBuildUploader(
+        max_concurrency=2,
+        progress=lambda upload, sent, total: progress.__setitem__(
+            upload.sha256, (sent, total)
+        ),
+        transport=httpx.MockTransport(handler),
+    ) as uploader:
+        uploader.upload_many(items, label="Docker image layer")
+
+    assert max(peak) == 2
+    for upload, path in items:
+        with open(path, "rb") as artifact:
+            assert received[upload.sha256] == artifact.read()
+    assert progress["artifact-4"] == (600_000, 600_000)
+    assert "artifact-2" not in progress
+
+
+def test_bandwidth_limit_paces_chunks_across_uploads(monkeypatch, tmp_path):
+    clock = [0.0]
+    monkeypatch.setattr(image_build_uploader.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(
+        image_build_uploader.time,
+        "sleep",
+        lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+    )
+    chunk = image_build_uploader._UPLOAD_CHUNK_BYTES
+
+    uploader = ImageBuildUploader(
+        max_concurrency=1,
+        max_bytes_per_second=chunk,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+    uploader.upload_many(_artifacts(tmp_path, [2 * chunk, chunk]), label="layer")
+    uploader.close()
+
+    assert clock[0] == pytest.approx(2.0)
+
+
+def test_upload_many_reports_the_failed_artifact_without_retrying_4xx(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(403, text="expired")
+
+    uploader = ImageBuildUploader(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(
+        RuntimeError, match="upload build context bundle artifact-0: .*403: expired"
+    ):
+        uploader.upload_many(_artifacts(tmp_path, [4]), label="build context bundle")
+    assert calls == ["/artifact-0"]
+
+
+@pytest.mark.anyio
+async def test_async_upload_many_bounds_concurrency_and_cancels_on_failure(
+    tmp_path,
+):
+    in_flight = []
+    peak = []
+    received = {}
+
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        received[request.url.path.lstrip("/")] = await request.aread()
+        in_flight.remove(request)
+        return httpx.Response(200)
+
+    items = _artifacts(tmp_path, [10, 300_000, 0, 5, 600_000, 1])
+    async with AsyncImageBuildUploader(
+        max_concurrency=2, transport=httpx.MockTransport(handler)
+    ) as uploader:
+        await uploader.upload_many(items, label="Docker image layer")
+
+    assert max(peak) == 2
+    for upload, path in items:
+        with open(path, "rb") as artifact:
+            assert received[upload.sha256] == artifact.read()
+
+    async def failing_handler(request):
+        if request.url.path == "/artifact-0":
+            return httpx.Response(403, text="expired")
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    async with AsyncImageBuildUploader(
+        transport=httpx.MockTransport(failing_handler)
+    ) as uploader:
+        with pytest.raises(
+            RuntimeError, match="upload layer artifact-0: .*403: expired"
+        ):
+            await asyncio.wait_for(
+                uploader.upload_many(_artifacts(tmp_path, [4, 4]), label="layer"),
+                timeout=5,
+            )
+
+
+@pytest.mark.anyio
+async def test_async_uploader_reads_artifacts_off_the_event_loop(tmp_path, monkeypatch):
+    loop_thread = threading.get_ident()
+    calls = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            def run():
+                calls.append((fn.func.__name__, threading.get_ident()))
+                return fn()
+
+            return super().submit(run)
+
+    executor = RecordingExecutor(max_workers=1)
+    monkeypatch.setattr(image_build_uploader, "_ARTIFACT_READ_EXECUTOR", executor)
+
+    async def handler(request):
+        await request.aread()
+        return httpx.Response(200)
+
+    upload, path = _artifacts(tmp_path, [300_000])[0]
+    try:
+        async with AsyncImageBuildUploader(
+            transport=httpx.MockTransport(handler)
+        ) as uploader:
+            await uploader.upload(upload, path)
+    finally:
+        executor.shutdown()
+
+    assert [name for name, _ in calls] == [
+        "getsize",
+        "open",
+        "read",
+        "read",
+        "read",
+    ]
+    assert all(thread != loop_thread for _, thread in calls)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_concurrency": 0}, {"max_bytes_per_second": 0}, {"attempts": 0}],
+)
+def test_uploader_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        ImageBuildUploader(**kwargs)
+    with pytest.raises(ValueError):
+        AsyncImageBuildUploader(**kwargs)
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from hyperbrowser import Hyperbrowser
+from hyperbrowser.config import ClientConfig
+from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import (
+    JSON_CONTENT_TYPE,
+    STDLIB_JSON_CODEC,
+    JsonCodec,
+    get_json_codec,
+)
+
+_OPTIONAL_CODECS = []
+for _name in ("orjson", "msgspec"):
+    try:
+        __import__(_name)
+    except ImportError:
+        continue
+    _OPTIONAL_CODECS.append(_name)
+
+
+def _available_codecs():
+    return [STDLIB_JSON_CODEC] + [get_json_codec(name) for name in _OPTIONAL_CODECS]
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_round_trip_payloads_identically(codec: JsonCodec):
+    payload = {
+        "url": "https://example.com/ü",
+        "formats": ["markdown", "html"],
+        "nested": {"count": 3, "ratio": 0.5, "enabled": True, "missing": None},
+    }
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == payload
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.decode("utf-8")) == payload
+    assert codec.loads(memoryview(encoded)) == payload
+    assert codec.dumps_text(payload) == encoded.decode("utf-8")
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_raise_json_decode_error_for_invalid_payloads(codec: JsonCodec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
+
+
+def test_request_kwargs_encode_body_with_json_content_type():
+    kwargs = STDLIB_JSON_CODEC.request_kwargs({"a": 1})
+
+    assert kwargs == {
+        "content": b'{"a":1}',
+        "headers": {"Content-Type": JSON_CONTENT_TYPE},
+    }
+    assert STDLIB_JSON_CODEC.request_kwargs(None) == {}
+
+
+def test_get_json_codec_selects_named_and_auto_backends():
+    assert get_json_codec("json") is STDLIB_JSON_CODEC
+    assert get_json_codec("JSON") is STDLIB_JSON_CODEC
+
+    expected_auto = _OPTIONAL_CODECS[0] if _OPTIONAL_CODECS else "json"
+    assert get_json_codec().name == expected_auto
+    assert get_json_codec(None).name == expected_auto
+
+
+def test_get_json_codec_rejects_unknown_backends():
+    with pytest.raises(HyperbrowserError, match="Unknown JSON codec"):
+        get_json_codec("simplejson")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_get_json_codec_requires_explicit_optional_backend(name: str):
+    if name in _OPTIONAL_CODECS:
+        assert get_json_codec(name).name == name
+        return
+
+    with pytest.raises(HyperbrowserError, match=f"requires the {name} package"):
+        get_json_codec(name)
+
+
+def test_client_threads_configured_codec_into_transport():
+    client = Hyperbrowser(config=ClientConfig(api_key="test-key", json_codec="json"))
+    try:
+        assert client.json_codec is STDLIB_JSON_CODEC
+        assert client.transport.json_codec is STDLIB_JSON_CODEC
+    finally:
+        client.close()
+
+
+def test_client_config_reads_json_codec_from_environment(monkeypatch):
+    monkeypatch.setenv("HYPERBROWSER_API_KEY", "test-key")
+    monkeypatch.setenv("HYPERBROWSER_JSON_CODEC", "json")
+
+    assert ClientConfig.from_env().json_codec == "json"
@@ -18,6 +18,7 @@ from hyperbrowser.client.managers.sync_manager.agents.browser_use import (
 from hyperbrowser.client.managers.sync_manager.extract import ExtractManager
 from hyperbrowser.client.managers.sync_manager.web import WebManager
 from hyperbrowser.models import StartBrowserUseTaskParams
+from hyperbrowser.transport.base import APIResponse
 
 
 RAW_SCHEMA = {
@@ -37,9 +38,8 @@ RAW_SCHEMA = {
 }
 
 
-class StubResponse:
-    def __init__(self, data):
-        self.data = data
+class StubResponse(APIResponse):
+    pass
 
 
 class RecordingSyncTransport:
@@ -0,0 +1,167 @@
+import json
+
+import httpx
+import pytest
+
+from hyperbrowser import AsyncHyperbrowser, Hyperbrowser
+from hyperbrowser.config import ClientConfig
+from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import STDLIB_JSON_CODEC, get_json_codec
+from hyperbrowser.json_stream import JsonArrayStreamDecoder
+from hyperbrowser.models import CrawledPage, LazyModel, PageData
+
+ENVELOPE = {
+    "jobId": "crawl_123",
+    "status": "completed",
+    "nested": {"data": [1, 2], "note": 'quote " and ] bracket'},
+    "data": [
+        {"url": "https://example.com/a", "html": '<a href="x">[{,}]</a>\\'},
+        [1, [2, 3], {"k": "v"}],
+        'plain "string" ,',
+        12.5,
+        None,
+        True,
+        {},
+    ],
+    "currentPageBatch": 1,
+    "totalPageBatches": 1,
+}
+
+
+def _decode(payload: bytes, chunk_size: int, codec=STDLIB_JSON_CODEC):
+    decoder = JsonArrayStreamDecoder("data", codec)
+    items = []
+    for start in range(0, len(payload), chunk_size):
+        items.extend(decoder.feed(payload[start : start + chunk_size]))
+    return items, decoder.close()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_decoder_yields_array_entries_for_any_chunking(indent, chunk_size):
+    payload = json.dumps(ENVELOPE, indent=indent, ensure_ascii=False).encode("utf-8")
+
+    items, envelope = _decode(payload, chunk_size, get_json_codec())
+
+    assert items == ENVELOPE["data"]
+    assert envelope == {**ENVELOPE, "data": []}
+
+
+def test_decoder_releases_consumed_entries():
+    page = json.dumps({"html": "x" * 10_000}).encode("utf-8")
+    decoder = JsonArrayStreamDecoder("data", STDLIB_JSON_CODEC)
+
+    decoder.feed(b'{"jobId": "crawl_123", "data": [')
+    for _ in range(20):
+        assert len(decoder.feed(page + b",")) == 1
+        assert len(decoder._buffer) < len(page)
+
+
+def test_decoder_handles_missing_and_null_arrays():
+    for payload in (b'{"jobId": "a", "data": null}', b'{"jobId": "a"}'):
+        items, envelope = _decode(payload, 3)
+        assert items == []
+        assert envelope["jobId"] == "a"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"data": [1, 2',
+        b'{"data": [1,, 2]}',
+        b'{"data": [{"a": 1}}',
+        b'{"data": [1]',
+        b"[1, 2]",
+    ],
+)
+def test_decoder_rejects_malformed_documents(payload):
+    with pytest.raises(json.JSONDecodeError):
+        _decode(payload, 4)
+
+
+def _batch(page_batch, total_batches=2):
+    return {
+        "jobId": "job_123",
+        "status": "completed",
+        "data": [
+            {"url": f"https://example.com/{page_batch}/{index}", "status": "completed"}
+            for index in range(3)
+        ],
+        "totalPageBatches": total_batches,
+        "currentPageBatch": page_batch,
+        "batchSize": 3,
+    }
+
+
+def _streaming_handler(requests, chunked=True):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"message": "Job not found"})
+        page_batch = int(request.url.params.get("page", "1"))
+        body = json.dumps(_batch(page_batch)).encode("utf-8")
+        chunks = [body[index : index + 16] for index in range(0, len(body), 16)]
+        return httpx.Response(200, content=iter(chunks) if chunked else body)
+
+    return handler
+
+
+def test_sync_iter_pages_streams_every_page_batch():
+    requests = []
+    client = Hyperbrowser(config=ClientConfig(api_key="test-key", json_codec="json"))
+    client.transport.client = httpx.Client(
+        headers={"x-api-key": "test-key"},
+        transport=httpx.MockTransport(_streaming_handler(requests)),
+    )
+    try:
+        pages = list(client.crawl.iter_pages("job_123", {"batch_size": 3}))
+        lazy_pages = list(client.web.crawl.iter_pages("job_123", result_mode="lazy"))
+        with pytest.raises(HyperbrowserError, match="Job not found"):
+            list(client.scrape.batch.iter_pages("missing"))
+    finally:
+        client.close()
+
+    assert [page.url for page in pages] == [
+        f"https://example.com/{batch}/{index}" for batch in (1, 2) for index in range(3)
+    ]
+    assert all(isinstance(page, CrawledPage) for page in pages)
+    assert all(isinstance(page, LazyModel) for page in lazy_pages)
+    assert lazy_pages[0].to_model() == PageData(**_batch(1)["data"][0])
+    assert [
+        (request.url.params.get("page"), request.url.params.get("batchSize"))
+        for request in requests[:2]
+    ] == [("1", "3"), ("2", "3")]
+
+
+@pytest.mark.anyio
+async def test_async_iter_pages_streams_every_page_batch():
+    requests = []
+    client = AsyncHyperbrowser(
+        config=ClientConfig(api_key="test-key", json_codec="json")
+    )
+    await client.transport.client.aclose()
+    client.transport.client = httpx.AsyncClient(
+        headers={"x-api-key": "test-key"},
+        transport=httpx.MockTransport(_streaming_handler(requests, chunked=False)),
+    )
+    try:
+        pages = [
+            page
+            async for page in client.web.batch_fetch.iter_pages(
+                "job_123", result_mode="dict"
+            )
+        ]
+    finally:
+        await client.close()
+
+    assert pages == _batch(1)["data"] + _batch(2)["data"]
+    assert len(requests) == 2
+
+
+def test_iter_pages_rejects_unknown_result_modes_eagerly():
+    client = Hyperbrowser(config=ClientConfig(api_key="test-key"))
+    try:
+        with pytest.raises(ValueError, match="result_mode"):
+            client.crawl.iter_pages("job_123", result_mode="pages")
+    finally:
+        client.close()
@@ -0,0 +1,99 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from pydantic import BaseModel
+
+import hyperbrowser
+import hyperbrowser.models as models
+
+
+def _loaded_modules(statement: str) -> set:
+    script = (
+        f"{statement}\n"
+        "import json, sys\n"
+        "print(json.dumps(sorted(name for name in sys.modules "
+        "if name.startswith('hyperbrowser'))))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout
+    return set(json.loads(output.strip().splitlines()[-1]))
+
+
+def test_package_import_does_not_load_clients_or_models():
+    loaded = _loaded_modules("import hyperbrowser")
+
+    assert loaded == {"hyperbrowser"}
+
+
+def test_client_construction_does_not_load_managers():
+    loaded = _loaded_modules(
+        "from hyperbrowser import Hyperbrowser, AsyncHyperbrowser\n"
+        "Hyperbrowser(api_key='test')\n"
+        "AsyncHyperbrowser(api_key='test')"
+    )
+
+    assert not any(".managers" in name for name in loaded)
+    assert not any(name.startswith("hyperbrowser.models.") for name in loaded)
+
+
+def test_manager_access_only_loads_its_own_models():
+    loaded = _loaded_modules(
+        "from hyperbrowser import Hyperbrowser\nHyperbrowser(api_key='test').sessions"
+    )
+
+    assert "hyperbrowser.client.managers.sync_manager.session" in loaded
+    assert "hyperbrowser.models.session" in loaded
+    assert "hyperbrowser.client.managers.sync_manager.sandbox" not in loaded
+    assert "hyperbrowser.models.sandbox" not in loaded
+
+
+def test_managers_are_created_once_per_client():
+    client = hyperbrowser.Hyperbrowser(api_key="test")
+    try:
+        assert client.sessions is client.sessions
+        assert client.agents.browser_use is client.agents.browser_use
+    finally:
+        client.close()
+
+
+def test_every_exported_name_resolves():
+    for module in (hyperbrowser, models):
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+        assert set(module.__all__) <= set(dir(module))
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="DoesNotExist"):
+        models.DoesNotExist
+
+
+def test_rarely_used_models_defer_schema_building():
+    script = (
+        "from hyperbrowser.models import CreateSandboxParams, FetchParams\n"
+        "print(CreateSandboxParams.__pydantic_complete__, "
+        "FetchParams.__pydantic_complete__)\n"
+        "CreateSandboxParams(image_name='node')\n"
+        "print(CreateSandboxParams.__pydantic_complete__)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout
+
+    assert output.split() == ["False", "True", "True"]
+
+
+def test_every_exported_model_builds():
+    for name in models.__all__:
+        value = getattr(models, name)
+        if isinstance(value, type) and issubclass(value, BaseModel):
+            assert value.model_json_schema(), name
@@ -43,11 +43,11 @@ from hyperbrowser.models import (
     StartScrapeJobParams,
     StartWebCrawlJobParams,
 )
+from hyperbrowser.transport.base import APIResponse
 
 
-class StubResponse:
-    def __init__(self, data):
-        self.data = data
+class StubResponse(APIResponse):
+    pass
 
 
 def test_model_prefixed_response_fields_support_the_pydantic_2_0_floor():
@@ -1,7 +1,8 @@
+from collections import OrderedDict
 from copy import deepcopy
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_serializer
 
 from hyperbrowser.client._request import (
     dump_request,
@@ -14,6 +15,7 @@ from hyperbrowser.models import (
     StartBrowserUseTaskParams,
     StartCuaTaskParams,
 )
+from hyperbrowser.models.computer_action import ClickActionParams
 from hyperbrowser.tools import _normalize_extract_tool_params
 
 
@@ -146,6 +148,62 @@ def test_pydantic_schema_provider_is_dereferenced_without_mutating_class():
     }
 
 
+def test_pydantic_schema_provider_is_resolved_once_per_model_class():
+    calls = []
+
+    class Profile(BaseModel):
+        name: str
+
+        @classmethod
+        def model_json_schema(cls, *args, **kwargs):
+            calls.append(cls)
+            return super().model_json_schema(*args, **kwargs)
+
+    first = normalize_pydantic_schema(Profile)
+    first["properties"]["name"]["type"] = "integer"
+    second = normalize_pydantic_schema(Profile)
+    third = normalize_pydantic_schema(Profile(name="x"))
+
+    assert calls == [Profile]
+    assert second["properties"]["name"] == {"title": "Name", "type": "string"}
+    assert third == second
+    assert second is not third
+    assert isinstance(second["required"], list)
+
+
+def test_structural_schema_providers_are_not_cached():
+    class DynamicSchema:
+        def __init__(self):
+            self.calls = 0
+
+        def model_json_schema(self):
+            self.calls += 1
+            return {"type": "object", "x-call": self.calls}
+
+    provider = DynamicSchema()
+
+    assert normalize_pydantic_schema(provider)["x-call"] == 1
+    assert normalize_pydantic_schema(provider)["x-call"] == 2
+
+
+def test_raw_json_schema_cache_returns_independent_copies(monkeypatch):
+    import hyperbrowser.client._request as request_module
+
+    monkeypatch.setattr(request_module, "_SCHEMA_CACHE_SIZE", 2)
+    monkeypatch.setattr(request_module, "_schema_cache", OrderedDict())
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+
+    first = normalize_pydantic_schema(schema)
+    first["properties"]["a"]["type"] = "number"
+    second = normalize_pydantic_schema(deepcopy(schema))
+    normalize_pydantic_schema({"type": "string"})
+    normalize_pydantic_schema({"type": "number"})
+
+    assert second == schema
+    assert first is not second
+    assert len(request_module._schema_cache) == 2
+
+
 def test_extract_tool_schema_string_is_parsed_without_mutating_input():
     params = {
         "urls": ["https://example.com"],
@@ -160,3 +218,65 @@ def test_extract_tool_schema_string_is_parsed_without_mutating_input():
         "type": "object",
         "properties": {"snake_case": {"type": "string"}},
     }
+
+
+def test_flat_request_fast_path_matches_model_dump():
+    params = ClickActionParams(x=10, y=None, num_clicks=2)
+
+    assert dump_request(params, ClickActionParams) == params.model_dump(
+        by_alias=True, exclude_none=True
+    )
+    assert dump_request(
+        {"x": 10}, ClickActionParams, exclude_unset=True
+    ) == ClickActionParams(x=10).model_dump(
+        by_alias=True, exclude_none=True, exclude_unset=True
+    )
+
+
+def test_flat_request_fast_path_copies_containers():
+    class TagsParams(BaseModel):
+        tags: list = Field(default_factory=list)
+        labels: dict = Field(default_factory=dict)
+
+    params = TagsParams(tags=["a"], labels={"k": ["v"]})
+    payload = dump_request(params, TagsParams)
+    payload["tags"].append("b")
+    payload["labels"]["k"].append("w")
+
+    assert params.tags == ["a"]
+    assert params.labels == {"k": ["v"]}
+
+
+def test_request_with_custom_serializer_uses_model_dump():
+    class UpperParams(BaseModel):
+        name: str = Field(serialization_alias="displayName")
+
+        @field_serializer("name")
+        def _upper(self, value: str) -> str:
+            return value.upper()
+
+    assert dump_request({"name": "demo"}, UpperParams) == {"displayName": "DEMO"}
+    assert dump_request({"name": "demo"}, UpperParams, validate=False) == {
+        "displayName": "DEMO"
+    }
+
+
+def test_trusted_request_skips_validation_and_applies_defaults():
+    payload = dump_request(
+        {"x": "not-validated", "return_screenshot": True},
+        ClickActionParams,
+        validate=False,
+    )
+
+    assert payload == {
+        "action": "click",
+        "x": "not-validated",
+        "button": "left",
+        "numClicks": 1,
+        "returnScreenshot": True,
+    }
+
+
+def test_trusted_request_falls_back_to_validation_when_required_field_is_missing():
+    with pytest.raises(ValidationError):
+        dump_request({}, CreateSandboxParams, validate=False)
@@ -0,0 +1,186 @@
+import json
+
+import httpx
+import pytest
+
+import hyperbrowser.response_cache as response_cache_module
+from hyperbrowser import AsyncHyperbrowser, ClientConfig, Hyperbrowser
+from hyperbrowser.response_cache import ResponseCache, ResponseCacheStats
+
+
+def _fetch_handler(requests, status="completed"):
+    def handler(request):
+        requests.append(request)
+        body = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "jobId": f"fetch_{len(requests)}",
+                "status": status,
+                "data": {"markdown": f"# {body['url']}"},
+            },
+        )
+
+    return handler
+
+
+def _client(cache, handler):
+    client = Hyperbrowser(config=ClientConfig(api_key="test-key", response_cache=cache))
+    client.transport.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_cache_key_ignores_mapping_order_and_separates_scopes():
+    first = ResponseCache.make_key("/web/fetch", {"url": "a", "outputs": {"x": 1}})
+    second = ResponseCache.make_key("/web/fetch", {"outputs": {"x": 1}, "url": "a"})
+
+    assert first == second
+    assert first != ResponseCache.make_key("/web/fetch", {"url": "a"}, scope="other")
+    assert first != ResponseCache.make_key("/scrape", {"url": "a", "outputs": {"x": 1}})
+
+
+def test_memory_cache_honors_max_age(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache(max_age_seconds=60)
+    cache.set("key", b"{}")
+
+    now[0] += 30
+    assert cache.get("key") == b"{}"
+    assert cache.get("key", max_age=10) is None
+    assert cache.get("key", max_age=0) is None
+    now[0] += 31
+    assert cache.get("key") is None
+    assert cache.stats == ResponseCacheStats(hits=1, misses=3, memory_hits=1, stores=1)
+    assert cache.stats.hit_rate == 0.25
+
+
+def test_memory_cache_evicts_least_recently_used_entries():
+    cache = ResponseCache(max_entries=2, max_memory_bytes=10)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+
+    cache.set("large", b"x" * 10)
+    assert cache.get("a") is None
+    assert cache.get("large") == b"x" * 10
+    cache.set("too-large", b"x" * 11)
+    assert cache.get("too-large") is None
+    assert cache.stats.evictions == 3
+
+
+def test_disk_cache_survives_new_instances(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    writer = ResponseCache(path=path)
+    writer.set("key", b'{"cached":true}')
+    writer.close()
+
+    reader = ResponseCache(path=path, max_disk_entries=1)
+    try:
+        assert reader.get("key") == b'{"cached":true}'
+        assert reader.get("key") == b'{"cached":true}'
+        assert reader.stats.disk_hits == 1
+        assert reader.stats.memory_hits == 1
+
+        reader.set("newer", b"{}")
+        reader.clear()
+        assert reader.get("newer") is None
+    finally:
+        reader.close()
+
+
+def test_fetch_reuses_completed_responses():
+    requests = []
+    cache = ResponseCache()
+    client = _client(cache, _fetch_handler(requests))
+    try:
+        first = client.web.fetch({"url": "https://example.com/docs"})
+        second = client.web.fetch({"url": "https://example.com/docs"})
+        other = client.web.fetch({"url": "https://example.com/other"})
+    finally:
+        client.close()
+
+    assert len(requests) == 2
+    assert second == first
+    assert other.data.markdown == "# https://example.com/other"
+    assert cache.stats.hits == 1
+    assert cache.stats.stores == 2
+
+
+def test_fetch_respects_requested_max_age_and_skips_failed_jobs():
+    requests = []
+    client = _client(ResponseCache(), _fetch_handler(requests))
+    failed_requests = []
+    failed_client = _client(
+        ResponseCache(), _fetch_handler(failed_requests, status="failed")
+    )
+    params = {"url": "https://example.com", "cache": {"max_age_seconds": 0}}
+    try:
+        client.web.fetch(params)
+        client.web.fetch(params)
+        failed_client.web.fetch({"url": "https://example.com"})
+        failed_client.web.fetch({"url": "https://example.com"})
+    finally:
+        client.close()
+        failed_client.close()
+
+    assert len(requests) == 2
+    assert len(failed_requests) == 2
+
+
+def test_scrape_start_and_wait_caches_final_job():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"jobId": "scrape_123"})
+        if request.url.path.endswith("/status"):
+            return httpx.Response(200, json={"status": "completed"})
+        return httpx.Response(
+            200,
+            json={
+                "jobId": "scrape_123",
+                "status": "completed",
+                "data": {"markdown": "# Docs"},
+            },
+        )
+
+    client = _client(ResponseCache(), handler)
+    try:
+        first = client.scrape.start_and_wait({"url": "https://example.com"})
+        second = client.scrape.start_and_wait({"url": "https://example.com"})
+    finally:
+        client.close()
+
+    assert len(requests) == 3
+    assert first == second
+    assert second.data.markdown == "# Docs"
+
+
+@pytest.mark.anyio
+async def test_async_fetch_uses_disk_cache(tmp_path):
+    requests = []
+    cache = ResponseCache(path=tmp_path / "responses.sqlite3")
+    client = AsyncHyperbrowser(
+        config=ClientConfig(api_key="test-key", response_cache=cache)
+    )
+    await client.transport.client.aclose()
+    client.transport.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_fetch_handler(requests))
+    )
+    try:
+        first = await client.web.fetch({"url": "https://example.com"})
+        cache._memory.clear()
+        second = await client.web.fetch({"url": "https://example.com"})
+    finally:
+        await client.close()
+        cache.close()
+
+    assert len(requests) == 1
+    assert first == second
+    assert cache.stats.disk_hits == 1
@@ -0,0 +1,202 @@
+import json
+
+import pytest
+
+import hyperbrowser.client.managers.async_manager.web.batch_fetch as async_batch_fetch_module
+import hyperbrowser.client.managers.sync_manager.crawl as sync_crawl_module
+from hyperbrowser.client.managers.async_manager.web.batch_fetch import (
+    BatchFetchManager as AsyncBatchFetchManager,
+)
+from hyperbrowser.client.managers.sync_manager.crawl import CrawlManager
+from hyperbrowser.json_codec import STDLIB_JSON_CODEC
+from hyperbrowser.models import (
+    BatchFetchJobResponse,
+    CrawledPage,
+    CrawlJobResponse,
+    LazyJobResponse,
+    LazyModel,
+    PageData,
+)
+from hyperbrowser.transport.base import APIResponse
+
+
+def _page(index):
+    return {
+        "url": f"https://example.com/{index}",
+        "status": "completed",
+        "html": f"<p>{index}</p>",
+        "metadata": {"title": f"Page {index}"},
+        "json": {"index": index},
+    }
+
+
+def _crawl_batch(page, total_batches=2):
+    return {
+        "jobId": "crawl_123",
+        "status": "completed",
+        "data": [_page(page * 10 + index) for index in range(2)],
+        "totalCrawledPages": 2 * total_batches,
+        "totalPageBatches": total_batches,
+        "currentPageBatch": page,
+        "batchSize": 100,
+    }
+
+
+def _fetch_batch(page, total_batches=2):
+    return {
+        "jobId": "fetch_123",
+        "status": "completed",
+        "data": [_page(page * 10 + index) for index in range(2)],
+        "totalPages": 2 * total_batches,
+        "totalPageBatches": total_batches,
+        "currentPageBatch": page,
+        "batchSize": 100,
+    }
+
+
+def _raw_response(payload):
+    return APIResponse.from_content(
+        json.dumps(payload).encode("utf-8"), STDLIB_JSON_CODEC
+    )
+
+
+class _Client:
+    def __init__(self, transport):
+        self.transport = transport
+
+    def _build_url(self, path):
+        return f"https://api.example.com{path}"
+
+
+class StubCrawlTransport:
+    def post(self, url, data=None):
+        return APIResponse({"jobId": "crawl_123"})
+
+    def get(self, url, params=None):
+        if url.endswith("/status"):
+            return APIResponse({"status": "completed"})
+        return _raw_response(_crawl_batch((params or {}).get("page") or 1))
+
+
+class AsyncStubFetchTransport:
+    async def post(self, url, data=None):
+        return APIResponse({"jobId": "fetch_123"})
+
+    async def get(self, url, params=None):
+        if url.endswith("/status"):
+            return APIResponse({"status": "completed"})
+        return _raw_response(_fetch_batch((params or {}).get("page") or 1))
+
+
+def test_get_defaults_to_fully_validated_models():
+    manager = CrawlManager(_Client(StubCrawlTransport()))
+
+    job = manager.get("crawl_123")
+
+    assert isinstance(job, CrawlJobResponse)
+    assert all(isinstance(page, CrawledPage) for page in job.data)
+
+
+def test_get_dict_mode_returns_the_wire_payload():
+    manager = CrawlManager(_Client(StubCrawlTransport()))
+
+    assert manager.get("crawl_123", result_mode="dict") == _crawl_batch(1)
+
+
+def test_get_lazy_mode_validates_envelope_and_wraps_pages():
+    manager = CrawlManager(_Client(StubCrawlTransport()))
+
+    job = manager.get("crawl_123", result_mode="lazy")
+
+    assert isinstance(job, LazyJobResponse)
+    assert job.model_class is CrawlJobResponse
+    assert job.total_page_batches == 2
+    assert job.to_dict() == _crawl_batch(1)
+    assert job.to_model() == CrawlJobResponse(**_crawl_batch(1))
+    page = job.data[0]
+    assert isinstance(page, LazyModel)
+    assert page.url == "https://example.com/10"
+    assert page.metadata == {"title": "Page 10"}
+    assert page.error is None
+    assert page.to_model() == CrawledPage(**_page(10))
+    assert page == CrawledPage(**_page(10))
+    assert page.to_dict() == _page(10)
+
+
+def test_lazy_model_only_validates_accessed_fields():
+    page = LazyModel(PageData, {"url": "https://example.com", "status": "bogus"})
+
+    assert page.url == "https://example.com"
+    with pytest.raises(Exception):
+        page.status
+
+
+def test_lazy_model_resolves_aliases_and_is_read_only():
+    page = LazyModel(PageData, _page(1))
+
+    assert page.json_ == {"index": 1}
+    assert page.branding is None
+    with pytest.raises(AttributeError):
+        page.url = "https://other.example.com"
+    with pytest.raises(AttributeError):
+        page.not_a_field
+
+
+def test_unknown_result_mode_is_rejected():
+    manager = CrawlManager(_Client(StubCrawlTransport()))
+
+    with pytest.raises(ValueError, match="result_mode"):
+        manager.get("crawl_123", result_mode="pages")
+
+
+@pytest.mark.parametrize("result_mode", ["model", "lazy", "dict"])
+def test_sync_start_and_wait_merges_batches_in_every_mode(monkeypatch, result_mode):
+    monkeypatch.setattr(sync_crawl_module.time, "sleep", lambda _: None)
+    manager = CrawlManager(_Client(StubCrawlTransport()))
+
+    job = manager.start_and_wait(
+        {"url": "https://example.com"}, result_mode=result_mode
+    )
+
+    expected_pages = _crawl_batch(1)["data"] + _crawl_batch(2)["data"]
+    if result_mode == "dict":
+        # Same shape as get(result_mode="dict"), with every page merged in.
+        assert job == {**_crawl_batch(2), "data": expected_pages}
+        return
+
+    job_type = LazyJobResponse if result_mode == "lazy" else CrawlJobResponse
+    assert isinstance(job, job_type)
+    assert job.current_page_batch == 2
+    assert [page.url for page in job.data] == [page["url"] for page in expected_pages]
+    page_type = LazyModel if result_mode == "lazy" else CrawledPage
+    assert all(isinstance(page, page_type) for page in job.data)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("result_mode", ["model", "lazy", "dict"])
+async def test_async_start_and_wait_merges_batches_in_every_mode(
+    monkeypatch, result_mode
+):
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(async_batch_fetch_module.asyncio, "sleep", no_sleep)
+    manager = AsyncBatchFetchManager(_Client(AsyncStubFetchTransport()))
+
+    job = await manager.start_and_wait(
+        {"urls": ["https://example.com"]}, result_mode=result_mode
+    )
+
+    expected_pages = _fetch_batch(1)["data"] + _fetch_batch(2)["data"]
+    if result_mode == "dict":
+        assert job == {**_fetch_batch(2), "data": expected_pages}
+        return
+
+    if result_mode == "lazy":
+        assert isinstance(job, LazyJobResponse)
+        assert job.to_dict() == {**_fetch_batch(2), "data": expected_pages}
+    else:
+        assert isinstance(job, BatchFetchJobResponse)
+    assert [page.json_ for page in job.data] == [
+        page["json"] for page in expected_pages
+    ]
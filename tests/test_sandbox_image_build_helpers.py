@@ -1,9 +1,12 @@
+import gzip
 import hashlib
 import io
 import json
 import os
+import random
 import subprocess
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 
 import httpx
@@ -18,6 +21,7 @@ from hyperbrowser.client.managers.async_manager.sandbox import (
 )
 from hyperbrowser.client.managers.sync_manager.sandbox import SandboxManager
 from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.image_build_uploader import ImageBuildUploader
 from hyperbrowser.models import (
     SandboxImageBuild,
     SandboxImageBuildCreateResult,
@@ -177,19 +181,20 @@ def test_upload_image_build_artifact_streams_file_with_content_length(
     artifact.write_bytes(b"compressed-rootfs")
     calls = []
 
-    def fake_request(method, url, content, headers, timeout):
+    def handler(request):
         calls.append(
             {
-                "method": method,
-                "url": url,
-                "body": content.read(),
-                "headers": headers,
-                "timeout": timeout,
+                "method": request.method,
+                "url": str(request.url),
+                "body": request.read(),
+                "headers": {
+                    name: request.headers[name]
+                    for name in ("x-upload", "content-length")
+                },
+                "timeout": request.extensions["timeout"]["read"],
             }
         )
-        return httpx.Response(200, request=httpx.Request(method, url))
-
-    monkeypatch.setattr(image_build.httpx, "request", fake_request)
+        return httpx.Response(200)
 
     image_build.upload_image_build_artifact(
         SandboxImageBuildUpload(
@@ -202,6 +207,7 @@ def test_upload_image_build_artifact_streams_file_with_content_length(
         ),
         str(artifact),
         timeout=None,
+        uploader=ImageBuildUploader(transport=httpx.MockTransport(handler)),
     )
 
     assert calls == [
@@ -224,12 +230,11 @@ def test_upload_image_build_artifact_retries_retryable_status(monkeypatch, tmp_p
     statuses = iter([500, 200])
     calls = []
 
-    def fake_request(method, url, content, headers, timeout):
+    def handler(request):
         status = next(statuses)
         calls.append(status)
-        return httpx.Response(status, request=httpx.Request(method, url))
+        return httpx.Response(status)
 
-    monkeypatch.setattr(image_build.httpx, "request", fake_request)
     monkeypatch.setattr(image_build.time, "sleep", lambda seconds: None)
 
     image_build.upload_image_build_artifact(
@@ -243,6 +248,7 @@ def test_upload_image_build_artifact_retries_retryable_status(monkeypatch, tmp_p
             maxUploadBytes=1000,
         ),
         str(artifact),
+        uploader=ImageBuildUploader(transport=httpx.MockTransport(handler)),
     )
 
     assert calls == [500, 200]
@@ -386,6 +392,220 @@ def test_remote_context_preserves_negated_descendant(tmp_path):
         packaged.cleanup()
 
 
+def test_negation_aware_pruning_selects_the_same_entries(monkeypatch, tmp_path):
+    rng = random.Random(42)
+    names = ["a", "b", "node_modules", "keep.js", "x.log", "src"]
+    for _ in range(60):
+        parts = [rng.choice(names) for _ in range(rng.randint(1, 4))]
+        destination = tmp_path.joinpath(*parts)
+        if destination.exists() or any(
+            parent.is_file() for parent in destination.parents
+        ):
+            continue
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text("data\n")
+    globs = ["*", "**", "*.log", "a*", "node_modules"]
+
+    for _ in range(80):
+        lines = []
+        for _ in range(rng.randint(1, 5)):
+            parts = [rng.choice(names + globs) for _ in range(rng.randint(1, 3))]
+            negation = "!" if rng.random() < 0.4 else ""
+            lines.append(negation + "/".join(parts))
+        matcher = image_build.DockerIgnoreMatcher.from_text("\n".join(lines))
+
+        pruned = image_build._collect_context_entries(
+            tmp_path, ["."], ignore_matcher=matcher, required=False
+        )
+        with monkeypatch.context() as patched:
+            patched.setattr(image_build, "_can_prune", lambda *_: False)
+            exhaustive = image_build._collect_context_entries(
+                tmp_path, ["."], ignore_matcher=matcher, required=False
+            )
+        assert pruned == exhaustive, lines
+
+
+def test_context_index_scans_each_directory_once(monkeypatch, tmp_path):
+    for relative in ("src/app/main.py", "src/lib/util.py", "docs/index.md"):
+        destination = tmp_path / relative
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text("data\n")
+
+    original_scandir = os.scandir
+    scanned = []
+
+    def tracking_scandir(path):
+        scanned.append(os.path.relpath(path, tmp_path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(image_build.os, "scandir", tracking_scandir)
+    index = image_build._ContextIndex(tmp_path, None, workers=1)
+    groups = [
+        image_build._collect_context_entries(
+            tmp_path, sources, ignore_matcher=None, required=True, index=index
+        )
+        for sources in (["src/app"], ["src"], ["."], ["src/lib/util.py"])
+    ]
+
+    assert groups[0] == {"src", "src/app", "src/app/main.py"}
+    assert "src/lib/util.py" in groups[1] and "docs" not in groups[1]
+    assert "docs/index.md" in groups[2]
+    assert groups[3] == {"src", "src/lib", "src/lib/util.py"}
+    assert sorted(scanned) == sorted(set(scanned))
+    assert set(scanned) == {".", "src", "src/app", "src/lib", "docs"}
+
+
+def test_context_index_threaded_scan_matches_serial_scan(tmp_path):
+    for package in range(6):
+        for relative in ("src/index.js", "node_modules/dep/index.js", "keep.log"):
+            destination = tmp_path / f"pkg{package}" / relative
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_text("data\n")
+    matcher = image_build.DockerIgnoreMatcher.from_text(
+        "**/node_modules\n*/*.log\n!pkg1/keep.log\n"
+    )
+
+    entries = [
+        image_build._collect_context_entries(
+            tmp_path,
+            ["."],
+            ignore_matcher=matcher,
+            required=False,
+            index=image_build._ContextIndex(tmp_path, matcher, workers=workers),
+        )
+        for workers in (1, 4)
+    ]
+
+    assert entries[0] == entries[1]
+    assert "pkg1/keep.log" in entries[0] and "pkg2/keep.log" not in entries[0]
+    assert not any("node_modules" in entry for entry in entries[0])
+
+
+def test_context_entries_behave_like_sets_of_paths(tmp_path):
+    for relative in ("src/app/main.py", "src/lib/util.py", "README.md"):
+        destination = tmp_path / relative
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text("data\n")
+    index = image_build._ContextIndex(tmp_path, None, workers=1)
+
+    def collect(sources):
+        return image_build._collect_context_entries(
+            tmp_path, sources, ignore_matcher=None, required=True, index=index
+        )
+
+    app, lib, readme = collect(["src/app"]), collect(["src/lib"]), collect(["*.md"])
+    combined = app | lib
+
+    assert sorted(combined) == [
+        "src",
+        "src/app",
+        "src/app/main.py",
+        "src/lib",
+        "src/lib/util.py",
+    ]
+    assert len(combined) == 5 and "src/lib/util.py" in combined
+    assert "README.md" not in combined and "missing" not in combined
+    assert app <= combined and not combined <= app
+    assert app | {"extra"} == set(app) | {"extra"}
+    assert combined == {"src", "src/app", "src/app/main.py", "src/lib", *lib}
+    assert set(readme) == {"README.md"}
+
+
+def test_remove_subsumed_entry_groups_keeps_first_of_equal_groups():
+    rng = random.Random(7)
+
+    def reference(groups):
+        return [
+            entries
+            for index, entries in enumerate(groups)
+            if not any(
+                index != candidate_index
+                and entries <= candidate
+                and (entries != candidate or index > candidate_index)
+                for candidate_index, candidate in enumerate(groups)
+            )
+        ]
+
+    for _ in range(200):
+        groups = [
+            frozenset(rng.sample(range(8), rng.randint(0, 5)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        expected = reference(groups)
+        result = image_build._remove_subsumed_entry_groups(groups)
+        assert result == expected
+        assert [id(entries) for entries in result] == [
+            id(entries) for entries in expected
+        ]
+
+
+def test_parallel_gzip_output_does_not_depend_on_worker_count():
+    data = bytes(random.Random(3).getrandbits(8) for _ in range(50_000)) * 3
+
+    def compress(executor):
+        output = io.BytesIO()
+        with image_build._ParallelGzipWriter(
+            output, executor=executor, block_size=4096, max_pending=2
+        ) as writer:
+            for start in range(0, len(data), 1000):
+                writer.write(data[start : start + 1000])
+            assert writer.tell() == len(data)
+        return output.getvalue()
+
+    serial = compress(None)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = compress(executor)
+
+    assert parallel == serial
+    assert gzip.decompress(serial) == data
+    assert serial.count(b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x04\xff") >= 37
+
+
+def test_parallel_gzip_writes_a_valid_empty_stream():
+    output = io.BytesIO()
+    with image_build._ParallelGzipWriter(output):
+        pass
+    assert gzip.decompress(output.getvalue()) == b""
+
+
+def test_context_bundles_are_reproducible(monkeypatch, tmp_path):
+    (tmp_path / "Dockerfile").write_text("FROM scratch\nCOPY . /app/\n")
+    for index in range(20):
+        (tmp_path / f"file{index}.bin").write_bytes(os.urandom(8192))
+    monkeypatch.setattr(image_build, "_CONTEXT_GZIP_BLOCK_BYTES", 16 * 1024)
+
+    digests = []
+    for workers in (1, 4):
+        monkeypatch.setattr(image_build, "_CONTEXT_GZIP_WORKERS", workers)
+        packaged = image_build.package_docker_build_context_manifest(tmp_path)
+        try:
+            digests.append(sorted(packaged.bundles))
+            for artifact in packaged.bundles.values():
+                with tarfile.open(artifact.path, "r:gz") as archive:
+                    assert "file19.bin" in archive.getnames()
+        finally:
+            packaged.cleanup()
+
+    assert digests[0] == digests[1]
+
+
+def test_streamed_entries_are_stored_with_overlapped_hashing(monkeypatch, tmp_path):
+    monkeypatch.setattr(image_build, "_PIPELINED_ENTRY_BYTES", 1)
+    data = os.urandom(3 * 1024 * 1024 + 17)
+
+    stored = image_build._store_streamed_entry(
+        io.BytesIO(data), str(tmp_path / "layer"), len(data), "layer.tar"
+    )
+
+    assert stored.sha256_hex == hashlib.sha256(data).hexdigest()
+    assert stored.size_bytes == len(data)
+    assert (tmp_path / "layer").read_bytes() == data
+    with pytest.raises(RuntimeError, match="truncated content"):
+        image_build._store_streamed_entry(
+            io.BytesIO(data), str(tmp_path / "short"), len(data) + 1, "layer.tar"
+        )
+
+
 def test_remote_context_honors_dockerfile_specific_ignore_rules(tmp_path):
     (tmp_path / "docker").mkdir()
     (tmp_path / "docker" / "Buildfile").write_text(
@@ -768,9 +988,12 @@ async def test_async_dockerfile_image_build_cleans_temp_tag_on_build_failure(
 ):
     removed = []
 
-    def fake_build(**kwargs):
+    async def fake_build(**kwargs):
         raise RuntimeError("build failed")
 
+    async def fake_remove(tag):
+        removed.append(tag)
+
     monkeypatch.setattr(
         async_sandbox_module,
         "make_temp_docker_tag",
@@ -781,7 +1004,7 @@ async def test_async_dockerfile_image_build_cleans_temp_tag_on_build_failure(
         "build_docker_image_from_dockerfile",
         fake_build,
     )
-    monkeypatch.setattr(async_sandbox_module, "remove_docker_image", removed.append)
+    monkeypatch.setattr(async_sandbox_module, "remove_docker_image", fake_remove)
 
     manager = AsyncSandboxManager(
         SimpleNamespace(
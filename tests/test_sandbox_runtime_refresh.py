@@ -0,0 +1,248 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hyperbrowser.client.managers.async_manager import sandbox as async_sandbox
+from hyperbrowser.client.managers.async_manager.sandbox import (
+    SandboxHandle as AsyncSandboxHandle,
+)
+from hyperbrowser.client.managers.sync_manager import sandbox as sync_sandbox
+from hyperbrowser.client.managers.sandboxes.shared import (
+    _seconds_until_background_refresh,
+)
+from hyperbrowser.client.managers.sync_manager.sandbox import SandboxHandle
+from hyperbrowser.json_codec import STDLIB_JSON_CODEC
+from hyperbrowser.models import SandboxDetail
+
+
+def _detail(token, expires_in_seconds, expires_at=None):
+    if expires_at is None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in_seconds)
+    return SandboxDetail(
+        id="sbx_123",
+        teamId="team_1",
+        status="active",
+        startTime=123,
+        createdAt="2026-03-12T00:00:00Z",
+        updatedAt="2026-03-12T00:00:01Z",
+        region="us",
+        sessionUrl="https://example.com/session",
+        duration=10,
+        runtime={
+            "transport": "regional_proxy",
+            "host": "https://runtime.example.com",
+            "baseUrl": "https://runtime.example.com/sandbox/sbx_123",
+        },
+        token=token,
+        tokenExpiresAt=expires_at.isoformat(),
+    )
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition was not met in time")
+        time.sleep(0.001)
+
+
+class FakeSyncService:
+    runtime_timeout = 30
+    runtime_proxy_override = None
+    json_codec = STDLIB_JSON_CODEC
+
+    def __init__(self, release=None, expires_in_seconds=3600, expires_at=None):
+        self.calls = 0
+        self.release = release
+        self.expires_in_seconds = expires_in_seconds
+        self.expires_at = expires_at
+
+    def get_detail(self, sandbox_id):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        return _detail(f"tok_{self.calls}", self.expires_in_seconds, self.expires_at)
+
+
+class FakeAsyncService:
+    runtime_timeout = 30
+    runtime_proxy_override = None
+    json_codec = STDLIB_JSON_CODEC
+
+    def __init__(self, expires_in_seconds=3600, expires_at=None):
+        self.calls = 0
+        self.expires_in_seconds = expires_in_seconds
+        self.expires_at = expires_at
+
+    async def get_detail(self, sandbox_id):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return _detail(f"tok_{self.calls}", self.expires_in_seconds, self.expires_at)
+
+
+def test_background_refresh_delay_leaves_room_before_the_refresh_buffer():
+    now = datetime.now(timezone.utc)
+
+    assert _seconds_until_background_refresh(None) is None
+    assert _seconds_until_background_refresh(now) == 0.0
+    assert _seconds_until_background_refresh(now, 5.0) == 5.0
+    assert 500 < _seconds_until_background_refresh(now + timedelta(minutes=10)) < 510
+
+
+def test_concurrent_sync_refreshes_share_one_detail_request():
+    release = threading.Event()
+    service = FakeSyncService(release)
+    sandbox = SandboxHandle(service, _detail("stale", 5))
+    tokens = []
+    threads = [
+        threading.Thread(
+            target=lambda: tokens.append(
+                sandbox.create_runtime_session(force_refresh=True).token
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: sandbox._runtime_refresh.shared == 7)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert service.calls == 1
+    assert tokens == ["tok_1"] * 8
+
+
+@pytest.mark.anyio
+async def test_concurrent_async_refreshes_share_one_detail_request():
+    service = FakeAsyncService()
+    sandbox = AsyncSandboxHandle(service, _detail("stale", 5))
+
+    sessions = await asyncio.gather(
+        *(sandbox.create_runtime_session() for _ in range(8)),
+        sandbox.create_runtime_session(force_refresh=True),
+    )
+
+    assert service.calls == 1
+    assert {session.token for session in sessions} == {"tok_1"}
+
+
+def test_sync_background_refresh_renews_token_before_expiry():
+    service = FakeSyncService()
+    sandbox = SandboxHandle(service, _detail("stale", 5))
+
+    sandbox.start_background_refresh()
+    try:
+        _wait_for(lambda: sandbox._runtime_session.token == "tok_1")
+    finally:
+        sandbox.stop_background_refresh()
+
+    assert service.calls == 1
+    assert sandbox.create_runtime_session().token == "tok_1"
+    assert service.calls == 1
+
+
+@pytest.mark.anyio
+async def test_async_background_refresh_renews_token_until_stopped():
+    service = FakeAsyncService()
+    sandbox = AsyncSandboxHandle(service, _detail("stale", 5))
+
+    sandbox.start_background_refresh()
+    task = sandbox._background_refresh
+    while sandbox._runtime_session.token != "tok_1":
+        await asyncio.sleep(0.001)
+    sandbox.stop_background_refresh()
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert service.calls == 1
+    assert (await sandbox.create_runtime_session()).token == "tok_1"
+
+
+_SHORT_LIVED_TOKENS = [
+    {"expires_in_seconds": 80},
+    {"expires_at": datetime.now(timezone.utc) + timedelta(seconds=10)},
+]
+
+
+@pytest.mark.parametrize("tokens", _SHORT_LIVED_TOKENS)
+def test_sync_background_refresh_spaces_out_short_lived_tokens(monkeypatch, tokens):
+    monkeypatch.setattr(sync_sandbox, "RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS", 0.05)
+    service = FakeSyncService(**tokens)
+    sandbox = SandboxHandle(service, _detail("stale", 5))
+
+    sandbox.start_background_refresh()
+    time.sleep(0.5)
+    sandbox.stop_background_refresh()
+
+    assert 1 <= service.calls <= 12
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("tokens", _SHORT_LIVED_TOKENS)
+async def test_async_background_refresh_spaces_out_short_lived_tokens(
+    monkeypatch, tokens
+):
+    monkeypatch.setattr(async_sandbox, "RUNTIME_SESSION_BACKGROUND_RETRY_SECONDS", 0.05)
+    service = FakeAsyncService(**tokens)
+    sandbox = AsyncSandboxHandle(service, _detail("stale", 5))
+
+    sandbox.start_background_refresh()
+    await asyncio.sleep(0.5)
+    sandbox.stop_background_refresh()
+
+    assert 1 <= service.calls <= 12
+
+
+def test_runtime_connection_is_reused_until_the_session_changes():
+    service = FakeSyncService()
+    sandbox = SandboxHandle(service, _detail("tok_0", 3600))
+
+    connection = sandbox._resolve_runtime_connection()
+    assert sandbox._resolve_runtime_connection() is connection
+    assert sandbox._resolve_runtime_socket_info() is connection
+    assert service.calls == 0
+
+    refreshed = sandbox._resolve_runtime_connection(force_refresh=True)
+    assert refreshed.token == "tok_1"
+    assert sandbox._resolve_runtime_connection() is refreshed
+
+    sandbox._hydrate(_detail("tok_hydrated", 3600))
+    assert sandbox._resolve_runtime_connection().token == "tok_hydrated"
+    assert service.calls == 1
+
+
+def test_runtime_connection_is_rebuilt_once_the_token_nears_expiry():
+    service = FakeSyncService()
+    sandbox = SandboxHandle(service, _detail("stale", 5))
+
+    assert sandbox._resolve_runtime_connection().token == "tok_1"
+    assert sandbox._resolve_runtime_connection().token == "tok_1"
+    assert service.calls == 1
+
+
+def test_create_runtime_session_still_returns_a_copy():
+    sandbox = SandboxHandle(FakeSyncService(), _detail("tok_0", 3600))
+
+    session = sandbox.create_runtime_session()
+    session.token = "mutated"
+
+    assert sandbox._resolve_runtime_connection().token == "tok_0"
+
+
+@pytest.mark.anyio
+async def test_async_runtime_connection_is_reused_until_the_session_changes():
+    service = FakeAsyncService()
+    sandbox = AsyncSandboxHandle(service, _detail("tok_0", 3600))
+
+    connection = await sandbox._resolve_runtime_connection()
+    assert await sandbox._resolve_runtime_connection() is connection
+    assert service.calls == 0
+
+    sandbox._clear_runtime_session()
+    refreshed = await sandbox._resolve_runtime_connection()
+    assert refreshed.token == "tok_1"
+    assert await sandbox._resolve_runtime_socket_info() is refreshed
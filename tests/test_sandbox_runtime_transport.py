@@ -26,7 +26,7 @@ def test_sync_runtime_transport_does_not_retry_consumed_stream_body(monkeypatch)
         def __init__(self, timeout):
             self.timeout = timeout
 
-        def request(self, method, url, headers, json, content):
+        def request(self, method, url, headers, content):
             body = b"".join(content)
             calls.append({"headers": headers, "body": body})
             return httpx.Response(
@@ -73,7 +73,7 @@ async def test_async_runtime_transport_does_not_retry_consumed_stream_body(
         def __init__(self, timeout):
             self.timeout = timeout
 
-        async def request(self, method, url, headers, json, content):
+        async def request(self, method, url, headers, content):
             chunks = []
             async for chunk in content:
                 chunks.append(chunk)
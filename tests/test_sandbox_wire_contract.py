@@ -1,4 +1,5 @@
 import io
+import json
 import httpx
 import pytest
 from types import SimpleNamespace
@@ -420,17 +421,23 @@ IMAGE_BUILD_LIST_PAYLOAD = {
 }
 
 
+def _decode_json_body(content):
+    if content is None:
+        return None
+    return json.loads(content)
+
+
 class RecordingHTTPClient:
     def __init__(self):
         self.calls = []
 
-    def request(self, method, url, params=None, json=None):
+    def request(self, method, url, params=None, content=None, headers=None):
         self.calls.append(
             {
                 "method": method,
                 "url": url,
                 "params": params,
-                "json": json,
+                "json": _decode_json_body(content),
             }
         )
 
@@ -639,13 +646,13 @@ class RecordingAsyncHTTPClient:
     def __init__(self):
         self.calls = []
 
-    async def request(self, method, url, params=None, json=None):
+    async def request(self, method, url, params=None, content=None, headers=None):
         self.calls.append(
             {
                 "method": method,
                 "url": url,
                 "params": params,
-                "json": json,
+                "json": _decode_json_body(content),
             }
         )
 
@@ -0,0 +1,105 @@
+import base64
+import io
+
+import pytest
+
+import hyperbrowser.models.screenshot as screenshot_module
+from hyperbrowser.models import (
+    ClickActionParams,
+    ComputerActionResponse,
+    CrawledPage,
+    FetchResponseData,
+    LazyModel,
+    Screenshot,
+)
+
+IMAGE = bytes(range(256)) * 1000 + b"tail"
+ENCODED = base64.b64encode(IMAGE).decode()
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(screenshot_module, "_DECODE_CHUNK_CHARS", 4096)
+
+
+@pytest.mark.parametrize("padding", [b"", b"a", b"ab"])
+def test_size_is_known_without_decoding(padding):
+    screenshot = Screenshot(base64.b64encode(IMAGE + padding).decode())
+
+    assert screenshot.nbytes == len(IMAGE) + len(padding)
+    assert screenshot.to_bytes() == IMAGE + padding
+
+
+def test_decodes_into_caller_buffers_and_files(tmp_path):
+    screenshot = Screenshot(ENCODED)
+
+    buffer = bytearray(len(IMAGE) + 10)
+    assert screenshot.decode_into(buffer) == len(IMAGE)
+    assert bytes(buffer[: len(IMAGE)]) == IMAGE
+
+    stream = io.BytesIO()
+    assert screenshot.write_to(stream) == len(IMAGE)
+    assert stream.getvalue() == IMAGE
+
+    path = tmp_path / "shot.png"
+    screenshot.write_to(path)
+    assert path.read_bytes() == IMAGE
+
+    with pytest.raises(ValueError):
+        screenshot.decode_into(bytearray(10))
+
+
+def test_view_reuses_one_buffer_and_can_release_the_text():
+    screenshot = Screenshot(f"data:image/png;base64,{ENCODED}")
+
+    view = screenshot.view(release=True)
+    assert view.readonly
+    assert view == IMAGE
+    assert screenshot.released
+    assert screenshot.view().obj is view.obj
+    assert screenshot.to_bytes() == IMAGE
+
+
+def test_released_screenshot_without_buffer_cannot_be_decoded():
+    screenshot = Screenshot(ENCODED)
+    screenshot.release()
+
+    with pytest.raises(ValueError):
+        screenshot.to_bytes()
+
+
+def test_line_wrapped_base64_is_decoded_in_one_piece():
+    wrapped = base64.encodebytes(IMAGE).decode()
+
+    assert Screenshot(wrapped).view() == IMAGE
+
+
+def test_response_models_expose_lazy_screenshots():
+    response = ComputerActionResponse(success=True, screenshot=ENCODED)
+    assert response.screenshot_data().to_bytes() == IMAGE
+    assert response.screenshot == ENCODED
+
+    page = CrawledPage(url="https://example.com", status="completed")
+    assert page.screenshot_data() is None
+
+    data = FetchResponseData(screenshot=ENCODED)
+    screenshot = data.screenshot_data(release=True)
+    assert data.screenshot is None
+    assert screenshot.nbytes == len(IMAGE)
+
+
+def test_lazy_pages_expose_lazy_screenshots():
+    raw = {"url": "https://example.com", "status": "bogus", "screenshot": ENCODED}
+    page = LazyModel(CrawledPage, raw)
+
+    # Only the screenshot field is validated.
+    assert page.screenshot_data().to_bytes() == IMAGE
+    screenshot = page.screenshot_data(release=True)
+    assert page.screenshot is None
+    assert raw["screenshot"] is None
+    assert screenshot.nbytes == len(IMAGE)
+
+    empty = LazyModel(CrawledPage, {"url": "https://example.com"})
+    assert empty.screenshot_data() is None
+    with pytest.raises(AttributeError):
+        LazyModel(ClickActionParams, {}).screenshot_data()
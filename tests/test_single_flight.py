@@ -0,0 +1,321 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from hyperbrowser import AsyncHyperbrowser, Hyperbrowser
+from hyperbrowser.config import ClientConfig
+from hyperbrowser.exceptions import HyperbrowserError
+from hyperbrowser.json_codec import STDLIB_JSON_CODEC
+from hyperbrowser.transport.async_transport import AsyncTransport
+from hyperbrowser.transport.single_flight import SingleFlight
+from hyperbrowser.transport.sync import SyncTransport
+
+STATUS_URL = "https://api.example.com/api/scrape/job_123/status"
+SANDBOX = {
+    "id": "sb_1",
+    "teamId": "team_1",
+    "status": "active",
+    "startTime": 123,
+    "createdAt": "2026-03-12T00:00:00Z",
+    "updatedAt": "2026-03-12T00:00:01Z",
+    "region": "us",
+    "sessionUrl": "https://example.com/session",
+    "duration": 10,
+    "runtime": {
+        "transport": "regional_proxy",
+        "host": "https://runtime.example.com",
+        "baseUrl": "https://runtime.example.com/sandbox/sb_1",
+    },
+}
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition was not met in time")
+        time.sleep(0.001)
+
+
+def test_endpoint_patterns_select_coalesced_urls():
+    assert SingleFlight().applies_to(STATUS_URL)
+    assert not SingleFlight(False).applies_to(STATUS_URL)
+    assert not SingleFlight([]).applies_to(STATUS_URL)
+
+    status_only = SingleFlight(["*/status", "/api/session/*"])
+    assert status_only.applies_to(STATUS_URL)
+    assert status_only.applies_to("https://api.example.com/api/session/abc")
+    assert not status_only.applies_to("https://api.example.com/api/scrape/job_123")
+
+
+def test_sync_transport_shares_concurrent_identical_gets():
+    requests = []
+    release = threading.Event()
+
+    def handler(request):
+        requests.append(request)
+        release.wait(5)
+        return httpx.Response(200, json={"status": "running"})
+
+    transport = SyncTransport(
+        "test-key", json_codec=STDLIB_JSON_CODEC, coalesce_gets=True
+    )
+    transport.client = httpx.Client(transport=httpx.MockTransport(handler))
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(transport.get(STATUS_URL, {"page": 1}))
+        )
+        for _ in range(5)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: transport.single_flight.shared == 4)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        transport.get(STATUS_URL, {"page": 2})
+    finally:
+        transport.close()
+
+    assert len(requests) == 2
+    assert len(results) == 5
+    assert len({id(result) for result in results}) == 5
+    assert all(result.data == {"status": "running"} for result in results)
+
+
+def test_sync_transport_does_not_coalesce_excluded_endpoints():
+    requests = []
+    transport = SyncTransport(
+        "test-key", json_codec=STDLIB_JSON_CODEC, coalesce_gets=["*/status"]
+    )
+    transport.client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: requests.append(request) or httpx.Response(200, json={})
+        )
+    )
+    try:
+        transport.get("https://api.example.com/api/scrape/job_123")
+        transport.get("https://api.example.com/api/scrape/job_123")
+    finally:
+        transport.close()
+
+    assert len(requests) == 2
+    assert transport.single_flight.shared == 0
+
+
+@pytest.mark.anyio
+async def test_async_transport_shares_results_and_errors():
+    requests = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        requests.append(request)
+        await release.wait()
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"message": "Job not found"})
+        return httpx.Response(200, json={"status": "completed"})
+
+    transport = AsyncTransport(
+        "test-key", json_codec=STDLIB_JSON_CODEC, coalesce_gets=True
+    )
+    await transport.client.aclose()
+    transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        found = [asyncio.ensure_future(transport.get(STATUS_URL)) for _ in range(4)]
+        missing = [
+            asyncio.ensure_future(transport.get(STATUS_URL + "/missing"))
+            for _ in range(2)
+        ]
+        cancelled = asyncio.ensure_future(transport.get(STATUS_URL))
+        while len(requests) < 2:
+            await asyncio.sleep(0)
+        cancelled.cancel()
+        release.set()
+
+        results = await asyncio.gather(*found)
+        errors = await asyncio.gather(*missing, return_exceptions=True)
+    finally:
+        await transport.close()
+
+    assert len(requests) == 2
+    assert cancelled.cancelled()
+    assert all(result.data == {"status": "completed"} for result in results)
+    assert all(isinstance(error, HyperbrowserError) for error in errors)
+    assert errors[0] is not errors[1]
+    assert [error.status_code for error in errors] == [404, 404]
+    assert transport.single_flight.shared == 5
+
+
+def test_sync_transport_does_not_coalesce_by_default():
+    requests = []
+    release = threading.Event()
+
+    def handler(request):
+        requests.append(request)
+        release.wait(5)
+        return httpx.Response(200, json={})
+
+    transport = SyncTransport("test-key", json_codec=STDLIB_JSON_CODEC)
+    transport.client = httpx.Client(transport=httpx.MockTransport(handler))
+    threads = [
+        threading.Thread(target=lambda: transport.get(STATUS_URL)) for _ in range(3)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: len(requests) == 3)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+    finally:
+        transport.close()
+
+    assert transport.single_flight.shared == 0
+
+
+@pytest.mark.anyio
+async def test_async_waiters_get_independent_payloads():
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, json={"status": "running", "pages": [1]})
+
+    transport = AsyncTransport(
+        "test-key", json_codec=STDLIB_JSON_CODEC, coalesce_gets=True
+    )
+    await transport.client.aclose()
+    transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        waiters = [asyncio.ensure_future(transport.get(STATUS_URL)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        first, second, third = await asyncio.gather(*waiters)
+    finally:
+        await transport.close()
+
+    first.data["status"] = "mutated"
+    first.data["pages"].append(2)
+    assert transport.single_flight.shared == 2
+    assert second.data == {"status": "running", "pages": [1]}
+    assert third.data == {"status": "running", "pages": [1]}
+
+
+def test_sync_get_after_a_write_does_not_join_an_earlier_get():
+    requests = []
+    release = threading.Event()
+
+    def handler(request):
+        requests.append(request.method)
+        if request.method == "GET" and requests.count("GET") == 1:
+            release.wait(5)
+            return httpx.Response(200, json={"status": "running"})
+        return httpx.Response(200, json={"status": "stopped"})
+
+    transport = SyncTransport(
+        "test-key", json_codec=STDLIB_JSON_CODEC, coalesce_gets=True
+    )
+    transport.client = httpx.Client(transport=httpx.MockTransport(handler))
+    before = []
+    thread = threading.Thread(target=lambda: before.append(transport.get(STATUS_URL)))
+    try:
+        thread.start()
+        _wait_for(lambda: requests == ["GET"])
+        transport.put("https://api.example.com/api/scrape/job_123/stop")
+        after = transport.get(STATUS_URL)
+        release.set()
+        thread.join(5)
+    finally:
+        transport.close()
+
+    assert requests == ["GET", "PUT", "GET"]
+    assert before[0].data == {"status": "running"}
+    assert after.data == {"status": "stopped"}
+    assert transport.single_flight.shared == 0
+
+
+def _sandbox_response(request):
+    if request.method == "POST":
+        return httpx.Response(200, json={"port": 8080, "exposed": False})
+    return httpx.Response(200, json=SANDBOX)
+
+
+def test_sync_sandbox_details_share_gets_until_a_sandbox_write():
+    requests = []
+    release = threading.Event()
+
+    def handler(request):
+        requests.append(request.method)
+        if requests == ["GET"]:
+            release.wait(5)
+        return _sandbox_response(request)
+
+    client = Hyperbrowser(config=ClientConfig(api_key="test-key", coalesce_gets=True))
+    client.transport.client = httpx.Client(transport=httpx.MockTransport(handler))
+    details = []
+    threads = [
+        threading.Thread(
+            target=lambda: details.append(client.sandboxes.get_detail("sb_1"))
+        )
+        for _ in range(3)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        _wait_for(
+            lambda: requests == ["GET"] and client.transport.single_flight.shared == 2
+        )
+        client.sandboxes.unexpose("sb_1", 8080)
+        after = client.sandboxes.get_detail("sb_1")
+        release.set()
+        for thread in threads:
+            thread.join(5)
+    finally:
+        client.close()
+
+    assert requests == ["GET", "POST", "GET"]
+    assert len({id(detail) for detail in details}) == 3
+    assert all(detail.id == "sb_1" for detail in details + [after])
+    assert client.transport.single_flight.shared == 2
+
+
+@pytest.mark.anyio
+async def test_async_sandbox_details_share_gets_until_a_sandbox_write():
+    requests = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        requests.append(request.method)
+        if requests == ["GET"]:
+            await release.wait()
+        return _sandbox_response(request)
+
+    client = AsyncHyperbrowser(
+        config=ClientConfig(api_key="test-key", coalesce_gets=True)
+    )
+    await client.transport.client.aclose()
+    client.transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        waiters = [
+            asyncio.ensure_future(client.sandboxes.get_detail("sb_1")) for _ in range(3)
+        ]
+        deadline = time.monotonic() + 5
+        while requests != ["GET"] or client.transport.single_flight.shared < 2:
+            assert time.monotonic() < deadline, "waiters did not share the GET"
+            await asyncio.sleep(0)
+        await client.sandboxes.unexpose("sb_1", 8080)
+        after = await client.sandboxes.get_detail("sb_1")
+        release.set()
+        details = await asyncio.gather(*waiters)
+    finally:
+        await client.close()
+
+    assert requests == ["GET", "POST", "GET"]
+    assert len({id(detail) for detail in details}) == 3
+    assert all(detail.id == "sb_1" for detail in details + [after])
+    assert client.transport.single_flight.shared == 2
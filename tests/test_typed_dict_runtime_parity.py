@@ -21,6 +21,7 @@ from hyperbrowser.client.managers.async_manager.sandboxes.sandbox_terminal impor
 from hyperbrowser.client.managers.sync_manager.computer_action import (
     ComputerActionManager,
 )
+from hyperbrowser.client.managers.sandboxes import shared as sandbox_shared
 from hyperbrowser.client.managers.sync_manager.sandbox import SandboxManager
 from hyperbrowser.client.managers.sync_manager.sandboxes.sandbox_files import (
     SandboxFilesApi,
@@ -49,6 +50,7 @@ from hyperbrowser.models import (
     SandboxSnapshotListParams,
     SandboxTerminalCreateParams,
 )
+from hyperbrowser.transport.base import APIResponse
 from tests.test_sandbox_wire_contract import (
     MOVE_FILE_PAYLOAD,
     PROCESS_RESULT_PAYLOAD,
@@ -383,7 +385,7 @@ class RecordingComputerActionTransport:
 
     def post(self, url, data=None):
         self.calls.append({"url": url, "data": data})
-        return SimpleNamespace(data={"success": True})
+        return APIResponse({"success": True})
 
 
 class AsyncRecordingComputerActionTransport:
@@ -392,7 +394,7 @@ class AsyncRecordingComputerActionTransport:
 
     async def post(self, url, data=None):
         self.calls.append({"url": url, "data": data})
-        return SimpleNamespace(data={"success": True})
+        return APIResponse({"success": True})
 
 
 def _computer_action_session():
@@ -472,3 +474,22 @@ async def test_async_computer_action_dicts_match_legacy_models_on_the_wire():
     )
 
     assert dict_client.transport.calls == legacy_client.transport.calls
+
+
+def test_trusted_batch_write_entries_skip_validation(monkeypatch):
+    validated = [
+        call
+        for call in _exercise_sync_runtime_surface(False)
+        if call["path"] == "/sandbox/files/write"
+    ]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("trusted entries must not be validated")
+
+    monkeypatch.setattr(sandbox_shared, "coerce_request", fail)
+    transport = RecordingRuntimeTransport()
+    SandboxFilesApi(transport, lambda: None, validate_requests=False).write(
+        [deepcopy(WRITE_ENTRY)]
+    )
+
+    assert transport.calls == validated
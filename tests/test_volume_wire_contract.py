@@ -10,6 +10,7 @@ from hyperbrowser.models import (
     VolumeDeleteResult,
     VolumeListParams,
 )
+from hyperbrowser.transport.base import APIResponse
 
 
 VOLUME_PAYLOAD = {
@@ -38,9 +39,8 @@ VOLUME_DELETE_PAYLOAD = {
 }
 
 
-class StubResponse:
-    def __init__(self, data):
-        self.data = data
+class StubResponse(APIResponse):
+    pass
 
 
 class RecordingSyncTransport: